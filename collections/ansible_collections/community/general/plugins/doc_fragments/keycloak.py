@@ -82,6 +82,20 @@ options:
     type: str
     default: Ansible
     version_added: 5.4.0
+
+  token_cache_dir:
+    description:
+      - Directory in which access and refresh tokens obtained with O(auth_username) and O(auth_password) are cached
+        between module invocations, one file per combination of O(auth_keycloak_url), O(auth_realm), O(auth_client_id)
+        and O(auth_username).
+      - A cached access token is reused until shortly before it expires, then it is renewed with the cached refresh
+        token. The credentials are only sent again when the refresh token is no longer valid.
+      - Cache entries are only used with the credentials they were obtained with.
+      - The directory is created if needed. It should only be readable by the user running the module, as the cached
+        tokens grant access to the Keycloak API.
+      - If not set, a new token is requested on every module invocation.
+    type: path
+    version_added: 10.8.0
 """
 
     ACTIONGROUP_KEYCLOAK = r"""
@@ -64,6 +64,14 @@ options:
     env:
       - name: OP_SERVICE_ACCOUNT_TOKEN
         version_added: 8.2.0
+  reuse_session:
+    description:
+      - Reuse the sign in of an earlier lookup in the same process that used the same account and credentials, instead of
+        checking whether a session exists and signing in again.
+      - If a command fails with a reused session, the sign in is checked again and the command is retried once.
+    type: bool
+    default: false
+    version_added: 10.8.0
 notes:
   - This lookup will use an existing 1Password session if one exists. If not, and you have already performed an initial sign
     in (meaning C(~/.op/config), C(~/.config/op/config) or C(~/.config/.op/config) exists), then only the O(master_password)
@@ -78,3 +86,18 @@ notes:
     which means this data could be stored in clear text on disk or in a database.
   - Tested with C(op) version 2.7.2.
 """
+
+    LOOKUP_PREFETCH = r"""
+options:
+  prefetch:
+    description:
+      - Retrieve all items of O(vault) with one C(op item list) and one C(op item get) call, and look up the terms in them
+        instead of calling C(op) for every term.
+      - The items are kept in memory and are shared by all lookups in the same process that use the same account, credentials
+        and vault.
+      - Terms that match none or several of the retrieved items by ID or title are still retrieved with C(op).
+      - Only works with 1Password CLI version 2 or later.
+    type: bool
+    default: false
+    version_added: 10.8.0
+"""
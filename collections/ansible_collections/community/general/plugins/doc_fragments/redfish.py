@@ -34,4 +34,37 @@ options:
       - The available ciphers is dependent on the Python and OpenSSL/LibreSSL versions.
     type: list
     elements: str
+  keep_alive:
+    description:
+      - If V(true), the connections to the service are kept open and reused by the following requests of the module run,
+        instead of opening a new connection, and doing a new TLS handshake, for every request.
+      - Requests that go through a proxy always use a new connection.
+    type: bool
+    default: false
+    version_added: 10.8.0
+  response_cache:
+    description:
+      - If V(true), the service root is read only once per module run, and resources returned with an ETag are kept.
+        When such a resource is requested again, it is revalidated with C(If-None-Match) and only downloaded again if it changed.
+      - Cached resources other than the service root are discarded when the module modifies a resource.
+    type: bool
+    default: false
+    version_added: 10.8.0
+  expand_collections:
+    description:
+      - If V(true) and the service advertises C($expand) support in C(ProtocolFeaturesSupported), collections that are read
+        to list their members are requested with their members expanded, which saves one request per member.
+    type: bool
+    default: false
+    version_added: 10.8.0
+  workers:
+    description:
+      - Maximum number of requests sent to the service at the same time.
+      - With a value greater than V(1), the members of collections walked by inventory commands, such as drives,
+        volumes, processors, memory modules, network interfaces and firmware components, are read in parallel.
+        The results and their order do not change.
+      - Some services do not cope well with concurrent requests; keep the default V(1) for them.
+    type: int
+    default: 1
+    version_added: 10.8.0
 """
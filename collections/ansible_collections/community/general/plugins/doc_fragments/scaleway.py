@@ -41,6 +41,14 @@ options:
       - Validate SSL certs of the Scaleway API.
     type: bool
     default: true
+  api_workers:
+    description:
+      - Number of result pages that are requested from the Scaleway API at the same time when listing resources.
+      - With a value greater than V(1), the remaining pages are fetched in parallel once the first page announces
+        the total number of resources. Otherwise pages are fetched one after the other until an empty page is returned.
+    type: int
+    default: 1
+    version_added: 10.8.0
 notes:
   - Also see the API documentation on U(https://developer.scaleway.com/).
   - If O(api_token) is not set within the module, the following environment variables can be used in decreasing order of precedence
@@ -39,4 +39,26 @@ options:
         instead.
     type: bool
     default: true
+  retrieval_mode:
+    description:
+      - How records of a VM and of its disks, network interfaces, networks, guest metrics and affinity host are retrieved.
+      - V(record) fetches the record of each object with a separate XAPI call.
+      - V(bulk) fetches the records of all those objects in the pool with a single C(event.from) call and keeps them up
+        to date with further C(event.from) calls that only return objects changed in the meantime. This needs far fewer
+        round trips to the pool master, at the cost of transferring the records of the whole pool once per module run.
+      - V(bulk) requires XenServer 6.0 or newer.
+    type: str
+    choices: [record, bulk]
+    default: record
+    version_added: 10.8.0
+  session_cache_dir:
+    description:
+      - Directory in which the XAPI session is cached between module runs, one file per combination of O(hostname) and
+        O(username).
+      - A cached session is reused as long as XenServer accepts it and only with the password it was logged on with.
+        Cached sessions are not logged out at the end of the module run.
+      - The directory is created if needed. It should only be readable by the user running the module, as a cached session
+        grants the same access as the password.
+    type: path
+    version_added: 10.8.0
 """
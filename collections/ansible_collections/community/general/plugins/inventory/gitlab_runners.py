@@ -16,10 +16,21 @@ DOCUMENTATION = '''
         - python-gitlab > 1.8.0
     extends_documentation_fragment:
         - constructed
+        - inventory_cache
     description:
         - Reads inventories from the GitLab API.
         - Uses a YAML configuration file gitlab_runners.[yml|yaml].
     options:
+        cache:
+            version_added: 10.8.0
+        cache_plugin:
+            version_added: 10.8.0
+        cache_timeout:
+            version_added: 10.8.0
+        cache_connection:
+            version_added: 10.8.0
+        cache_prefix:
+            version_added: 10.8.0
         plugin:
             description: The name of this plugin, it should always be set to 'gitlab_runners' for this plugin to recognize it as its own.
             type: str
@@ -54,6 +65,17 @@ DOCUMENTATION = '''
             description: Toggle to (not) include all available nodes metadata
             type: bool
             default: true
+        workers:
+            description:
+                - Number of runner details requested from the GitLab API at the same time.
+                - With the default V(1), the details of the runners are fetched one after the other.
+            type: int
+            default: 1
+            version_added: 10.8.0
+    notes:
+        - When O(cache) is enabled and the inventory is refreshed, for example with C(--flush-cache), the details of a runner
+          are only fetched again when its entry in the runner list changed since the cached snapshot, for example its
+          status or its description. The details of the other runners are taken from the cache.
 '''
 
 EXAMPLES = '''
@@ -79,11 +101,24 @@ keyed_groups:
   # hint: labels containing special characters will be converted to safe names
   - key: 'tag_list'
     prefix: tag
+
+---
+# Example fetching the details of 8 runners at a time and caching the inventory for an hour
+plugin: community.general.gitlab_runners
+host: https://gitlab.com
+workers: 8
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: /tmp/gitlab_runners_inventory
+cache_timeout: 3600
 '''
 
+from concurrent.futures import ThreadPoolExecutor
+
 from ansible.errors import AnsibleError, AnsibleParserError
-from ansible.plugins.inventory import BaseInventoryPlugin, Constructable
+from ansible.plugins.inventory import BaseInventoryPlugin, Constructable, Cacheable
 
+from ansible_collections.community.general.plugins.module_utils.gitlab import list_all_kwargs
 from ansible_collections.community.general.plugins.plugin_utils.unsafe import make_unsafe
 
 try:
@@ -93,38 +128,68 @@ except ImportError:
     HAS_GITLAB = False
 
 
-class InventoryModule(BaseInventoryPlugin, Constructable):
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
     ''' Host inventory parser for ansible using GitLab API as source. '''
 
     NAME = 'community.general.gitlab_runners'
 
-    def _populate(self):
+    def _fetch_runners(self, previous=None):
+        """Return a list of dictionaries holding the list entry and the details of each runner.
+
+        The details of a runner found in ``previous`` with the same list entry are reused.
+        """
         gl = gitlab.Gitlab(self.get_option('server_url'), private_token=self.get_option('api_token'))
+        if self.get_option('filter'):
+            runners = gl.runners.all(scope=self.get_option('filter'), **list_all_kwargs)
+        else:
+            runners = gl.runners.all(**list_all_kwargs)
+        known = dict((item['runner']['id'], item) for item in previous or [])
+
+        result = []
+        outdated = []
+        for runner in runners:
+            # newer python-gitlab versions return objects instead of dictionaries
+            if not isinstance(runner, dict):
+                runner = runner.attributes
+            item = known.get(runner['id'])
+            if item is None or item['runner'] != runner:
+                item = {'runner': runner, 'attributes': None}
+                outdated.append(item)
+            result.append(item)
+
+        def fetch_attributes(item):
+            item['attributes'] = vars(gl.runners.get(item['runner']['id']))['_attrs']
+
+        workers = self.get_option('workers')
+        if workers > 1 and len(outdated) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # consume the results so that exceptions are raised here
+                list(executor.map(fetch_attributes, outdated))
+        else:
+            for item in outdated:
+                fetch_attributes(item)
+        return result
+
+    def _populate(self, runners):
         self.inventory.add_group('gitlab_runners')
-        try:
-            if self.get_option('filter'):
-                runners = gl.runners.all(scope=self.get_option('filter'))
-            else:
-                runners = gl.runners.all()
-            for runner in runners:
-                host = make_unsafe(str(runner['id']))
-                ip_address = runner['ip_address']
-                host_attrs = make_unsafe(vars(gl.runners.get(runner['id']))['_attrs'])
-                self.inventory.add_host(host, group='gitlab_runners')
-                self.inventory.set_variable(host, 'ansible_host', make_unsafe(ip_address))
-                if self.get_option('verbose_output', True):
-                    self.inventory.set_variable(host, 'gitlab_runner_attributes', host_attrs)
-
-                # Use constructed if applicable
-                strict = self.get_option('strict')
-                # Composed variables
-                self._set_composite_vars(self.get_option('compose'), host_attrs, host, strict=strict)
-                # Complex groups based on jinja2 conditionals, hosts that meet the conditional are added to group
-                self._add_host_to_composed_groups(self.get_option('groups'), host_attrs, host, strict=strict)
-                # Create groups based on variable values and add the corresponding hosts to it
-                self._add_host_to_keyed_groups(self.get_option('keyed_groups'), host_attrs, host, strict=strict)
-        except Exception as e:
-            raise AnsibleParserError(f'Unable to fetch hosts from GitLab API, this was the original exception: {e}')
+        for item in runners:
+            runner = item['runner']
+            host = make_unsafe(str(runner['id']))
+            ip_address = runner['ip_address']
+            host_attrs = make_unsafe(item['attributes'])
+            self.inventory.add_host(host, group='gitlab_runners')
+            self.inventory.set_variable(host, 'ansible_host', make_unsafe(ip_address))
+            if self.get_option('verbose_output', True):
+                self.inventory.set_variable(host, 'gitlab_runner_attributes', host_attrs)
+
+            # Use constructed if applicable
+            strict = self.get_option('strict')
+            # Composed variables
+            self._set_composite_vars(self.get_option('compose'), host_attrs, host, strict=strict)
+            # Complex groups based on jinja2 conditionals, hosts that meet the conditional are added to group
+            self._add_host_to_composed_groups(self.get_option('groups'), host_attrs, host, strict=strict)
+            # Create groups based on variable values and add the corresponding hosts to it
+            self._add_host_to_keyed_groups(self.get_option('keyed_groups'), host_attrs, host, strict=strict)
 
     def verify_file(self, path):
         """Return the possibly of a file being consumable by this plugin."""
@@ -137,4 +202,26 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
             raise AnsibleError('The GitLab runners dynamic inventory plugin requires python-gitlab: https://python-gitlab.readthedocs.io/en/stable/')
         super(InventoryModule, self).parse(inventory, loader, path, cache)
         self._read_config_data(path)
-        self._populate()
+
+        cache_key = self.get_cache_key(path)
+        user_cache_setting = self.get_option('cache')
+        attempt_to_read_cache = user_cache_setting and cache
+        cache_needs_update = user_cache_setting and not cache
+
+        runners = None
+        if attempt_to_read_cache:
+            try:
+                runners = self._cache[cache_key]
+            except KeyError:
+                cache_needs_update = True
+
+        try:
+            if runners is None:
+                # a refresh still reuses the details of unchanged runners from the last snapshot
+                previous = self._cache.get(cache_key) if user_cache_setting else None
+                runners = self._fetch_runners(previous)
+            if cache_needs_update:
+                self._cache[cache_key] = runners
+            self._populate(runners)
+        except Exception as e:
+            raise AnsibleParserError(f'Unable to fetch hosts from GitLab API, this was the original exception: {e}')
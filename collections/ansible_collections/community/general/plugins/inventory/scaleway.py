@@ -70,6 +70,15 @@ DOCUMENTATION = r'''
                           L(Scaleway API, https://developer.scaleway.com/#servers-server-get)
                           can be used.'
             type: dict
+        workers:
+            description:
+                - Number of requests sent to the Scaleway API at the same time.
+                - With a value greater than V(1), all zones are queried concurrently. When the first page of a zone
+                  announces its last page, the remaining pages of that zone are requested in parallel as well.
+                - With the default V(1), zones and pages are fetched one after the other.
+            type: int
+            default: 1
+            version_added: 10.8.0
 '''
 
 EXAMPLES = r'''
@@ -114,6 +123,7 @@ variables:
 
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import yaml
@@ -133,33 +143,104 @@ from ansible.module_utils.six import raise_from
 import ansible.module_utils.six.moves.urllib.parse as urllib_parse
 
 
+def _fetch_page(token, url):
+    try:
+        response = open_url(url,
+                            headers={'X-Auth-Token': token,
+                                     'Content-type': 'application/json'})
+    except Exception as e:
+        raise AnsibleError(f"Error while fetching {url}: {e}")
+    try:
+        raw_json = json.loads(to_text(response.read()))
+    except ValueError:
+        raise AnsibleError("Incorrect JSON payload")
+
+    try:
+        servers = raw_json["servers"]
+    except KeyError:
+        raise AnsibleError("Incorrect format from the Scaleway API response")
+
+    return servers, response.headers
+
+
+def _next_page_url(url, headers):
+    link = headers['Link']
+    if not link:
+        return None
+    relations = parse_pagination_link(link)
+    if 'next' not in relations:
+        return None
+    return urllib_parse.urljoin(url, relations['next'])
+
+
 def _fetch_information(token, url):
     results = []
     paginated_url = url
-    while True:
-        try:
-            response = open_url(paginated_url,
-                                headers={'X-Auth-Token': token,
-                                         'Content-type': 'application/json'})
-        except Exception as e:
-            raise AnsibleError(f"Error while fetching {url}: {e}")
-        try:
-            raw_json = json.loads(to_text(response.read()))
-        except ValueError:
-            raise AnsibleError("Incorrect JSON payload")
+    while paginated_url:
+        servers, headers = _fetch_page(token, paginated_url)
+        results.extend(servers)
+        paginated_url = _next_page_url(paginated_url, headers)
+    return results
 
-        try:
-            results.extend(raw_json["servers"])
-        except KeyError:
-            raise AnsibleError("Incorrect format from the Scaleway API response")
 
-        link = response.headers['Link']
-        if not link:
-            return results
-        relations = parse_pagination_link(link)
-        if 'next' not in relations:
-            return results
-        paginated_url = urllib_parse.urljoin(paginated_url, relations['next'])
+def _page_number(url):
+    query = urllib_parse.parse_qs(urllib_parse.urlsplit(url).query)
+    try:
+        return int(query['page'][0])
+    except (KeyError, ValueError):
+        return None
+
+
+def _with_page_number(url, page):
+    parts = urllib_parse.urlsplit(url)
+    query = [(k, v) for k, v in urllib_parse.parse_qsl(parts.query) if k != 'page']
+    query.append(('page', str(page)))
+    return urllib_parse.urlunsplit(parts._replace(query=urllib_parse.urlencode(query)))
+
+
+def _remaining_page_urls(url, headers, page_length):
+    """Return the URLs of all the pages after the first one, [] if there are none,
+    or None if the response does not tell where the pagination ends."""
+    next_url = _next_page_url(url, headers)
+    if next_url is None:
+        return []
+    next_page = _page_number(next_url)
+    relations = parse_pagination_link(headers['Link'])
+    if 'last' in relations:
+        last_page = _page_number(urllib_parse.urljoin(url, relations['last']))
+    else:
+        try:
+            last_page = -(-int(headers['X-Total-Count']) // page_length)
+        except (TypeError, ValueError, ZeroDivisionError):
+            last_page = None
+    if next_page is None or last_page is None:
+        return None
+    return [_with_page_number(next_url, page) for page in range(next_page, last_page + 1)]
+
+
+def _fetch_zones_information(token, urls, workers):
+    """Fetch the servers behind several URLs, sharing one pool of ``workers`` threads between
+    the first pages of all URLs and then their remaining pages."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        first_pages = list(executor.map(lambda url: _fetch_page(token, url), urls))
+
+        pending = []
+        for url, (servers, headers) in zip(urls, first_pages):
+            page_urls = _remaining_page_urls(url, headers, len(servers))
+            if page_urls is None:
+                # the last page is unknown, follow the links of this zone one page after the other
+                pending.append([executor.submit(_fetch_information, token, _next_page_url(url, headers))])
+            else:
+                pending.append([executor.submit(lambda page_url: _fetch_page(token, page_url)[0], page_url)
+                                for page_url in page_urls])
+
+        results = []
+        for (servers, dummy), futures in zip(first_pages, pending):
+            servers = list(servers)
+            for future in futures:
+                servers.extend(future.result())
+            results.append(servers)
+    return results
 
 
 def _build_server_url(api_endpoint):
@@ -279,12 +360,14 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
 
         return None
 
-    def do_zone_inventory(self, zone, token, tags, hostname_preferences):
+    def do_zone_inventory(self, zone, token, tags, hostname_preferences, servers=None):
         self.inventory.add_group(zone)
-        zone_info = SCALEWAY_LOCATION[zone]
 
-        url = _build_server_url(zone_info["api_endpoint"])
-        raw_zone_hosts_infos = make_unsafe(_fetch_information(url=url, token=token))
+        if servers is None:
+            zone_info = SCALEWAY_LOCATION[zone]
+            url = _build_server_url(zone_info["api_endpoint"])
+            servers = _fetch_information(url=url, token=token)
+        raw_zone_hosts_infos = make_unsafe(servers)
 
         for host_infos in raw_zone_hosts_infos:
 
@@ -344,6 +427,17 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
         if not token:
             raise AnsibleError("'oauth_token' value is null, you must configure it either in inventory, envvars or scaleway-cli config.")
         hostname_preference = self.get_option("hostnames")
+        workers = self.get_option("workers")
+
+        zones = [make_unsafe(zone) for zone in self._get_zones(config_zones)]
+        if workers > 1 and zones:
+            urls = [_build_server_url(SCALEWAY_LOCATION[zone]["api_endpoint"]) for zone in zones]
+            # zone aliases share their endpoint, fetch it only once
+            unique_urls = list(dict.fromkeys(urls))
+            servers_by_url = dict(zip(unique_urls, _fetch_zones_information(token, unique_urls, workers)))
+            zones_servers = [servers_by_url[url] for url in urls]
+        else:
+            zones_servers = [None] * len(zones)
 
-        for zone in self._get_zones(config_zones):
-            self.do_zone_inventory(zone=make_unsafe(zone), token=token, tags=tags, hostname_preferences=hostname_preference)
+        for zone, servers in zip(zones, zones_servers):
+            self.do_zone_inventory(zone=zone, token=token, tags=tags, hostname_preferences=hostname_preference, servers=servers)
@@ -61,6 +61,25 @@ options:
         of query results. Leave empty to skip this check.
     type: int
     version_added: 10.4.0
+  cache:
+    description:
+      - Retrieve all items with a single C(bw list items) call and answer searches by O(search=name) and O(search=id) from
+        an in-memory index of them, instead of calling C(bw) for every term.
+      - The items are shared by all lookups in the same process that use the same O(bw_session), O(organization_id) and
+        collection.
+      - Like without O(cache), searches by O(search=id) ignore O(collection_id), O(collection_name) and O(organization_id).
+        Ids that are not found among the items are looked up with C(bw get item).
+      - Searches by other fields always call C(bw).
+    type: bool
+    default: false
+    version_added: 10.8.0
+  cache_ttl:
+    description:
+      - Number of seconds after which the items retrieved for O(cache=true) are retrieved again.
+      - V(0) keeps them for the lifetime of the process.
+    type: int
+    default: 0
+    version_added: 10.8.0
 """
 
 EXAMPLES = r"""
@@ -108,6 +127,11 @@ EXAMPLES = r"""
   ansible.builtin.debug:
     msg: >-
       {{ lookup('community.general.bitwarden', 'a_test', result_count=1) }}
+
+- name: "Get 'password' from several Bitwarden records, calling bw only once to list all items"
+  ansible.builtin.debug:
+    msg: >-
+      {{ lookup('community.general.bitwarden', 'a_test', 'b_test', 'c_test', field='password', cache=true, cache_ttl=300) }}
 """
 
 RETURN = r"""
@@ -120,7 +144,9 @@ _raw:
   elements: list
 """
 
+from copy import deepcopy
 from subprocess import Popen, PIPE
+import time
 
 from ansible.errors import AnsibleError, AnsibleOptionsError
 from ansible.module_utils.common.text.converters import to_bytes, to_text
@@ -137,6 +163,7 @@ class Bitwarden(object):
     def __init__(self, path='bw'):
         self._cli_path = path
         self._session = None
+        self._items_cache = {}
 
     @property
     def cli_path(self):
@@ -169,10 +196,51 @@ class Bitwarden(object):
             raise BitwardenException(err)
         return to_text(out, errors='surrogate_or_strict'), to_text(err, errors='surrogate_or_strict')
 
-    def _get_matches(self, search_value, search_field, collection_id=None, organization_id=None):
+    def _get_indexed_items(self, collection_id=None, organization_id=None, cache_ttl=0):
+        """Return all records and an index of them by id and by name.
+
+        The records are retrieved with one CLI call and kept for cache_ttl seconds (forever if 0).
+        """
+        key = (self.session, collection_id, organization_id)
+        cached = self._items_cache.get(key)
+        if cached is None or (cache_ttl and time.time() - cached[0] >= cache_ttl):
+            params = ['list', 'items']
+            if collection_id:
+                params.extend(['--collectionid', collection_id])
+            if organization_id:
+                params.extend(['--organizationid', organization_id])
+
+            out, err = self._run(params)
+            items = AnsibleJSONDecoder().raw_decode(out)[0]
+
+            index = {'id': {}, 'name': {}}
+            for item in items:
+                index['id'].setdefault(item.get('id'), []).append(item)
+                index['name'].setdefault(item.get('name'), []).append(item)
+            cached = (time.time(), items, index)
+            self._items_cache[key] = cached
+
+        return cached[1], cached[2]
+
+    def _get_matches(self, search_value, search_field, collection_id=None, organization_id=None, cache_ttl=None):
         """Return matching records whose search_field is equal to key.
+
+        If cache_ttl is not None, searches by name and id are answered from _get_indexed_items().
+        Like C(bw get item), searches by id ignore the collection and the organization, and ids
+        that are not among the records are passed on to C(bw get item).
         """
 
+        if cache_ttl is not None:
+            if search_value and search_field == 'id':
+                matches = self._get_indexed_items(cache_ttl=cache_ttl)[1]['id'].get(search_value)
+                if matches:
+                    return deepcopy(matches)
+            elif search_value and search_field == 'name':
+                index = self._get_indexed_items(collection_id, organization_id, cache_ttl)[1]
+                return deepcopy(index['name'].get(search_value, []))
+            elif not search_value and search_field != 'id':
+                return deepcopy(self._get_indexed_items(collection_id, organization_id, cache_ttl)[0])
+
         # Prepare set of params for Bitwarden CLI
         if search_field == 'id':
             params = ['get', 'item', search_value]
@@ -201,13 +269,13 @@ class Bitwarden(object):
         return [item for item in initial_matches
                 if not search_value or not search_field or item.get(search_field) == search_value]
 
-    def get_field(self, field, search_value, search_field="name", collection_id=None, organization_id=None):
+    def get_field(self, field, search_value, search_field="name", collection_id=None, organization_id=None, cache_ttl=None):
         """Return a list of the specified field for records whose search_field match search_value
         and filtered by collection if collection has been provided.
 
         If field is None, return the whole record for each match.
         """
-        matches = self._get_matches(search_value, search_field, collection_id, organization_id)
+        matches = self._get_matches(search_value, search_field, collection_id, organization_id, cache_ttl)
         if not field:
             return matches
         field_matches = []
@@ -263,6 +331,7 @@ class LookupModule(LookupBase):
         collection_name = self.get_option('collection_name')
         organization_id = self.get_option('organization_id')
         result_count = self.get_option('result_count')
+        cache_ttl = self.get_option('cache_ttl') if self.get_option('cache') else None
         _bitwarden.session = self.get_option('bw_session')
 
         if not _bitwarden.unlocked:
@@ -281,7 +350,7 @@ class LookupModule(LookupBase):
             collection_ids = [collection_id]
 
         results = [
-            _bitwarden.get_field(field, term, search_field, collection_id, organization_id)
+            _bitwarden.get_field(field, term, search_field, collection_id, organization_id, cache_ttl)
             for collection_id in collection_ids
             for term in terms
         ]
@@ -86,6 +86,16 @@ options:
     ini:
       - section: lookup_consul
         key: url
+  prefetch_prefix:
+    description:
+      - Fetch all keys below this prefix with a single recursive request, and answer the keys of the lookup that start
+        with this prefix from the fetched values instead of requesting each of them from Consul.
+      - The values are fetched once per lookup and per combination of O(token) and O(datacenter).
+      - Keys that are retrieved with a specific O(index) are always requested from Consul.
+      - Use this when many keys that share a prefix are looked up at once. Values of keys below the prefix that are not
+        looked up are transferred as well.
+    type: str
+    version_added: 10.8.0
 """
 
 EXAMPLES = r"""
@@ -100,6 +110,10 @@ EXAMPLES = r"""
   with_community.general.consul_kv:
     - 'key/to recurse=true token=E6C060A9-26FB-407A-B83E-12DDAFCB4D98'
 
+- name: retrieving many keys below the same prefix with one request
+  ansible.builtin.debug:
+    msg: "{{ query('community.general.consul_kv', 'app/config/db_host', 'app/config/db_port', 'app/config/db_name', prefetch_prefix='app/config/') }}"
+
 - name: retrieving a KV from a remote cluster on non default port
   ansible.builtin.debug:
     msg: "{{ lookup('community.general.consul_kv', 'my/key', host='10.10.10.10', port=2000) }}"
@@ -124,6 +138,9 @@ try:
 except ImportError as e:
     HAS_CONSUL = False
 
+# Consul clients by connection parameters, reused for the lifetime of the controller process
+_CLIENTS = {}
+
 
 class LookupModule(LookupBase):
 
@@ -151,11 +168,31 @@ class LookupModule(LookupBase):
         validate_certs = self.get_option('validate_certs')
         client_cert = self.get_option('client_cert')
 
+        client_key = (host, port, scheme, validate_certs, client_cert)
+        if client_key not in _CLIENTS:
+            _CLIENTS[client_key] = consul.Consul(host=host, port=port, scheme=scheme, verify=validate_certs, cert=client_cert)
+        consul_api = _CLIENTS[client_key]
+
+        prefetch_prefix = self.get_option('prefetch_prefix')
+        prefetched = {}
+
         values = []
         try:
             for term in terms:
                 params = self.parse_params(term)
-                consul_api = consul.Consul(host=host, port=port, scheme=scheme, verify=validate_certs, cert=client_cert)
+
+                if prefetch_prefix and params['index'] is None and params['key'].startswith(prefetch_prefix):
+                    cache_key = (params['token'], params['datacenter'])
+                    if cache_key not in prefetched:
+                        results = consul_api.kv.get(prefetch_prefix,
+                                                    token=params['token'],
+                                                    recurse=True,
+                                                    dc=params['datacenter'])
+                        prefetched[cache_key] = results[1] or []
+                    for r in prefetched[cache_key]:
+                        if r['Key'] == params['key'] or (params['recurse'] and r['Key'].startswith(params['key'])):
+                            values.append(to_text(r['Value']))
+                    continue
 
                 results = consul_api.kv.get(params['key'],
                                             token=params['token'],
@@ -81,6 +81,21 @@ options:
     default: 53
     type: int
     version_added: 9.5.0
+  cache:
+    description:
+      - Cache the answers of the DNS servers for their TTL, and reuse them for further queries of the same record by lookups
+        in the same process that use the same DNS servers and settings.
+      - Answers cached by one lookup are not seen by lookups that use O(cache=false).
+    default: false
+    type: bool
+    version_added: 10.8.0
+  workers:
+    description:
+      - Maximum number of domains that are queried in parallel when several domains are passed to one lookup.
+      - With the default V(1), the domains are queried one after another.
+    default: 1
+    type: int
+    version_added: 10.8.0
 notes:
   - V(ALL) is not a record in itself, merely the listed fields are available for any record results you retrieve in the form of
     a dictionary.
@@ -225,7 +240,10 @@ from ansible.errors import AnsibleError
 from ansible.plugins.lookup import LookupBase
 from ansible.module_utils.parsing.convert_bool import boolean
 from ansible.utils.display import Display
+from concurrent.futures import ThreadPoolExecutor
 import socket
+import threading
+import time
 
 try:
     import dns.exception
@@ -242,6 +260,12 @@ except ImportError:
 
 display = Display()
 
+# Resolvers shared by all lookups in this process, keyed by their settings; see _get_resolver()
+_RESOLVERS = {}
+# Addresses of nameservers given by name, with the time their answer expires
+_NAMESERVER_ADDRESSES = {}
+_LOCK = threading.Lock()
+
 
 def make_rdata_dict(rdata):
     ''' While the 'dig' lookup plugin supports anything which dnspython supports
@@ -303,6 +327,48 @@ def make_rdata_dict(rdata):
     return rd
 
 
+def _get_nameserver_address(name, cache):
+    ''' Resolve the name of a nameserver with the system's resolver.
+        With cache=True, the address is reused by further lookups until the TTL of the answer expires.
+    '''
+    if cache:
+        with _LOCK:
+            address, expiration = _NAMESERVER_ADDRESSES.get(name, (None, 0))
+        if time.time() < expiration:
+            return address
+    try:
+        answer = dns.resolver.query(name)
+        address = answer[0].address
+    except Exception as e:
+        raise AnsibleError(f"dns lookup NS: {e}")
+    if cache:
+        with _LOCK:
+            _NAMESERVER_ADDRESSES[name] = (address, answer.expiration)
+    return address
+
+
+def _get_resolver(nameservers, port, retry_servfail, cache):
+    ''' Return a resolver for the given settings, reusing the one created by an earlier lookup if possible.
+        Resolvers with cache=True have their own dns.resolver.Cache, which honors the TTL of the answers.
+    '''
+    key = (tuple(nameservers), port, retry_servfail, cache)
+    with _LOCK:
+        if key not in _RESOLVERS:
+            # Create Resolver object so that we can set NS if necessary
+            myres = dns.resolver.Resolver(configure=True)
+            edns_size = 4096
+            myres.use_edns(0, ednsflags=dns.flags.DO, payload=edns_size)
+            myres.retry_servfail = retry_servfail
+            if port:
+                myres.port = port
+            if len(nameservers) > 0:
+                myres.nameservers = nameservers
+            if cache:
+                myres.cache = dns.resolver.Cache()
+            _RESOLVERS[key] = myres
+        return _RESOLVERS[key]
+
+
 # ==============================================================
 # dig: Lookup DNS records
 #
@@ -331,11 +397,6 @@ class LookupModule(LookupBase):
 
         self.set_options(var_options=variables, direct=kwargs)
 
-        # Create Resolver object so that we can set NS if necessary
-        myres = dns.resolver.Resolver(configure=True)
-        edns_size = 4096
-        myres.use_edns(0, ednsflags=dns.flags.DO, payload=edns_size)
-
         domains = []
         nameservers = []
         qtype = self.get_option('qtype')
@@ -344,11 +405,15 @@ class LookupModule(LookupBase):
         real_empty = self.get_option('real_empty')
         tcp = self.get_option('tcp')
         port = self.get_option('port')
+        cache = self.get_option('cache')
+        workers = self.get_option('workers')
+        if workers < 1:
+            raise AnsibleError(f"dns lookup illegal number of workers: {workers}")
         try:
             rdclass = dns.rdataclass.from_text(self.get_option('class'))
         except Exception as e:
             raise AnsibleError(f"dns lookup illegal CLASS: {e}")
-        myres.retry_servfail = self.get_option('retry_servfail')
+        retry_servfail = self.get_option('retry_servfail')
 
         for t in terms:
             if t.startswith('@'):       # e.g. "@10.0.1.2,192.0.2.1" is ok.
@@ -361,11 +426,7 @@ class LookupModule(LookupBase):
                         socket.inet_aton(ns)
                         nameservers.append(ns)
                     except Exception:
-                        try:
-                            nsaddr = dns.resolver.query(ns)[0].address
-                            nameservers.append(nsaddr)
-                        except Exception as e:
-                            raise AnsibleError(f"dns lookup NS: {e}")
+                        nameservers.append(_get_nameserver_address(ns, cache))
                 continue
             if '=' in t:
                 try:
@@ -383,7 +444,7 @@ class LookupModule(LookupBase):
                     except Exception as e:
                         raise AnsibleError(f"dns lookup illegal CLASS: {e}")
                 elif opt == 'retry_servfail':
-                    myres.retry_servfail = boolean(arg)
+                    retry_servfail = boolean(arg)
                 elif opt == 'fail_on_error':
                     fail_on_error = boolean(arg)
                 elif opt == 'real_empty':
@@ -404,10 +465,7 @@ class LookupModule(LookupBase):
 
         # print "--- domain = {domain} qtype={qtype} rdclass={rdclass}"
 
-        if port:
-            myres.port = port
-        if len(nameservers) > 0:
-            myres.nameservers = nameservers
+        myres = _get_resolver(nameservers, port, retry_servfail, cache)
 
         if qtype.upper() == 'PTR':
             reversed_domains = []
@@ -424,43 +482,54 @@ class LookupModule(LookupBase):
         if len(domains) > 1:
             real_empty = True
 
+        def lookup_domain(domain):
+            return self._lookup_domain(myres, domain, qtype, rdclass, tcp, flat, fail_on_error, real_empty)
+
+        if workers > 1 and len(domains) > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(domains))) as executor:
+                results = list(executor.map(lookup_domain, domains))
+        else:
+            results = [lookup_domain(domain) for domain in domains]
+
+        return [item for result in results for item in result]
+
+    def _lookup_domain(self, myres, domain, qtype, rdclass, tcp, flat, fail_on_error, real_empty):
         ret = []
 
-        for domain in domains:
-            try:
-                answers = myres.query(domain, qtype, rdclass=rdclass, tcp=tcp)
-                for rdata in answers:
-                    s = rdata.to_text()
-                    if qtype.upper() == 'TXT':
-                        s = s[1:-1]  # Strip outside quotes on TXT rdata
-
-                    if flat:
-                        ret.append(s)
-                    else:
-                        try:
-                            rd = make_rdata_dict(rdata)
-                            rd['owner'] = answers.canonical_name.to_text()
-                            rd['type'] = dns.rdatatype.to_text(rdata.rdtype)
-                            rd['ttl'] = answers.rrset.ttl
-                            rd['class'] = dns.rdataclass.to_text(rdata.rdclass)
-
-                            ret.append(rd)
-                        except Exception as err:
-                            if fail_on_error:
-                                raise AnsibleError(f"Lookup failed: {err}")
-                            ret.append(str(err))
-
-            except dns.resolver.NXDOMAIN as err:
-                if fail_on_error:
-                    raise AnsibleError(f"Lookup failed: {err}")
-                if not real_empty:
-                    ret.append('NXDOMAIN')
-            except (dns.resolver.NoAnswer, dns.resolver.Timeout, dns.resolver.NoNameservers) as err:
-                if fail_on_error:
-                    raise AnsibleError(f"Lookup failed: {err}")
-                if not real_empty:
-                    ret.append("")
-            except dns.exception.DNSException as err:
-                raise AnsibleError(f"dns.resolver unhandled exception {err}")
+        try:
+            answers = myres.query(domain, qtype, rdclass=rdclass, tcp=tcp)
+            for rdata in answers:
+                s = rdata.to_text()
+                if qtype.upper() == 'TXT':
+                    s = s[1:-1]  # Strip outside quotes on TXT rdata
+
+                if flat:
+                    ret.append(s)
+                else:
+                    try:
+                        rd = make_rdata_dict(rdata)
+                        rd['owner'] = answers.canonical_name.to_text()
+                        rd['type'] = dns.rdatatype.to_text(rdata.rdtype)
+                        rd['ttl'] = answers.rrset.ttl
+                        rd['class'] = dns.rdataclass.to_text(rdata.rdclass)
+
+                        ret.append(rd)
+                    except Exception as err:
+                        if fail_on_error:
+                            raise AnsibleError(f"Lookup failed: {err}")
+                        ret.append(str(err))
+
+        except dns.resolver.NXDOMAIN as err:
+            if fail_on_error:
+                raise AnsibleError(f"Lookup failed: {err}")
+            if not real_empty:
+                ret.append('NXDOMAIN')
+        except (dns.resolver.NoAnswer, dns.resolver.Timeout, dns.resolver.NoNameservers) as err:
+            if fail_on_error:
+                raise AnsibleError(f"Lookup failed: {err}")
+            if not real_empty:
+                ret.append("")
+        except dns.exception.DNSException as err:
+            raise AnsibleError(f"dns.resolver unhandled exception {err}")
 
         return ret
@@ -18,6 +18,8 @@ description:
   - Try to reuse M(community.general.etcd3) options for connection parameters, but add support for some E(ETCDCTL_*) environment
     variables.
   - See U(https://github.com/etcd-io/etcd/tree/master/Documentation/op-guide) for etcd overview.
+  - When several keys are looked up at once, they are fetched with a single transaction per O(txn_size) keys. The connection
+    to the etcd3 server is reused by later lookups in the same process that use the same connection parameters.
 options:
   _terms:
     description:
@@ -30,6 +32,13 @@ options:
       - Look for key or prefix key.
     type: bool
     default: false
+  txn_size:
+    description:
+      - Maximum number of keys (or key prefixes) fetched by a single transaction.
+      - Must not exceed the C(--max-txn-ops) setting of the etcd3 server, which defaults to V(128).
+    type: int
+    default: 128
+    version_added: 10.8.0
   endpoints:
     description:
       - Counterpart of E(ETCDCTL_ENDPOINTS) environment variable. Specify the etcd3 connection with an URL form, for example
@@ -134,6 +143,7 @@ _raw:
       type: str
 """
 
+import os
 import re
 
 from ansible.errors import AnsibleLookupError
@@ -163,6 +173,11 @@ etcd3_cnx_opts = (
 )
 
 
+# etcd3 clients by process ID and connection parameters; gRPC channels must not be shared
+# with forked worker processes, so each process opens its own
+_CLIENTS = {}
+
+
 def etcd3_client(client_params):
     try:
         etcd = etcd3.client(**client_params)
@@ -172,6 +187,17 @@ def etcd3_client(client_params):
     return etcd
 
 
+def _get_client(client_params):
+    key = (os.getpid(),) + tuple(sorted(client_params.items()))
+    if key not in _CLIENTS:
+        _CLIENTS[key] = etcd3_client(client_params)
+    return _CLIENTS[key]
+
+
+def _kv_list(items):
+    return [{'key': to_native(meta.key), 'value': to_native(val)} for val, meta in items if val and meta]
+
+
 class LookupModule(LookupBase):
 
     def run(self, terms, variables, **kwargs):
@@ -207,12 +233,23 @@ class LookupModule(LookupBase):
         display.verbose(f"etcd3 connection parameters: {cnx_log}")
 
         # connect to etcd3 server
-        etcd = etcd3_client(client_params)
+        etcd = _get_client(client_params)
+
+        prefix = self.get_option('prefix')
+        txn_size = self.get_option('txn_size')
+        if txn_size < 1:
+            raise AnsibleLookupError(f'txn_size must be a positive integer, got {txn_size}')
+
+        if len(terms) > 1:
+            try:
+                return self._get_transactional(etcd, terms, prefix, txn_size)
+            except Exception as exp:
+                display.vvv(f'etcd3 transaction failed, falling back to one request per key: {exp}')
 
         ret = []
         # we can pass many keys to lookup
         for term in terms:
-            if self.get_option('prefix'):
+            if prefix:
                 try:
                     for val, meta in etcd.get_prefix(term):
                         if val and meta:
@@ -227,3 +264,18 @@ class LookupModule(LookupBase):
                 except Exception as exp:
                     display.warning(f'Caught except during etcd3.get: {exp}')
         return ret
+
+    def _get_transactional(self, etcd, terms, prefix, txn_size):
+        ret = []
+        for i in range(0, len(terms), txn_size):
+            ops = []
+            for term in terms[i:i + txn_size]:
+                if prefix:
+                    range_end = etcd3.utils.prefix_range_end(etcd3.utils.to_bytes(term))
+                    ops.append(etcd.transactions.get(term, range_end=range_end))
+                else:
+                    ops.append(etcd.transactions.get(term))
+            dummy, responses = etcd.transaction(compare=[], success=ops, failure=[])
+            for items in responses:
+                ret.extend(_kv_list(items))
+        return ret
@@ -14,6 +14,9 @@ version_added: '0.2.0'
 short_description: fetch data from LMDB
 description:
   - This lookup returns a list of results from an LMDB DB corresponding to a list of items given to it.
+  - A key ending with an asterisk returns the key/value pairs of all keys that start with the part before the asterisk.
+  - The database is opened read-only, and kept open for further lookups in the same process until it is modified. All keys
+    of one lookup are read in a single transaction.
 requirements:
   - lmdb (Python library U(https://lmdb.readthedocs.io/en/release/))
 options:
@@ -60,6 +63,8 @@ _raw:
 """
 
 
+import os
+
 from ansible.errors import AnsibleError
 from ansible.plugins.lookup import LookupBase
 from ansible.module_utils.common.text.converters import to_native, to_text
@@ -70,6 +75,33 @@ try:
 except ImportError:
     HAVE_LMDB = False
 
+# Read-only LMDB environments by path, with the stat signature of the data file when they were opened
+_ENVIRONMENTS = {}
+
+
+def _stat_signature(path):
+    if os.path.isdir(path):
+        path = os.path.join(path, 'data.mdb')
+    st = os.stat(path)
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _open_env(path):
+    try:
+        signature = _stat_signature(path)
+    except OSError:
+        signature = None
+    cached = _ENVIRONMENTS.get(path)
+    if cached is not None:
+        if signature is not None and cached[0] == signature:
+            return cached[1]
+        del _ENVIRONMENTS[path]
+        cached[1].close()
+    env = lmdb.open(path, readonly=True)
+    if signature is not None:
+        _ENVIRONMENTS[path] = (signature, env)
+    return env
+
 
 class LookupModule(LookupBase):
 
@@ -94,32 +126,37 @@ class LookupModule(LookupBase):
         db = self.get_option('db')
 
         try:
-            env = lmdb.open(str(db), readonly=True)
+            env = _open_env(str(db))
         except Exception as e:
             raise AnsibleError(f"LMDB cannot open database {db}: {e}")
 
         ret = []
-        if len(terms) == 0:
-            with env.begin() as txn:
-                cursor = txn.cursor()
+        with env.begin() as txn:
+            cursor = txn.cursor()
+            if len(terms) == 0:
                 cursor.first()
                 for key, value in cursor:
                     ret.append((to_text(key), to_native(value)))
+                return ret
+
+            # Serve all prefix terms with one sweep of the cursor, in key order
+            prefixes = sorted(set(to_text(term[:-1]).encode() for term in terms if term.endswith('*')))
+            matches = {}
+            for prefix in prefixes:
+                matches[prefix] = []
+                if not cursor.set_range(prefix):
+                    continue
+                for key, value in cursor:
+                    if not key.startswith(prefix):
+                        break
+                    matches[prefix].append((to_text(key), to_native(value)))
 
-        else:
             for term in terms:
-                with env.begin() as txn:
-                    if term.endswith('*'):
-                        cursor = txn.cursor()
-                        prefix = term[:-1]  # strip asterisk
-                        cursor.set_range(to_text(term).encode())
-                        while cursor.key().startswith(to_text(prefix).encode()):
-                            for key, value in cursor:
-                                ret.append((to_text(key), to_native(value)))
-                            cursor.next()
-                    else:
-                        value = txn.get(to_text(term).encode())
-                        if value is not None:
-                            ret.append(to_native(value))
+                if term.endswith('*'):
+                    ret.extend(matches[to_text(term[:-1]).encode()])
+                else:
+                    value = txn.get(to_text(term).encode())
+                    if value is not None:
+                        ret.append(to_native(value))
 
         return ret
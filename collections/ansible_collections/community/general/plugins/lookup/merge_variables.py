@@ -117,6 +117,7 @@ _raw:
   elements: raw
 """
 
+from copy import deepcopy
 import re
 
 from ansible.errors import AnsibleError
@@ -142,21 +143,32 @@ class LookupModule(LookupBase):
         self._override = self.get_option('override', 'error')
         self._pattern_type = self.get_option('pattern_type', 'regex')
         self._groups = self.get_option('groups', None)
+        # templated variable values, keyed by (host, variable name); only needed if several terms can match a variable
+        self._templated = {} if len(terms) > 1 else None
 
-        ret = []
         for term in terms:
             if not isinstance(term, str):
                 raise AnsibleError(f"Non-string type '{type(term)}' passed, only 'str' types are allowed!")
 
+        if self._groups:
+            # retrieve the variables of each host only once, and not again for every term
+            group_host_variables = []
+            for host in variables["hostvars"]:
+                host_variables = variables["hostvars"].raw_get(host)
+                if self._is_host_in_allowed_groups(host_variables["group_names"]):
+                    host_variables = dict(host_variables)
+                    host_variables["hostvars"] = variables["hostvars"]  # re-add hostvars
+                    group_host_variables.append((host, host_variables))
+
+        ret = []
+        for term in terms:
+            matcher = self._get_matcher(term)
             if not self._groups:  # consider only own variables
-                ret.append(self._merge_vars(term, initial_value, variables))
+                ret.append(self._merge_vars(term, initial_value, variables, matcher=matcher))
             else:  # consider variables of hosts in given groups
                 cross_host_merge_result = initial_value
-                for host in variables["hostvars"]:
-                    if self._is_host_in_allowed_groups(variables["hostvars"][host]["group_names"]):
-                        host_variables = dict(variables["hostvars"].raw_get(host))
-                        host_variables["hostvars"] = variables["hostvars"]  # re-add hostvars
-                        cross_host_merge_result = self._merge_vars(term, cross_host_merge_result, host_variables)
+                for host, host_variables in group_host_variables:
+                    cross_host_merge_result = self._merge_vars(term, cross_host_merge_result, host_variables, host=host, matcher=matcher)
                 ret.append(cross_host_merge_result)
 
         return ret
@@ -171,20 +183,33 @@ class LookupModule(LookupBase):
 
         return False
 
-    def _var_matches(self, key, search_pattern):
+    def _get_matcher(self, search_pattern):
         if self._pattern_type == "prefix":
-            return key.startswith(search_pattern)
+            return lambda key: key.startswith(search_pattern)
         elif self._pattern_type == "suffix":
-            return key.endswith(search_pattern)
+            return lambda key: key.endswith(search_pattern)
         elif self._pattern_type == "regex":
-            matcher = re.compile(search_pattern)
-            return matcher.search(key)
+            return re.compile(search_pattern).search
 
-        return False
+        return lambda key: False
 
-    def _merge_vars(self, search_pattern, initial_value, variables):
+    def _template_var(self, var_name, variables, host=None):
+        key = (host, var_name)
+        if self._templated is None or key not in self._templated:
+            with self._templar.set_temporary_context(available_variables=variables):  # tmp. switch renderer to context of current variables
+                var_value = self._templar.template(variables[var_name])  # Render jinja2 templates
+            if self._templated is None:
+                return var_value
+            self._templated[key] = var_value
+
+        # the merge modifies the values it is given, so hand out copies
+        return deepcopy(self._templated[key])
+
+    def _merge_vars(self, search_pattern, initial_value, variables, host=None, matcher=None):
         display.vvv(f"Merge variables with {self._pattern_type}: {search_pattern}")
-        var_merge_names = sorted([key for key in variables.keys() if self._var_matches(key, search_pattern)])
+        if matcher is None:
+            matcher = self._get_matcher(search_pattern)
+        var_merge_names = sorted([key for key in variables.keys() if matcher(key)])
         display.vvv(f"The following variables will be merged: {var_merge_names}")
         prev_var_type = None
         result = None
@@ -194,8 +219,7 @@ class LookupModule(LookupBase):
             result = initial_value
 
         for var_name in var_merge_names:
-            with self._templar.set_temporary_context(available_variables=variables):  # tmp. switch renderer to context of current variables
-                var_value = self._templar.template(variables[var_name])  # Render jinja2 templates
+            var_value = self._template_var(var_name, variables, host)
             var_type = _verify_and_get_type(var_value)
 
             if prev_var_type is None:
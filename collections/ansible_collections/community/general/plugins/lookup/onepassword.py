@@ -38,6 +38,7 @@ options:
 extends_documentation_fragment:
   - community.general.onepassword
   - community.general.onepassword.lookup
+  - community.general.onepassword.lookup_prefetch
 """
 
 EXAMPLES = r"""
@@ -68,6 +69,12 @@ EXAMPLES = r"""
 - name: Retrieve password from specific account
   ansible.builtin.debug:
     var: lookup('community.general.onepassword', 'HAL 9000', account_id='abc123')
+
+- name: Retrieve several fields, fetching all items of the vault at once and signing in only once per process
+  ansible.builtin.debug:
+    msg:
+      - "{{ lookup('community.general.onepassword', 'HAL 9000', field='username', vault='Discovery', prefetch=true, reuse_session=true) }}"
+      - "{{ lookup('community.general.onepassword', 'HAL 9000', vault='Discovery', prefetch=true, reuse_session=true) }}"
 """
 
 RETURN = r"""
@@ -91,6 +98,11 @@ from ansible.module_utils.six import with_metaclass
 from ansible_collections.community.general.plugins.module_utils.onepassword import OnePasswordConfig
 
 
+# Sign-in state and prefetched items shared by all lookups of this process, see OnePass
+_SESSIONS = {}
+_PREFETCHED_ITEMS = {}
+
+
 def _lower_if_possible(value):
     """Return the lower case version value, otherwise return the value"""
     try:
@@ -178,6 +190,10 @@ class OnePassCLIBase(with_metaclass(abc.ABCMeta, object)):
     def get_raw(self, item_id, vault=None, token=None):
         """Gets the specified item from the vault"""
 
+    def get_all_raw(self, vault=None, token=None):
+        """Gets all items from the vault"""
+        raise AnsibleLookupError(f"Prefetching items is not supported with 1Password CLI version {self.supports_version}")
+
     @abc.abstractmethod
     def signin(self):
         """Sign in using the master password"""
@@ -546,7 +562,7 @@ class OnePassCLIv2(OnePassCLIBase):
         environment_update = {"OP_SECRET_KEY": self.secret_key}
         return self._run(args, command_input=to_bytes(self.master_password), environment_update=environment_update)
 
-    def _add_parameters_and_run(self, args, vault=None, token=None):
+    def _add_parameters_and_run(self, args, vault=None, token=None, command_input=None):
         if self.account_id:
             args.extend(["--account", self.account_id])
 
@@ -560,23 +576,32 @@ class OnePassCLIv2(OnePassCLIBase):
                 "OP_CONNECT_HOST": self.connect_host,
                 "OP_CONNECT_TOKEN": self.connect_token,
             }
-            return self._run(args, environment_update=environment_update)
+            return self._run(args, command_input=command_input, environment_update=environment_update)
 
         if self.service_account_token:
             if vault is None:
                 raise AnsibleLookupError("'vault' is required with 'service_account_token'")
             environment_update = {"OP_SERVICE_ACCOUNT_TOKEN": self.service_account_token}
-            return self._run(args, environment_update=environment_update)
+            return self._run(args, command_input=command_input, environment_update=environment_update)
 
         if token is not None:
             args += [to_bytes("--session=") + token]
 
-        return self._run(args)
+        return self._run(args, command_input=command_input)
 
     def get_raw(self, item_id, vault=None, token=None):
         args = ["item", "get", item_id, "--format", "json"]
         return self._add_parameters_and_run(args, vault=vault, token=token)
 
+    def get_all_raw(self, vault=None, token=None):
+        # 'op item get' reads the list of items from stdin when the item is '-', so two calls are enough
+        rc, out, err = self._add_parameters_and_run(["item", "list", "--format", "json"], vault=vault, token=token)
+        if not json.loads(out):
+            return rc, "[]", err
+
+        args = ["item", "get", "-", "--format", "json"]
+        return self._add_parameters_and_run(args, vault=vault, token=token, command_input=to_bytes(out))
+
     def signin(self):
         self._check_required_params(['master_password'])
 
@@ -589,7 +614,8 @@ class OnePassCLIv2(OnePassCLIBase):
 
 class OnePass(object):
     def __init__(self, subdomain=None, domain="1password.com", username=None, secret_key=None, master_password=None,
-                 service_account_token=None, account_id=None, connect_host=None, connect_token=None, cli_class=None):
+                 service_account_token=None, account_id=None, connect_host=None, connect_token=None, cli_class=None,
+                 reuse_session=False, prefetch=False):
         self.subdomain = subdomain
         self.domain = domain
         self.username = username
@@ -600,8 +626,12 @@ class OnePass(object):
         self.connect_host = connect_host
         self.connect_token = connect_token
 
+        self.reuse_session = reuse_session
+        self.prefetch = prefetch
+
         self.logged_in = False
         self.token = None
+        self._session_reused = False
 
         self._config = OnePasswordConfig()
         self._cli = self._get_cli_class(cli_class)
@@ -648,7 +678,18 @@ class OnePass(object):
             rc, out, err = self._cli.full_signin()
             self.token = out.strip()
 
+    def _session_key(self):
+        return (
+            self._cli.supports_version, self.subdomain, self.domain, self.username, self.account_id,
+            self.service_account_token, self.connect_host, self.connect_token,
+        )
+
     def assert_logged_in(self):
+        if self.reuse_session and self._session_key() in _SESSIONS:
+            self.logged_in, self.token = _SESSIONS[self._session_key()]
+            self._session_reused = True
+            return
+
         logged_in = self._cli.assert_logged_in()
         if logged_in:
             self.logged_in = logged_in
@@ -656,8 +697,57 @@ class OnePass(object):
         else:
             self.set_token()
 
+        if self.reuse_session:
+            _SESSIONS[self._session_key()] = (self.logged_in, self.token)
+
+    def _renew_session(self):
+        # A reused session might have expired since it was stored, so check the sign in again.
+        # Returns False if the session was not reused, since then there is nothing to renew.
+        if not self._session_reused:
+            return False
+        self._session_reused = False
+        _SESSIONS.pop(self._session_key(), None)
+        self.logged_in = False
+        self.token = None
+        self.assert_logged_in()
+        return True
+
+    def _get_prefetched(self, item_id, vault=None):
+        key = (self._session_key(), vault)
+        if key not in _PREFETCHED_ITEMS:
+            try:
+                rc, out, err = self._cli.get_all_raw(vault, self.token)
+            except AnsibleLookupError:
+                if not self._renew_session():
+                    raise
+                rc, out, err = self._cli.get_all_raw(vault, self.token)
+
+            index = {}
+            for item in _load_json_stream(out):
+                for name in set([item.get("id"), item.get("title")]):
+                    if name is not None:
+                        index.setdefault(name.lower(), []).append(item)
+            _PREFETCHED_ITEMS[key] = index
+
+        matches = _PREFETCHED_ITEMS[key].get(_lower_if_possible(item_id), [])
+        if len(matches) == 1:
+            return json.dumps(matches[0])
+
+        # Let op decide about unknown and ambiguous items
+        return None
+
     def get_raw(self, item_id, vault=None):
-        rc, out, err = self._cli.get_raw(item_id, vault, self.token)
+        if self.prefetch:
+            output = self._get_prefetched(item_id, vault)
+            if output is not None:
+                return output
+
+        try:
+            rc, out, err = self._cli.get_raw(item_id, vault, self.token)
+        except AnsibleLookupError:
+            if not self._renew_session():
+                raise
+            rc, out, err = self._cli.get_raw(item_id, vault, self.token)
         return out
 
     def get_field(self, item_id, field, section=None, vault=None):
@@ -668,6 +758,24 @@ class OnePass(object):
         return ""
 
 
+def _load_json_stream(data):
+    """Return the list of JSON values contained in data, flattening top-level lists"""
+    data = to_text(data)
+    decoder = json.JSONDecoder()
+    values = []
+    pos = 0
+    while True:
+        while pos < len(data) and data[pos].isspace():
+            pos += 1
+        if pos >= len(data):
+            return values
+        value, pos = decoder.raw_decode(data, pos)
+        if isinstance(value, list):
+            values.extend(value)
+        else:
+            values.append(value)
+
+
 class LookupModule(LookupBase):
 
     def run(self, terms, variables=None, **kwargs):
@@ -685,6 +793,8 @@ class LookupModule(LookupBase):
         account_id = self.get_option("account_id")
         connect_host = self.get_option("connect_host")
         connect_token = self.get_option("connect_token")
+        reuse_session = self.get_option("reuse_session")
+        prefetch = self.get_option("prefetch")
 
         op = OnePass(
             subdomain=subdomain,
@@ -696,6 +806,8 @@ class LookupModule(LookupBase):
             account_id=account_id,
             connect_host=connect_host,
             connect_token=connect_token,
+            reuse_session=reuse_session,
+            prefetch=prefetch,
         )
         op.assert_logged_in()
 
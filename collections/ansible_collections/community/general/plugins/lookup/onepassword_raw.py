@@ -34,6 +34,7 @@ options:
 extends_documentation_fragment:
   - community.general.onepassword
   - community.general.onepassword.lookup
+  - community.general.onepassword.lookup_prefetch
 """
 
 EXAMPLES = r"""
@@ -75,6 +76,8 @@ class LookupModule(LookupBase):
         account_id = self.get_option("account_id")
         connect_host = self.get_option("connect_host")
         connect_token = self.get_option("connect_token")
+        reuse_session = self.get_option("reuse_session")
+        prefetch = self.get_option("prefetch")
 
         op = OnePass(
             subdomain=subdomain,
@@ -86,6 +89,8 @@ class LookupModule(LookupBase):
             account_id=account_id,
             connect_host=connect_host,
             connect_token=connect_token,
+            reuse_session=reuse_session,
+            prefetch=prefetch,
         )
         op.assert_logged_in()
 
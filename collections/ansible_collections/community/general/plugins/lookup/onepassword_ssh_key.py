@@ -98,6 +98,7 @@ class LookupModule(LookupBase):
         account_id = self.get_option("account_id")
         connect_host = self.get_option("connect_host")
         connect_token = self.get_option("connect_token")
+        reuse_session = self.get_option("reuse_session")
 
         op = OnePass(
             subdomain=subdomain,
@@ -109,6 +110,7 @@ class LookupModule(LookupBase):
             account_id=account_id,
             connect_host=connect_host,
             connect_token=connect_token,
+            reuse_session=reuse_session,
             cli_class=OnePassCLIv2,
         )
         op.assert_logged_in()
@@ -92,7 +92,8 @@ options:
   lock:
     description:
       - How to synchronize operations.
-      - The default of V(write) only synchronizes write operations.
+      - The default of V(write) only synchronizes write operations. Since community.general 10.8.0, every entry is locked
+        separately, so writes to different entries no longer wait for each other.
       - V(readwrite) synchronizes all operations (including read). This makes sure that gpg-agent is never called in parallel.
       - V(none) does not do any synchronization.
     ini:
@@ -158,6 +159,30 @@ options:
     ini:
       - section: passwordstore_lookup
         key: missing_subkey
+  workers:
+    description:
+      - Maximum number of entries that are decrypted in parallel when several terms are passed to one lookup.
+      - With the default V(1), the entries are decrypted one after another.
+      - Entries are never decrypted in parallel when O(lock=readwrite).
+      - Values larger than V(1) require C(auto-expand-secmem) in C(~/.gnupg/gpg-agent.conf).
+    ini:
+      - section: passwordstore_lookup
+        key: workers
+    type: int
+    default: 1
+    version_added: 10.8.0
+  cache:
+    description:
+      - Keep the content of decrypted entries in memory, and reuse it when the same entry of the same password store is
+        looked up again by the same process.
+      - Entries created or updated by this lookup are removed from the cache.
+      - Changes done to the password store by other means are not noticed while the content of an entry is cached.
+    ini:
+      - section: passwordstore_lookup
+        key: cache
+    type: bool
+    default: false
+    version_added: 10.8.0
 notes:
   - The lookup supports passing all options as lookup parameters since community.general 6.0.0.
 """
@@ -232,6 +257,10 @@ tasks.yml: |-
   - name: Return the entire password file content
     ansible.builtin.set_fact:
       passfilecontent: "{{ lookup('community.general.passwordstore', 'example/test', returnall=true)}}"
+
+  - name: Decrypt up to four entries in parallel, and keep them in memory for later lookups
+    ansible.builtin.set_fact:
+      credentials: "{{ query('community.general.passwordstore', 'db/user', 'db/admin', 'web/api', workers=4, cache=true) }}"
 """
 
 RETURN = r"""
@@ -242,7 +271,9 @@ _raw:
   elements: str
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+import hashlib
 import os
 import re
 import subprocess
@@ -261,6 +292,9 @@ from ansible_collections.community.general.plugins.module_utils._filelock import
 
 display = Display()
 
+# Output of 'pass show', keyed by (backend, directory, passname). Only used with cache=true.
+_SHOW_CACHE = {}
+
 
 # backhacked check_output with input for python 2.7
 # http://stackoverflow.com/questions/10103551/passing-data-to-subprocess-check-output
@@ -376,13 +410,57 @@ class LookupModule(LookupBase):
                 else:
                     self.env['PASSWORD_STORE_UMASK'] = self.paramvals['umask']
 
+    def cache_key(self):
+        return (self.backend, self.paramvals['directory'], self.passname)
+
+    def show_pass(self):
+        key = self.cache_key()
+        if key in self.prefetched:
+            b_output = self.prefetched[key]
+        elif self.cache and key in _SHOW_CACHE:
+            b_output = _SHOW_CACHE[key]
+        else:
+            b_output = check_output2([self.pass_cmd, 'show', self.passname], env=self.env)
+        if isinstance(b_output, Exception):
+            raise b_output
+        if self.cache:
+            _SHOW_CACHE[key] = b_output
+        return b_output
+
+    def forget_pass(self):
+        key = self.cache_key()
+        self.prefetched.pop(key, None)
+        _SHOW_CACHE.pop(key, None)
+
+    def prefetch(self, terms):
+        # Decrypt the distinct entries of all terms in parallel, so that the sequential processing of
+        # the terms in run() finds their content (or the error raised by pass) in self.prefetched.
+        paramvals = dict(self.paramvals)
+        commands = {}
+        for term in terms:
+            self.parse_params(term)
+            key = self.cache_key()
+            if key not in commands and not (self.cache and key in _SHOW_CACHE):
+                commands[key] = ([self.pass_cmd, 'show', self.passname], self.env)
+        self.paramvals = paramvals
+
+        if len(commands) < 2:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(commands))) as executor:
+            futures = dict(
+                (key, executor.submit(check_output2, cmd, env=env))
+                for key, (cmd, env) in commands.items()
+            )
+        for key, future in futures.items():
+            try:
+                self.prefetched[key] = future.result()
+            except subprocess.CalledProcessError as e:
+                self.prefetched[key] = e
+
     def check_pass(self):
         try:
-            self.passoutput = to_text(
-                check_output2([self.pass_cmd, 'show'] +
-                              [self.passname], env=self.env),
-                errors='surrogate_or_strict'
-            ).splitlines()
+            self.passoutput = to_text(self.show_pass(), errors='surrogate_or_strict').splitlines()
             self.password = self.passoutput[0]
             self.passdict = {}
             try:
@@ -469,6 +547,7 @@ class LookupModule(LookupBase):
             check_output2([self.pass_cmd, 'insert', '-f', '-m', self.passname], input=msg, env=self.env)
         except (subprocess.CalledProcessError) as e:
             raise AnsibleError(f'exit code {e.returncode} while running {e.cmd}. Error output: {e.output}')
+        self.forget_pass()
         return newpass
 
     def generate_password(self):
@@ -490,6 +569,7 @@ class LookupModule(LookupBase):
             check_output2([self.pass_cmd, 'insert', '-f', '-m', self.passname], input=msg, env=self.env)
         except (subprocess.CalledProcessError) as e:
             raise AnsibleError(f'exit code {e.returncode} while running {e.cmd}. Error output: {e.output}')
+        self.forget_pass()
 
         return newpass
 
@@ -519,8 +599,16 @@ class LookupModule(LookupBase):
         if self.get_option('lock') == type:
             tmpdir = os.environ.get('TMPDIR', '/tmp')
             user = os.environ.get('USER')
-            lockfile = os.path.join(tmpdir, f'.{user}.passwordstore.lock')
+            if type == 'write':
+                # writes only need to be synchronized per entry
+                entry = hashlib.sha256(to_bytes(f"{self.paramvals['directory']}\0{self.passname}")).hexdigest()[:16]
+                lockfile = os.path.join(tmpdir, f'.{user}.passwordstore.{entry}.lock')
+            else:
+                lockfile = os.path.join(tmpdir, f'.{user}.passwordstore.lock')
             with FileLock().lock_file(lockfile, tmpdir, self.lock_timeout):
+                if type == 'write':
+                    # the entry might have been changed by someone else while waiting for the lock
+                    self.forget_pass()
                 self.locked = type
                 yield
             self.locked = None
@@ -531,6 +619,11 @@ class LookupModule(LookupBase):
         self.backend = self.get_option('backend')
         self.pass_cmd = self.backend  # pass and gopass are commands as well
         self.locked = None
+        self.cache = self.get_option('cache')
+        self.workers = self.get_option('workers')
+        if self.workers < 1:
+            raise AnsibleError(f"{self.workers} is not a correct value for workers")
+        self.prefetched = {}
         timeout = self.get_option('locktimeout')
         if not re.match('^[0-9]+[smh]$', timeout):
             raise AnsibleError(f"{timeout} is not a correct value for locktimeout")
@@ -570,6 +663,9 @@ class LookupModule(LookupBase):
         self.setup(variables)
         result = []
 
+        if self.workers > 1 and self.get_option('lock') != 'readwrite':
+            self.prefetch(terms)
+
         for term in terms:
             self.parse_params(term)   # parse the input into paramvals
             with self.opt_lock('readwrite'):
@@ -14,6 +14,8 @@ author:
 short_description: fetch data from Redis
 description:
   - This lookup returns a list of results from a Redis DB corresponding to a list of items given to it.
+  - All keys of one lookup are fetched with pipelined C(MGET) commands, and the connection to Redis is reused by later lookups
+    in the same process that use the same O(host), O(port) and O(socket).
 requirements:
   - redis (python library https://github.com/andymccurdy/redis-py/)
 options:
@@ -47,6 +49,16 @@ options:
     ini:
       - section: lookup_redis
         key: socket
+  batch_size:
+    description:
+      - Maximum number of keys fetched by a single C(MGET) command.
+      - All C(MGET) commands of one lookup are sent in one pipeline.
+    type: int
+    default: 500
+    ini:
+      - section: lookup_redis
+        key: batch_size
+    version_added: 10.8.0
 """
 
 EXAMPLES = r"""
@@ -86,6 +98,19 @@ from ansible.module_utils.common.text.converters import to_text
 from ansible.errors import AnsibleError
 from ansible.plugins.lookup import LookupBase
 
+# Redis clients by (host, port, socket), reused for the lifetime of the controller process
+_CONNECTIONS = {}
+
+
+def _get_connection(host, port, socket):
+    key = (host, port, socket)
+    if key not in _CONNECTIONS:
+        if socket is None:
+            _CONNECTIONS[key] = redis.Redis(host=host, port=port)
+        else:
+            _CONNECTIONS[key] = redis.Redis(unix_socket_path=socket)
+    return _CONNECTIONS[key]
+
 
 class LookupModule(LookupBase):
 
@@ -101,19 +126,40 @@ class LookupModule(LookupBase):
         host = self.get_option('host')
         port = self.get_option('port')
         socket = self.get_option('socket')
-        if socket is None:
-            conn = redis.Redis(host=host, port=port)
-        else:
-            conn = redis.Redis(unix_socket_path=socket)
+        batch_size = self.get_option('batch_size')
+        if batch_size < 1:
+            raise AnsibleError(f'batch_size must be a positive integer, got {batch_size}')
+        conn = _get_connection(host, port, socket)
+
+        terms = list(terms)
+        if not terms:
+            return []
 
-        ret = []
-        for term in terms:
+        batches = [terms[i:i + batch_size] for i in range(0, len(terms), batch_size)]
+        try:
+            pipe = conn.pipeline(transaction=False)
+            for batch in batches:
+                pipe.mget(batch)
+            results = pipe.execute()
+        except Exception as e:
+            # connection failed
+            raise AnsibleError(f'Encountered exception while fetching {", ".join(terms)}: {e}')
+
+        ret = [res for batch_result in results for res in batch_result]
+
+        # MGET returns nil for keys holding a value that is not a string, where GET raised an error
+        missing = [term for term, res in zip(terms, ret) if res is None]
+        if missing:
             try:
-                res = conn.get(term)
-                if res is None:
-                    res = ""
-                ret.append(to_text(res))
+                pipe = conn.pipeline(transaction=False)
+                for term in missing:
+                    pipe.type(term)
+                types = pipe.execute()
             except Exception as e:
-                # connection failed or key not found
-                raise AnsibleError(f'Encountered exception while fetching {term}: {e}')
-        return ret
+                raise AnsibleError(f'Encountered exception while fetching {", ".join(missing)}: {e}')
+            for term, key_type in zip(missing, types):
+                if to_text(key_type) != 'none':
+                    raise AnsibleError(f'Encountered exception while fetching {term}: '
+                                       'WRONGTYPE Operation against a key holding the wrong kind of value')
+
+        return [to_text(res) if res is not None else "" for res in ret]
@@ -12,6 +12,7 @@ author: Alejandro Guirao (!UNKNOWN) <lekumberri@gmail.com>
 short_description: read keys from Python shelve file
 description:
   - Read keys from Python shelve file.
+  - The shelve file is opened read-only, and kept open for further lookups in the same process until it is modified.
 options:
   _terms:
     description: Sets of key value pairs of parameters.
@@ -40,6 +41,7 @@ _list:
   type: list
   elements: str
 """
+import os
 import shelve
 
 from ansible.errors import AnsibleError, AnsibleAssertionError
@@ -47,16 +49,39 @@ from ansible.plugins.lookup import LookupBase
 from ansible.module_utils.common.text.converters import to_bytes, to_text
 
 
+# Read-only shelves by file name, with the stat signature of the file when it was opened
+_SHELVES = {}
+
+
+def _stat_signature(filename):
+    st = os.stat(filename)
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _open_shelve(shelve_filename):
+    """
+    Return a read-only handle of a shelve file, reusing the one opened
+    before unless the file has changed since
+    """
+    signature = _stat_signature(shelve_filename)
+    cached = _SHELVES.get(shelve_filename)
+    if cached is not None:
+        if cached[0] == signature:
+            return cached[1]
+        del _SHELVES[shelve_filename]
+        cached[1].close()
+    d = shelve.open(to_bytes(shelve_filename), flag='r')
+    _SHELVES[shelve_filename] = (signature, d)
+    return d
+
+
 class LookupModule(LookupBase):
 
     def read_shelve(self, shelve_filename, key):
         """
         Read the value of "key" from a shelve file
         """
-        d = shelve.open(to_bytes(shelve_filename))
-        res = d.get(key, None)
-        d.close()
-        return res
+        return _open_shelve(shelve_filename).get(key, None)
 
     def run(self, terms, variables=None, **kwargs):
         if not isinstance(terms, list):
@@ -90,7 +115,6 @@ class LookupModule(LookupBase):
                     raise AnsibleError(f"Key {key} not found in shelve file {shelvefile}")
                 # Convert the value read to string
                 ret.append(to_text(res))
-                break
             else:
                 raise AnsibleError(f"Could not locate shelve file in lookup: {paramvals['file']}")
 
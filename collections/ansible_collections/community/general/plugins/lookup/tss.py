@@ -116,6 +116,33 @@ options:
     env:
       - name: TSS_TOKEN_PATH_URI
     required: false
+  reuse_token:
+    description:
+      - Reuse the OAuth2 Access Grant obtained with O(username) and O(password) in later lookups in the same process that use
+        the same server and credentials, instead of requesting a new one for every lookup.
+      - A new Access Grant is requested when the reused one expires within the next minute.
+    type: bool
+    default: false
+    ini:
+      - section: tss_lookup
+        key: reuse_token
+    version_added: 10.8.0
+  workers:
+    description:
+      - Maximum number of secrets, or folders when O(fetch_secret_ids_from_folder=true), that are fetched in parallel.
+      - With the default V(1), they are fetched one after another.
+    type: int
+    default: 1
+    ini:
+      - section: tss_lookup
+        key: workers
+    version_added: 10.8.0
+  deduplicate:
+    description:
+      - Fetch every secret only once per lookup, even when it is requested by several terms.
+    type: bool
+    default: false
+    version_added: 10.8.0
 """
 
 RETURN = r"""
@@ -231,6 +258,25 @@ EXAMPLES = r"""
               secret
           }}
 
+# Fetch several secrets in parallel, reusing the access grant in later lookups
+- hosts: localhost
+  vars:
+    secrets: >-
+      {{
+        query(
+          'community.general.tss',
+          102, 103, 104, 105,
+          workers=4,
+          reuse_token=true,
+          base_url='https://secretserver.domain.com/SecretServer/',
+          username='user.name',
+          password='password'
+        )
+      }}
+  tasks:
+    - ansible.builtin.debug:
+        msg: the secret names are {{ secrets | map(attribute='name') }}
+
 # If secret ID is 0 and secret_path has value then secret is fetched by secret path
 - hosts: localhost
   vars:
@@ -257,6 +303,9 @@ EXAMPLES = r"""
 
 import abc
 import os
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from datetime import datetime, timedelta
 from ansible.errors import AnsibleError, AnsibleOptionsError
 from ansible.module_utils import six
 from ansible.plugins.lookup import LookupBase
@@ -288,6 +337,37 @@ except ImportError:
 
 display = Display()
 
+# Authorizers by server and credentials, kept for reuse_token=true so their access grant is reused
+_AUTHORIZERS = {}
+# Access grants that expire within this many seconds are not reused
+_ACCESS_GRANT_EXPIRY_MARGIN = 60
+
+
+def _drop_expiring_access_grant(authorizer):
+    grant = getattr(authorizer, "access_grant", None)
+    refreshed = getattr(authorizer, "access_grant_refreshed", None)
+    if grant is None or refreshed is None:
+        return
+    try:
+        expires_in = int(grant["expires_in"])
+    except (KeyError, TypeError, ValueError):
+        expires_in = 0
+    if refreshed + timedelta(seconds=expires_in - _ACCESS_GRANT_EXPIRY_MARGIN) <= datetime.now():
+        del authorizer.access_grant
+
+
+def _map(func, args, workers):
+    """Call func for every element of args, using up to workers threads, and return the results in order.
+
+    The first call is done on its own, so that the access grant is requested only once.
+    """
+    if workers <= 1 or len(args) <= 1:
+        return [func(arg) for arg in args]
+    results = [func(args[0])]
+    with ThreadPoolExecutor(max_workers=min(workers, len(args) - 1)) as executor:
+        results.extend(executor.map(func, args[1:]))
+    return results
+
 
 @six.add_metaclass(abc.ABCMeta)
 class TSSClient(object):
@@ -338,6 +418,29 @@ class TSSClient(object):
             else:
                 return self._client.get_secret_json(secret_id)
 
+    def get_secrets(self, terms, secret_path, fetch_file_attachments, file_download_path, workers=1, deduplicate=False):
+        def get_secret(term):
+            return self.get_secret(term, secret_path, fetch_file_attachments, file_download_path)
+
+        if not deduplicate:
+            return _map(get_secret, terms, workers)
+
+        keys = [self._secret_key(term, secret_path) for term in terms]
+        unique = {}
+        for key, term in zip(keys, terms):
+            unique.setdefault(key, term)
+        secrets = dict(zip(unique, _map(get_secret, list(unique.values()), workers)))
+
+        results = []
+        handed_out = set()
+        for key in keys:
+            results.append(deepcopy(secrets[key]) if key in handed_out else secrets[key])
+            handed_out.add(key)
+        return results
+
+    def get_secret_ids_by_folderids(self, terms, workers=1):
+        return _map(self.get_secret_ids_by_folderid, terms, workers)
+
     def get_secret_ids_by_folderid(self, term):
         display.debug(f"tss_lookup term: {term}")
         folder_id = self._term_to_folder_id(term)
@@ -345,6 +448,13 @@ class TSSClient(object):
 
         return self._client.get_secret_ids_by_folderid(folder_id)
 
+    @classmethod
+    def _secret_key(cls, term, secret_path):
+        secret_id = cls._term_to_secret_id(term)
+        if secret_id == 0 and secret_path:
+            return ("path", secret_path)
+        return ("id", secret_id)
+
     @staticmethod
     def _term_to_secret_id(term):
         try:
@@ -380,11 +490,27 @@ class TSSClientV1(TSSClient):
     def __init__(self, **server_parameters):
         super(TSSClientV1, self).__init__()
 
-        authorizer = self._get_authorizer(**server_parameters)
+        if server_parameters.get("reuse_token"):
+            authorizer = self._get_reused_authorizer(**server_parameters)
+        else:
+            authorizer = self._get_authorizer(**server_parameters)
         self._client = SecretServer(
             server_parameters["base_url"], authorizer, server_parameters["api_path_uri"]
         )
 
+    @staticmethod
+    def _get_reused_authorizer(**server_parameters):
+        key = tuple(
+            server_parameters.get(name)
+            for name in ("base_url", "username", "domain", "password", "token", "token_path_uri")
+        )
+        authorizer = _AUTHORIZERS.get(key)
+        if authorizer is None:
+            authorizer = _AUTHORIZERS[key] = TSSClientV1._get_authorizer(**server_parameters)
+        else:
+            _drop_expiring_access_grant(authorizer)
+        return authorizer
+
     @staticmethod
     def _get_authorizer(**server_parameters):
         if server_parameters.get("token"):
@@ -424,23 +550,26 @@ class LookupModule(LookupBase):
             token=self.get_option("token"),
             api_path_uri=self.get_option("api_path_uri"),
             token_path_uri=self.get_option("token_path_uri"),
+            reuse_token=self.get_option("reuse_token"),
         )
+        workers = self.get_option("workers")
+        if workers < 1:
+            raise AnsibleOptionsError(f"workers must be a positive integer, got {workers}")
 
         try:
             if self.get_option("fetch_secret_ids_from_folder"):
                 if HAS_DELINEA_SS_SDK:
-                    return [tss.get_secret_ids_by_folderid(term) for term in terms]
+                    return tss.get_secret_ids_by_folderids(terms, workers)
                 else:
                     raise AnsibleError("latest python-tss-sdk must be installed to use this plugin")
             else:
-                return [
-                    tss.get_secret(
-                        term,
-                        self.get_option("secret_path"),
-                        self.get_option("fetch_attachments"),
-                        self.get_option("file_download_path"),
-                    )
-                    for term in terms
-                ]
+                return tss.get_secrets(
+                    terms,
+                    self.get_option("secret_path"),
+                    self.get_option("fetch_attachments"),
+                    self.get_option("file_download_path"),
+                    workers=workers,
+                    deduplicate=self.get_option("deduplicate"),
+                )
         except SecretServerError as error:
             raise AnsibleError(f"Secret Server lookup failure: {error.message}")
@@ -7,11 +7,30 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import os
+import threading
+import time
 
 from ansible.module_utils.common.collections import is_sequence
 from ansible.module_utils.common.locale import get_best_parsable_locale
 from ansible_collections.community.general.plugins.module_utils import cmd_runner_fmt
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+    HAS_THREAD_POOL = True
+except ImportError:
+    # Python 2.7 without the futures backport: batches run sequentially
+    HAS_THREAD_POOL = False
+
+
+_timer = getattr(time, 'monotonic', time.time)
+
+# values of these types cannot change in place, so their formatted arguments can be reused by later runs
+_IMMUTABLE_TYPES = (type(None), bool, int, float, str, bytes)
+try:
+    _IMMUTABLE_TYPES += (unicode, long)  # noqa: F821 pylint: disable=undefined-variable
+except NameError:
+    pass
+
 
 def _ensure_list(value):
     return list(value) if is_sequence(value) else [value]
@@ -101,7 +120,7 @@ class CmdRunner(object):
         return tuple(order) if is_sequence(order) else tuple(order.split())
 
     def __init__(self, module, command, arg_formats=None, default_args_order=(),
-                 check_rc=False, force_lang="C", path_prefix=None, environ_update=None):
+                 check_rc=False, force_lang="C", path_prefix=None, environ_update=None, collect_stats=None):
         self.module = module
         self.command = _ensure_list(command)
         self.default_args_order = self._prepare_args_order(default_args_order)
@@ -124,6 +143,14 @@ class CmdRunner(object):
         if environ_update is None:
             environ_update = {}
         self.environ_update = environ_update
+        if collect_stats is None:
+            verbosity = getattr(module, '_verbosity', 0)
+            collect_stats = isinstance(verbosity, int) and verbosity >= 4
+        # list of dicts with cmd, rc and elapsed (in seconds) for every command executed, or None if disabled
+        self.stats = [] if collect_stats else None
+        # argument templates by args_order, and last formatted arguments, shared by all contexts
+        self._templates = {}
+        self._rendered = {}
 
         _cmd = self.command[0]
         self.command[0] = _cmd if (os.path.isabs(_cmd) or '/' in _cmd) else module.get_bin_path(_cmd, opt_dirs=path_prefix, required=True)
@@ -147,9 +174,11 @@ class CmdRunner(object):
         if args_order is None:
             args_order = self.default_args_order
         args_order = self._prepare_args_order(args_order)
-        for p in args_order:
-            if p not in self.arg_formats:
-                raise MissingArgumentFormat(p, args_order, tuple(self.arg_formats.keys()))
+        if args_order not in self._templates:
+            for p in args_order:
+                if p not in self.arg_formats:
+                    raise MissingArgumentFormat(p, args_order, tuple(self.arg_formats.keys()))
+            self._templates[args_order] = tuple((p, self.arg_formats[p]) for p in args_order)
         return _CmdRunnerContext(runner=self,
                                  args_order=args_order,
                                  output_process=output_process,
@@ -160,11 +189,40 @@ class CmdRunner(object):
     def has_arg_format(self, arg):
         return arg in self.arg_formats
 
+    def _record_stats(self, cmd, rc, elapsed):
+        if self.stats is None:
+            return
+        self.stats.append(dict(cmd=cmd, rc=rc, elapsed=round(elapsed, 6)))
+        self.module.debug("CmdRunner: rc={0} elapsed={1:.6f}s cmd={2}".format(rc, elapsed, cmd))
+
     # not decided whether to keep it or not, but if deprecating it will happen in a farther future.
     context = __call__
 
 
+class _ThreadLocalAttr(object):
+    """Attribute of a runner context holding the state of the last ``run()`` made by the current thread."""
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj._local, self.name, None)
+
+    def __set__(self, obj, value):
+        setattr(obj._local, self.name, value)
+
+
 class _CmdRunnerContext(object):
+    cmd = _ThreadLocalAttr('cmd')
+    context_run_args = _ThreadLocalAttr('context_run_args')
+    results_rc = _ThreadLocalAttr('results_rc')
+    results_out = _ThreadLocalAttr('results_out')
+    results_err = _ThreadLocalAttr('results_err')
+    results_processed = _ThreadLocalAttr('results_processed')
+    results_elapsed = _ThreadLocalAttr('results_elapsed')
+    batch_run_info = _ThreadLocalAttr('batch_run_info')
+
     def __init__(self, runner, args_order, output_process, ignore_value_none, check_mode_skip, check_mode_return, **kwargs):
         self.runner = runner
         self.args_order = tuple(args_order)
@@ -175,54 +233,164 @@ class _CmdRunnerContext(object):
         self.check_mode_return = check_mode_return
         self.run_command_args = dict(kwargs)
 
-        self.environ_update = runner.environ_update
-        self.environ_update.update(self.run_command_args.get('environ_update', {}))
+        # each context has its own environment, built once and not modified afterwards
+        environ_update = dict(runner.environ_update)
+        environ_update.update(self.run_command_args.get('environ_update') or {})
         if runner.force_lang:
-            self.environ_update.update({
+            environ_update.update({
                 'LANGUAGE': runner.force_lang,
                 'LC_ALL': runner.force_lang,
             })
-        self.run_command_args['environ_update'] = self.environ_update
+        self.environ_update = environ_update
+        self.run_command_args['environ_update'] = environ_update
 
         if 'check_rc' not in self.run_command_args:
             self.run_command_args['check_rc'] = runner.check_rc
         self.check_rc = self.run_command_args['check_rc']
 
-        self.cmd = None
-        self.results_rc = None
-        self.results_out = None
-        self.results_err = None
-        self.results_processed = None
+        self._local = threading.local()
+        # argument template: the format of each argument, in order
+        self._template = runner._templates.get(self.args_order)
+        if self._template is None:
+            self._template = tuple((arg_name, runner.arg_formats[arg_name]) for arg_name in self.args_order)
+        # last formatted arguments per name, as (value, args), reused while the value does not change
+        self._rendered = runner._rendered
+
+    def _lookup(self, arg_name, run_args):
+        if arg_name in run_args:
+            return True, run_args[arg_name]
+        params = self.runner.module.params
+        if arg_name in params:
+            return True, params[arg_name]
+        return False, None
+
+    def _format_arg(self, arg_name, fmt, run_args):
+        value = None
+        try:
+            found, value = self._lookup(arg_name, run_args)
+            if not found and not fmt.ignore_missing_value:
+                raise MissingArgumentValue(self.args_order, arg_name)
+            cacheable = type(value) in _IMMUTABLE_TYPES
+            if cacheable:
+                rendered = self._rendered.get((arg_name, self.ignore_value_none))
+                if rendered is not None and type(rendered[0]) is type(value) and rendered[0] == value:
+                    return rendered[1]
+            # DEPRECATION: remove parameter ctx_ignore_none in 12.0.0
+            args = fmt(value, ctx_ignore_none=self.ignore_value_none)
+            if cacheable:
+                self._rendered[(arg_name, self.ignore_value_none)] = (value, args)
+            return args
+        except MissingArgumentValue:
+            raise
+        except Exception as e:
+            raise FormatError(arg_name, value, fmt, e)
+
+    def _format_cmd(self, run_args):
+        cmd = list(self.runner.command)
+        for arg_name, fmt in self._template:
+            cmd.extend(self._format_arg(arg_name, fmt, run_args))
+        return cmd
+
+    def _run_command(self, cmd, run_command_args):
+        start = _timer()
+        results = self.runner.module.run_command(cmd, **run_command_args)
+        elapsed = _timer() - start
+        self.runner._record_stats(cmd, results[0], elapsed)
+        return results, elapsed
 
     def run(self, **kwargs):
-        runner = self.runner
         module = self.runner.module
-        self.cmd = list(runner.command)
         self.context_run_args = dict(kwargs)
-
-        named_args = dict(module.params)
-        named_args.update(kwargs)
-        for arg_name in self.args_order:
-            value = None
-            try:
-                if arg_name in named_args:
-                    value = named_args[arg_name]
-                elif not runner.arg_formats[arg_name].ignore_missing_value:
-                    raise MissingArgumentValue(self.args_order, arg_name)
-                # DEPRECATION: remove parameter ctx_ignore_none in 12.0.0
-                self.cmd.extend(runner.arg_formats[arg_name](value, ctx_ignore_none=self.ignore_value_none))
-            except MissingArgumentValue:
-                raise
-            except Exception as e:
-                raise FormatError(arg_name, value, runner.arg_formats[arg_name], e)
+        self.cmd = self._format_cmd(kwargs)
 
         if self.check_mode_skip and module.check_mode:
             return self.check_mode_return
-        results = module.run_command(self.cmd, **self.run_command_args)
+        results, self.results_elapsed = self._run_command(self.cmd, self.run_command_args)
         self.results_rc, self.results_out, self.results_err = results
         self.results_processed = self.output_process(*results)
         return self.results_processed
 
+    def _coalesce(self, items):
+        """
+        Group the items of a batch into invocations.
+
+        Returns a list of ``(run_args, indexes)`` tuples, where ``indexes`` are the positions of the items
+        served by the invocation with ``run_args``. Items are only merged when exactly one argument in
+        ``args_order`` has a format with ``multiple_operands=True``, and all other arguments format to the
+        same command line.
+        """
+        multi = [arg_name for arg_name, fmt in self._template if fmt.multiple_operands]
+        if len(multi) != 1:
+            return [(dict(item), [idx]) for idx, item in enumerate(items)]
+
+        operand = multi[0]
+        groups = {}
+        invocations = []
+        for idx, item in enumerate(items):
+            key = tuple(
+                tuple(self._format_arg(arg_name, fmt, item))
+                for arg_name, fmt in self._template if arg_name != operand
+            )
+            value = self._lookup(operand, item)[1]
+            if key not in groups:
+                groups[key] = (dict(item), [])
+                groups[key][0][operand] = []
+                invocations.append(groups[key])
+            run_args, indexes = groups[key]
+            if value is not None:
+                run_args[operand].extend(_ensure_list(value))
+            indexes.append(idx)
+        return invocations
+
+    def run_batch(self, items, max_workers=1, coalesce=True):
+        """
+        Run the command once for each element of ``items``, a list of dicts with the arguments that would
+        be passed to ``run()``, and return the list of processed results in the same order.
+
+        With ``coalesce=True``, items whose arguments only differ in an argument whose format declares
+        ``multiple_operands`` are executed as a single invocation, and share its result.
+        The remaining invocations are executed using up to ``max_workers`` threads.
+
+        If ``check_rc`` is set, the module fails after all invocations finished, reporting the first one
+        that returned a non-zero exit code. Details of every invocation are kept in ``batch_run_info``.
+        """
+        module = self.runner.module
+        items = list(items)
+        if self.check_mode_skip and module.check_mode:
+            return [self.check_mode_return] * len(items)
+
+        if coalesce:
+            invocations = self._coalesce(items)
+        else:
+            invocations = [(dict(item), [idx]) for idx, item in enumerate(items)]
+        cmds = [self._format_cmd(run_args) for run_args, dummy in invocations]
+
+        run_command_args = dict(self.run_command_args, check_rc=False)
+
+        def execute(cmd):
+            return self._run_command(cmd, run_command_args)
+
+        if max_workers > 1 and len(cmds) > 1 and HAS_THREAD_POOL:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(cmds))) as executor:
+                executed = list(executor.map(execute, cmds))
+        else:
+            executed = [execute(cmd) for cmd in cmds]
+
+        self.batch_run_info = []
+        for cmd, (results, elapsed), (run_args, indexes) in zip(cmds, executed, invocations):
+            rc, out, err = results
+            self.batch_run_info.append(dict(cmd=cmd, context_run_args=run_args, items=indexes,
+                                            results_rc=rc, results_out=out, results_err=err, results_elapsed=elapsed))
+            if self.check_rc and rc != 0:
+                module.fail_json(cmd=cmd, rc=rc, stdout=out, stderr=err, msg=err.rstrip())
+
+        batch_results = [None] * len(items)
+        for (results, elapsed), (run_args, indexes) in zip(executed, invocations):
+            processed = self.output_process(*results)
+            for idx in indexes:
+                batch_results[idx] = processed
+        return batch_results
+
     @property
     def run_info(self):
         return dict(
@@ -237,6 +405,7 @@ class _CmdRunnerContext(object):
             results_out=self.results_out,
             results_err=self.results_err,
             results_processed=self.results_processed,
+            results_elapsed=self.results_elapsed,
         )
 
     def __enter__(self):
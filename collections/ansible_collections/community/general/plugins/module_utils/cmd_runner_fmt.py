@@ -17,10 +17,12 @@ def _ensure_list(value):
 
 class _ArgFormat(object):
     # DEPRECATION: set default value for ignore_none to True in community.general 12.0.0
-    def __init__(self, func, ignore_none=None, ignore_missing_value=False):
+    def __init__(self, func, ignore_none=None, ignore_missing_value=False, multiple_operands=False):
         self.func = func
         self.ignore_none = ignore_none
         self.ignore_missing_value = ignore_missing_value
+        # the command accepts several values for this argument in one invocation, see _CmdRunnerContext.run_batch()
+        self.multiple_operands = multiple_operands
 
     # DEPRECATION: remove parameter ctx_ignore_none in community.general 12.0.0
     def __call__(self, value, ctx_ignore_none=True):
@@ -32,10 +34,11 @@ class _ArgFormat(object):
         return [str(x) for x in f(value)]
 
     def __str__(self):
-        return "<ArgFormat: func={0}, ignore_none={1}, ignore_missing_value={2}>".format(
+        return "<ArgFormat: func={0}, ignore_none={1}, ignore_missing_value={2}, multiple_operands={3}>".format(
             self.func,
             self.ignore_none,
             self.ignore_missing_value,
+            self.multiple_operands,
         )
 
     def __repr__(self):
@@ -67,7 +70,7 @@ def as_opt_eq_val(arg, ignore_none=None):
     return _ArgFormat(lambda value: ["{0}={1}".format(arg, value)], ignore_none=ignore_none)
 
 
-def as_list(ignore_none=None, min_len=0, max_len=None):
+def as_list(ignore_none=None, min_len=0, max_len=None, multiple_operands=False):
     def func(value):
         value = _ensure_list(value)
         if len(value) < min_len:
@@ -75,7 +78,7 @@ def as_list(ignore_none=None, min_len=0, max_len=None):
         if max_len is not None and len(value) > max_len:
             raise ValueError("Parameter must have at most {0} element(s)".format(max_len))
         return value
-    return _ArgFormat(func, ignore_none=ignore_none)
+    return _ArgFormat(func, ignore_none=ignore_none, multiple_operands=multiple_operands)
 
 
 def as_fixed(*args):
@@ -81,6 +81,37 @@ def find_group(gitlab_instance, identifier):
     return group
 
 
+def find_user_ids(gitlab_instance, usernames, members=None):
+    """Resolve usernames to user IDs with as few requests as possible.
+
+    Returns a dictionary mapping lower-cased usernames to user IDs; usernames
+    that do not exist are missing from it. The usernames of the given members
+    are resolved without a request. The remaining ones are looked up one by one,
+    unless listing all users takes fewer requests.
+    """
+    user_ids = dict((member.username.lower(), member.id) for member in members or [])
+    missing = set(username.lower() for username in usernames) - set(user_ids)
+
+    if len(missing) > 1:
+        # the first page is fetched right away and tells how many pages there are
+        users = gitlab_instance.users.list(**list_all_kwargs)
+        total_pages = getattr(users, 'total_pages', None)
+        if total_pages is not None and total_pages <= len(missing):
+            for user in users:
+                user_ids.setdefault(user.username.lower(), user.id)
+            return user_ids
+
+    for username in sorted(missing):
+        for user in gitlab_instance.users.list(username=username, **list_all_kwargs):
+            user_ids[user.username.lower()] = user.id
+    return user_ids
+
+
+def variable_index(variables):
+    """Index variables, as returned by filter_returned_variables(), by key and environment scope."""
+    return dict(((var.get('key'), var.get('environment_scope')), var) for var in variables)
+
+
 def ensure_gitlab_package(module, min_version=None):
     if not HAS_GITLAB_PACKAGE:
         module.fail_json(
@@ -7,7 +7,12 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import binascii
+import hashlib
 import json
+import os
+import tempfile
+import time
 import traceback
 import copy
 
@@ -20,6 +25,8 @@ URL_REALM_INFO = "{url}/realms/{realm}"
 URL_REALMS = "{url}/admin/realms"
 URL_REALM = "{url}/admin/realms/{realm}"
 URL_REALM_KEYS_METADATA = "{url}/admin/realms/{realm}/keys"
+URL_REALM_PARTIAL_EXPORT = "{url}/admin/realms/{realm}/partial-export"
+URL_REALM_PARTIAL_IMPORT = "{url}/admin/realms/{realm}/partialImport"
 
 URL_TOKEN = "{url}/realms/{realm}/protocol/openid-connect/token"
 URL_CLIENT = "{url}/admin/realms/{realm}/clients/{id}"
@@ -125,6 +132,8 @@ URL_AUTHZ_RESOURCES = "{url}/admin/realms/{realm}/clients/{client_id}/authz/reso
 URL_AUTHZ_CUSTOM_POLICY = "{url}/admin/realms/{realm}/clients/{client_id}/authz/resource-server/policy/{policy_type}"
 URL_AUTHZ_CUSTOM_POLICIES = "{url}/admin/realms/{realm}/clients/{client_id}/authz/resource-server/policy"
 
+GROUP_SEARCH_PAGE_SIZE = 100
+
 
 def keycloak_argument_spec():
     """
@@ -144,6 +153,7 @@ def keycloak_argument_spec():
         token=dict(type='str', no_log=True),
         refresh_token=dict(type='str', no_log=True),
         http_agent=dict(type='str', default='Ansible'),
+        token_cache_dir=dict(type='path'),
     )
 
 
@@ -160,20 +170,11 @@ class KeycloakError(Exception):
         return str(self.msg)
 
 
-def _token_request(module_params, payload):
-    """ Obtains connection header with token for the authentication,
-    using the provided auth_username/auth_password
+def _token_response(module_params, payload):
+    """ Requests a token from the token endpoint of the authentication realm
     :param module_params: parameters of the module
-    :param payload:
-       type:
-           dict
-       description:
-           Authentication request payload. Must contain at least
-           'grant_type' and 'client_id', optionally 'client_secret',
-           along with parameters based on 'grant_type'; e.g.,
-           'username'/'password' for type 'password',
-           'refresh_token' for type 'refresh_token'.
-    :return: access token
+    :param payload: authentication request payload, see _token_request()
+    :return: the token endpoint response, a dict containing at least 'access_token'
     """
     base_url = module_params.get('auth_keycloak_url')
     if not base_url.lower().startswith(('http', 'https')):
@@ -188,19 +189,148 @@ def _token_request(module_params, payload):
         r = json.loads(to_native(open_url(auth_url, method='POST',
                                           validate_certs=validate_certs, http_agent=http_agent, timeout=connection_timeout,
                                           data=urlencode(payload)).read()))
-
-        return r['access_token']
     except ValueError as e:
         raise KeycloakError(
             'API returned invalid JSON when trying to obtain access token from %s: %s'
             % (auth_url, str(e)))
-    except KeyError:
-        raise KeycloakError(
-            'API did not include access_token field in response from %s' % auth_url)
     except Exception as e:
         raise KeycloakError('Could not obtain access token from %s: %s'
                             % (auth_url, str(e)), authError=e)
 
+    if not isinstance(r, dict) or 'access_token' not in r:
+        raise KeycloakError(
+            'API did not include access_token field in response from %s' % auth_url)
+    return r
+
+
+def _token_request(module_params, payload):
+    """ Obtains connection header with token for the authentication,
+    using the provided auth_username/auth_password
+    :param module_params: parameters of the module
+    :param payload:
+       type:
+           dict
+       description:
+           Authentication request payload. Must contain at least
+           'grant_type' and 'client_id', optionally 'client_secret',
+           along with parameters based on 'grant_type'; e.g.,
+           'username'/'password' for type 'password',
+           'refresh_token' for type 'refresh_token'.
+    :return: access token
+    """
+    return _token_response(module_params, payload)['access_token']
+
+
+# Cached access tokens are not used when they expire within this many seconds
+TOKEN_CACHE_MARGIN = 30
+TOKEN_CACHE_ITERATIONS = 10000
+
+
+def _token_cache_path(module_params):
+    """ Returns the path of the token cache file for the module's
+    (url, realm, client, user) combination, or None if caching is disabled
+    """
+    cache_dir = module_params.get('token_cache_dir')
+    if not cache_dir or module_params.get('auth_username') is None or module_params.get('auth_password') is None:
+        return None
+    key = '|'.join(to_text(module_params.get(name)) for name in
+                   ('auth_keycloak_url', 'auth_realm', 'auth_client_id', 'auth_username'))
+    return os.path.join(cache_dir, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.json')
+
+
+def _token_cache_digest(module_params, salt):
+    """ Derives a digest of the credentials, so that a cached token is only
+    handed out to callers which know the password it was obtained with
+    """
+    secret = '|'.join(to_text(module_params.get(name)) for name in ('auth_password', 'auth_client_secret'))
+    digest = hashlib.pbkdf2_hmac('sha256', secret.encode('utf-8'), salt, TOKEN_CACHE_ITERATIONS)
+    return to_native(binascii.hexlify(digest))
+
+
+def _load_cached_token(module_params):
+    """ Reads the token cache entry of the module's credentials
+    :return: dict with the cached token response, or None
+    """
+    path = _token_cache_path(module_params)
+    if path is None:
+        return None
+    try:
+        with open(path) as f:
+            entry = json.load(f)
+        salt = binascii.unhexlify(entry['salt'])
+        if entry['digest'] != _token_cache_digest(module_params, salt):
+            return None
+        return entry
+    except (IOError, OSError, ValueError, KeyError, TypeError, binascii.Error):
+        return None
+
+
+def _store_cached_token(module_params, response):
+    """ Stores a token endpoint response in the token cache; failures to write
+    the cache are not fatal, the token is simply requested again next time
+    """
+    path = _token_cache_path(module_params)
+    if path is None:
+        return
+    now = time.time()
+    salt = os.urandom(16)
+    entry = {
+        'salt': to_native(binascii.hexlify(salt)),
+        'digest': _token_cache_digest(module_params, salt),
+        'access_token': response['access_token'],
+        'expires_at': now + response.get('expires_in', 0),
+        'refresh_token': response.get('refresh_token'),
+        # a refresh_expires_in of 0 denotes an offline token which does not expire
+        'refresh_expires_at': now + response['refresh_expires_in'] if response.get('refresh_expires_in') else None,
+    }
+    cache_dir = os.path.dirname(path)
+    try:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir, 0o700)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f)
+            os.rename(tmp_path, path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+    except (IOError, OSError):
+        pass
+
+
+def _request_cached_token(module_params):
+    """ Obtains an access token from the token cache: the cached access token if
+    it is still valid, or a new one requested with the cached refresh token.
+    Falls back to the credentials if neither is usable.
+    :param module_params: parameters of the module. Must include 'auth_username' and 'auth_password'.
+    :return: access token
+    """
+    entry = _load_cached_token(module_params)
+    if entry is not None:
+        now = time.time()
+        if entry['expires_at'] - TOKEN_CACHE_MARGIN > now:
+            return entry['access_token']
+        refresh_expires_at = entry.get('refresh_expires_at')
+        if entry.get('refresh_token') and (refresh_expires_at is None or refresh_expires_at - TOKEN_CACHE_MARGIN > now):
+            temp_payload = {
+                'grant_type': 'refresh_token',
+                'client_id': module_params.get('auth_client_id'),
+                'client_secret': module_params.get('auth_client_secret'),
+                'refresh_token': entry['refresh_token'],
+            }
+            payload = {k: v for k, v in temp_payload.items() if v is not None}
+            try:
+                response = _token_response(module_params, payload)
+            except KeycloakError:
+                # the refresh token has been revoked or the session ended, log in again
+                pass
+            else:
+                _store_cached_token(module_params, response)
+                return response['access_token']
+
+    return _request_token_using_credentials(module_params)
+
 
 def _request_token_using_credentials(module_params):
     """ Obtains connection header with token for the authentication,
@@ -223,7 +353,9 @@ def _request_token_using_credentials(module_params):
     # Remove empty items, for instance missing client_secret
     payload = {k: v for k, v in temp_payload.items() if v is not None}
 
-    return _token_request(module_params, payload)
+    response = _token_response(module_params, payload)
+    _store_cached_token(module_params, response)
+    return response['access_token']
 
 
 def _request_token_using_refresh_token(module_params):
@@ -257,7 +389,7 @@ def get_token(module_params):
     token = module_params.get('token')
 
     if token is None:
-        token = _request_token_using_credentials(module_params)
+        token = _request_cached_token(module_params)
 
     return {
         'Authorization': 'Bearer ' + token,
@@ -336,6 +468,8 @@ class KeycloakAPI(object):
         self.connection_timeout = self.module.params.get('connection_timeout')
         self.restheaders = connection_header
         self.http_agent = self.module.params.get('http_agent')
+        # collection listings fetched during this run, dropped on every write
+        self._listings = {}
 
     def _request(self, url, method, data=None):
         """ Makes a request to Keycloak and returns the raw response.
@@ -350,6 +484,9 @@ class KeycloakAPI(object):
         :param data: (optional) data for request
         :return: raw API response
         """
+        if method != 'GET':
+            self._listings.clear()
+
         def make_request_catching_401():
             try:
                 return open_url(url, method=method, data=data,
@@ -403,6 +540,17 @@ class KeycloakAPI(object):
         """
         return json.loads(to_native(self._request(url, method, data).read()))
 
+    def _request_listing(self, url):
+        """ Fetches a collection listing, reusing the result of an earlier identical
+        request as long as nothing has been written to the server in the meantime.
+
+        :param url: request path, including the query string
+        :return: deserialized API response; callers may modify it freely
+        """
+        if url not in self._listings:
+            self._listings[url] = self._request_and_deserialize(url, method='GET')
+        return copy.deepcopy(self._listings[url])
+
     def get_realm_info_by_id(self, realm='master'):
         """ Obtain realm public info by id
 
@@ -523,6 +671,42 @@ class KeycloakAPI(object):
             self.fail_request(e, msg='Could not delete realm %s: %s' % (realm, str(e)),
                               exception=traceback.format_exc())
 
+    def export_realm_partial(self, realm="master", export_clients=True, export_groups_and_roles=True):
+        """ Export a realm with its clients and/or groups and roles in one request.
+        Secrets contained in the export are masked by Keycloak.
+
+        :param realm: realm to be exported
+        :param export_clients: whether to include the clients
+        :param export_groups_and_roles: whether to include the groups and roles
+        :return: dict of realm representation
+        """
+        query = urlencode([('exportClients', 'true' if export_clients else 'false'),
+                           ('exportGroupsAndRoles', 'true' if export_groups_and_roles else 'false')])
+        export_url = '%s?%s' % (URL_REALM_PARTIAL_EXPORT.format(url=self.baseurl, realm=realm), query)
+
+        try:
+            return self._request_and_deserialize(export_url, method='POST')
+        except ValueError as e:
+            self.module.fail_json(msg='API returned incorrect JSON when trying to export realm %s: %s' % (realm, str(e)))
+        except Exception as e:
+            self.fail_request(e, msg='Could not export realm %s: %s' % (realm, str(e)))
+
+    def import_realm_partial(self, importrep, realm="master"):
+        """ Import clients, roles, groups, users and identity providers into a realm in one request
+
+        :param importrep: PartialImportRepresentation; its ifResourceExists decides what happens to existing resources
+        :param realm: realm to import into
+        :return: dict of partial import results
+        """
+        import_url = URL_REALM_PARTIAL_IMPORT.format(url=self.baseurl, realm=realm)
+
+        try:
+            return self._request_and_deserialize(import_url, method='POST', data=json.dumps(importrep))
+        except ValueError as e:
+            self.module.fail_json(msg='API returned incorrect JSON when trying to import into realm %s: %s' % (realm, str(e)))
+        except Exception as e:
+            self.fail_request(e, msg='Could not import into realm %s: %s' % (realm, str(e)))
+
     def get_clients(self, realm='master', filter=None):
         """ Obtains client representations for clients in a realm
 
@@ -535,7 +719,7 @@ class KeycloakAPI(object):
             clientlist_url += '?clientId=%s' % filter
 
         try:
-            return self._request_and_deserialize(clientlist_url, method='GET')
+            return self._request_listing(clientlist_url)
         except ValueError as e:
             self.module.fail_json(msg='API returned incorrect JSON when trying to obtain list of clients for realm %s: %s'
                                       % (realm, str(e)))
@@ -646,7 +830,7 @@ class KeycloakAPI(object):
         """
         client_roles_url = URL_CLIENT_ROLES.format(url=self.baseurl, realm=realm, id=cid)
         try:
-            return self._request_and_deserialize(client_roles_url, method="GET")
+            return self._request_listing(client_roles_url)
         except Exception as e:
             self.fail_request(e, msg="Could not fetch rolemappings for client %s in realm %s: %s"
                                      % (cid, realm, str(e)))
@@ -659,11 +843,17 @@ class KeycloakAPI(object):
         :param realm: Realm from which to obtain the rolemappings.
         :return: The ID of the role, None if not found.
         """
-        rolemappings = self.get_client_roles_by_id(cid, realm=realm)
-        for role in rolemappings:
-            if name == role['name']:
-                return role['id']
-        return None
+        role_url = URL_CLIENT_ROLE.format(url=self.baseurl, realm=realm, id=cid, name=quote(name, safe=''))
+        try:
+            return self._request_and_deserialize(role_url, method="GET")['id']
+        except HTTPError as e:
+            if e.code == 404:
+                return None
+            self.fail_request(e, msg="Could not fetch role %s of client %s in realm %s: %s"
+                                     % (name, cid, realm, str(e)))
+        except Exception as e:
+            self.fail_request(e, msg="Could not fetch role %s of client %s in realm %s: %s"
+                                     % (name, cid, realm, str(e)))
 
     def get_client_group_rolemapping_by_id(self, gid, cid, rid, realm='master'):
         """ Obtain client representation by id
@@ -1127,7 +1317,7 @@ class KeycloakAPI(object):
         """
         clientscopes_url = URL_CLIENTSCOPES.format(url=self.baseurl, realm=realm)
         try:
-            return self._request_and_deserialize(clientscopes_url, method="GET")
+            return self._request_listing(clientscopes_url)
         except Exception as e:
             self.fail_request(e, msg="Could not fetch list of clientscopes in realm %s: %s"
                                      % (realm, str(e)))
@@ -1159,8 +1349,8 @@ class KeycloakAPI(object):
         """ Fetch a keycloak clientscope within a realm based on its name.
 
         The Keycloak API does not allow filtering of the clientscopes resource by name.
-        As a result, this method first retrieves the entire list of clientscopes - name and ID -
-        then performs a second query to fetch the group.
+        As a result, this method retrieves the entire list of clientscopes, which
+        already holds their full representations.
 
         If the clientscope does not exist, None is returned.
         :param name: Name of the clientscope to fetch.
@@ -1171,7 +1361,7 @@ class KeycloakAPI(object):
 
             for clientscope in all_clientscopes:
                 if clientscope['name'] == name:
-                    return self.get_clientscope_by_clientscopeid(clientscope['id'], realm=realm)
+                    return clientscope
 
             return None
 
@@ -1516,7 +1706,7 @@ class KeycloakAPI(object):
         """
         groups_url = URL_GROUPS.format(url=self.baseurl, realm=realm)
         try:
-            return self._request_and_deserialize(groups_url, method="GET")
+            return self._request_listing(groups_url)
         except Exception as e:
             self.fail_request(e, msg="Could not fetch list of groups in realm %s: %s"
                                      % (realm, str(e)))
@@ -1552,18 +1742,41 @@ class KeycloakAPI(object):
                 group_children = []
             else:
                 group_children_url = URL_GROUP_CHILDREN.format(url=self.baseurl, realm=realm, groupid=parent['id'])
-                group_children = self._request_and_deserialize(group_children_url, method="GET")
+                group_children = self._request_listing(group_children_url)
             subgroups = group_children
         else:
             subgroups = parent['subGroups']
         return subgroups
 
+    def _search_groups(self, name, realm="master", parent=None):
+        """ Searches the top level groups, or the children of parent, for name.
+
+        The search is an exact match on servers which support it, older servers return
+        all groups containing name (or ignore the search altogether), so callers still
+        have to compare the names.
+        """
+        if parent is None:
+            groups_url = URL_GROUPS.format(url=self.baseurl, realm=realm)
+        elif 'subGroupCount' in parent:
+            if parent['subGroupCount'] == 0:
+                return []
+            groups_url = URL_GROUP_CHILDREN.format(url=self.baseurl, realm=realm, groupid=parent['id'])
+        else:
+            return parent['subGroups']
+
+        groups = []
+        while True:
+            query = urlencode([('search', name), ('exact', 'true'), ('first', len(groups)), ('max', GROUP_SEARCH_PAGE_SIZE)])
+            page = self._request_listing('%s?%s' % (groups_url, query))
+            groups.extend(page)
+            if len(page) < GROUP_SEARCH_PAGE_SIZE:
+                return groups
+
     def get_group_by_name(self, name, realm="master", parents=None):
         """ Fetch a keycloak group within a realm based on its name.
 
-        The Keycloak API does not allow filtering of the Groups resource by name.
-        As a result, this method first retrieves the entire list of groups - name and ID -
-        then performs a second query to fetch the group.
+        The groups resource is searched for the name on the server, then a second
+        query fetches the full representation of the matching group.
 
         If the group does not exist, None is returned.
         :param name: Name of the group to fetch.
@@ -1577,9 +1790,9 @@ class KeycloakAPI(object):
                 if not parent:
                     return None
 
-                all_groups = self.get_subgroups(parent, realm)
+                all_groups = self._search_groups(name, realm, parent=parent)
             else:
-                all_groups = self.get_groups(realm=realm)
+                all_groups = self._search_groups(name, realm)
 
             for group in all_groups:
                 if group['name'] == name:
@@ -1784,7 +1997,7 @@ class KeycloakAPI(object):
         """
         rolelist_url = URL_REALM_ROLES.format(url=self.baseurl, realm=realm)
         try:
-            return self._request_and_deserialize(rolelist_url, method='GET')
+            return self._request_listing(rolelist_url)
         except ValueError as e:
             self.module.fail_json(msg='API returned incorrect JSON when trying to obtain list of roles for realm %s: %s'
                                       % (realm, str(e)))
@@ -1971,7 +2184,7 @@ class KeycloakAPI(object):
                                       % (clientid, realm))
         rolelist_url = URL_CLIENT_ROLES.format(url=self.baseurl, realm=realm, id=cid)
         try:
-            return self._request_and_deserialize(rolelist_url, method='GET')
+            return self._request_listing(rolelist_url)
         except ValueError as e:
             self.module.fail_json(msg='API returned incorrect JSON when trying to obtain list of roles for client %s in realm %s: %s'
                                       % (clientid, realm, str(e)))
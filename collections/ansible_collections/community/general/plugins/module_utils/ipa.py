@@ -17,6 +17,7 @@ import json
 import os
 import socket
 import uuid
+from contextlib import contextmanager
 
 import re
 from ansible.module_utils.common.text.converters import to_bytes, to_native, to_text
@@ -52,6 +53,8 @@ class IPAClient(object):
         self.headers = None
         self.timeout = module.params.get('ipa_timeout')
         self.use_gssapi = False
+        self._batch = None
+        self._batch_supported = True
 
     def get_base_url(self):
         return '%s://%s/ipa' % (self.protocol, self.host)
@@ -114,10 +117,7 @@ class IPAClient(object):
     def ping(self):
         return self._post_json(method='ping', name=None)
 
-    def _post_json(self, method, name, item=None):
-        if item is None:
-            item = {}
-        url = '%s/session/json' % self.get_base_url()
+    def _json_command(self, method, name, item):
         data = dict(method=method)
 
         # TODO: We should probably handle this a little better.
@@ -127,7 +127,10 @@ class IPAClient(object):
             data['params'] = [[], item]
         else:
             data['params'] = [[name], item]
+        return data
 
+    def _send_json(self, method, data):
+        url = '%s/session/json' % self.get_base_url()
         try:
             resp, info = fetch_url(module=self.module, url=url, data=to_bytes(json.dumps(data)),
                                    headers=self.headers, timeout=self.timeout, use_gssapi=self.use_gssapi)
@@ -145,23 +148,74 @@ class IPAClient(object):
                 charset = response_charset
             else:
                 charset = 'latin-1'
-        resp = json.loads(to_text(resp.read(), encoding=charset))
+        return json.loads(to_text(resp.read(), encoding=charset))
+
+    @staticmethod
+    def _unpack_result(result):
+        if 'result' in result:
+            result = result.get('result')
+            if isinstance(result, list):
+                if len(result) > 0:
+                    return result[0]
+                else:
+                    return {}
+        return result
+
+    def _post_json(self, method, name, item=None):
+        if item is None:
+            item = {}
+        if self._batch is not None:
+            self._batch.append((method, name, item))
+            return None
+
+        resp = self._send_json(method, self._json_command(method, name, item))
         err = resp.get('error')
         if err is not None:
             self._fail('response %s' % method, err)
 
         if 'result' in resp:
-            result = resp.get('result')
-            if 'result' in result:
-                result = result.get('result')
-                if isinstance(result, list):
-                    if len(result) > 0:
-                        return result[0]
-                    else:
-                        return {}
-            return result
+            return self._unpack_result(resp.get('result'))
         return None
 
+    def post_json_batch(self, commands):
+        """Runs a list of (method, name, item) commands with a single batch request.
+
+        Returns the result of each command, in order. The module fails with the
+        error of each failed command. Commands are sent one by one if the server
+        does not support the batch method.
+        """
+        if not commands:
+            return []
+        if self._batch_supported:
+            batch = [self._json_command(method, name, item if item is not None else {}) for method, name, item in commands]
+            data = dict(method='batch', params=[batch, {}])
+            resp = self._send_json('batch', data)
+            if resp.get('error') is None:
+                results = resp['result']['results']
+                errors = ['response %s: %s' % (command[0], result.get('error'))
+                          for command, result in zip(commands, results) if result.get('error') is not None]
+                if errors:
+                    self.module.fail_json(msg='; '.join(errors))
+                return [self._unpack_result(result) for result in results]
+            self._batch_supported = False
+        return [self._post_json(method, name, item) for method, name, item in commands]
+
+    @contextmanager
+    def batch(self):
+        """Queues the commands posted within the context and runs them with a
+        single batch request when it exits. Queued commands return None.
+        """
+        if self._batch is not None:
+            yield
+            return
+        self._batch = []
+        try:
+            yield
+            commands = self._batch
+        finally:
+            self._batch = None
+        self.post_json_batch(commands)
+
     def get_diff(self, ipa_data, module_data):
         result = []
         for key in module_data.keys():
@@ -182,23 +236,24 @@ class IPAClient(object):
 
     def modify_if_diff(self, name, ipa_list, module_list, add_method, remove_method, item=None, append=None):
         changed = False
-        diff = list(set(ipa_list) - set(module_list))
-        if append is not True and len(diff) > 0:
-            changed = True
-            if not self.module.check_mode:
-                if item:
-                    remove_method(name=name, item={item: diff})
-                else:
-                    remove_method(name=name, item=diff)
-
-        diff = list(set(module_list) - set(ipa_list))
-        if len(diff) > 0:
-            changed = True
-            if not self.module.check_mode:
-                if item:
-                    add_method(name=name, item={item: diff})
-                else:
-                    add_method(name=name, item=diff)
+        with self.batch():
+            diff = list(set(ipa_list) - set(module_list))
+            if append is not True and len(diff) > 0:
+                changed = True
+                if not self.module.check_mode:
+                    if item:
+                        remove_method(name=name, item={item: diff})
+                    else:
+                        remove_method(name=name, item=diff)
+
+            diff = list(set(module_list) - set(ipa_list))
+            if len(diff) > 0:
+                changed = True
+                if not self.module.check_mode:
+                    if item:
+                        add_method(name=name, item={item: diff})
+                    else:
+                        add_method(name=name, item=diff)
 
         return changed
 
@@ -13,10 +13,14 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import base64
+import binascii
+import fnmatch
 import os
 import hmac
 import re
 
+from ansible.module_utils.common.text.converters import to_bytes, to_text
 from ansible.module_utils.six.moves.urllib.parse import urlparse
 
 try:
@@ -26,6 +30,9 @@ except ImportError:
 
 HASHED_KEY_MAGIC = "|1|"
 
+# Parsed known_hosts files by path, see get_known_hosts_index().
+_KNOWN_HOSTS_INDEXES = {}
+
 
 def is_ssh_url(url):
 
@@ -78,6 +85,106 @@ def check_hostkey(module, fqdn):
     return not not_in_host_file(module, fqdn)
 
 
+class KnownHostsIndex(object):
+
+    """ parsed known_hosts file
+
+    Plain host names are kept in a set, host patterns with wildcards in a
+    list. Hashed entries are decoded once and grouped by salt, so that
+    looking up a host costs one HMAC per distinct salt and a set lookup.
+    """
+
+    def __init__(self, data):
+        self.names = set()
+        self.patterns = []
+        self.hashed = {}
+        self._lookups = {}
+        for line in data.splitlines():
+            tokens = line.split()
+            if len(tokens) < 2 or tokens[0].startswith("#"):
+                continue
+            if tokens[0].startswith("@"):
+                # revoked keys do not make a host known, the hosts of a
+                # certificate authority line are in the second field
+                if tokens[0] != "@cert-authority" or len(tokens) < 3:
+                    continue
+                tokens = tokens[1:]
+            if tokens[0].startswith(HASHED_KEY_MAGIC):
+                self._add_hashed(tokens[0])
+            else:
+                self._add_patterns(tokens[0])
+
+    def _add_hashed(self, entry):
+        try:
+            (kn_salt, kn_host) = entry[len(HASHED_KEY_MAGIC):].split("|", 2)
+            salt = base64.b64decode(kn_salt)
+            digest = base64.b64decode(kn_host)
+        except (ValueError, TypeError, binascii.Error):
+            # invalid hashed host key, skip it
+            return
+        self.hashed.setdefault(salt, set()).add(digest)
+
+    def _add_patterns(self, entry):
+        for pattern in entry.split(","):
+            if not pattern or pattern.startswith("!"):
+                continue
+            # entries for a non-standard port also make the host known
+            if pattern.startswith("[") and "]:" in pattern:
+                pattern = pattern[1:pattern.rindex("]:")]
+            if "*" in pattern or "?" in pattern:
+                self.patterns.append(pattern)
+            else:
+                self.names.add(pattern)
+
+    def has_host(self, host):
+
+        """ check if host has an entry """
+
+        if host not in self._lookups:
+            self._lookups[host] = self._has_host(host)
+        return self._lookups[host]
+
+    def _has_host(self, host):
+        if host in self.names:
+            return True
+        for pattern in self.patterns:
+            if fnmatch.fnmatch(host, pattern):
+                return True
+        b_host = to_bytes(host)
+        for salt, digests in self.hashed.items():
+            if hmac.new(salt, b_host, sha1).digest() in digests:
+                return True
+        return False
+
+
+def get_known_hosts_index(path):
+
+    """ return the parsed known_hosts file at path, or None if it cannot be read
+
+    The index is kept for the life of the process and parsed again when the
+    modification time or size of the file change.
+    """
+
+    try:
+        st = os.stat(path)
+    except OSError:
+        _KNOWN_HOSTS_INDEXES.pop(path, None)
+        return None
+    key = (st.st_mtime, st.st_size)
+    cached = _KNOWN_HOSTS_INDEXES.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    try:
+        with open(path, 'rb') as host_fh:
+            data = to_text(host_fh.read(), errors='surrogate_or_strict')
+    except (IOError, OSError):
+        return None
+    index = KnownHostsIndex(data)
+    _KNOWN_HOSTS_INDEXES[path] = (key, index)
+    return index
+
+
 # this is a variant of code found in connection_plugins/paramiko.py and we should modify
 # the paramiko code to import and use this.
 
@@ -96,46 +203,46 @@ def not_in_host_file(self, host):
         "/etc/openssh/ssh_known_hosts",
     ]
 
-    hfiles_not_found = 0
     for hf in host_file_list:
-        if not os.path.exists(hf):
-            hfiles_not_found += 1
-            continue
+        index = get_known_hosts_index(hf)
+        if index is not None and index.has_host(host):
+            return False
 
-        try:
-            with open(hf) as host_fh:
-                data = host_fh.read()
-        except IOError:
-            hfiles_not_found += 1
-            continue
+    return True
 
-        for line in data.split("\n"):
-            if line is None or " " not in line:
-                continue
-            tokens = line.split()
-            if tokens[0].find(HASHED_KEY_MAGIC) == 0:
-                # this is a hashed known host entry
-                try:
-                    (kn_salt, kn_host) = tokens[0][len(HASHED_KEY_MAGIC):].split("|", 2)
-                    hash = hmac.new(kn_salt.decode('base64'), digestmod=sha1)
-                    hash.update(host)
-                    if hash.digest() == kn_host.decode('base64'):
-                        return False
-                except Exception:
-                    # invalid hashed host key, skip it
-                    continue
-            else:
-                # standard host file entry
-                if host in tokens[0]:
-                    return False
 
-    return True
+def _scanned_hosts(out):
+
+    """ return the lower case names and addresses ssh-keyscan printed keys for """
+
+    hosts = set()
+    for line in out.splitlines():
+        fields = line.split()
+        if not fields or fields[0].startswith("#"):
+            continue
+        for name in fields[0].split(","):
+            if name.startswith("[") and "]:" in name:
+                name = name[1:name.rindex("]:")]
+            hosts.add(name.lower())
+    return hosts
 
 
 def add_host_key(module, fqdn, port=22, key_type="rsa", create_dir=False):
 
     """ use ssh-keyscan to add the hostkey """
 
+    return add_host_keys(module, [(fqdn, port)], key_type=key_type, create_dir=create_dir)
+
+
+def add_host_keys(module, hosts, key_type="rsa", create_dir=False):
+
+    """ use ssh-keyscan to add the hostkeys of a list of (fqdn, port) tuples
+
+    Hosts are scanned with one ssh-keyscan invocation per distinct port. As
+    ssh-keyscan succeeds as long as one host answers, the keys found are added
+    and the module fails if any of the hosts scanned together did not answer.
+    """
+
     keyscan_cmd = module.get_bin_path('ssh-keyscan', True)
 
     if 'USER' in os.environ:
@@ -157,25 +264,48 @@ def add_host_key(module, fqdn, port=22, key_type="rsa", create_dir=False):
     elif not os.path.isdir(user_ssh_dir):
         module.fail_json(msg="%s is not a directory" % user_ssh_dir)
 
-    if port:
-        this_cmd = "%s -t %s -p %s %s" % (keyscan_cmd, key_type, port, fqdn)
-    else:
-        this_cmd = "%s -t %s %s" % (keyscan_cmd, key_type, fqdn)
-
-    rc, out, err = module.run_command(this_cmd)
-    # ssh-keyscan gives a 0 exit code and prints nothing on timeout
-    if rc != 0 or not out:
-        msg = 'failed to retrieve hostkey'
-        if not out:
-            msg += '. "%s" returned no matches.' % this_cmd
+    fqdns_by_port = {}
+    ports = []
+    for fqdn, port in hosts:
+        if port not in fqdns_by_port:
+            fqdns_by_port[port] = []
+            ports.append(port)
+        if fqdn not in fqdns_by_port[port]:
+            fqdns_by_port[port].append(fqdn)
+
+    outs = []
+    errs = []
+    for port in ports:
+        if port:
+            this_cmd = "%s -t %s -p %s %s" % (keyscan_cmd, key_type, port, " ".join(fqdns_by_port[port]))
         else:
-            msg += ' using command "%s". [stdout]: %s' % (this_cmd, out)
+            this_cmd = "%s -t %s %s" % (keyscan_cmd, key_type, " ".join(fqdns_by_port[port]))
+
+        rc, out, err = module.run_command(this_cmd)
+        # ssh-keyscan gives a 0 exit code and prints nothing on timeout
+        if rc != 0 or not out:
+            msg = 'failed to retrieve hostkey'
+            if not out:
+                msg += '. "%s" returned no matches.' % this_cmd
+            else:
+                msg += ' using command "%s". [stdout]: %s' % (this_cmd, out)
+
+            if err:
+                msg += ' [stderr]: %s' % err
 
-        if err:
-            msg += ' [stderr]: %s' % err
+            module.fail_json(msg=msg)
 
-        module.fail_json(msg=msg)
+        module.append_to_file(user_host_file, out)
+        outs.append(out)
+        errs.append(err)
 
-    module.append_to_file(user_host_file, out)
+        if len(fqdns_by_port[port]) > 1:
+            scanned = _scanned_hosts(out)
+            missing = [fqdn for fqdn in fqdns_by_port[port] if fqdn.strip("[]").lower() not in scanned]
+            if missing:
+                msg = 'failed to retrieve hostkey of %s. "%s" returned no matches for them.' % (", ".join(missing), this_cmd)
+                if err:
+                    msg += ' [stderr]: %s' % err
+                module.fail_json(msg=msg)
 
-    return rc, out, err
+    return rc, ''.join(outs), ''.join(errs)
@@ -29,6 +29,9 @@ try:
 except ImportError:
     HAS_LDAP = False
 
+# Number of DNs selected by the filter of one search of LdapGeneric.search_entries()
+BULK_SEARCH_CHUNK = 500
+
 
 def gen_specs(**specs):
     specs.update({
@@ -53,6 +56,29 @@ def ldap_required_together():
     return [['client_cert', 'client_key']]
 
 
+def normalize_dn(dn):
+    """ Returns a case insensitive representation of dn for comparisons. """
+    return tuple(
+        tuple(sorted((attr.lower(), value.lower()) for attr, value, dummy in rdn))
+        for rdn in ldap.dn.str2dn(dn))
+
+
+def dn_depth(dn):
+    """ Returns the number of RDNs of dn. """
+    return len(ldap.dn.str2dn(dn))
+
+
+def _rdn_filter(dn):
+    """ Returns a filter matching the entries with the same RDN as dn. """
+    assertions = [
+        "(%s=%s)" % (attr, ldap.filter.escape_filter_chars(value))
+        for attr, value, dummy in ldap.dn.str2dn(dn)[0]]
+
+    if len(assertions) == 1:
+        return assertions[0]
+    return "(&%s)" % ''.join(assertions)
+
+
 class LdapGeneric(object):
     def __init__(self, module):
         # Shortcuts
@@ -137,6 +163,69 @@ class LdapGeneric(object):
 
         return connection
 
+    def search_entries(self, dns, attrlist):
+        """ Reads the entries with the given DNs below self.dn.
+
+        Instead of one base search per DN, this runs subtree searches below
+        self.dn with filters selecting BULK_SEARCH_CHUNK RDNs at a time.
+        Returns a dict mapping normalize_dn() of each entry found to its
+        (dn, attributes) tuple. Attribute names are lower case. """
+        wanted = set(normalize_dn(dn) for dn in dns)
+        filters = sorted(set(_rdn_filter(dn) for dn in dns))
+        entries = {}
+
+        for start in range(0, len(filters), BULK_SEARCH_CHUNK):
+            filterstr = "(|%s)" % ''.join(filters[start:start + BULK_SEARCH_CHUNK])
+            try:
+                results = self.connection.search_s(self.dn, ldap.SCOPE_SUBTREE, filterstr, attrlist)
+            except ldap.NO_SUCH_OBJECT:
+                results = []
+            except ldap.LDAPError as e:
+                self.fail("Cannot search for entries below %s" % self.dn, e)
+
+            for dn, attrs in results:
+                # Skip search references
+                if dn is None:
+                    continue
+                key = normalize_dn(dn)
+                if key in wanted:
+                    entries[key] = (dn, dict((name.lower(), values) for name, values in attrs.items()))
+
+        return entries
+
+    def run_operations(self, operations, pipeline_depth=1):
+        """ Runs a list of (operation, dn, args) tuples on the connection,
+        where operation is one of add, modify or delete.
+
+        With pipeline_depth 1, each operation is run synchronously. Otherwise
+        up to pipeline_depth asynchronous operations are sent before waiting
+        for the result of the oldest one. All operations are run, the error of
+        each failed one is returned in a dict by DN. """
+        errors = {}
+        pending = []
+
+        def collect(msgid, dn):
+            try:
+                self.connection.result3(msgid)
+            except ldap.LDAPError as e:
+                errors[dn] = to_native(e)
+
+        for operation, dn, args in operations:
+            try:
+                if pipeline_depth <= 1:
+                    getattr(self.connection, "%s_s" % operation)(dn, *args)
+                    continue
+                if len(pending) >= pipeline_depth:
+                    collect(*pending.pop(0))
+                pending.append((getattr(self.connection, "%s_ext" % operation)(dn, *args), dn))
+            except ldap.LDAPError as e:
+                errors[dn] = to_native(e)
+
+        for msgid, dn in pending:
+            collect(msgid, dn)
+
+        return errors
+
     def _xorder_dn(self):
         # match X_ORDERed DNs
         regex = r".+\{\d+\}.+"
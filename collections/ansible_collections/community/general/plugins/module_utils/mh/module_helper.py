@@ -27,6 +27,7 @@ class ModuleHelper(DeprecateAttrsMixin, ModuleHelperBase):
     change_params = ()
     facts_params = ()
     use_old_vardict = True      # remove in 11.0.0
+    vardict_copy_on_write = False
     mute_vardict_deprecation = False
 
     def __init__(self, module=None):
@@ -41,7 +42,7 @@ class ModuleHelper(DeprecateAttrsMixin, ModuleHelperBase):
                     version="11.0.0", collection_name="community.general"
                 )
         else:
-            self.vars = _NewVarDict()
+            self.vars = _NewVarDict(copy_on_write=self.vardict_copy_on_write)
             super(ModuleHelper, self).__init__(module)
 
         for name, value in self.module.params.items():
@@ -77,6 +78,9 @@ class ModuleHelper(DeprecateAttrsMixin, ModuleHelperBase):
     @property
     def output(self):
         result = dict(self.vars.output())
+        runner_stats = getattr(getattr(self, 'runner', None), 'stats', None)
+        if runner_stats:
+            result['cmd_runner_stats'] = runner_stats
         if self.facts_name:
             facts = self.vars.facts()
             if facts is not None:
@@ -8,7 +8,7 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import traceback
-from time import sleep
+from time import sleep, time
 
 PROXMOXER_IMP_ERR = None
 try:
@@ -72,6 +72,10 @@ def ansible_to_proxmox_bool(value):
 class ProxmoxAnsible(object):
     """Base class for Proxmox modules"""
     TASK_TIMED_OUT = 'timeout expired'
+    # Task status polls start fast, as most tasks finish within a second,
+    # and back off exponentially for long running ones
+    TASK_POLL_INTERVAL = 0.1
+    TASK_POLL_MAX_INTERVAL = 2.0
 
     def __init__(self, module):
         if not HAS_PROXMOXER:
@@ -79,7 +83,10 @@ class ProxmoxAnsible(object):
 
         self.module = module
         self.proxmoxer_version = proxmoxer_version
+        self._vms_by_id = None
+        self._vms_by_name = None
         self.proxmox_api = self._connect()
+        self._invalidate_resources_on_change()
         # Test token validity
         try:
             self.proxmox_api.version.get()
@@ -113,6 +120,44 @@ class ProxmoxAnsible(object):
         except Exception as e:
             self.module.fail_json(msg='%s' % e, exception=traceback.format_exc())
 
+    def _invalidate_resources_on_change(self):
+        """Drop the cluster resource index whenever a request other than GET is sent,
+        as any of them can create, remove, rename or migrate guests.
+
+        All resources derived from the ProxmoxAPI object share its session,
+        so wrapping the session's request method covers them all.
+        """
+        store = getattr(self.proxmox_api, '_store', None)
+        session = store.get('session') if isinstance(store, dict) else None
+        if session is None or not callable(getattr(session, 'request', None)):
+            return
+        request = session.request
+
+        def request_and_invalidate(method, *args, **kwargs):
+            try:
+                return request(method, *args, **kwargs)
+            finally:
+                if method.upper() != 'GET':
+                    self.invalidate_resources()
+
+        session.request = request_and_invalidate
+
+    def invalidate_resources(self):
+        """Forget the cluster resource index, so that the next lookup fetches it again."""
+        self._vms_by_id = None
+        self._vms_by_name = None
+
+    def _index_resources(self):
+        """Fetch the guests of the cluster once and index them by vmid and by name."""
+        if self._vms_by_id is None:
+            vms = self.proxmox_api.cluster.resources.get(type='vm')
+            self._vms_by_id = {}
+            self._vms_by_name = {}
+            for vm in vms:
+                self._vms_by_id.setdefault(int(vm['vmid']), vm)
+                self._vms_by_name.setdefault(vm.get('name'), []).append(vm)
+        return self._vms_by_id, self._vms_by_name
+
     def version(self):
         try:
             apiversion = self.proxmox_api.version.get()
@@ -135,7 +180,7 @@ class ProxmoxAnsible(object):
 
     def get_vmid(self, name, ignore_missing=False, choose_first_if_multiple=False):
         try:
-            vms = [vm['vmid'] for vm in self.proxmox_api.cluster.resources.get(type='vm') if vm.get('name') == name]
+            vms = [vm['vmid'] for vm in self._index_resources()[1].get(name, [])]
         except Exception as e:
             self.module.fail_json(msg='Unable to retrieve list of VMs filtered by name %s: %s' % (name, e))
 
@@ -151,12 +196,12 @@ class ProxmoxAnsible(object):
 
     def get_vm(self, vmid, ignore_missing=False):
         try:
-            vms = [vm for vm in self.proxmox_api.cluster.resources.get(type='vm') if vm['vmid'] == int(vmid)]
+            vm = self._index_resources()[0].get(int(vmid))
         except Exception as e:
             self.module.fail_json(msg='Unable to retrieve list of VMs filtered by vmid %s: %s' % (vmid, e))
 
-        if vms:
-            return vms[0]
+        if vm:
+            return vm
         else:
             if ignore_missing:
                 return None
@@ -187,23 +232,49 @@ class ProxmoxAnsible(object):
         :param timeout: Timeout in seconds to wait for the task to complete.
         :return: Task completion status (True/False) and ``exitstatus`` message when status=False.
         """
-        status = {}
-        while timeout:
-            try:
-                status = self.proxmox_api.nodes(node_name).tasks(task_id).status.get()
-            except Exception as e:
-                self.module.fail_json(msg='Unable to retrieve API task ID from node %s: %s' % (node_name, e))
-
-            if status['status'] == 'stopped':
-                if status['exitstatus'] == 'OK':
-                    return True, None
-                else:
-                    return False, status['exitstatus']
-            else:
-                timeout -= 1
-                if timeout <= 0:
-                    return False, ProxmoxAnsible.TASK_TIMED_OUT
-                sleep(1)
+        return self.api_tasks_complete([(node_name, task_id)], timeout)[task_id]
+
+    def api_tasks_complete(self, tasks, timeout):
+        """Wait until all tasks stop or the timeout expires.
+
+        The tasks are polled in rounds, the interval between rounds starts at
+        TASK_POLL_INTERVAL and doubles up to TASK_POLL_MAX_INTERVAL.
+
+        :param tasks: list of (node name, task ID) tuples.
+        :param timeout: Timeout in seconds to wait for all tasks to complete.
+        :return: dict mapping each task ID to its completion status and ``exitstatus`` message,
+                 as returned by api_task_complete().
+        """
+        pending = dict((task_id, node_name) for node_name, task_id in tasks)
+        results = {}
+        deadline = time() + timeout
+        interval = self.TASK_POLL_INTERVAL
+        while pending:
+            for task_id, node_name in list(pending.items()):
+                try:
+                    status = self.proxmox_api.nodes(node_name).tasks(task_id).status.get()
+                except Exception as e:
+                    self.module.fail_json(msg='Unable to retrieve API task ID from node %s: %s' % (node_name, e))
+
+                if status['status'] == 'stopped':
+                    del pending[task_id]
+                    if status['exitstatus'] == 'OK':
+                        results[task_id] = (True, None)
+                    else:
+                        results[task_id] = (False, status['exitstatus'])
+
+            remaining = deadline - time()
+            if pending and remaining <= 0:
+                for task_id in pending:
+                    results[task_id] = (False, ProxmoxAnsible.TASK_TIMED_OUT)
+                break
+            if pending:
+                sleep(min(interval, remaining))
+                interval = min(interval * 2, self.TASK_POLL_MAX_INTERVAL)
+
+        # finished tasks may have created, removed or migrated guests
+        self.invalidate_resources()
+        return results
 
     def get_pool(self, poolid):
         """Retrieve pool information
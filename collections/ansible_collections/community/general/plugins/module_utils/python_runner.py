@@ -14,7 +14,7 @@ from ansible_collections.community.general.plugins.module_utils.cmd_runner impor
 class PythonRunner(CmdRunner):
     def __init__(self, module, command, arg_formats=None, default_args_order=(),
                  check_rc=False, force_lang="C", path_prefix=None, environ_update=None,
-                 python="python", venv=None):
+                 python="python", venv=None, collect_stats=None):
         self.python = python
         self.venv = venv
         self.has_venv = venv is not None
@@ -33,4 +33,4 @@ class PythonRunner(CmdRunner):
         python_cmd = [self.python] + _ensure_list(command)
 
         super(PythonRunner, self).__init__(module, python_cmd, arg_formats, default_args_order,
-                                           check_rc, force_lang, path_prefix, environ_update)
+                                           check_rc, force_lang, path_prefix, environ_update, collect_stats)
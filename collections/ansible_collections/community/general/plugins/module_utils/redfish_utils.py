@@ -6,24 +6,39 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+import base64
+import copy
+import functools
 import json
 import os
 import random
+import socket
+import ssl
 import string
 import gzip
+import hashlib
+import threading
 import time
 from io import BytesIO
-from ansible.module_utils.urls import open_url
+from ansible.module_utils.urls import open_url, make_context
 from ansible.module_utils.common.text.converters import to_native
 from ansible.module_utils.common.text.converters import to_text
 from ansible.module_utils.common.text.converters import to_bytes
 from ansible.module_utils.six import text_type
 from ansible.module_utils.six.moves import http_client
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
-from ansible.module_utils.six.moves.urllib.parse import urlparse
+from ansible.module_utils.six.moves.urllib.parse import urlparse, urljoin
+from ansible.module_utils.six.moves.urllib.request import getproxies, proxy_bypass
 from ansible.module_utils.ansible_release import __version__ as ansible_version
 from ansible_collections.community.general.plugins.module_utils.version import LooseVersion
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+    HAS_THREAD_POOL = True
+except ImportError:
+    # Python 2.7 without the futures backport: collections are walked sequentially
+    HAS_THREAD_POOL = False
+
 GET_HEADERS = {'accept': 'application/json', 'OData-Version': '4.0'}
 POST_HEADERS = {'content-type': 'application/json', 'accept': 'application/json',
                 'OData-Version': '4.0'}
@@ -51,8 +66,289 @@ REDFISH_COMMON_ARGUMENT_SPEC = {
         "type": "list",
         "elements": "str",
     },
+    "keep_alive": {
+        "type": "bool",
+        "default": False,
+    },
+    "response_cache": {
+        "type": "bool",
+        "default": False,
+    },
+    "expand_collections": {
+        "type": "bool",
+        "default": False,
+    },
+    "workers": {
+        "type": "int",
+        "default": 1,
+    },
 }
 
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+
+class _SessionResponse(object):
+    """Response of a request sent through a _KeepAliveSession.
+
+    The body is read as soon as the response arrives, so that the connection can serve the next request.
+    The interface is the part of the open_url() response used by RedfishUtils.
+    """
+
+    def __init__(self, url, status, reason, headers, body):
+        self.url = url
+        self.status = self.code = status
+        self.reason = reason
+        self.headers = headers
+        self._body = BytesIO(body)
+
+    def read(self, amt=None):
+        return self._body.read() if amt is None else self._body.read(amt)
+
+    def info(self):
+        return self.headers
+
+    def getcode(self):
+        return self.status
+
+    def geturl(self):
+        return self.url
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+
+class _KeepAliveSession(object):
+    """Keeps the HTTP connections to the service open between requests.
+
+    Idle connections are pooled per scheme and host, so requests sent from several
+    threads each use their own connection. Requests going through a proxy, and
+    anything else this class does not handle, are left to open_url().
+    """
+
+    max_redirects = 10
+
+    def __init__(self, validate_certs, ca_path, ciphers):
+        self.validate_certs = validate_certs
+        self.ca_path = ca_path
+        self.ciphers = ciphers
+        self._context = None
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def handles(self, uri, use_proxy=True):
+        parsed = urlparse(uri)
+        if parsed.scheme not in ('http', 'https'):
+            return False
+        if use_proxy and parsed.scheme in getproxies() and not proxy_bypass(parsed.hostname):
+            return False
+        return True
+
+    def _connect(self, scheme, netloc, timeout):
+        if scheme == 'https':
+            if self._context is None:
+                self._context = make_context(cafile=self.ca_path, ciphers=self.ciphers,
+                                             validate_certs=self.validate_certs)
+            return http_client.HTTPSConnection(netloc, timeout=timeout, context=self._context)
+        return http_client.HTTPConnection(netloc, timeout=timeout)
+
+    def _acquire(self, scheme, netloc, timeout):
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            conn = idle.pop() if idle else None
+        if conn is None:
+            return self._connect(scheme, netloc, timeout), False
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def _release(self, scheme, netloc, conn):
+        with self._lock:
+            self._idle.setdefault((scheme, netloc), []).append(conn)
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+    def open(self, uri, method='GET', data=None, headers=None, url_username=None, url_password=None,
+             force_basic_auth=False, timeout=10, follow_redirects='all', **kwargs):
+        headers = dict(headers or {})
+        headers.setdefault('User-Agent', 'ansible-httpget')
+        if force_basic_auth and url_username is not None:
+            credentials = to_bytes('%s:%s' % (url_username, url_password or ''), errors='surrogate_or_strict')
+            headers['Authorization'] = 'Basic %s' % to_native(base64.b64encode(credentials))
+        if data is not None and not hasattr(data, 'read'):
+            data = to_bytes(data, errors='surrogate_or_strict')
+
+        for dummy in range(self.max_redirects + 1):
+            status, reason, resp_headers, body = self._send(uri, method, data, headers, timeout)
+            location = resp_headers.get('location')
+            if status not in REDIRECT_CODES or not location or follow_redirects not in ('all', 'yes', True):
+                break
+            uri = urljoin(uri, location)
+            if status == 303 or (status in (301, 302) and method == 'POST'):
+                method, data = 'GET', None
+            elif hasattr(data, 'seek'):
+                data.seek(0)
+        if status >= 300:
+            raise HTTPError(uri, status, reason, resp_headers, BytesIO(body))
+        return _SessionResponse(uri, status, reason, resp_headers, body)
+
+    def _send(self, uri, method, data, headers, timeout):
+        parsed = urlparse(uri)
+        path = parsed.path or '/'
+        if parsed.query:
+            path += '?' + parsed.query
+
+        conn, reused = self._acquire(parsed.scheme, parsed.netloc, timeout)
+        try:
+            try:
+                conn.request(method, path, body=data, headers=headers)
+                resp = conn.getresponse()
+            except (http_client.BadStatusLine, http_client.CannotSendRequest, socket.error) as e:
+                if not reused or isinstance(e, socket.timeout):
+                    raise
+                # The service closed the idle connection; send the request again on a new one
+                conn.close()
+                if hasattr(data, 'seek'):
+                    data.seek(0)
+                conn = self._connect(parsed.scheme, parsed.netloc, timeout)
+                conn.request(method, path, body=data, headers=headers)
+                resp = conn.getresponse()
+            body = resp.read()
+        except (http_client.HTTPException, socket.error, ssl.SSLError) as e:
+            conn.close()
+            raise URLError(e)
+
+        resp_headers = resp.msg
+        if resp_headers.get('content-encoding') == 'gzip':
+            body = gzip.GzipFile(fileobj=BytesIO(body)).read()
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(parsed.scheme, parsed.netloc, conn)
+        return resp.status, resp.reason, resp_headers, body
+
+
+class _MultipartStream(object):
+    """Streaming multipart/form-data body with the same layout as RedfishUtils._prepare_multipart().
+
+    Parts without a ``content`` are read from their ``filename`` while the body is sent,
+    so an image is never held in memory as a whole. The length of the body is known up
+    front for the Content-Length header. If ``hash_algorithm`` is given, the content of
+    the files is hashed in the same pass; see hexdigest().
+    """
+
+    def __init__(self, fields, boundary=None, hash_algorithm=None):
+        if boundary is None:
+            boundary = ''.join(random.choice(string.digits + string.ascii_letters) for i in range(30))
+        self.boundary = boundary
+        self.content_type = 'multipart/form-data; boundary=' + boundary
+        self._hash_algorithm = hash_algorithm
+
+        # Each segment is either bytes, or a (path, size) tuple for a file read when sending
+        self._segments = []
+        b_boundary = to_bytes('--' + boundary)
+        for form in fields:
+            field = fields[form]
+            if 'filename' in field:
+                name = os.path.basename(field['filename']).replace('"', '\\"')
+                disposition = u'Content-Disposition: form-data; name="%s"; filename="%s"' % (to_text(form), to_text(name))
+            else:
+                disposition = 'Content-Disposition: form-data; name="%s"' % form
+            header = b'\r\n'.join([b_boundary, to_bytes(disposition, encoding='utf-8'),
+                                   to_bytes('Content-Type: %s' % field['mime_type'], encoding='utf-8'), b'', b''])
+            self._segments.append(header)
+            if 'content' in field:
+                content = field['content']
+                if isinstance(content, text_type):
+                    content = to_bytes(content, encoding='utf-8')
+                elif isinstance(content, dict):
+                    content = to_bytes(json.dumps(content), encoding='utf-8')
+                self._segments.append(content)
+            else:
+                path = to_bytes(field['filename'], errors='surrogate_or_strict')
+                self._segments.append((path, os.path.getsize(path)))
+            self._segments.append(b'\r\n')
+        self._segments.append(b_boundary + b'--\r\n')
+
+        self.length = sum(segment[1] if isinstance(segment, tuple) else len(segment) for segment in self._segments)
+        self.seek(0)
+
+    def seek(self, offset, whence=0):
+        """Rewind the body, so that it can be sent again. Only rewinding to the start is supported."""
+        if offset != 0 or whence != 0:
+            raise IOError('A multipart body can only be rewound to its start')
+        self.close()
+        self._index = 0
+        self._offset = 0
+        self._file = None
+        self._hash = hashlib.new(self._hash_algorithm) if self._hash_algorithm else None
+
+    def close(self):
+        if getattr(self, '_file', None) is not None:
+            self._file.close()
+            self._file = None
+
+    def hexdigest(self):
+        """Return the hash of the files sent so far."""
+        return self._hash.hexdigest() if self._hash is not None else None
+
+    def _read_segment(self, size):
+        segment = self._segments[self._index]
+        if not isinstance(segment, tuple):
+            chunk = segment[self._offset:self._offset + size]
+            self._offset += len(chunk)
+            return chunk, self._offset >= len(segment)
+
+        path, file_size = segment
+        if self._file is None:
+            self._file = open(path, 'rb')
+        chunk = self._file.read(min(size, file_size - self._offset))
+        if not chunk and self._offset < file_size:
+            raise IOError('%s changed while it was being sent' % to_native(path))
+        self._offset += len(chunk)
+        if self._hash is not None:
+            self._hash.update(chunk)
+        if self._offset >= file_size:
+            self.close()
+            return chunk, True
+        return chunk, False
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.length
+        chunks = []
+        while size > 0 and self._index < len(self._segments):
+            chunk, done = self._read_segment(size)
+            chunks.append(chunk)
+            size -= len(chunk)
+            if done:
+                self._index += 1
+                self._offset = 0
+        return b''.join(chunks)
+
+
+def _drops_unused_prefetches(method):
+    """Decorates the methods of RedfishUtils which call _prefetch().
+
+    The responses they prefetched but did not read, for example because they returned early on
+    an error, are dropped when they return, so that later lookups GET these resources again.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        prefetched_before = set(self._prefetched)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            for uri in list(self._prefetched):
+                if uri not in prefetched_before:
+                    del self._prefetched[uri]
+    return wrapper
+
 
 class RedfishUtils(object):
 
@@ -72,6 +368,20 @@ class RedfishUtils(object):
         self._vendor = None
         self.validate_certs = module.params.get("validate_certs", False)
         self.ca_path = module.params.get("ca_path")
+        self._session = None
+        if module.params.get("keep_alive"):
+            self._session = _KeepAliveSession(self.validate_certs, self.ca_path, self.ciphers)
+        # Responses kept for the module run: the service root, and resources with an ETag that are revalidated
+        self.response_cache = module.params.get("response_cache", False)
+        self._responses = {}
+        # Members received in expanded collections, handed out once by get_request()
+        self.expand_collections = module.params.get("expand_collections", False)
+        self._expand_query = None
+        self._expanded_members = {}
+        # Collection members read ahead in parallel, handed out once by get_request()
+        self.workers = max(module.params.get("workers") or 1, 1)
+        self._request_slots = threading.BoundedSemaphore(self.workers)
+        self._prefetched = {}
 
     def _auth_params(self, headers):
         """
@@ -156,15 +466,105 @@ class RedfishUtils(object):
         kwargs.setdefault("timeout", self.timeout)
         kwargs.setdefault("ciphers", self.ciphers)
         kwargs.setdefault("ca_path", self.ca_path)
-        resp = open_url(uri, **kwargs)
+        if kwargs.get("method", "GET") != "GET":
+            # Anything read before a modification may be outdated now
+            self._forget_responses()
+        with self._request_slots:
+            if self._session is not None and self._session.handles(uri, kwargs["use_proxy"]):
+                resp = self._session.open(uri, **kwargs)
+            else:
+                resp = open_url(uri, **kwargs)
         headers = {k.lower(): v for (k, v) in resp.info().items()}
         return resp, headers
 
+    def _forget_responses(self, uri=None):
+        if uri is None:
+            self._expanded_members.clear()
+            self._prefetched.clear()
+            self._responses = dict((k, v) for k, v in self._responses.items()
+                                   if k == self.root_uri + self.service_root)
+        else:
+            self._expanded_members.pop(uri, None)
+            self._prefetched.pop(uri, None)
+            self._responses.pop(uri, None)
+
+    def _prefetch(self, uris):
+        """GET the resources at ``uris`` in parallel, with at most O(workers) requests to the service at a time.
+
+        The responses, failed ones included, are kept for the next get_request() of each URI.
+        Code that walks the members of a collection one after the other thus gets the same
+        results in the same order, without waiting for each request in turn.
+        """
+        if self.workers < 2 or not HAS_THREAD_POOL:
+            return
+        uris = [uri for uri in dict.fromkeys(uris) if uri not in self._expanded_members and uri not in self._prefetched]
+        if len(uris) < 2:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(uris))) as executor:
+            for uri, response in zip(uris, executor.map(self.get_request, uris)):
+                self._prefetched[uri] = response
+
+    def _prefetch_members(self, members):
+        self._prefetch([self.root_uri + member[u'@odata.id'] for member in members or []
+                        if isinstance(member, dict) and u'@odata.id' in member])
+
+    def _get_expand_query(self):
+        """Return the $expand query that lists collection members inline, or an empty string."""
+        if self._expand_query is None:
+            self._expand_query = ''
+            response = self.get_request(self.root_uri + self.service_root)
+            if response['ret']:
+                expand = response['data'].get('ProtocolFeaturesSupported', {}).get('ExpandQuery', {})
+                if expand.get('NoLinks'):
+                    self._expand_query = '.'
+                elif expand.get('ExpandAll'):
+                    self._expand_query = '*'
+                if self._expand_query and expand.get('Levels'):
+                    self._expand_query += '($levels=1)'
+        return self._expand_query
+
+    def get_collection_request(self, uri):
+        """GET a resource collection.
+
+        With O(expand_collections), and if the service supports $expand, the members are
+        requested inline. They are remembered so that the next get_request() of each member
+        is answered without contacting the service again. The returned data is the same as
+        the one of get_request().
+        """
+        expand_query = self._get_expand_query() if self.expand_collections else ''
+        if expand_query:
+            response = self.get_request(uri + ('&' if '?' in uri else '?') + '$expand=' + expand_query)
+            if response['ret'] and isinstance(response['data'].get('Members'), list):
+                for member in response['data']['Members']:
+                    if len(member) > 1 and '@odata.id' in member:
+                        self._expanded_members[self.root_uri + member['@odata.id']] = member
+                return response
+        return self.get_request(uri)
+
+    def _get_request_with_headers(self, uri):
+        """GET a resource whose response headers, such as ETag or Allow, are needed.
+
+        Members received in an expanded collection come without headers, so they are requested again.
+        """
+        self._expanded_members.pop(uri, None)
+        return self.get_request(uri)
+
     # The following functions are to send GET/POST/PATCH/DELETE requests
     def get_request(self, uri, override_headers=None, allow_no_resp=False, timeout=None):
+        if uri in self._prefetched and not override_headers:
+            return self._prefetched.pop(uri)
+        if uri in self._expanded_members and not override_headers:
+            return {'ret': True, 'data': self._expanded_members.pop(uri), 'headers': {}, 'resp': None}
+        cached = None
+        if self.response_cache and not override_headers:
+            cached = self._responses.get(uri)
+            if cached is not None and uri == self.root_uri + self.service_root:
+                return dict(cached, data=copy.deepcopy(cached['data']))
         req_headers = dict(GET_HEADERS)
         if override_headers:
             req_headers.update(override_headers)
+        if cached is not None:
+            req_headers['If-None-Match'] = cached['headers']['etag']
         username, password, basic_auth = self._auth_params(req_headers)
         if timeout is None:
             timeout = self.timeout
@@ -195,6 +595,9 @@ class RedfishUtils(object):
                 if not allow_no_resp:
                     raise
         except HTTPError as e:
+            if e.code == 304 and cached is not None:
+                # Not modified since it was cached
+                return dict(cached, data=copy.deepcopy(cached['data']))
             msg, data = self._get_extended_message(e)
             return {'ret': False,
                     'msg': "HTTP Error %s on GET request to '%s', extended message: '%s'"
@@ -207,7 +610,11 @@ class RedfishUtils(object):
         except Exception as e:
             return {'ret': False,
                     'msg': "Failed GET request to '%s': '%s'" % (uri, to_text(e))}
-        return {'ret': True, 'data': data, 'headers': headers, 'resp': resp}
+        response = {'ret': True, 'data': data, 'headers': headers, 'resp': resp}
+        if self.response_cache and not override_headers and data is not None:
+            if headers.get('etag') or uri == self.root_uri + self.service_root:
+                self._responses[uri] = dict(response, data=copy.deepcopy(data))
+        return response
 
     def post_request(self, uri, pyld, multipart=False):
         req_headers = dict(POST_HEADERS)
@@ -219,10 +626,11 @@ class RedfishUtils(object):
             if self.sessions_uri is not None and uri == (self.root_uri + self.sessions_uri):
                 basic_auth = False
             if multipart:
-                # Multipart requests require special handling to encode the request body
-                multipart_encoder = self._prepare_multipart(pyld)
-                data = multipart_encoder[0]
-                req_headers['content-type'] = multipart_encoder[1]
+                # Multipart requests require special handling to encode the request body;
+                # files are streamed from disk while the request is sent
+                data = _MultipartStream(pyld)
+                req_headers['content-type'] = data.content_type
+                req_headers['content-length'] = str(data.length)
             else:
                 data = json.dumps(pyld)
             resp, headers = self._request(
@@ -256,6 +664,8 @@ class RedfishUtils(object):
 
     def patch_request(self, uri, pyld, check_pyld=False):
         req_headers = dict(PATCH_HEADERS)
+        # The ETag sent in If-Match must come from the service, not from an expanded collection
+        self._forget_responses(uri)
         r = self.get_request(uri)
         if r['ret']:
             # Get etag from etag header or @odata.etag property
@@ -307,6 +717,8 @@ class RedfishUtils(object):
 
     def put_request(self, uri, pyld):
         req_headers = dict(PUT_HEADERS)
+        # The ETag sent in If-Match must come from the service, not from an expanded collection
+        self._forget_responses(uri)
         r = self.get_request(uri)
         if r['ret']:
             # Get etag from etag header or @odata.etag property
@@ -539,7 +951,7 @@ class RedfishUtils(object):
         data = response['data']
         if 'Systems' not in data:
             return {'ret': False, 'msg': "Systems resource not found"}
-        response = self.get_request(self.root_uri + data['Systems']['@odata.id'])
+        response = self.get_collection_request(self.root_uri + data['Systems']['@odata.id'])
         if response['ret'] is False:
             return response
         self.systems_uris = [
@@ -590,7 +1002,7 @@ class RedfishUtils(object):
         if 'Chassis' not in data:
             return {'ret': False, 'msg': "Chassis resource not found"}
         chassis = data["Chassis"]["@odata.id"]
-        response = self.get_request(self.root_uri + chassis)
+        response = self.get_collection_request(self.root_uri + chassis)
         if response['ret'] is False:
             return response
         self.chassis_uris = [
@@ -619,7 +1031,7 @@ class RedfishUtils(object):
         if 'Managers' not in data:
             return {'ret': False, 'msg': "Manager resource not found"}
         manager = data["Managers"]["@odata.id"]
-        response = self.get_request(self.root_uri + manager)
+        response = self.get_collection_request(self.root_uri + manager)
         if response['ret'] is False:
             return response
         self.manager_uris = [
@@ -792,6 +1204,7 @@ class RedfishUtils(object):
     def aggregate_systems(self, func):
         return self.aggregate(func, self.systems_uris, 'system_uri')
 
+    @_drops_unused_prefetches
     def get_storage_controller_inventory(self, systems_uri):
         result = {}
         controller_list = []
@@ -814,7 +1227,7 @@ class RedfishUtils(object):
 
         # Get a list of all storage controllers and build respective URIs
         storage_uri = data['Storage']["@odata.id"]
-        response = self.get_request(self.root_uri + storage_uri)
+        response = self.get_collection_request(self.root_uri + storage_uri)
         if response['ret'] is False:
             return response
         result['ret'] = True
@@ -823,6 +1236,7 @@ class RedfishUtils(object):
         # Loop through Members and their StorageControllers
         # and gather properties from each StorageController
         if data[u'Members']:
+            self._prefetch_members(data[u'Members'])
             for storage_member in data[u'Members']:
                 storage_member_uri = storage_member[u'@odata.id']
                 response = self.get_request(self.root_uri + storage_member_uri)
@@ -831,13 +1245,14 @@ class RedfishUtils(object):
                 if key in data:
                     controllers_uri = data[key][u'@odata.id']
 
-                    response = self.get_request(self.root_uri + controllers_uri)
+                    response = self.get_collection_request(self.root_uri + controllers_uri)
                     if response['ret'] is False:
                         return response
                     result['ret'] = True
                     data = response['data']
 
                     if data[u'Members']:
+                        self._prefetch_members(data[u'Members'])
                         for controller_member in data[u'Members']:
                             controller_member_uri = controller_member[u'@odata.id']
                             response = self.get_request(self.root_uri + controller_member_uri)
@@ -867,6 +1282,7 @@ class RedfishUtils(object):
     def get_multi_storage_controller_inventory(self):
         return self.aggregate_systems(self.get_storage_controller_inventory)
 
+    @_drops_unused_prefetches
     def get_disk_inventory(self, systems_uri):
         result = {'entries': []}
         controller_list = []
@@ -891,7 +1307,7 @@ class RedfishUtils(object):
         if 'Storage' in data:
             # Get a list of all storage controllers and build respective URIs
             storage_uri = data[u'Storage'][u'@odata.id']
-            response = self.get_request(self.root_uri + storage_uri)
+            response = self.get_collection_request(self.root_uri + storage_uri)
             if response['ret'] is False:
                 return response
             result['ret'] = True
@@ -900,6 +1316,7 @@ class RedfishUtils(object):
             if data[u'Members']:
                 for controller in data[u'Members']:
                     controller_list.append(controller[u'@odata.id'])
+                self._prefetch([self.root_uri + c for c in controller_list])
                 for c in controller_list:
                     uri = self.root_uri + c
                     response = self.get_request(uri)
@@ -911,7 +1328,7 @@ class RedfishUtils(object):
                     if 'Controllers' in data:
                         controllers_uri = data['Controllers'][u'@odata.id']
 
-                        response = self.get_request(self.root_uri + controllers_uri)
+                        response = self.get_collection_request(self.root_uri + controllers_uri)
                         if response['ret'] is False:
                             return response
                         result['ret'] = True
@@ -936,6 +1353,7 @@ class RedfishUtils(object):
                                 controller_name = 'Controller %s' % sc_id
                     drive_results = []
                     if 'Drives' in data:
+                        self._prefetch_members(data[u'Drives'])
                         for device in data[u'Drives']:
                             disk_uri = self.root_uri + device[u'@odata.id']
                             response = self.get_request(disk_uri)
@@ -961,7 +1379,7 @@ class RedfishUtils(object):
         if 'SimpleStorage' in data:
             # Get a list of all storage controllers and build respective URIs
             storage_uri = data["SimpleStorage"]["@odata.id"]
-            response = self.get_request(self.root_uri + storage_uri)
+            response = self.get_collection_request(self.root_uri + storage_uri)
             if response['ret'] is False:
                 return response
             result['ret'] = True
@@ -969,6 +1387,7 @@ class RedfishUtils(object):
 
             for controller in data[u'Members']:
                 controller_list.append(controller[u'@odata.id'])
+            self._prefetch([self.root_uri + c for c in controller_list])
 
             for c in controller_list:
                 uri = self.root_uri + c
@@ -997,6 +1416,7 @@ class RedfishUtils(object):
     def get_multi_disk_inventory(self):
         return self.aggregate_systems(self.get_disk_inventory)
 
+    @_drops_unused_prefetches
     def get_volume_inventory(self, systems_uri):
         result = {'entries': []}
         controller_list = []
@@ -1021,7 +1441,7 @@ class RedfishUtils(object):
         if 'Storage' in data:
             # Get a list of all storage controllers and build respective URIs
             storage_uri = data[u'Storage'][u'@odata.id']
-            response = self.get_request(self.root_uri + storage_uri)
+            response = self.get_collection_request(self.root_uri + storage_uri)
             if response['ret'] is False:
                 return response
             result['ret'] = True
@@ -1030,6 +1450,7 @@ class RedfishUtils(object):
             if data.get('Members'):
                 for controller in data[u'Members']:
                     controller_list.append(controller[u'@odata.id'])
+                self._prefetch([self.root_uri + c for c in controller_list])
                 for idx, c in enumerate(controller_list):
                     uri = self.root_uri + c
                     response = self.get_request(uri)
@@ -1068,12 +1489,13 @@ class RedfishUtils(object):
                     if 'Volumes' in data:
                         # Get a list of all volumes and build respective URIs
                         volumes_uri = data[u'Volumes'][u'@odata.id']
-                        response = self.get_request(self.root_uri + volumes_uri)
+                        response = self.get_collection_request(self.root_uri + volumes_uri)
                         data = response['data']
 
                         if data.get('Members'):
                             for volume in data[u'Members']:
                                 volume_list.append(volume[u'@odata.id'])
+                            self._prefetch([self.root_uri + v for v in volume_list])
                             for v in volume_list:
                                 uri = self.root_uri + v
                                 response = self.get_request(uri)
@@ -1299,7 +1721,7 @@ class RedfishUtils(object):
 
         if password_change_uri:
             # Password change required; go directly to the specified URI
-            response = self.get_request(self.root_uri + password_change_uri)
+            response = self._get_request_with_headers(self.root_uri + password_change_uri)
             if response['ret'] is False:
                 return response
             data = response['data']
@@ -1322,7 +1744,7 @@ class RedfishUtils(object):
             uris = [a.get('@odata.id') for a in data.get('Members', []) if
                     a.get('@odata.id')]
             for uri in uris:
-                response = self.get_request(self.root_uri + uri)
+                response = self._get_request_with_headers(self.root_uri + uri)
                 if response['ret'] is False:
                     continue
                 data = response['data']
@@ -1351,7 +1773,7 @@ class RedfishUtils(object):
             # first slot may be reserved, so move to end of list
             uris += [uris.pop(0)]
         for uri in uris:
-            response = self.get_request(self.root_uri + uri)
+            response = self._get_request_with_headers(self.root_uri + uri)
             if response['ret'] is False:
                 continue
             data = response['data']
@@ -1437,7 +1859,7 @@ class RedfishUtils(object):
             # account_username already exists, nothing to do
             return {'ret': True, 'changed': False}
 
-        response = self.get_request(self.root_uri + self.accounts_uri)
+        response = self._get_request_with_headers(self.root_uri + self.accounts_uri)
         if not response['ret']:
             return response
         headers = response['headers']
@@ -1775,6 +2197,7 @@ class RedfishUtils(object):
             return {'ret': "False", 'msg': "Key Actions not found."}
         return result
 
+    @_drops_unused_prefetches
     def _software_inventory(self, uri):
         result = {}
         result['entries'] = []
@@ -1791,6 +2214,7 @@ class RedfishUtils(object):
             else:
                 uri = None
 
+            self._prefetch_members(data[u'Members'])
             for member in data[u'Members']:
                 fw_uri = self.root_uri + member[u'@odata.id']
                 # Get details for each software or firmware member
@@ -1987,8 +2411,9 @@ class RedfishUtils(object):
             return {'ret': False, 'msg':
                     'Must specify a valid file for the MultipartHTTPPushUpdate command'}
         try:
-            with open(image_file, 'rb') as f:
-                image_payload = f.read()
+            # The image is streamed from the file when the request is sent
+            with open(image_file, 'rb'):
+                pass
         except Exception as e:
             return {'ret': False, 'msg':
                     'Could not read file %s' % image_file}
@@ -2012,7 +2437,7 @@ class RedfishUtils(object):
             payload["Oem"] = oem_params
         multipart_payload = {
             'UpdateParameters': {'content': json.dumps(payload), 'mime_type': 'application/json'},
-            'UpdateFile': {'filename': image_file, 'content': image_payload, 'mime_type': 'application/octet-stream'}
+            'UpdateFile': {'filename': image_file, 'mime_type': 'application/octet-stream'}
         }
         if custom_oem_params:
             multipart_payload[custom_oem_header] = {'content': custom_oem_params}
@@ -2597,6 +3022,7 @@ class RedfishUtils(object):
         result['entries'] = sensors
         return result
 
+    @_drops_unused_prefetches
     def get_cpu_inventory(self, systems_uri):
         result = {}
         cpu_list = []
@@ -2619,7 +3045,7 @@ class RedfishUtils(object):
         processors_uri = data[key]["@odata.id"]
 
         # Get a list of all CPUs and build respective URIs
-        response = self.get_request(self.root_uri + processors_uri)
+        response = self.get_collection_request(self.root_uri + processors_uri)
         if response['ret'] is False:
             return response
         result['ret'] = True
@@ -2627,6 +3053,7 @@ class RedfishUtils(object):
 
         for cpu in data[u'Members']:
             cpu_list.append(cpu[u'@odata.id'])
+        self._prefetch([self.root_uri + c for c in cpu_list])
 
         for c in cpu_list:
             cpu = {}
@@ -2647,6 +3074,7 @@ class RedfishUtils(object):
     def get_multi_cpu_inventory(self):
         return self.aggregate_systems(self.get_cpu_inventory)
 
+    @_drops_unused_prefetches
     def get_memory_inventory(self, systems_uri):
         result = {}
         memory_list = []
@@ -2669,7 +3097,7 @@ class RedfishUtils(object):
         memory_uri = data[key]["@odata.id"]
 
         # Get a list of all DIMMs and build respective URIs
-        response = self.get_request(self.root_uri + memory_uri)
+        response = self.get_collection_request(self.root_uri + memory_uri)
         if response['ret'] is False:
             return response
         result['ret'] = True
@@ -2677,6 +3105,7 @@ class RedfishUtils(object):
 
         for dimm in data[u'Members']:
             memory_list.append(dimm[u'@odata.id'])
+        self._prefetch([self.root_uri + m for m in memory_list])
 
         for m in memory_list:
             dimm = {}
@@ -2721,6 +3150,7 @@ class RedfishUtils(object):
         result['entries'] = nic
         return result
 
+    @_drops_unused_prefetches
     def get_nic_inventory(self, resource_uri):
         result = {}
         nic_list = []
@@ -2739,7 +3169,7 @@ class RedfishUtils(object):
         ethernetinterfaces_uri = data[key]["@odata.id"]
 
         # Get a list of all network controllers and build respective URIs
-        response = self.get_request(self.root_uri + ethernetinterfaces_uri)
+        response = self.get_collection_request(self.root_uri + ethernetinterfaces_uri)
         if response['ret'] is False:
             return response
         result['ret'] = True
@@ -2747,6 +3177,7 @@ class RedfishUtils(object):
 
         for nic in data[u'Members']:
             nic_list.append(nic[u'@odata.id'])
+        self._prefetch([self.root_uri + n for n in nic_list])
 
         for n in nic_list:
             nic = self.get_nic(n)
@@ -2882,7 +3313,7 @@ class RedfishUtils(object):
         resources = {}
         headers = {}
         for uri in uri_list:
-            response = self.get_request(self.root_uri + uri)
+            response = self._get_request_with_headers(self.root_uri + uri)
             if response['ret'] is False:
                 continue
             resources[uri] = response['data']
@@ -3291,6 +3722,7 @@ class RedfishUtils(object):
             resource_name = resource_name[:-1]
         return resource_name
 
+    @_drops_unused_prefetches
     def get_health_resource(self, subsystem, uri, health, expanded):
         status = 'Status'
 
@@ -3304,6 +3736,7 @@ class RedfishUtils(object):
                 return
 
         if 'Members' in d:  # collections case
+            self._prefetch_members(d.get('Members'))
             for m in d.get('Members'):
                 u = m.get('@odata.id')
                 r = self.get_request(self.root_uri + u)
@@ -3320,6 +3753,7 @@ class RedfishUtils(object):
                                "Status not available")}
             health[subsystem].append(e)
 
+    @_drops_unused_prefetches
     def get_health_subsystem(self, subsystem, data, health):
         if subsystem in data:
             sub = data.get(subsystem)
@@ -3336,6 +3770,7 @@ class RedfishUtils(object):
                     uri = sub.get('@odata.id')
                     self.get_health_resource(subsystem, uri, health, None)
         elif 'Members' in data:
+            self._prefetch_members(data.get('Members'))
             for m in data.get('Members'):
                 u = m.get('@odata.id')
                 r = self.get_request(self.root_uri + u)
@@ -21,6 +21,13 @@ from ansible_collections.community.general.plugins.module_utils.datetime import
     now,
 )
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+    HAS_THREAD_POOL = True
+except ImportError:
+    # Python 2.7 without the futures backport: pages are fetched sequentially
+    HAS_THREAD_POOL = False
+
 SCALEWAY_SECRET_IMP_ERR = None
 try:
     from passlib.hash import argon2
@@ -39,6 +46,7 @@ def scaleway_argument_spec():
         api_timeout=dict(type='int', default=30, aliases=['timeout']),
         query_parameters=dict(type='dict', default={}),
         validate_certs=dict(default=True, type='bool'),
+        api_workers=dict(type='int', default=1),
     )
 
 
@@ -196,7 +204,7 @@ class Scaleway(object):
         return results.json.get(self.name)
 
     def _url_builder(self, path, params):
-        d = self.module.params.get('query_parameters')
+        d = dict(self.module.params.get('query_parameters'))
         if params is not None:
             d.update(params)
         query_string = urlencode(d, doseq=True)
@@ -205,7 +213,7 @@ class Scaleway(object):
             path = path[1:]
         return '%s/%s?%s' % (self.module.params.get('api_url'), path, query_string)
 
-    def send(self, method, path, data=None, headers=None, params=None):
+    def _request(self, method, path, data=None, headers=None, params=None):
         url = self._url_builder(path=path, params=params)
         self.warn(url)
 
@@ -219,12 +227,16 @@ class Scaleway(object):
             self.module, url, data=data, headers=self.headers, method=method,
             timeout=self.module.params.get('api_timeout')
         )
+        return Response(resp, info)
+
+    def send(self, method, path, data=None, headers=None, params=None):
+        response = self._request(method, path, data=data, headers=headers, params=params)
 
         # Exceptions in fetch_url may result in a status -1, the ensures a proper error to the user in all cases
-        if info['status'] == -1:
-            self.module.fail_json(msg=info['msg'])
+        if response.status_code == -1:
+            self.module.fail_json(msg=response.info['msg'])
 
-        return Response(resp, info)
+        return response
 
     @staticmethod
     def get_user_agent_string(module):
@@ -268,12 +280,9 @@ class Scaleway(object):
         except KeyError:
             self.module.fail_json(msg="Could not fetch state in %s" % response.json)
 
-    def fetch_paginated_resources(self, resource_key, **pagination_kwargs):
-        response = self.get(
-            path=self.api_path,
-            params=pagination_kwargs)
-
-        status_code = response.status_code
+    def _check_page(self, resource_key, response):
+        if response.status_code == -1:
+            self.module.fail_json(msg=response.info['msg'])
         if not response.ok:
             self.module.fail_json(msg='Error getting {0} [{1}: {2}]'.format(
                 resource_key,
@@ -281,17 +290,58 @@ class Scaleway(object):
 
         return response.json[resource_key]
 
+    def fetch_paginated_resources(self, resource_key, **pagination_kwargs):
+        response = self.get(
+            path=self.api_path,
+            params=pagination_kwargs)
+
+        return self._check_page(resource_key, response)
+
+    @staticmethod
+    def _last_page(response, page_length, pagination_kwargs):
+        # The total is announced in the X-Total-Count header by the instance API,
+        # and in the total_count field of the body by the other APIs
+        total_count = response.info.get('x-total-count')
+        if total_count is None:
+            total_count = (response.json or {}).get('total_count')
+        page_size = pagination_kwargs.get('per_page') or pagination_kwargs.get('page_size') or page_length
+        try:
+            total_count = int(total_count)
+            page_size = int(page_size)
+        except (TypeError, ValueError):
+            return None
+        if page_size <= 0:
+            return None
+        return -(-total_count // page_size)
+
     def fetch_all_resources(self, resource_key, **pagination_kwargs):
-        resources = []
-
-        result = [None]
-        while len(result) != 0:
-            result = self.fetch_paginated_resources(resource_key, **pagination_kwargs)
-            resources += result
-            if 'page' in pagination_kwargs:
-                pagination_kwargs['page'] += 1
-            else:
-                pagination_kwargs['page'] = 2
+        page = pagination_kwargs.get('page', 1)
+        response = self.get(path=self.api_path, params=pagination_kwargs)
+        resources = list(self._check_page(resource_key, response))
+
+        workers = self.module.params.get('api_workers') or 1
+        last_page = None
+        if workers > 1 and HAS_THREAD_POOL and resources:
+            last_page = self._last_page(response, len(resources), pagination_kwargs)
+
+        if last_page is None:
+            result = resources
+            while len(result) != 0:
+                page += 1
+                result = self.fetch_paginated_resources(resource_key, **dict(pagination_kwargs, page=page))
+                resources += result
+            return resources
+
+        # The number of pages is known: request all of them at once.
+        # The responses are checked here, as failing from a worker thread would exit the module more than once.
+        pages = range(page + 1, last_page + 1)
+        if pages:
+            def fetch(page):
+                return self._request('GET', self.api_path, params=dict(pagination_kwargs, page=page))
+
+            with ThreadPoolExecutor(max_workers=min(workers, len(pages))) as executor:
+                for response in list(executor.map(fetch, pages)):
+                    resources += self._check_page(resource_key, response)
 
         return resources
 
@@ -9,14 +9,43 @@ __metaclass__ = type
 
 import copy
 
+from ansible.module_utils.six import binary_type, integer_types, text_type
+
+
+_ATOMS = (type(None), bool, float, complex, text_type, binary_type) + integer_types
+
+
+def _snapshot(value):
+    """Immutable copy of the contents of ``value``, compared with ``==`` to detect in-place changes.
+
+    Immutable values are shared with ``value`` instead of being copied.
+    """
+    if isinstance(value, _ATOMS):
+        return value
+    if isinstance(value, dict):
+        return (dict, dict((k, _snapshot(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        if set(map(type, value)).issubset(_ATOMS):
+            return (type(value), tuple(value))
+        return (type(value), tuple(_snapshot(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        # set elements are hashable, hence cannot be changed in place
+        return (type(value), frozenset(value))
+    return (type(value), copy.deepcopy(value))
+
 
 class _Variable(object):
     NOTHING = object()
 
-    def __init__(self, diff=False, output=True, change=None, fact=False, verbosity=0):
+    def __init__(self, diff=False, output=True, change=None, fact=False, verbosity=0, copy_on_write=False):
         self.init = False
         self.initial_value = None
         self.value = None
+        # in copy-on-write mode, only variables with diff=True keep a copy of their initial value, the others
+        # keep a reference to it and, with change=True, an immutable snapshot of its contents
+        self.copy_on_write = copy_on_write
+        self._initial_snapshot = _Variable.NOTHING
+        self._initial_copied = False
 
         self.diff = None
         self._change = None
@@ -62,9 +91,23 @@ class _Variable(object):
         if fact is not None:
             self.fact = fact
         if initial_value is not _Variable.NOTHING:
-            self.initial_value = copy.deepcopy(initial_value)
+            self._set_initial_value(initial_value)
         if verbosity is not None:
             self.verbosity = verbosity
+        if self.copy_on_write and self.init and not self._initial_copied:
+            if self.diff or (self.change and self._initial_snapshot is _Variable.NOTHING):
+                # diff or change tracking has just been enabled
+                self._set_initial_value(self.initial_value)
+
+    def _set_initial_value(self, value):
+        if self.copy_on_write and not self.diff:
+            self.initial_value = value
+            self._initial_snapshot = _snapshot(value) if self.change else _Variable.NOTHING
+            self._initial_copied = False
+        else:
+            self.initial_value = copy.deepcopy(value)
+            self._initial_snapshot = _Variable.NOTHING
+            self._initial_copied = True
 
     def as_dict(self, meta_only=False):
         d = {
@@ -81,7 +124,7 @@ class _Variable(object):
 
     def set_value(self, value):
         if not self.init:
-            self.initial_value = copy.deepcopy(value)
+            self._set_initial_value(value)
             self.init = True
         self.value = value
         return self
@@ -91,7 +134,12 @@ class _Variable(object):
 
     @property
     def has_changed(self):
-        return self.change and (self.initial_value != self.value)
+        if not self.change:
+            return False
+        if self._initial_snapshot is not _Variable.NOTHING:
+            # the initial value may have been changed in place, even if it has been replaced since
+            return _snapshot(self.value) != self._initial_snapshot
+        return self.initial_value != self.value
 
     @property
     def diff_result(self):
@@ -106,10 +154,20 @@ class _Variable(object):
 
 
 class VarDict(object):
-    reserved_names = ('__vars__', '_var', 'var', 'set_meta', 'get_meta', 'set', 'output', 'diff', 'facts', 'has_changed', 'as_dict')
+    reserved_names = ('__vars__', '_var', 'var', 'set_meta', 'get_meta', 'set', 'output', 'diff', 'facts', 'has_changed', 'as_dict',
+                      'copy_on_write', '_cache')
 
-    def __init__(self):
+    def __init__(self, copy_on_write=False):
+        """
+        Args:
+            copy_on_write (bool, optional): do not copy the initial values of variables that are not used for diff, and detect
+                changes to them by comparing immutable snapshots of their contents. The results of `output`, `diff`, `facts`, `has_changed` and `as_dict`
+                are cached until the next call to `set` or `set_meta`, so values must not be modified in place without setting them
+                again. Defaults to False.
+        """
         self.__vars__ = dict()
+        super(VarDict, self).__setattr__('copy_on_write', copy_on_write)
+        super(VarDict, self).__setattr__('_cache', {})
 
     def __getitem__(self, item):
         return self.__vars__[item].value
@@ -129,6 +187,13 @@ class VarDict(object):
         else:
             self.set(key, value)
 
+    def _cached(self, key, func):
+        if not self.copy_on_write:
+            return func()
+        if key not in self._cache:
+            self._cache[key] = func()
+        return self._cache[key]
+
     def _var(self, name):
         return self.__vars__[name]
 
@@ -148,6 +213,7 @@ class VarDict(object):
             verbosity (int, optional): level of verbosity in which this variable is reported by the module as `output`, `fact` or `diff`. Defaults to None.
         """
         self._var(name).set_meta(**kwargs)
+        self._cache.clear()
 
     def get_meta(self, name):
         return self._var(name).as_dict(meta_only=True)
@@ -170,28 +236,38 @@ class VarDict(object):
             var = self._var(name)
             var.set_meta(**kwargs)
         else:
-            var = _Variable(**kwargs)
+            var = _Variable(copy_on_write=self.copy_on_write, **kwargs)
         var.set_value(value)
         self.__vars__[name] = var
+        self._cache.clear()
 
     def output(self, verbosity=0):
-        return {n: v.value for n, v in self.__vars__.items() if v.output and v.is_visible(verbosity)}
+        return dict(self._cached(('output', verbosity), lambda: {
+            n: v.value for n, v in self.__vars__.items() if v.output and v.is_visible(verbosity)
+        }))
 
-    def diff(self, verbosity=0):
-        diff_results = [(n, v.diff_result) for n, v in self.__vars__.items() if v.diff_result and v.is_visible(verbosity)]
+    def _diff(self, verbosity):
+        diff_results = [(n, v.diff_result) for n, v in self.__vars__.items() if v.is_visible(verbosity)]
+        diff_results = [(n, dr) for n, dr in diff_results if dr]
         if diff_results:
             before = {n: dr['before'] for n, dr in diff_results}
             after = {n: dr['after'] for n, dr in diff_results}
             return {'before': before, 'after': after}
         return None
 
+    def diff(self, verbosity=0):
+        result = self._cached(('diff', verbosity), lambda: self._diff(verbosity))
+        return None if result is None else {'before': dict(result['before']), 'after': dict(result['after'])}
+
     def facts(self, verbosity=0):
-        facts_result = {n: v.value for n, v in self.__vars__.items() if v.fact and v.is_visible(verbosity)}
-        return facts_result if facts_result else None
+        facts_result = self._cached(('facts', verbosity), lambda: {
+            n: v.value for n, v in self.__vars__.items() if v.fact and v.is_visible(verbosity)
+        })
+        return dict(facts_result) if facts_result else None
 
     @property
     def has_changed(self):
-        return any(var.has_changed for var in self.__vars__.values())
+        return self._cached('has_changed', lambda: any(var.has_changed for var in self.__vars__.values()))
 
     def as_dict(self):
-        return {name: var.value for name, var in self.__vars__.items()}
+        return dict(self._cached('as_dict', lambda: {name: var.value for name, var in self.__vars__.items()}))
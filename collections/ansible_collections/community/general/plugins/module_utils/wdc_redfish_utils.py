@@ -225,23 +225,24 @@ class WdcRedfishUtils(RedfishUtils):
             return bundle_version, is_multi_tenant, gen
 
         # Bundle is for MM or DP G1
-        tf = tarfile.open(bundle_temp_filename)
+        # Only the member names and one byte of the .bin member are read; nothing is extracted
         pattern_pkg = r"oobm-(.+)\.pkg"
         pattern_bin = r"(.*\.bin)"
         bundle_version = None
         is_multi_tenant = None
-        for filename in tf.getnames():
-            match_pkg = re.match(pattern_pkg, filename)
-            if match_pkg is not None:
-                bundle_version = match_pkg.group(1)
-            match_bin = re.match(pattern_bin, filename)
-            if match_bin is not None:
-                bin_filename = match_bin.group(1)
-                bin_file = tf.extractfile(bin_filename)
-                bin_file.seek(11)
-                byte_11 = bin_file.read(1)
-                is_multi_tenant = byte_11 == b'\x80'
-                gen = "G1"
+        with tarfile.open(bundle_temp_filename) as tf:
+            for filename in tf.getnames():
+                match_pkg = re.match(pattern_pkg, filename)
+                if match_pkg is not None:
+                    bundle_version = match_pkg.group(1)
+                match_bin = re.match(pattern_bin, filename)
+                if match_bin is not None:
+                    bin_filename = match_bin.group(1)
+                    bin_file = tf.extractfile(bin_filename)
+                    bin_file.seek(11)
+                    byte_11 = bin_file.read(1)
+                    is_multi_tenant = byte_11 == b'\x80'
+                    gen = "G1"
 
         return bundle_version, is_multi_tenant, gen
 
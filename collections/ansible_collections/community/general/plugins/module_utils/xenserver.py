@@ -8,8 +8,14 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import atexit
-import time
+import binascii
+import copy
+import hashlib
+import json
+import os
 import re
+import tempfile
+import time
 import traceback
 
 XENAPI_IMP_ERR = None
@@ -21,8 +27,11 @@ except ImportError:
     XENAPI_IMP_ERR = traceback.format_exc()
 
 from ansible.module_utils.basic import env_fallback, missing_required_lib
+from ansible.module_utils.common.text.converters import to_native, to_text
 from ansible.module_utils.ansible_release import __version__ as ANSIBLE_VERSION
 
+SESSION_CACHE_ITERATIONS = 10000
+
 
 def xenserver_common_argument_spec():
     return dict(
@@ -46,6 +55,12 @@ def xenserver_common_argument_spec():
                             required=False,
                             default=True,
                             fallback=(env_fallback, ['XENSERVER_VALIDATE_CERTS'])),
+        retrieval_mode=dict(type='str',
+                            required=False,
+                            default='record',
+                            choices=['record', 'bulk']),
+        session_cache_dir=dict(type='path',
+                               required=False),
     )
 
 
@@ -324,6 +339,10 @@ def get_object_ref(module, name, uuid=None, obj_type="VM", fail=True, msg_prefix
 def gather_vm_params(module, vm_ref):
     """Gathers all VM parameters available in XAPI database.
 
+    With retrieval_mode=bulk, records of the VM and its related objects
+    are taken from the per-run cache of pool-wide records kept by
+    XAPIRecordCache instead of being fetched one by one.
+
     Args:
         module: Reference to Ansible module object.
         vm_ref (str): XAPI reference to VM.
@@ -337,20 +356,30 @@ def gather_vm_params(module, vm_ref):
 
     xapi_session = XAPI.connect(module)
 
+    if module.params.get('retrieval_mode') == 'bulk':
+        def get_record(xapi_class, obj_ref):
+            return XAPIRecordCache.get_record(module, xapi_class, obj_ref)
+    else:
+        def get_record(xapi_class, obj_ref):
+            return getattr(xapi_session.xenapi, xapi_class).get_record(obj_ref)
+
     try:
-        vm_params = xapi_session.xenapi.VM.get_record(vm_ref)
+        if module.params.get('retrieval_mode') == 'bulk':
+            XAPIRecordCache.refresh(module)
+
+        vm_params = get_record("VM", vm_ref)
 
         # We need some params like affinity, VBDs, VIFs, VDIs etc. dereferenced.
 
         # Affinity.
         if vm_params['affinity'] != "OpaqueRef:NULL":
-            vm_affinity = xapi_session.xenapi.host.get_record(vm_params['affinity'])
+            vm_affinity = get_record("host", vm_params['affinity'])
             vm_params['affinity'] = vm_affinity
         else:
             vm_params['affinity'] = {}
 
         # VBDs.
-        vm_vbd_params_list = [xapi_session.xenapi.VBD.get_record(vm_vbd_ref) for vm_vbd_ref in vm_params['VBDs']]
+        vm_vbd_params_list = [get_record("VBD", vm_vbd_ref) for vm_vbd_ref in vm_params['VBDs']]
 
         # List of VBDs is usually sorted by userdevice but we sort just
         # in case. We need this list sorted by userdevice so that we can
@@ -361,14 +390,14 @@ def gather_vm_params(module, vm_ref):
         # VDIs.
         for vm_vbd_params in vm_params['VBDs']:
             if vm_vbd_params['VDI'] != "OpaqueRef:NULL":
-                vm_vdi_params = xapi_session.xenapi.VDI.get_record(vm_vbd_params['VDI'])
+                vm_vdi_params = get_record("VDI", vm_vbd_params['VDI'])
             else:
                 vm_vdi_params = {}
 
             vm_vbd_params['VDI'] = vm_vdi_params
 
         # VIFs.
-        vm_vif_params_list = [xapi_session.xenapi.VIF.get_record(vm_vif_ref) for vm_vif_ref in vm_params['VIFs']]
+        vm_vif_params_list = [get_record("VIF", vm_vif_ref) for vm_vif_ref in vm_params['VIFs']]
 
         # List of VIFs is usually sorted by device but we sort just
         # in case. We need this list sorted by device so that we can
@@ -379,7 +408,7 @@ def gather_vm_params(module, vm_ref):
         # Networks.
         for vm_vif_params in vm_params['VIFs']:
             if vm_vif_params['network'] != "OpaqueRef:NULL":
-                vm_network_params = xapi_session.xenapi.network.get_record(vm_vif_params['network'])
+                vm_network_params = get_record("network", vm_vif_params['network'])
             else:
                 vm_network_params = {}
 
@@ -387,7 +416,7 @@ def gather_vm_params(module, vm_ref):
 
         # Guest metrics.
         if vm_params['guest_metrics'] != "OpaqueRef:NULL":
-            vm_guest_metrics = xapi_session.xenapi.VM_guest_metrics.get_record(vm_params['guest_metrics'])
+            vm_guest_metrics = get_record("VM_guest_metrics", vm_params['guest_metrics'])
             vm_params['guest_metrics'] = vm_guest_metrics
         else:
             vm_params['guest_metrics'] = {}
@@ -450,7 +479,10 @@ def gather_vm_facts(module, vm_params):
 
     for vm_vbd_params in vm_params['VBDs']:
         if vm_vbd_params['type'] == "Disk":
-            vm_disk_sr_params = xapi_session.xenapi.SR.get_record(vm_vbd_params['VDI']['SR'])
+            if module.params.get('retrieval_mode') == 'bulk':
+                vm_disk_sr_params = XAPIRecordCache.get_record(module, "SR", vm_vbd_params['VDI']['SR'])
+            else:
+                vm_disk_sr_params = xapi_session.xenapi.SR.get_record(vm_vbd_params['VDI']['SR'])
 
             vm_disk_params = {
                 "size": int(vm_vbd_params['VDI']['virtual_size']),
@@ -761,6 +793,97 @@ def get_xenserver_version(module):
     return xenserver_version
 
 
+def _session_cache_path(module, hostname, username):
+    """Returns path of XAPI session cache file.
+
+    Args:
+        module: Reference to Ansible module object.
+        hostname (str): URL of XenServer host or pool master.
+        username (str): Username the session is logged on with.
+
+    Returns:
+        str: Path of session cache file or None if session caching
+        is disabled.
+    """
+    session_cache_dir = module.params.get('session_cache_dir')
+
+    if not session_cache_dir:
+        return None
+
+    key = "%s|%s" % (hostname, username)
+
+    return os.path.join(session_cache_dir, "%s.json" % hashlib.sha256(to_text(key).encode('utf-8')).hexdigest())
+
+
+def _session_cache_digest(password, salt):
+    """Derives a digest of password so that cached session is only reused
+    by callers that know the password it was logged on with."""
+    digest = hashlib.pbkdf2_hmac('sha256', to_text(password).encode('utf-8'), salt, SESSION_CACHE_ITERATIONS)
+
+    return to_native(binascii.hexlify(digest))
+
+
+def _load_cached_session(path, password):
+    """Reads XAPI session cache entry.
+
+    Args:
+        path (str): Path of session cache file.
+        password (str): Password the session must have been logged on with.
+
+    Returns:
+        dict: Session cache entry or None if there is no usable entry.
+    """
+    try:
+        with open(path) as f:
+            entry = json.load(f)
+
+        if entry['digest'] != _session_cache_digest(password, binascii.unhexlify(entry['salt'])):
+            return None
+
+        return entry
+    except (IOError, OSError, ValueError, KeyError, TypeError, binascii.Error):
+        return None
+
+
+def _store_cached_session(path, password, xapi_session):
+    """Writes XAPI session cache entry.
+
+    Failures to write the cache are not fatal. A new session is simply
+    logged on next time.
+
+    Args:
+        path (str): Path of session cache file.
+        password (str): Password the session was logged on with.
+        xapi_session: Reference to XAPI session.
+    """
+    salt = os.urandom(16)
+    entry = {
+        "salt": to_native(binascii.hexlify(salt)),
+        "digest": _session_cache_digest(password, salt),
+        "session": xapi_session._session,
+        "api_version": xapi_session.API_version,
+    }
+
+    session_cache_dir = os.path.dirname(path)
+
+    try:
+        if not os.path.isdir(session_cache_dir):
+            os.makedirs(session_cache_dir, 0o700)
+
+        fd, tmp_path = tempfile.mkstemp(dir=session_cache_dir, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f)
+
+            os.rename(tmp_path, path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+    except (IOError, OSError):
+        pass
+
+
 class XAPI(object):
     """Class for XAPI session management."""
     _xapi_session = None
@@ -772,6 +895,10 @@ class XAPI(object):
         If no existing session is available, establishes a new one
         and returns it, else returns existing one.
 
+        If session_cache_dir module param is set, a session logged on
+        by a previous module run is reused while it is still valid
+        and a newly logged on session is kept open for the next run.
+
         Args:
             module: Reference to Ansible module object.
             disconnect_atexit (bool): Controls if method should
@@ -813,17 +940,137 @@ class XAPI(object):
             if not password:
                 password = ''
 
-        try:
-            cls._xapi_session.login_with_password(username, password, ANSIBLE_VERSION, 'Ansible')
-        except XenAPI.Failure as f:
-            module.fail_json(msg="Unable to log on to XenServer at %s as %s: %s" % (hostname, username, f.details))
+        login_params = (username, password, ANSIBLE_VERSION, 'Ansible')
+        session_cache_path = _session_cache_path(module, hostname, username)
 
-        # Disabling atexit should be used in special cases only.
-        if disconnect_atexit:
+        if session_cache_path is None or not cls._resume_session(session_cache_path, login_params):
+            try:
+                cls._xapi_session.login_with_password(*login_params)
+            except XenAPI.Failure as f:
+                module.fail_json(msg="Unable to log on to XenServer at %s as %s: %s" % (hostname, username, f.details))
+
+            if session_cache_path is not None:
+                _store_cached_session(session_cache_path, password, cls._xapi_session)
+
+        # Disabling atexit should be used in special cases only. Cached
+        # sessions are kept open for the next module run.
+        if disconnect_atexit and session_cache_path is None:
             atexit.register(cls._xapi_session.logout)
 
         return cls._xapi_session
 
+    @classmethod
+    def _resume_session(cls, session_cache_path, login_params):
+        """Resumes XAPI session from session cache.
+
+        Args:
+            session_cache_path (str): Path of session cache file.
+            login_params (tuple): Params of login_with_password() call
+                used to log on again if the session expires later on.
+
+        Returns:
+            bool: True if cached session is valid and was resumed,
+            else False.
+        """
+        entry = _load_cached_session(session_cache_path, login_params[1])
+
+        if entry is None:
+            return False
+
+        cls._xapi_session._session = entry['session']
+        cls._xapi_session.API_version = entry['api_version']
+
+        try:
+            # Any call that only takes the session reference will do
+            # to check the session is still valid.
+            cls._xapi_session.xenapi.pool.get_all()
+        except Exception:
+            cls._xapi_session._session = None
+            return False
+
+        # Let XenAPI log on again transparently if the session
+        # expires while the module is running.
+        cls._xapi_session.last_login_method = 'login_with_password'
+        cls._xapi_session.last_login_params = login_params
+
+        return True
+
+
+class XAPIRecordCache(object):
+    """Class for per-run cache of pool-wide XAPI records.
+
+    Records of all objects of XAPI classes used by gather_vm_params()
+    and gather_vm_facts() are fetched by a single event.from call. Every refresh afterwards
+    is another event.from call returning only objects changed since
+    the previous one, so the cache stays valid after a module changes
+    anything.
+    """
+    xapi_classes = ["vm", "vbd", "vdi", "sr", "vif", "network", "host", "vm_guest_metrics"]
+    _records = None
+    _token = ""
+
+    @classmethod
+    def refresh(cls, module):
+        """Updates cached records with changes made since last refresh.
+
+        Args:
+            module: Reference to Ansible module object.
+
+        Returns:
+            dict: Cached records of each XAPI class (lowercase) by
+            object reference.
+        """
+        xapi_session = XAPI.connect(module)
+
+        if cls._records is None:
+            cls._records = dict((xapi_class, {}) for xapi_class in cls.xapi_classes)
+            # Empty token returns all existing objects.
+            cls._token = ""
+
+        # Zero timeout makes event.from return immediately even if
+        # nothing has changed.
+        event_batch = xapi_session.xenapi_request("event.from", (cls.xapi_classes, cls._token, 0.0))
+
+        for event in event_batch['events']:
+            class_records = cls._records.get(event['class'].lower())
+
+            if class_records is None:
+                continue
+
+            if event['operation'] == "del":
+                class_records.pop(event['ref'], None)
+            elif 'snapshot' in event:
+                class_records[event['ref']] = event['snapshot']
+
+        cls._token = event_batch['token']
+
+        return cls._records
+
+    @classmethod
+    def get_record(cls, module, xapi_class, obj_ref):
+        """Returns a copy of cached record of XAPI object.
+
+        Objects not present in cache are fetched from XAPI and cached.
+
+        Args:
+            module: Reference to Ansible module object.
+            xapi_class (str): XAPI class of object.
+            obj_ref (str): XAPI reference to object.
+
+        Returns:
+            dict: Object record.
+        """
+        if cls._records is None:
+            cls.refresh(module)
+
+        class_records = cls._records.setdefault(xapi_class.lower(), {})
+
+        if obj_ref not in class_records:
+            xapi_session = XAPI.connect(module)
+            class_records[obj_ref] = getattr(xapi_session.xenapi, xapi_class).get_record(obj_ref)
+
+        return copy.deepcopy(class_records[obj_ref])
+
 
 class XenServerObject(object):
     """Base class for all XenServer objects.
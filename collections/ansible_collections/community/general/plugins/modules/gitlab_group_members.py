@@ -159,7 +159,7 @@ from ansible.module_utils.api import basic_auth_argument_spec
 from ansible.module_utils.basic import AnsibleModule
 
 from ansible_collections.community.general.plugins.module_utils.gitlab import (
-    auth_argument_spec, gitlab_authentication, gitlab, list_all_kwargs
+    auth_argument_spec, find_user_ids, gitlab_authentication, gitlab, list_all_kwargs
 )
 
 
@@ -168,69 +168,43 @@ class GitLabGroup(object):
         self._module = module
         self._gitlab = gl
 
-    # get user id if the user exists
-    def get_user_id(self, gitlab_user):
-        return next(
-            (u.id for u in self._gitlab.users.list(username=gitlab_user, **list_all_kwargs)),
-            None
-        )
+    # get the ids of the given users, known members are resolved without a request
+    def get_user_ids(self, gitlab_users, members=None):
+        return find_user_ids(self._gitlab, gitlab_users, members)
 
-    # get group id if group exists
-    def get_group_id(self, gitlab_group):
+    # get group if group exists
+    def get_group(self, gitlab_group):
         return next(
             (
-                g.id for g in self._gitlab.groups.list(search=gitlab_group, **list_all_kwargs)
+                g for g in self._gitlab.groups.list(search=gitlab_group, **list_all_kwargs)
                 if g.full_path == gitlab_group
             ),
             None
         )
 
     # get all members in a group
-    def get_members_in_a_group(self, gitlab_group_id):
-        group = self._gitlab.groups.get(gitlab_group_id)
-        return group.members.list(all=True)
+    def get_members_in_a_group(self, group):
+        return list(group.members.list(**list_all_kwargs))
 
     # get single member in a group by user name
-    def get_member_in_a_group(self, gitlab_group_id, gitlab_user_id):
-        member = None
-        group = self._gitlab.groups.get(gitlab_group_id)
+    def get_member_in_a_group(self, group, gitlab_user_id):
         try:
-            member = group.members.get(gitlab_user_id)
-            if member:
-                return member
+            return group.members.get(gitlab_user_id)
         except gitlab.exceptions.GitlabGetError as e:
             return None
 
-    # check if the user is a member of the group
-    def is_user_a_member(self, members, gitlab_user_id):
-        for member in members:
-            if member.id == gitlab_user_id:
-                return True
-        return False
-
     # add user to a group
-    def add_member_to_group(self, gitlab_user_id, gitlab_group_id, access_level):
-        group = self._gitlab.groups.get(gitlab_group_id)
-        add_member = group.members.create(
-            {'user_id': gitlab_user_id, 'access_level': access_level})
+    def add_member_to_group(self, gitlab_user_id, group, access_level):
+        group.members.create({'user_id': gitlab_user_id, 'access_level': access_level})
 
     # remove user from a group
-    def remove_user_from_group(self, gitlab_user_id, gitlab_group_id):
-        group = self._gitlab.groups.get(gitlab_group_id)
+    def remove_user_from_group(self, gitlab_user_id, group):
         group.members.delete(gitlab_user_id)
 
-    # get user's access level
-    def get_user_access_level(self, members, gitlab_user_id):
-        for member in members:
-            if member.id == gitlab_user_id:
-                return member.access_level
-
     # update user's access level in a group
-    def update_user_access_level(self, members, gitlab_user_id, access_level):
-        for member in members:
-            if member.id == gitlab_user_id:
-                member.access_level = access_level
-                member.save()
+    def update_user_access_level(self, member, access_level):
+        member.access_level = access_level
+        member.save()
 
 
 def main():
@@ -298,10 +272,10 @@ def main():
 
     group = GitLabGroup(module, gl)
 
-    gitlab_group_id = group.get_group_id(gitlab_group)
+    gitlab_group_obj = group.get_group(gitlab_group)
 
     # group doesn't exist
-    if not gitlab_group_id:
+    if not gitlab_group_obj:
         module.fail_json(msg="group '%s' not found." % gitlab_group)
 
     members = []
@@ -315,25 +289,32 @@ def main():
         for user_level in gitlab_users_access:
             user_level['access_level'] = access_level_int[user_level['access_level']]
 
+    gitlab_user_names = [gitlab_user['name'] for gitlab_user in gitlab_users_access]
     if len(gitlab_users_access) == 1 and not purge_users:
         # only single user given
-        members = [group.get_member_in_a_group(gitlab_group_id, group.get_user_id(gitlab_users_access[0]['name']))]
-        if members[0] is None:
-            members = []
+        user_ids = group.get_user_ids(gitlab_user_names)
+        gitlab_user_id = user_ids.get(gitlab_user_names[0].lower())
+        if gitlab_user_id:
+            member = group.get_member_in_a_group(gitlab_group_obj, gitlab_user_id)
+            if member is not None:
+                members = [member]
     elif len(gitlab_users_access) > 1 or purge_users:
         # list of users given
-        members = group.get_members_in_a_group(gitlab_group_id)
+        members = group.get_members_in_a_group(gitlab_group_obj)
+        user_ids = group.get_user_ids(gitlab_user_names, members)
     else:
         module.exit_json(changed='OK', result="Nothing to do, please give at least one user or set purge_users true.",
                          result_data=[])
 
+    members_by_id = dict((member.id, member) for member in members)
+
     changed = False
     error = False
     changed_users = []
     changed_data = []
 
     for gitlab_user in gitlab_users_access:
-        gitlab_user_id = group.get_user_id(gitlab_user['name'])
+        gitlab_user_id = user_ids.get(gitlab_user['name'].lower())
 
         # user doesn't exist
         if not gitlab_user_id:
@@ -348,15 +329,15 @@ def main():
                                      'msg': "user '%s' not found." % gitlab_user['name']})
             continue
 
-        is_user_a_member = group.is_user_a_member(members, gitlab_user_id)
+        member = members_by_id.get(gitlab_user_id)
 
         # check if the user is a member in the group
-        if not is_user_a_member:
+        if member is None:
             if state == 'present':
                 # add user to the group
                 try:
                     if not module.check_mode:
-                        group.add_member_to_group(gitlab_user_id, gitlab_group_id, gitlab_user['access_level'])
+                        group.add_member_to_group(gitlab_user_id, gitlab_group_obj, gitlab_user['access_level'])
                     changed = True
                     changed_users.append("Successfully added user '%s' to group" % gitlab_user['name'])
                     changed_data.append({'gitlab_user': gitlab_user['name'], 'result': 'CHANGED',
@@ -375,8 +356,7 @@ def main():
         else:
             if state == 'present':
                 # compare the access level
-                user_access_level = group.get_user_access_level(members, gitlab_user_id)
-                if user_access_level == gitlab_user['access_level']:
+                if member.access_level == gitlab_user['access_level']:
                     changed_users.append("User, '%s', is already a member in the group. No change to report" % gitlab_user['name'])
                     changed_data.append({'gitlab_user': gitlab_user['name'], 'result': 'OK',
                                          'msg': "User, '%s', is already a member in the group. No change to report" % gitlab_user['name']})
@@ -384,7 +364,7 @@ def main():
                     # update the access level for the user
                     try:
                         if not module.check_mode:
-                            group.update_user_access_level(members, gitlab_user_id, gitlab_user['access_level'])
+                            group.update_user_access_level(member, gitlab_user['access_level'])
                         changed = True
                         changed_users.append("Successfully updated the access level for the user, '%s'" % gitlab_user['name'])
                         changed_data.append({'gitlab_user': gitlab_user['name'], 'result': 'CHANGED',
@@ -398,7 +378,7 @@ def main():
                 # remove the user from the group
                 try:
                     if not module.check_mode:
-                        group.remove_user_from_group(gitlab_user_id, gitlab_group_id)
+                        group.remove_user_from_group(gitlab_user_id, gitlab_group_obj)
                     changed = True
                     changed_users.append("Successfully removed user, '%s', from the group" % gitlab_user['name'])
                     changed_data.append({'gitlab_user': gitlab_user['name'], 'result': 'CHANGED',
@@ -411,24 +391,22 @@ def main():
 
     # if state = present and purge_users set delete users which are in members having give access level but not in gitlab_users
     if state == 'present' and purge_users:
-        uppercase_names_in_gitlab_users_access = []
-        for name in gitlab_users_access:
-            uppercase_names_in_gitlab_users_access.append(name['name'].upper())
+        uppercase_names_in_gitlab_users_access = set(name.upper() for name in gitlab_user_names)
 
         for member in members:
             if member.access_level in purge_users and member.username.upper() not in uppercase_names_in_gitlab_users_access:
                 try:
                     if not module.check_mode:
-                        group.remove_user_from_group(member.id, gitlab_group_id)
+                        group.remove_user_from_group(member.id, gitlab_group_obj)
                     changed = True
                     changed_users.append("Successfully removed user '%s', from group. Was not in given list" % member.username)
                     changed_data.append({'gitlab_user': member.username, 'result': 'CHANGED',
                                          'msg': "Successfully removed user '%s', from group. Was not in given list" % member.username})
                 except (gitlab.exceptions.GitlabDeleteError) as e:
                     error = True
-                    changed_users.append("Failed to removed user, '%s', from the group" % gitlab_user['name'])
-                    changed_data.append({'gitlab_user': gitlab_user['name'], 'result': 'FAILED',
-                                         'msg': "Failed to remove user, '%s' from the group: %s" % (gitlab_user['name'], e)})
+                    changed_users.append("Failed to removed user, '%s', from the group" % member.username)
+                    changed_data.append({'gitlab_user': member.username, 'result': 'FAILED',
+                                         'msg': "Failed to remove user, '%s' from the group: %s" % (member.username, e)})
 
     if len(gitlab_users_access) == 1 and error:
         # if single user given and an error occurred return error for list errors will be per user
@@ -164,7 +164,7 @@ from ansible.module_utils.api import basic_auth_argument_spec
 from ansible.module_utils.basic import AnsibleModule
 
 from ansible_collections.community.general.plugins.module_utils.gitlab import (
-    auth_argument_spec, gitlab_authentication, gitlab
+    auth_argument_spec, find_user_ids, gitlab_authentication, gitlab, list_all_kwargs
 )
 
 
@@ -175,64 +175,39 @@ class GitLabProjectMembers(object):
 
     def get_project(self, project_name):
         try:
-            project_exists = self._gitlab.projects.get(project_name)
-            return project_exists.id
+            return self._gitlab.projects.get(project_name)
         except gitlab.exceptions.GitlabGetError as e:
             project_exists = self._gitlab.projects.list(search=project_name, all=False)
             if project_exists:
-                return project_exists[0].id
+                return project_exists[0]
 
-    def get_user_id(self, gitlab_user):
-        user_exists = self._gitlab.users.list(username=gitlab_user, all=False)
-        if user_exists:
-            return user_exists[0].id
+    # get the ids of the given users, known members are resolved without a request
+    def get_user_ids(self, gitlab_users, members=None):
+        return find_user_ids(self._gitlab, gitlab_users, members)
 
     # get all members in a project
-    def get_members_in_a_project(self, gitlab_project_id):
-        project = self._gitlab.projects.get(gitlab_project_id)
-        return project.members.list(all=True)
+    def get_members_in_a_project(self, project):
+        return list(project.members.list(**list_all_kwargs))
 
     # get single member in a project by user name
-    def get_member_in_a_project(self, gitlab_project_id, gitlab_user_id):
-        member = None
-        project = self._gitlab.projects.get(gitlab_project_id)
+    def get_member_in_a_project(self, project, gitlab_user_id):
         try:
-            member = project.members.get(gitlab_user_id)
-            if member:
-                return member
+            return project.members.get(gitlab_user_id)
         except gitlab.exceptions.GitlabGetError as e:
             return None
 
-    # check if the user is a member of the project
-    def is_user_a_member(self, members, gitlab_user_id):
-        for member in members:
-            if member.id == gitlab_user_id:
-                return True
-        return False
-
     # add user to a project
-    def add_member_to_project(self, gitlab_user_id, gitlab_project_id, access_level):
-        project = self._gitlab.projects.get(gitlab_project_id)
-        add_member = project.members.create(
-            {'user_id': gitlab_user_id, 'access_level': access_level})
+    def add_member_to_project(self, gitlab_user_id, project, access_level):
+        project.members.create({'user_id': gitlab_user_id, 'access_level': access_level})
 
     # remove user from a project
-    def remove_user_from_project(self, gitlab_user_id, gitlab_project_id):
-        project = self._gitlab.projects.get(gitlab_project_id)
+    def remove_user_from_project(self, gitlab_user_id, project):
         project.members.delete(gitlab_user_id)
 
-    # get user's access level
-    def get_user_access_level(self, members, gitlab_user_id):
-        for member in members:
-            if member.id == gitlab_user_id:
-                return member.access_level
-
     # update user's access level in a project
-    def update_user_access_level(self, members, gitlab_user_id, access_level):
-        for member in members:
-            if member.id == gitlab_user_id:
-                member.access_level = access_level
-                member.save()
+    def update_user_access_level(self, member, access_level):
+        member.access_level = access_level
+        member.save()
 
 
 def main():
@@ -302,10 +277,10 @@ def main():
 
     project = GitLabProjectMembers(module, gl)
 
-    gitlab_project_id = project.get_project(gitlab_project)
+    gitlab_project_obj = project.get_project(gitlab_project)
 
     # project doesn't exist
-    if not gitlab_project_id:
+    if not gitlab_project_obj:
         module.fail_json(msg="project '%s' not found." % gitlab_project)
 
     members = []
@@ -320,26 +295,32 @@ def main():
         for user_level in gitlab_users_access:
             user_level['access_level'] = access_level_int[user_level['access_level']]
 
+    gitlab_user_names = [gitlab_user['name'] for gitlab_user in gitlab_users_access]
     if len(gitlab_users_access) == 1 and not purge_users:
         # only single user given
-        members = [project.get_member_in_a_project(
-            gitlab_project_id, project.get_user_id(gitlab_users_access[0]['name']))]
-        if members[0] is None:
-            members = []
+        user_ids = project.get_user_ids(gitlab_user_names)
+        gitlab_user_id = user_ids.get(gitlab_user_names[0].lower())
+        if gitlab_user_id:
+            member = project.get_member_in_a_project(gitlab_project_obj, gitlab_user_id)
+            if member is not None:
+                members = [member]
     elif len(gitlab_users_access) > 1 or purge_users:
         # list of users given
-        members = project.get_members_in_a_project(gitlab_project_id)
+        members = project.get_members_in_a_project(gitlab_project_obj)
+        user_ids = project.get_user_ids(gitlab_user_names, members)
     else:
         module.exit_json(changed='OK', result="Nothing to do, please give at least one user or set purge_users true.",
                          result_data=[])
 
+    members_by_id = dict((member.id, member) for member in members)
+
     changed = False
     error = False
     changed_users = []
     changed_data = []
 
     for gitlab_user in gitlab_users_access:
-        gitlab_user_id = project.get_user_id(gitlab_user['name'])
+        gitlab_user_id = user_ids.get(gitlab_user['name'].lower())
 
         # user doesn't exist
         if not gitlab_user_id:
@@ -354,15 +335,15 @@ def main():
                                      'msg': "user '%s' not found." % gitlab_user['name']})
             continue
 
-        is_user_a_member = project.is_user_a_member(members, gitlab_user_id)
+        member = members_by_id.get(gitlab_user_id)
 
         # check if the user is a member in the project
-        if not is_user_a_member:
+        if member is None:
             if state == 'present':
                 # add user to the project
                 try:
                     if not module.check_mode:
-                        project.add_member_to_project(gitlab_user_id, gitlab_project_id, gitlab_user['access_level'])
+                        project.add_member_to_project(gitlab_user_id, gitlab_project_obj, gitlab_user['access_level'])
                     changed = True
                     changed_users.append("Successfully added user '%s' to project" % gitlab_user['name'])
                     changed_data.append({'gitlab_user': gitlab_user['name'], 'result': 'CHANGED',
@@ -381,8 +362,7 @@ def main():
         else:
             if state == 'present':
                 # compare the access level
-                user_access_level = project.get_user_access_level(members, gitlab_user_id)
-                if user_access_level == gitlab_user['access_level']:
+                if member.access_level == gitlab_user['access_level']:
                     changed_users.append("User, '%s', is already a member in the project. No change to report" % gitlab_user['name'])
                     changed_data.append({'gitlab_user': gitlab_user['name'], 'result': 'OK',
                                          'msg': "User, '%s', is already a member in the project. No change to report" % gitlab_user['name']})
@@ -390,7 +370,7 @@ def main():
                     # update the access level for the user
                     try:
                         if not module.check_mode:
-                            project.update_user_access_level(members, gitlab_user_id, gitlab_user['access_level'])
+                            project.update_user_access_level(member, gitlab_user['access_level'])
                         changed = True
                         changed_users.append("Successfully updated the access level for the user, '%s'" % gitlab_user['name'])
                         changed_data.append({'gitlab_user': gitlab_user['name'], 'result': 'CHANGED',
@@ -404,7 +384,7 @@ def main():
                 # remove the user from the project
                 try:
                     if not module.check_mode:
-                        project.remove_user_from_project(gitlab_user_id, gitlab_project_id)
+                        project.remove_user_from_project(gitlab_user_id, gitlab_project_obj)
                     changed = True
                     changed_users.append("Successfully removed user, '%s', from the project" % gitlab_user['name'])
                     changed_data.append({'gitlab_user': gitlab_user['name'], 'result': 'CHANGED',
@@ -417,24 +397,22 @@ def main():
 
     # if state = present and purge_users set delete users which are in members having give access level but not in gitlab_users
     if state == 'present' and purge_users:
-        uppercase_names_in_gitlab_users_access = []
-        for name in gitlab_users_access:
-            uppercase_names_in_gitlab_users_access.append(name['name'].upper())
+        uppercase_names_in_gitlab_users_access = set(name.upper() for name in gitlab_user_names)
 
         for member in members:
             if member.access_level in purge_users and member.username.upper() not in uppercase_names_in_gitlab_users_access:
                 try:
                     if not module.check_mode:
-                        project.remove_user_from_project(member.id, gitlab_project_id)
+                        project.remove_user_from_project(member.id, gitlab_project_obj)
                     changed = True
                     changed_users.append("Successfully removed user '%s', from project. Was not in given list" % member.username)
                     changed_data.append({'gitlab_user': member.username, 'result': 'CHANGED',
                                          'msg': "Successfully removed user '%s', from project. Was not in given list" % member.username})
                 except (gitlab.exceptions.GitlabDeleteError) as e:
                     error = True
-                    changed_users.append("Failed to removed user, '%s', from the project" % gitlab_user['name'])
-                    changed_data.append({'gitlab_user': gitlab_user['name'], 'result': 'FAILED',
-                                         'msg': "Failed to remove user, '%s' from the project: %s" % (gitlab_user['name'], e)})
+                    changed_users.append("Failed to removed user, '%s', from the project" % member.username)
+                    changed_data.append({'gitlab_user': member.username, 'result': 'FAILED',
+                                         'msg': "Failed to remove user, '%s' from the project: %s" % (member.username, e)})
 
     if len(gitlab_users_access) == 1 and error:
         # if single user given and an error occurred return error for list errors will be per user
@@ -226,7 +226,7 @@ from ansible.module_utils.api import basic_auth_argument_spec
 
 from ansible_collections.community.general.plugins.module_utils.gitlab import (
     auth_argument_spec, gitlab_authentication, filter_returned_variables, vars_to_variables,
-    list_all_kwargs
+    list_all_kwargs, variable_index
 )
 
 
@@ -313,9 +313,8 @@ def native_python_main(this_gitlab, purge, requested_variables, state, module):
 
     gitlab_keys = this_gitlab.list_all_project_variables()
     before = [x.attributes for x in gitlab_keys]
-
-    gitlab_keys = this_gitlab.list_all_project_variables()
     existing_variables = filter_returned_variables(gitlab_keys)
+    existing_index = variable_index(existing_variables)
 
     # filter out and enrich before compare
     for item in requested_variables:
@@ -336,8 +335,14 @@ def native_python_main(this_gitlab, purge, requested_variables, state, module):
         untouched, updated, added = compare(requested_variables, existing_variables, state)
 
     if state == 'present':
-        add_or_update = [x for x in requested_variables if x not in existing_variables]
-        for item in add_or_update:
+        for item in requested_variables:
+            existing = existing_index.get((item.get('key'), item.get('environment_scope')))
+            if existing == item:
+                continue
+            if existing is not None:
+                if this_gitlab.update_variable(item):
+                    return_value['updated'].append(item)
+                continue
             try:
                 if this_gitlab.create_variable(item):
                     return_value['added'].append(item)
@@ -347,11 +352,9 @@ def native_python_main(this_gitlab, purge, requested_variables, state, module):
                     return_value['updated'].append(item)
 
         if purge:
-            # refetch and filter
-            gitlab_keys = this_gitlab.list_all_project_variables()
-            existing_variables = filter_returned_variables(gitlab_keys)
-
-            remove = [x for x in existing_variables if x not in requested_variables]
+            # everything that was neither requested nor updated above
+            requested_index = variable_index(requested_variables)
+            remove = [x for x in existing_variables if (x.get('key'), x.get('environment_scope')) not in requested_index]
             for item in remove:
                 if this_gitlab.delete_variable(item):
                     return_value['removed'].append(item)
@@ -367,7 +370,8 @@ def native_python_main(this_gitlab, purge, requested_variables, state, module):
             item.pop('variable_type')
 
         if not purge:
-            remove_requested = [x for x in requested_variables if x in existing_variables]
+            remove_requested = [x for x in requested_variables
+                                if existing_index.get((x.get('key'), x.get('environment_scope'))) == x]
             for item in remove_requested:
                 if this_gitlab.delete_variable(item):
                     return_value['removed'].append(item)
@@ -383,7 +387,8 @@ def native_python_main(this_gitlab, purge, requested_variables, state, module):
     if any(return_value[x] for x in ['added', 'removed', 'updated']):
         change = True
 
-    gitlab_keys = this_gitlab.list_all_project_variables()
+    if change and not module.check_mode:
+        gitlab_keys = this_gitlab.list_all_project_variables()
     after = [x.attributes for x in gitlab_keys]
 
     return change, return_value, before, after
@@ -238,32 +238,33 @@ def ensure(module, client):
                         data[key] = module_role.get(key)
                     client.role_mod(name=name, item=data)
 
-        if group is not None:
-            changed = client.modify_if_diff(name, ipa_role.get('member_group', []), group,
-                                            client.role_add_group,
-                                            client.role_remove_group) or changed
-        if host is not None:
-            changed = client.modify_if_diff(name, ipa_role.get('member_host', []), host,
-                                            client.role_add_host,
-                                            client.role_remove_host) or changed
-
-        if hostgroup is not None:
-            changed = client.modify_if_diff(name, ipa_role.get('member_hostgroup', []), hostgroup,
-                                            client.role_add_hostgroup,
-                                            client.role_remove_hostgroup) or changed
-
-        if privilege is not None:
-            changed = client.modify_if_diff(name, ipa_role.get('memberof_privilege', []), privilege,
-                                            client.role_add_privilege,
-                                            client.role_remove_privilege) or changed
-        if service is not None:
-            changed = client.modify_if_diff(name, ipa_role.get('member_service', []), service,
-                                            client.role_add_service,
-                                            client.role_remove_service) or changed
-        if user is not None:
-            changed = client.modify_if_diff(name, ipa_role.get('member_user', []), user,
-                                            client.role_add_user,
-                                            client.role_remove_user) or changed
+        with client.batch():
+            if group is not None:
+                changed = client.modify_if_diff(name, ipa_role.get('member_group', []), group,
+                                                client.role_add_group,
+                                                client.role_remove_group) or changed
+            if host is not None:
+                changed = client.modify_if_diff(name, ipa_role.get('member_host', []), host,
+                                                client.role_add_host,
+                                                client.role_remove_host) or changed
+
+            if hostgroup is not None:
+                changed = client.modify_if_diff(name, ipa_role.get('member_hostgroup', []), hostgroup,
+                                                client.role_add_hostgroup,
+                                                client.role_remove_hostgroup) or changed
+
+            if privilege is not None:
+                changed = client.modify_if_diff(name, ipa_role.get('memberof_privilege', []), privilege,
+                                                client.role_add_privilege,
+                                                client.role_remove_privilege) or changed
+            if service is not None:
+                changed = client.modify_if_diff(name, ipa_role.get('member_service', []), service,
+                                                client.role_add_service,
+                                                client.role_remove_service) or changed
+            if user is not None:
+                changed = client.modify_if_diff(name, ipa_role.get('member_user', []), user,
+                                                client.role_add_user,
+                                                client.role_remove_user) or changed
 
     else:
         if ipa_role:
@@ -0,0 +1,544 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+module: keycloak_realm_partial_import
+
+short_description: Reconcile many clients, roles, groups and identity providers of a realm at once using the Keycloak API
+
+version_added: 10.8.0
+
+description:
+  - This module converges the clients, realm roles, client roles, groups and identity providers of a Keycloak realm towards
+    a desired state in bulk. It requires access to the REST API using OpenID Connect; the user connecting and the client
+    being used must have the requisite access rights. In a default Keycloak installation, admin-cli and an admin user would
+    work, as would a separate client definition with the scope tailored to your needs and a user having the expected roles.
+  - The current state is read with a single partial export of the realm. Every object given to the module is compared
+    with its exported counterpart. All missing objects, and differing clients and identity providers, are written with
+    a single partial import. Differing roles and groups are updated in place, so that their members and mappings are kept.
+  - Objects are given as Keycloak representations, with their keys in camelCase as in the Keycloak REST API. Only the keys
+    which are given are compared, and keys which are not given keep their current value.
+  - Objects of the realm which are not given to the module are left alone; this module never deletes objects.
+  - Client scopes cannot be imported partially. Use M(community.general.keycloak_clientscope) for them.
+notes:
+  - Keycloak replaces an existing client or identity provider during a partial import by deleting it and creating it
+    again, with the same ID, from the merged representation. The client roles of a replaced client are therefore imported
+    again together with it. Role mappings which refer to a replaced client or to its roles, such as the roles of the
+    service account of a client, or the user and group role mappings of its client roles, are lost unless they are part
+    of the same import. Users linked to a replaced identity provider lose that link.
+  - Existing realm roles, client roles of clients which are not replaced, and groups are updated with the role and group
+    endpoints instead. Their user and group role mappings and the members of groups are kept. The role mappings of a
+    group and the composites of a role are set to the ones given, for each client whose roles are given.
+  - Keycloak masks secrets in exports, so C(secret) and C(clientSecret) are not compared. The secrets of replaced
+    confidential clients are read separately and kept. Other masked values, such as the client secret of an identity
+    provider, are only kept if they are given to the module.
+attributes:
+  check_mode:
+    support: full
+  diff_mode:
+    support: full
+  action_group:
+    version_added: 10.8.0
+
+options:
+  realm:
+    type: str
+    description:
+      - The Keycloak realm.
+    default: 'master'
+
+  clients:
+    description:
+      - Client representations, identified by their C(clientId).
+    type: list
+    elements: dict
+
+  realm_roles:
+    description:
+      - Realm role representations, identified by their C(name).
+    type: list
+    elements: dict
+
+  client_roles:
+    description:
+      - Client role representations, as a dictionary mapping the C(clientId) of a client to a list of its roles, identified
+        by their C(name).
+      - The client must either exist or be given in O(clients).
+    type: dict
+
+  groups:
+    description:
+      - Top level group representations, identified by their C(name).
+      - Subgroups are given in C(subGroups) and are identified by their name below their parent. Existing subgroups which
+        are not given are kept.
+      - Role mappings are given in C(realmRoles) and C(clientRoles).
+    type: list
+    elements: dict
+
+  identity_providers:
+    description:
+      - Identity provider representations, identified by their C(alias).
+    type: list
+    elements: dict
+
+extends_documentation_fragment:
+  - community.general.keycloak
+  - community.general.keycloak.actiongroup_keycloak
+  - community.general.attributes
+
+author:
+  - agent (@agent)
+"""
+
+EXAMPLES = r"""
+- name: Converge the clients, roles and groups of a realm
+  community.general.keycloak_realm_partial_import:
+    auth_client_id: admin-cli
+    auth_keycloak_url: https://auth.example.com/auth
+    auth_realm: master
+    auth_username: USERNAME
+    auth_password: PASSWORD
+    realm: MyCustomRealm
+    clients:
+      - clientId: frontend
+        publicClient: true
+        redirectUris:
+          - https://app.example.com/*
+      - clientId: backend
+        serviceAccountsEnabled: true
+    realm_roles:
+      - name: auditor
+        description: Read only access
+    client_roles:
+      backend:
+        - name: admin
+        - name: reader
+    groups:
+      - name: operators
+        realmRoles:
+          - auditor
+        clientRoles:
+          backend:
+            - admin
+        subGroups:
+          - name: oncall
+  delegate_to: localhost
+"""
+
+RETURN = r"""
+msg:
+  description: Message as to what action was taken.
+  returned: always
+  type: str
+  sample: "2 objects added, 1 object updated, 1 object overwritten, 4 objects unchanged"
+objects:
+  description: What happened to each of the given objects, and to the client roles of replaced clients.
+  returned: always
+  type: list
+  elements: dict
+  contains:
+    resource_type:
+      description: The type of the object.
+      type: str
+      sample: client_role
+    name:
+      description: The C(clientId), C(name) or C(alias) of the object.
+      type: str
+      sample: admin
+    client_id:
+      description: The C(clientId) of the client of a client role.
+      type: str
+      returned: for client roles
+      sample: backend
+    action:
+      description:
+        - One of V(added), V(updated), V(overwritten) or V(unchanged).
+        - V(updated) objects were changed in place, V(overwritten) objects were replaced by the partial import.
+      type: str
+      sample: added
+  sample: [{resource_type: client_role, client_id: backend, name: admin, action: added}]
+import_result:
+  description:
+    - The partial import results returned by Keycloak.
+  returned: when objects were imported
+  type: dict
+  sample: {added: 2, overwritten: 1, skipped: 0, results: []}
+"""
+
+import copy
+
+from ansible.module_utils.basic import AnsibleModule
+
+from ansible_collections.community.general.plugins.module_utils.identity.keycloak.keycloak import (
+    KeycloakAPI, KeycloakError, get_token, is_struct_included, keycloak_argument_spec)
+
+# Value Keycloak exports in place of secrets
+MASKED_VALUE = '**********'
+SECRET_KEYS = ['secret', 'clientSecret']
+# Keys of a group representation which are not written by the group endpoint
+GROUP_MAPPING_KEYS = ['subGroups', 'realmRoles', 'clientRoles']
+
+
+def merge_representation(existing, desired):
+    """ Returns existing updated with the keys of desired, recursively for dicts. """
+    merged = copy.deepcopy(existing)
+    for key, value in desired.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_representation(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+def merge_group(existing, desired):
+    """ Like merge_representation(), but merges subgroups by name instead of replacing them. """
+    subgroups = desired.get('subGroups')
+    merged = merge_representation(existing, dict((k, v) for k, v in desired.items() if k != 'subGroups'))
+    if subgroups is not None:
+        existing_subgroups = dict((group.get('name'), group) for group in existing.get('subGroups') or [])
+        merged_subgroups = [merge_group(existing_subgroups.pop(group.get('name'), {}), group) for group in subgroups]
+        merged['subGroups'] = merged_subgroups + list(existing_subgroups.values())
+    return merged
+
+
+def composite_names(composites):
+    """ Returns the (client ID, name) pairs of the composites of a role representation, with None for realm roles. """
+    names = set((None, name) for name in (composites or {}).get('realm') or [])
+    for client_id, roles in ((composites or {}).get('client') or {}).items():
+        names.update((client_id, name) for name in roles)
+    return names
+
+
+def find_masked(rep, path=''):
+    """ Returns the paths of all masked values in a representation. """
+    if isinstance(rep, dict):
+        items = rep.items()
+    elif isinstance(rep, list):
+        items = enumerate(rep)
+    else:
+        return [path] if rep == MASKED_VALUE else []
+    masked = []
+    for key, value in items:
+        masked.extend(find_masked(value, '%s.%s' % (path, key) if path else str(key)))
+    return masked
+
+
+def remove_masked(rep):
+    """ Removes all masked values from a representation, so that Keycloak does not store them verbatim. """
+    if isinstance(rep, dict):
+        return dict((k, remove_masked(v)) for k, v in rep.items() if v != MASKED_VALUE)
+    if isinstance(rep, list):
+        return [remove_masked(v) for v in rep]
+    return rep
+
+
+def mask_secrets(rep):
+    """ Returns a copy of a representation with all secrets masked, for the diff. """
+    if isinstance(rep, dict):
+        return dict((k, MASKED_VALUE if k in SECRET_KEYS and v is not None else mask_secrets(v)) for k, v in rep.items())
+    if isinstance(rep, list):
+        return [mask_secrets(v) for v in rep]
+    return rep
+
+
+class PartialImport(object):
+    """ Collects the objects to import or update in place and the per-object results. """
+
+    def __init__(self, module, kc, realm):
+        self.module = module
+        self.kc = kc
+        self.realm = realm
+        self.importrep = dict(ifResourceExists='OVERWRITE')
+        self.updates = []
+        self.objects = []
+        self.before = {}
+        self.after = {}
+        self._roles = {}
+        self._client_uuids = {}
+
+    def _record(self, resource_type, name, action, before, after, client_id=None):
+        obj = dict(resource_type=resource_type, name=name, action=action)
+        if client_id is not None:
+            obj['client_id'] = client_id
+        self.objects.append(obj)
+        if action != 'unchanged':
+            label = '%s/%s' % (client_id, name) if client_id is not None else name
+            self.before.setdefault(resource_type, {})[label] = mask_secrets(before or {})
+            self.after.setdefault(resource_type, {})[label] = mask_secrets(after)
+
+    def _reconcile(self, resource_type, key, desired_objects, existing_objects, merge=merge_representation, client_id=None,
+                   in_place=False):
+        """ Compares desired_objects with existing_objects by key and returns the merged representations to import.
+        With in_place, differing existing objects are queued in updates instead. """
+        existing_by_key = dict((obj.get(key), obj) for obj in existing_objects or [])
+        to_import = []
+        for desired in desired_objects or []:
+            name = desired.get(key)
+            if name is None:
+                self.module.fail_json(msg='All %s must have a %s' % (resource_type.replace('_', ' ') + 's', key))
+            existing = existing_by_key.get(name)
+            if existing is None:
+                self._record(resource_type, name, 'added', existing, desired, client_id=client_id)
+                to_import.append(copy.deepcopy(desired))
+            elif is_struct_included(desired, existing, exclude=SECRET_KEYS):
+                self._record(resource_type, name, 'unchanged', existing, existing, client_id=client_id)
+            else:
+                merged = merge(existing, desired)
+                self._record(resource_type, name, 'updated' if in_place else 'overwritten', existing, merged, client_id=client_id)
+                if in_place:
+                    self.updates.append((resource_type, existing, merged, client_id))
+                else:
+                    to_import.append(merged)
+        return to_import
+
+    def _restore_client_secret(self, client):
+        if client.get('secret') != MASKED_VALUE or self.module.check_mode:
+            return
+        secret = self.kc.get_clientsecret(client['id'], realm=self.realm)
+        if secret and secret.get('value'):
+            client['secret'] = secret['value']
+
+    def _reimport_client_roles(self, client_id, desired_roles, existing_roles):
+        """ Replacing a client deletes its roles, so all of them are imported again along with it. """
+        existing_by_name = dict((role['name'], role) for role in existing_roles or [])
+        to_import = []
+        for desired in desired_roles or []:
+            name = desired.get('name')
+            if name is None:
+                self.module.fail_json(msg='All client roles must have a name')
+            existing = existing_by_name.pop(name, None)
+            merged = merge_representation(existing or {}, desired)
+            self._record('client_role', name, 'added' if existing is None else 'overwritten', existing, merged, client_id=client_id)
+            to_import.append(merged)
+        for name in sorted(existing_by_name):
+            role = existing_by_name[name]
+            self._record('client_role', name, 'overwritten', role, role, client_id=client_id)
+            to_import.append(role)
+        return to_import
+
+    def prepare(self, export):
+        """ Compares the module parameters with the export and fills importrep and updates. """
+        params = self.module.params
+
+        clients = self._reconcile('client', 'clientId', params['clients'], export.get('clients'))
+        replaced_clients = set(obj['name'] for obj in self.objects if obj['action'] == 'overwritten')
+        for client in clients:
+            if client['clientId'] in replaced_clients:
+                self._restore_client_secret(client)
+        if clients:
+            self.importrep['clients'] = clients
+
+        roles = {}
+        realm_roles = self._reconcile('realm_role', 'name', params['realm_roles'], (export.get('roles') or {}).get('realm'),
+                                      in_place=True)
+        if realm_roles:
+            roles['realm'] = realm_roles
+
+        existing_client_roles = (export.get('roles') or {}).get('client') or {}
+        desired_client_roles = params['client_roles'] or {}
+        client_roles = {}
+        for client_id in sorted(set(desired_client_roles) | replaced_clients):
+            if client_id in replaced_clients:
+                imported = self._reimport_client_roles(client_id, desired_client_roles.get(client_id),
+                                                       existing_client_roles.get(client_id))
+            else:
+                imported = self._reconcile('client_role', 'name', desired_client_roles[client_id],
+                                           existing_client_roles.get(client_id), client_id=client_id, in_place=True)
+            if imported:
+                client_roles[client_id] = imported
+        if client_roles:
+            roles['client'] = client_roles
+        if roles:
+            self.importrep['roles'] = roles
+
+        groups = self._reconcile('group', 'name', params['groups'], export.get('groups'), merge=merge_group, in_place=True)
+        if groups:
+            self.importrep['groups'] = groups
+
+        if params['identity_providers']:
+            existing = export.get('identityProviders')
+            if existing is None:
+                existing = self.kc.get_identity_providers(realm=self.realm)
+            identity_providers = self._reconcile('identity_provider', 'alias', params['identity_providers'], existing)
+            if identity_providers:
+                self.importrep['identityProviders'] = identity_providers
+
+        for resource_type in ('clients', 'groups', 'identityProviders'):
+            if resource_type not in self.importrep:
+                continue
+            for rep in self.importrep[resource_type]:
+                masked = find_masked(rep)
+                if masked:
+                    self.module.warn('Keycloak does not export the value of %s of %s, it is removed by the import'
+                                     % (', '.join(masked), rep.get('clientId') or rep.get('alias') or rep.get('name')))
+            self.importrep[resource_type] = [remove_masked(rep) for rep in self.importrep[resource_type]]
+
+    def _get_role(self, name, client_id=None):
+        """ Returns the representation of a realm or client role, which may have been imported by this run. """
+        if (client_id, name) not in self._roles:
+            if client_id is None:
+                role = self.kc.get_realm_role(name, realm=self.realm)
+            else:
+                role = self.kc.get_client_role(name, client_id, realm=self.realm)
+            if role is None:
+                label = name if client_id is None else '%s/%s' % (client_id, name)
+                self.module.fail_json(msg='Could not find role %s in realm %s' % (label, self.realm))
+            self._roles[(client_id, name)] = role
+        return self._roles[(client_id, name)]
+
+    def _get_client_uuid(self, client_id):
+        if client_id not in self._client_uuids:
+            uuid = self.kc.get_client_id(client_id, realm=self.realm)
+            if uuid is None:
+                self.module.fail_json(msg='Could not find client %s in realm %s' % (client_id, self.realm))
+            self._client_uuids[client_id] = uuid
+        return self._client_uuids[client_id]
+
+    def _update_role(self, existing, merged, client_id=None):
+        rolerep = dict((k, v) for k, v in merged.items() if k != 'composites')
+        if merged.get('composites') != existing.get('composites'):
+            wanted = composite_names(merged.get('composites'))
+            current = composite_names(existing.get('composites'))
+            rolerep['composites'] = [dict(client_id=c, name=n, state='present' if (c, n) in wanted else 'absent')
+                                     for c, n in sorted(wanted | current, key=lambda pair: (pair[0] or '', pair[1]))]
+        if client_id is None:
+            self.kc.update_realm_role(rolerep, realm=self.realm)
+        else:
+            self.kc.update_client_role(rolerep, client_id, realm=self.realm)
+
+    def _update_role_mappings(self, group_id, existing, merged, client_id=None):
+        """ Sets the realm or client role mappings of a group to merged, which are lists of role names. """
+        added = [self._get_role(name, client_id) for name in merged or [] if name not in (existing or [])]
+        removed = [self._get_role(name, client_id) for name in existing or [] if name not in (merged or [])]
+        if client_id is None:
+            if added:
+                self.kc.add_group_realm_rolemapping(group_id, added, realm=self.realm)
+            if removed:
+                self.kc.delete_group_realm_rolemapping(group_id, removed, realm=self.realm)
+        else:
+            if added:
+                self.kc.add_group_rolemapping(group_id, self._get_client_uuid(client_id), added, realm=self.realm)
+            if removed:
+                self.kc.delete_group_rolemapping(group_id, self._get_client_uuid(client_id), removed, realm=self.realm)
+
+    def _update_group(self, existing, merged, parent_id=None):
+        """ Writes a group and its subgroups with the group endpoints, which keeps their members.
+        An existing of None creates merged as a subgroup of parent_id. """
+        grouprep = dict((k, v) for k, v in merged.items() if k not in GROUP_MAPPING_KEYS)
+        if existing is None:
+            response = self.kc.create_subgroup([dict(id=parent_id)], grouprep, realm=self.realm)
+            group_id = response.getheader('Location').rsplit('/', 1)[1]
+            existing = {}
+        else:
+            group_id = existing['id']
+            if grouprep != dict((k, v) for k, v in existing.items() if k not in GROUP_MAPPING_KEYS):
+                self.kc.update_group(grouprep, realm=self.realm)
+
+        self._update_role_mappings(group_id, existing.get('realmRoles'), merged.get('realmRoles'))
+        existing_client_roles = existing.get('clientRoles') or {}
+        for client_id, role_names in sorted((merged.get('clientRoles') or {}).items()):
+            self._update_role_mappings(group_id, existing_client_roles.get(client_id), role_names, client_id=client_id)
+
+        existing_subgroups = dict((group['name'], group) for group in existing.get('subGroups') or [])
+        for subgroup in merged.get('subGroups') or []:
+            existing_subgroup = existing_subgroups.get(subgroup['name'])
+            if existing_subgroup is None or subgroup != existing_subgroup:
+                self._update_group(existing_subgroup, subgroup, parent_id=group_id)
+
+    def apply(self):
+        """ Runs the partial import, then the updates in place, which may refer to imported roles.
+        Returns the partial import results, or None if nothing had to be imported. """
+        import_result = None
+        if any(key != 'ifResourceExists' for key in self.importrep):
+            import_result = self.kc.import_realm_partial(self.importrep, realm=self.realm)
+        for resource_type, existing, merged, client_id in self.updates:
+            if resource_type == 'group':
+                self._update_group(existing, merged)
+            else:
+                self._update_role(existing, merged, client_id=client_id)
+        return import_result
+
+    def summary(self):
+        counts = []
+        for action in ('added', 'updated', 'overwritten', 'unchanged'):
+            number = len([obj for obj in self.objects if obj['action'] == action])
+            counts.append('%d object%s %s' % (number, '' if number == 1 else 's', action))
+        return ', '.join(counts)
+
+
+def main():
+    """
+    Module execution
+
+    :return:
+    """
+    argument_spec = keycloak_argument_spec()
+
+    meta_args = dict(
+        realm=dict(type='str', default='master'),
+        clients=dict(type='list', elements='dict'),
+        realm_roles=dict(type='list', elements='dict'),
+        client_roles=dict(type='dict'),
+        groups=dict(type='list', elements='dict'),
+        identity_providers=dict(type='list', elements='dict'),
+    )
+
+    argument_spec.update(meta_args)
+
+    module = AnsibleModule(argument_spec=argument_spec,
+                           supports_check_mode=True,
+                           required_one_of=([['token', 'auth_realm', 'auth_username', 'auth_password'],
+                                             ['clients', 'realm_roles', 'client_roles', 'groups', 'identity_providers']]),
+                           required_together=([['auth_realm', 'auth_username', 'auth_password']]),
+                           required_by={'refresh_token': 'auth_realm'},
+                           mutually_exclusive=[
+                               ['token', 'auth_realm'],
+                               ['token', 'auth_username'],
+                               ['token', 'auth_password']
+                           ])
+
+    result = dict(changed=False, msg='', objects=[])
+
+    # Obtain access token, initialize API
+    try:
+        connection_header = get_token(module.params)
+    except KeycloakError as e:
+        module.fail_json(msg=str(e))
+
+    kc = KeycloakAPI(module, connection_header)
+
+    realm = module.params.get('realm')
+    export_clients = bool(module.params.get('clients') or module.params.get('client_roles'))
+    export_groups_and_roles = bool(module.params.get('realm_roles') or module.params.get('client_roles') or module.params.get('groups'))
+    # the clients are needed to know which client roles are deleted along with a replaced client
+    export = kc.export_realm_partial(realm, export_clients=export_clients,
+                                     export_groups_and_roles=export_groups_and_roles or export_clients)
+
+    partial_import = PartialImport(module, kc, realm)
+    partial_import.prepare(export)
+
+    result['objects'] = partial_import.objects
+    result['changed'] = any(obj['action'] != 'unchanged' for obj in partial_import.objects)
+    result['msg'] = partial_import.summary()
+    if module._diff:
+        result['diff'] = dict(before=partial_import.before, after=partial_import.after)
+
+    if module.check_mode or not result['changed']:
+        module.exit_json(**result)
+
+    import_result = partial_import.apply()
+    if import_result is not None:
+        result['import_result'] = import_result
+    module.exit_json(**result)
+
+
+if __name__ == '__main__':
+    main()
@@ -48,10 +48,10 @@ options:
         forced to exactly those provided and no others. If O(state=exact) and the attribute value is empty, all values for
         this attribute will be removed.
   attributes:
-    required: true
     type: dict
     description:
       - The attribute(s) and value(s) to add or remove.
+      - Exactly one of O(attributes) and O(entries) is required.
       - Each attribute value can be a string for single-valued attributes or a list of strings for multi-valued attributes.
       - If you specify values for this option in YAML, please note that you can improve readability for long string values
         by using YAML block modifiers as seen in the examples for this module.
@@ -64,6 +64,42 @@ options:
     description:
       - If V(true), prepend list values with X-ORDERED index numbers in all attributes specified in the current task. This
         is useful mostly with C(olcAccess) attribute to easily manage LDAP Access Control Lists.
+  entries:
+    type: list
+    elements: dict
+    description:
+      - Manage the attributes of many entries at once, instead of the attributes of the entry O(dn).
+      - O(dn) is then the base below which all entries are located. The entries are looked up with subtree searches below
+        O(dn), which also return the current values of the attributes being managed. All changes are applied on the same
+        connection.
+      - O(state) and O(ordered) apply to all entries. All entries must exist.
+      - For O(state=exact), values are compared with the values read in Python, as without O(entries).
+      - For O(state=present) and O(state=absent), a value which is equal to one of the values read, or which belongs to an
+        attribute without values, is decided without asking the server. Any other value may still match a value read
+        according to the matching rules of the attribute, for example because of case, and is compared by the server as
+        without O(entries), with one more search for each such value.
+      - Exactly one of O(attributes) and O(entries) is required.
+    suboptions:
+      dn:
+        description:
+          - The DN of the entry.
+        type: str
+        required: true
+      attributes:
+        description:
+          - The attribute(s) and value(s) to add or remove, in the same format as O(attributes).
+        type: dict
+        required: true
+    version_added: 10.8.0
+  pipeline_depth:
+    type: int
+    default: 1
+    description:
+      - With O(entries), the number of modify operations sent to the server before waiting for the result of the oldest
+        one.
+      - V(1) runs one operation at a time. Higher values send asynchronous operations and collect their results, which saves
+        a round trip per entry.
+    version_added: 10.8.0
 extends_documentation_fragment:
   - community.general.ldap.documentation
   - community.general.attributes
@@ -141,6 +177,23 @@ EXAMPLES = r"""
     bind_dn: cn=admin,dc=example,dc=com
     bind_pw: password
 
+- name: Set the login shell and the description of many users
+  community.general.ldap_attrs:
+    dn: ou=people,dc=example,dc=com
+    entries:
+      - dn: uid=jdoe,ou=people,dc=example,dc=com
+        attributes:
+          loginShell: /bin/bash
+          description: John Doe
+      - dn: uid=asmith,ou=people,dc=example,dc=com
+        attributes:
+          loginShell: /bin/zsh
+    state: exact
+    pipeline_depth: 20
+    server_uri: ldap://localhost/
+    bind_dn: cn=admin,dc=example,dc=com
+    bind_pw: password
+
 - name: Remove specified attribute(s) from an entry
   community.general.ldap_attrs:
     dn: uid=jdoe,ou=people,dc=example,dc=com
@@ -156,17 +209,27 @@ EXAMPLES = r"""
 RETURN = r"""
 modlist:
   description: List of modified parameters.
-  returned: success
+  returned: success and O(entries) is not set
   type: list
   sample:
     - [2, "olcRootDN", ["cn=root,dc=example,dc=com"]]
+entries:
+  description: The entries of O(entries) that were modified, with their list of modified parameters.
+  returned: success and O(entries) is set
+  type: list
+  elements: dict
+  sample:
+    - dn: uid=jdoe,ou=people,dc=example,dc=com
+      modlist:
+        - [2, "loginShell", ["/bin/bash"]]
+  version_added: 10.8.0
 """
 
 import traceback
 
 from ansible.module_utils.basic import AnsibleModule, missing_required_lib
 from ansible.module_utils.common.text.converters import to_native, to_bytes, to_text
-from ansible_collections.community.general.plugins.module_utils.ldap import LdapGeneric, gen_specs, ldap_required_together
+from ansible_collections.community.general.plugins.module_utils.ldap import LdapGeneric, gen_specs, ldap_required_together, normalize_dn
 
 import re
 
@@ -217,29 +280,33 @@ class LdapAttrs(LdapGeneric):
 
         return norm_values
 
-    def add(self):
+    def _attributes(self, attributes):
+        """ The given attributes of an entry of the entries option, or the attributes option. """
+        return self.module.params['attributes'] if attributes is None else attributes
+
+    def add(self, attributes=None, dn=None, current_attrs=None):
         modlist = []
         new_attrs = {}
-        for name, values in self.module.params['attributes'].items():
+        for name, values in self._attributes(attributes).items():
             norm_values = self._normalize_values(values)
             added_values = []
             for value in norm_values:
-                if self._is_value_absent(name, value):
+                if self._is_value_absent(name, value, dn, current_attrs):
                     modlist.append((ldap.MOD_ADD, name, value))
                     added_values.append(value)
             if added_values:
                 new_attrs[name] = norm_values
         return modlist, {}, new_attrs
 
-    def delete(self):
+    def delete(self, attributes=None, dn=None, current_attrs=None):
         modlist = []
         old_attrs = {}
         new_attrs = {}
-        for name, values in self.module.params['attributes'].items():
+        for name, values in self._attributes(attributes).items():
             norm_values = self._normalize_values(values)
             removed_values = []
             for value in norm_values:
-                if self._is_value_present(name, value):
+                if self._is_value_present(name, value, dn, current_attrs):
                     removed_values.append(value)
                     modlist.append((ldap.MOD_DELETE, name, value))
             if removed_values:
@@ -247,19 +314,24 @@ class LdapAttrs(LdapGeneric):
                 new_attrs[name] = [value for value in norm_values if value not in removed_values]
         return modlist, old_attrs, new_attrs
 
-    def exact(self):
+    def exact(self, attributes=None, current_attrs=None):
+        """ With current_attrs, the values of the entry read by bulk() are
+        used instead of searching for each attribute. """
         modlist = []
         old_attrs = {}
         new_attrs = {}
-        for name, values in self.module.params['attributes'].items():
+        for name, values in self._attributes(attributes).items():
             norm_values = self._normalize_values(values)
-            try:
-                results = self.connection.search_s(
-                    self.dn, ldap.SCOPE_BASE, attrlist=[name])
-            except ldap.LDAPError as e:
-                self.fail("Cannot search for attribute %s" % name, e)
+            if current_attrs is not None:
+                current = current_attrs.get(name.lower(), [])
+            else:
+                try:
+                    results = self.connection.search_s(
+                        self.dn, ldap.SCOPE_BASE, attrlist=[name])
+                except ldap.LDAPError as e:
+                    self.fail("Cannot search for attribute %s" % name, e)
 
-            current = results[0][1].get(name, [])
+                current = results[0][1].get(name, [])
 
             if frozenset(norm_values) != frozenset(current):
                 if len(current) == 0:
@@ -276,32 +348,89 @@ class LdapAttrs(LdapGeneric):
 
         return modlist, old_attrs, new_attrs
 
-    def _is_value_present(self, name, value):
-        """ True if the target attribute has the given value. """
+    def bulk(self):
+        """ Computes the changes of all entries of the entries option, which are
+        looked up together. """
+        entries = self.module.params['entries']
+        keys = []
+        try:
+            for entry in entries:
+                keys.append(normalize_dn(entry['dn']))
+        except ldap.LDAPError as e:
+            self.fail("Invalid DN %s" % entry['dn'], e)
+        if len(set(keys)) != len(keys):
+            self.module.fail_json(msg="Each DN may only be listed once in entries.")
+
+        names = set()
+        for entry in entries:
+            names.update(entry['attributes'])
+        found = self.search_entries([entry['dn'] for entry in entries], sorted(names) or ['1.1'])
+
+        missing = [entry['dn'] for key, entry in zip(keys, entries) if key not in found]
+        if missing:
+            self.module.fail_json(msg="Entries not found below %s: %s" % (self.dn, ', '.join(missing)))
+
+        results = []
+        old_entries = {}
+        new_entries = {}
+        for key, entry in zip(keys, entries):
+            dn, current = found[key]
+            if self.state == 'present':
+                modlist, old_attrs, new_attrs = self.add(entry['attributes'], dn, current)
+            elif self.state == 'absent':
+                modlist, old_attrs, new_attrs = self.delete(entry['attributes'], dn, current)
+            else:
+                modlist, old_attrs, new_attrs = self.exact(entry['attributes'], current)
+            if modlist:
+                results.append(dict(dn=dn, modlist=modlist))
+                old_entries[dn] = old_attrs
+                new_entries[dn] = new_attrs
+
+        return results, old_entries, new_entries
+
+    def _is_value_present(self, name, value, dn=None, current_attrs=None):
+        """ True if the target attribute has the given value.
+
+        With current_attrs, the values read by bulk(), the server is only asked
+        if the value differs from the values of a non-empty attribute, as its
+        matching rules may still consider them equal. """
+        if current_attrs is not None:
+            current = current_attrs.get(name.lower(), [])
+            if value in current:
+                return True
+            if not current:
+                return False
         try:
             escaped_value = ldap.filter.escape_filter_chars(to_text(value))
             filterstr = "(%s=%s)" % (name, escaped_value)
-            dns = self.connection.search_s(self.dn, ldap.SCOPE_BASE, filterstr)
+            dns = self.connection.search_s(dn or self.dn, ldap.SCOPE_BASE, filterstr)
             is_present = len(dns) == 1
         except ldap.NO_SUCH_OBJECT:
             is_present = False
 
         return is_present
 
-    def _is_value_absent(self, name, value):
+    def _is_value_absent(self, name, value, dn=None, current_attrs=None):
         """ True if the target attribute doesn't have the given value. """
-        return not self._is_value_present(name, value)
+        return not self._is_value_present(name, value, dn, current_attrs)
 
 
 def main():
     module = AnsibleModule(
         argument_spec=gen_specs(
-            attributes=dict(type='dict', required=True),
+            attributes=dict(type='dict'),
+            entries=dict(type='list', elements='dict', options=dict(
+                dn=dict(type='str', required=True),
+                attributes=dict(type='dict', required=True),
+            )),
             ordered=dict(type='bool', default=False, required=False),
+            pipeline_depth=dict(type='int', default=1),
             state=dict(type='str', default='present', choices=['absent', 'exact', 'present']),
         ),
         supports_check_mode=True,
         required_together=ldap_required_together(),
+        required_one_of=[('attributes', 'entries')],
+        mutually_exclusive=[('attributes', 'entries')],
     )
 
     if not HAS_LDAP:
@@ -315,6 +444,17 @@ def main():
 
     state = module.params['state']
 
+    if module.params['entries'] is not None:
+        results, old_entries, new_entries = ldap.bulk()
+
+        if results and not module.check_mode:
+            errors = ldap.run_operations([('modify', result['dn'], (result['modlist'],)) for result in results],
+                                         module.params['pipeline_depth'])
+            if errors:
+                module.fail_json(msg="Attribute action failed for %d of %d entries." % (len(errors), len(results)), details=errors)
+
+        module.exit_json(changed=bool(results), entries=results, diff={"before": old_entries, "after": new_entries})
+
     # Perform action
     if state == 'present':
         modlist, old_attrs, new_attrs = ldap.add()
@@ -56,6 +56,42 @@ options:
     type: bool
     default: false
     version_added: 4.6.0
+  entries:
+    description:
+      - Add or remove many entries at once, instead of the entry O(dn).
+      - O(dn) is then the base below which all entries are located. Which entries exist is found out with subtree searches
+        below O(dn) that return no attributes. All entries are added or deleted on the same connection.
+      - Parents are added before their children and deleted after them, when they are listed in the same task.
+      - O(state) and O(recursive) apply to all entries.
+      - Mutually exclusive with O(attributes) and O(objectClass).
+    type: list
+    elements: dict
+    suboptions:
+      dn:
+        description:
+          - The DN of the entry.
+        type: str
+        required: true
+      objectClass:
+        description:
+          - If O(state=present), value or list of values to use when creating the entry. Required if O(state=present).
+        type: list
+        elements: str
+      attributes:
+        description:
+          - If O(state=present), attributes necessary to create the entry, in the same format as O(attributes).
+        type: dict
+        default: {}
+    version_added: 10.8.0
+  pipeline_depth:
+    description:
+      - With O(entries), the number of add or delete operations sent to the server before waiting for the result of the
+        oldest one. Entries are only sent once all of their parents listed in O(entries) have been added.
+      - V(1) runs one operation at a time. Higher values send asynchronous operations and collect their results, which saves
+        a round trip per entry. Recursive deletes always run one at a time.
+    type: int
+    default: 1
+    version_added: 10.8.0
 extends_documentation_fragment:
   - community.general.ldap.documentation
   - community.general.attributes
@@ -124,18 +160,40 @@ EXAMPLES = r"""
     dn: ou=stuff,dc=example,dc=com
     state: absent
   args: "{{ ldap_auth }}"
+
+- name: Make sure we have the organizational units of all departments
+  community.general.ldap_entry:
+    dn: dc=example,dc=com
+    entries:
+      - dn: ou=departments,dc=example,dc=com
+        objectClass: organizationalUnit
+      - dn: ou=sales,ou=departments,dc=example,dc=com
+        objectClass: organizationalUnit
+      - dn: ou=research,ou=departments,dc=example,dc=com
+        objectClass: organizationalUnit
+        attributes:
+          description: Research and development
+    pipeline_depth: 20
+  args: "{{ ldap_auth }}"
 """
 
 
 RETURN = r"""
-# Default return values
+entries:
+  description: The DNs of the entries of O(entries) that were added or deleted.
+  returned: success and O(entries) is set
+  type: list
+  elements: str
+  sample:
+    - uid=jdoe,ou=people,dc=example,dc=com
+  version_added: 10.8.0
 """
 
 import traceback
 
 from ansible.module_utils.basic import AnsibleModule, missing_required_lib
 from ansible.module_utils.common.text.converters import to_native, to_bytes
-from ansible_collections.community.general.plugins.module_utils.ldap import LdapGeneric, gen_specs, ldap_required_together
+from ansible_collections.community.general.plugins.module_utils.ldap import LdapGeneric, gen_specs, ldap_required_together, normalize_dn, dn_depth
 
 LDAP_IMP_ERR = None
 try:
@@ -156,19 +214,22 @@ class LdapEntry(LdapGeneric):
         self.state = self.module.params['state']
         self.recursive = self.module.params['recursive']
 
+        if self.module.params['entries'] is not None:
+            return
+
         # Add the objectClass into the list of attributes
         self.module.params['attributes']['objectClass'] = (
             self.module.params['objectClass'])
 
         # Load attributes
         if self.state == 'present':
-            self.attrs = self._load_attrs()
+            self.attrs = self._load_attrs(self.module.params['attributes'])
 
-    def _load_attrs(self):
+    def _load_attrs(self, attributes):
         """ Turn attribute's value to array. """
         attrs = {}
 
-        for name, value in self.module.params['attributes'].items():
+        for name, value in attributes.items():
             if isinstance(value, list):
                 attrs[name] = list(map(to_bytes, value))
             else:
@@ -197,16 +258,7 @@ class LdapEntry(LdapGeneric):
             self.connection.delete_s(self.dn)
 
         def _delete_recursive():
-            """ Attempt recursive deletion using the subtree-delete control.
-            If that fails, do it manually. """
-            try:
-                subtree_delete = ldap.controls.ValueLessRequestControl('1.2.840.113556.1.4.805')
-                self.connection.delete_ext_s(self.dn, serverctrls=[subtree_delete])
-            except ldap.NOT_ALLOWED_ON_NONLEAF:
-                search = self.connection.search_s(self.dn, ldap.SCOPE_SUBTREE, attrlist=('dn',))
-                search.reverse()
-                for entry in search:
-                    self.connection.delete_s(entry[0])
+            self._delete_recursive(self.dn)
 
         if self._is_entry_present():
             if self.recursive:
@@ -218,6 +270,73 @@ class LdapEntry(LdapGeneric):
 
         return action
 
+    def _delete_recursive(self, dn):
+        """ Attempt recursive deletion using the subtree-delete control.
+        If that fails, do it manually. """
+        try:
+            subtree_delete = ldap.controls.ValueLessRequestControl('1.2.840.113556.1.4.805')
+            self.connection.delete_ext_s(dn, serverctrls=[subtree_delete])
+        except ldap.NOT_ALLOWED_ON_NONLEAF:
+            search = self.connection.search_s(dn, ldap.SCOPE_SUBTREE, attrlist=('dn',))
+            search.reverse()
+            for entry in search:
+                self.connection.delete_s(entry[0])
+
+    def bulk(self):
+        """ Returns the DNs of the entries to add or delete, and a callable
+        that will add or delete them and return the errors by DN. """
+        entries = self.module.params['entries']
+        keys = []
+        try:
+            for entry in entries:
+                keys.append(normalize_dn(entry['dn']))
+        except ldap.LDAPError as e:
+            self.fail("Invalid DN %s" % entry['dn'], e)
+        if len(set(keys)) != len(keys):
+            self.module.fail_json(msg="Each DN may only be listed once in entries.")
+
+        # '1.1' requests no attributes at all
+        found = self.search_entries([entry['dn'] for entry in entries], ['1.1'])
+
+        if self.state == 'present':
+            missing = [entry for key, entry in zip(keys, entries) if key not in found]
+            for entry in missing:
+                if not entry['objectClass']:
+                    self.module.fail_json(msg="objectClass is required to add entry %s." % entry['dn'])
+            # Parents first
+            levels = self._by_depth([
+                (entry['dn'], ('add', entry['dn'], (ldap.modlist.addModlist(self._load_attrs(
+                    dict(entry['attributes'] or {}, objectClass=entry['objectClass']))),)))
+                for entry in missing])
+        else:
+            # Children first
+            levels = self._by_depth([(found[key][0], ('delete', found[key][0], ())) for key in keys if key in found])
+            levels.reverse()
+
+        def _run():
+            errors = {}
+            for level in levels:
+                if self.recursive and self.state == 'absent':
+                    for operation, dn, args in level:
+                        try:
+                            self._delete_recursive(dn)
+                        except ldap.LDAPError as e:
+                            errors[dn] = to_native(e)
+                else:
+                    errors.update(self.run_operations(level, self.module.params['pipeline_depth']))
+            return errors
+
+        return [operation[1] for level in levels for operation in level], _run
+
+    def _by_depth(self, operations):
+        """ Groups (dn, operation) tuples into lists of operations on entries
+        of the same depth, ordered by increasing depth. """
+        levels = {}
+        for dn, operation in operations:
+            levels.setdefault(dn_depth(dn), []).append(operation)
+
+        return [levels[depth] for depth in sorted(levels)]
+
     def _is_entry_present(self):
         try:
             self.connection.search_s(self.dn, ldap.SCOPE_BASE)
@@ -236,8 +355,15 @@ def main():
             objectClass=dict(type='list', elements='str'),
             state=dict(default='present', choices=['present', 'absent']),
             recursive=dict(default=False, type='bool'),
+            entries=dict(type='list', elements='dict', options=dict(
+                dn=dict(type='str', required=True),
+                objectClass=dict(type='list', elements='str'),
+                attributes=dict(type='dict', default={}),
+            )),
+            pipeline_depth=dict(type='int', default=1),
         ),
-        required_if=[('state', 'present', ['objectClass'])],
+        required_if=[('state', 'present', ['objectClass', 'entries'], True)],
+        mutually_exclusive=[('entries', 'objectClass'), ('entries', 'attributes')],
         supports_check_mode=True,
         required_together=ldap_required_together(),
     )
@@ -251,6 +377,16 @@ def main():
     # Instantiate the LdapEntry object
     ldap = LdapEntry(module)
 
+    if module.params['entries'] is not None:
+        dns, run = ldap.bulk()
+
+        if dns and not module.check_mode:
+            errors = run()
+            if errors:
+                module.fail_json(msg="Entry action failed for %d of %d entries." % (len(errors), len(dns)), details=errors)
+
+        module.exit_json(changed=bool(dns), entries=dns)
+
     # Get the action function
     if state == 'present':
         action = ldap.add()
@@ -606,7 +606,6 @@ EXAMPLES = r"""
 """
 
 import re
-import time
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.common.text.converters import to_native
@@ -1669,11 +1668,11 @@ class ProxmoxLxcAnsible(ProxmoxAnsible):
         if timeout_msg != "":
             timeout_msg = "%s " % timeout_msg
 
-        while timeout > 0:
-            if self.api_task_ok(node, taskid):
-                return
-            timeout -= 1
-            time.sleep(1)
+        success, fail_reason = self.api_task_complete(node, taskid, timeout)
+        if success:
+            return
+        if fail_reason != ProxmoxAnsible.TASK_TIMED_OUT:
+            self.module.fail_json(vmid=vmid, taskid=taskid, msg="Task error: %s" % fail_reason)
 
         self.module.fail_json(
             vmid=vmid,
@@ -989,16 +989,13 @@ class ProxmoxKvmAnsible(ProxmoxAnsible):
             # Increase task timeout in case of stopped state to be sure it waits longer than VM stop operation itself
             timeout += 10
 
-        while timeout:
-            if self.api_task_ok(node, taskid):
-                # Wait an extra second as the API can be a ahead of the hypervisor
-                time.sleep(1)
-                return True
-            timeout = timeout - 1
-            if timeout == 0:
-                break
+        success, fail_reason = self.api_task_complete(node, taskid, timeout)
+        if success:
+            # Wait an extra second as the API can be a ahead of the hypervisor
             time.sleep(1)
-        return False
+        elif fail_reason != ProxmoxAnsible.TASK_TIMED_OUT:
+            self.module.fail_json(msg="Task error: %s" % fail_reason)
+        return success
 
     def create_vm(self, vmid, newid, node, name, memory, cpu, cores, sockets, update, update_unsafe, **kwargs):
         # Available only in PVE 4
@@ -147,7 +147,6 @@ EXAMPLES = r"""
 
 RETURN = r"""#"""
 
-import time
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.common.text.converters import to_native
@@ -188,29 +187,22 @@ class ProxmoxSnapAnsible(ProxmoxAnsible):
         if vmstatus == 'running':
             self.start_instance(vm, vmid, timeout)
 
+    def wait_for_task(self, vm, taskid, timeout, action):
+        success, fail_reason = self.api_task_complete(vm['node'], taskid, timeout)
+        if fail_reason == ProxmoxAnsible.TASK_TIMED_OUT:
+            self.module.fail_json(msg='Reached timeout while waiting for %s. Last line in task before timeout: %s' %
+                                  (action, self.proxmox_api.nodes(vm['node']).tasks(taskid).log.get()[:1]))
+        elif not success:
+            self.module.fail_json(msg="Task error while waiting for %s: %s" % (action, fail_reason))
+        return success
+
     def start_instance(self, vm, vmid, timeout):
         taskid = self.vmstatus(vm, vmid).start.post()
-        while timeout:
-            if self.api_task_ok(vm['node'], taskid):
-                return True
-            timeout -= 1
-            if timeout == 0:
-                self.module.fail_json(msg='Reached timeout while waiting for VM to start. Last line in task before timeout: %s' %
-                                      self.proxmox_api.nodes(vm['node']).tasks(taskid).log.get()[:1])
-            time.sleep(1)
-        return False
+        return self.wait_for_task(vm, taskid, timeout, 'VM to start')
 
     def shutdown_instance(self, vm, vmid, timeout):
         taskid = self.vmstatus(vm, vmid).shutdown.post()
-        while timeout:
-            if self.api_task_ok(vm['node'], taskid):
-                return True
-            timeout -= 1
-            if timeout == 0:
-                self.module.fail_json(msg='Reached timeout while waiting for VM to stop. Last line in task before timeout: %s' %
-                                      self.proxmox_api.nodes(vm['node']).tasks(taskid).log.get()[:1])
-            time.sleep(1)
-        return False
+        return self.wait_for_task(vm, taskid, timeout, 'VM to stop')
 
     def snapshot_retention(self, vm, vmid, retention):
         # ignore the last snapshot, which is the current state
@@ -245,52 +237,26 @@ class ProxmoxSnapAnsible(ProxmoxAnsible):
         else:
             taskid = self.snapshot(vm, vmid).post(snapname=snapname, description=description, vmstate=int(vmstate))
 
-        while timeout:
-            if self.api_task_ok(vm['node'], taskid):
-                break
-            if timeout == 0:
-                self.module.fail_json(msg='Reached timeout while waiting for creating VM snapshot. Last line in task before timeout: %s' %
-                                      self.proxmox_api.nodes(vm['node']).tasks(taskid).log.get()[:1])
-
-            time.sleep(1)
-            timeout -= 1
+        success = self.wait_for_task(vm, taskid, timeout, 'creating VM snapshot')
         if vm['type'] == 'lxc' and unbind is True and mountpoints:
             self._container_mp_restore(vm, vmid, timeout, unbind, mountpoints, vmstatus)
 
         self.snapshot_retention(vm, vmid, retention)
-        return timeout > 0
+        return success
 
     def snapshot_remove(self, vm, vmid, timeout, snapname, force):
         if self.module.check_mode:
             return True
 
         taskid = self.snapshot(vm, vmid).delete(snapname, force=int(force))
-        while timeout:
-            if self.api_task_ok(vm['node'], taskid):
-                return True
-            if timeout == 0:
-                self.module.fail_json(msg='Reached timeout while waiting for removing VM snapshot. Last line in task before timeout: %s' %
-                                      self.proxmox_api.nodes(vm['node']).tasks(taskid).log.get()[:1])
-
-            time.sleep(1)
-            timeout -= 1
-        return False
+        return self.wait_for_task(vm, taskid, timeout, 'removing VM snapshot')
 
     def snapshot_rollback(self, vm, vmid, timeout, snapname):
         if self.module.check_mode:
             return True
 
         taskid = self.snapshot(vm, vmid)(snapname).post("rollback")
-        while timeout:
-            if self.api_task_ok(vm['node'], taskid):
-                return True
-            if timeout == 0:
-                self.module.fail_json(msg='Reached timeout while waiting for rolling back VM snapshot. Last line in task before timeout: %s' %
-                                      self.proxmox_api.nodes(vm['node']).tasks(taskid).log.get()[:1])
-
-            time.sleep(1)
-            timeout -= 1
-        return False
+        return self.wait_for_task(vm, taskid, timeout, 'rolling back VM snapshot')
 
 
 def main():
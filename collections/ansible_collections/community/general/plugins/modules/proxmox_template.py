@@ -206,18 +206,13 @@ class ProxmoxTemplateAnsible(ProxmoxAnsible):
         """
         Check the task status and wait until the task is completed or the timeout is reached.
         """
-        while timeout:
-            if self.api_task_ok(node, taskid):
-                return True
-            elif self.api_task_failed(node, taskid):
-                self.module.fail_json(msg="Task error: %s" % self.proxmox_api.nodes(node).tasks(taskid).status.get()['exitstatus'])
-            timeout = timeout - 1
-            if timeout == 0:
-                self.module.fail_json(msg='Reached timeout while waiting for uploading/downloading template. Last line in task before timeout: %s' %
-                                      self.proxmox_api.nodes(node).tasks(taskid).log.get()[:1])
-
-            time.sleep(1)
-        return False
+        success, fail_reason = self.api_task_complete(node, taskid, timeout)
+        if success:
+            return True
+        if fail_reason == ProxmoxAnsible.TASK_TIMED_OUT:
+            self.module.fail_json(msg='Reached timeout while waiting for uploading/downloading template. Last line in task before timeout: %s' %
+                                  self.proxmox_api.nodes(node).tasks(taskid).log.get()[:1])
+        self.module.fail_json(msg="Task error: %s" % fail_reason)
 
     def upload_template(self, node, storage, content_type, realpath, timeout):
         stats = os.stat(realpath)
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import threading
+
+import pytest
+
+from ansible.errors import AnsibleParserError
+from ansible.inventory.data import InventoryData
+from ansible.module_utils.six.moves.urllib.parse import parse_qs, urlencode
+from ansible_collections.community.general.plugins.inventory.gitlab_runners import InventoryModule
+
+pytest.importorskip('gitlab')
+httmock = pytest.importorskip('httmock')
+
+
+class FakeGitLab(object):
+    """Serves a list of runners and the details of each of them."""
+
+    def __init__(self, count):
+        self.runners = [{'id': idx, 'description': 'runner%d' % idx, 'ip_address': '192.0.2.%d' % idx, 'status': 'online'}
+                        for idx in range(1, count + 1)]
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def __call__(self, url, request):
+        with self.lock:
+            self.requests.append(url.path[len('/api/v4'):])
+        headers = {'Content-Type': 'application/json'}
+        if url.path == '/api/v4/runners/all':
+            query = dict((k, v[0]) for k, v in parse_qs(url.query).items())
+            page, per_page = int(query.get('page', 1)), int(query.get('per_page', 20))
+            total_pages = (len(self.runners) + per_page - 1) // per_page
+            headers.update({'X-Page': str(page), 'X-Total-Pages': str(total_pages), 'X-Per-Page': str(per_page)})
+            if page < total_pages:
+                query['page'] = page + 1
+                headers['Link'] = '<http://localhost%s?%s>; rel="next"' % (url.path, urlencode(query))
+            return httmock.response(200, self.runners[(page - 1) * per_page:page * per_page], headers)
+        runner = self.runners[int(url.path.rsplit('/', 1)[1]) - 1]
+        if runner['status'] == 'broken':
+            return httmock.response(500, {'message': 'boom'}, headers)
+        return httmock.response(200, dict(runner, tag_list=['docker'], architecture='amd64'), headers)
+
+
+@pytest.fixture
+def inventory(mocker):
+    r = InventoryModule()
+    r.inventory = InventoryData()
+    r._cache = {}
+    r.options = {'server_url': 'http://localhost', 'api_token': 'token', 'filter': None, 'verbose_output': True,
+                 'workers': 1, 'cache': False, 'strict': False, 'compose': {}, 'groups': {},
+                 'keyed_groups': [{'key': 'tag_list', 'prefix': 'tag'}]}
+    r.get_option = mocker.MagicMock(side_effect=lambda option, *args: r.options[option])
+    mocker.patch.object(r, '_read_config_data')
+    return r
+
+
+def parse(inventory, server, cache=True):
+    with httmock.HTTMock(httmock.urlmatch(netloc='localhost')(server)):
+        inventory.parse(InventoryData(), None, 'gitlab_runners.yml', cache=cache)
+
+
+def test_populate(inventory):
+    server = FakeGitLab(250)
+    inventory.options['workers'] = 4
+
+    parse(inventory, server)
+
+    assert sorted(inventory.inventory.hosts, key=int) == [str(idx) for idx in range(1, 251)]
+    host = inventory.inventory.get_host('42')
+    assert host.vars['ansible_host'] == '192.0.2.42'
+    assert host.vars['gitlab_runner_attributes']['architecture'] == 'amd64'
+    assert inventory.inventory.groups['tag_docker'].hosts == inventory.inventory.groups['gitlab_runners'].hosts
+    # three pages of 100 runners, then one request per runner
+    assert len([path for path in server.requests if path == '/runners/all']) == 3
+    assert len(server.requests) == 253
+
+
+def test_detail_error(inventory):
+    server = FakeGitLab(10)
+    server.runners[6]['status'] = 'broken'
+    inventory.options['workers'] = 4
+
+    with pytest.raises(AnsibleParserError, match='Unable to fetch hosts from GitLab API'):
+        parse(inventory, server)
+
+
+def test_cache(inventory):
+    server = FakeGitLab(20)
+    inventory.options['cache'] = True
+
+    parse(inventory, server)
+    assert len(server.requests) == 21
+
+    server.requests = []
+    parse(inventory, server)
+    assert server.requests == []
+    assert len(inventory.inventory.hosts) == 20
+
+    # a refresh fetches the details of the changed and the new runners only
+    server.requests = []
+    server.runners[3]['status'] = 'offline'
+    server.runners.append({'id': 21, 'description': 'runner21', 'ip_address': '192.0.2.21', 'status': 'online'})
+    parse(inventory, server, cache=False)
+    assert server.requests == ['/runners/all', '/runners/4', '/runners/21']
+    assert len(inventory.inventory.hosts) == 21
+    assert inventory.inventory.get_host('4').vars['gitlab_runner_attributes']['status'] == 'offline'
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import threading
+
+import pytest
+
+from ansible.errors import AnsibleError
+from ansible.inventory.data import InventoryData
+from ansible.module_utils.six.moves.urllib.parse import parse_qs
+from ansible_collections.community.general.plugins.inventory import scaleway
+from ansible_collections.community.general.plugins.inventory.scaleway import InventoryModule
+
+
+PAR1 = 'https://api.scaleway.com/instance/v1/zones/fr-par-1/servers'
+AMS1 = 'https://api.scaleway.com/instance/v1/zones/nl-ams-1/servers'
+
+
+def server(name, zone):
+    return {
+        'id': name, 'hostname': name, 'arch': 'x86_64', 'commercial_type': 'DEV1-S', 'organization': 'org',
+        'state': 'running', 'tags': ['web'], 'public_ip': {'address': '192.0.2.1'}, 'private_ip': None,
+        'ipv6': None, 'location': {'zone_id': zone},
+    }
+
+
+class FakeResponse(object):
+    def __init__(self, servers, headers):
+        self._body = json.dumps({'servers': servers})
+        self.headers = headers
+
+    def read(self):
+        return self._body
+
+
+class FakeHeaders(dict):
+    def __getitem__(self, key):
+        return self.get(key)
+
+
+class FakeAPI(object):
+    """Serves ``pages`` servers per zone, two servers per page."""
+
+    def __init__(self, pages, announce_last=True):
+        self.pages = pages
+        self.announce_last = announce_last
+        self.requested = []
+        self.lock = threading.Lock()
+
+    def __call__(self, url, headers=None):
+        with self.lock:
+            self.requested.append(url)
+        base, dummy, query = url.partition('?')
+        page = int(parse_qs(query).get('page', ['1'])[0])
+        zone = 'par1' if base == PAR1 else 'ams1'
+        servers = [server('%s-%d-%d' % (zone, page, idx), zone) for idx in range(2)]
+        links = []
+        if page < self.pages:
+            links.append('</servers?per_page=2&page=%d>; rel="next"' % (page + 1))
+            if self.announce_last:
+                links.append('</servers?per_page=2&page=%d>; rel="last"' % self.pages)
+        return FakeResponse(servers, FakeHeaders(Link=','.join(links), **{'X-Total-Count': None}))
+
+
+@pytest.fixture
+def inventory():
+    r = InventoryModule()
+    r.inventory = InventoryData()
+    return r
+
+
+def hostnames(servers):
+    return [s['hostname'] for s in servers]
+
+
+def test_fetch_information_follows_links(mocker):
+    api = FakeAPI(pages=3)
+    mocker.patch.object(scaleway, 'open_url', side_effect=api)
+
+    servers = scaleway._fetch_information('token', PAR1)
+
+    assert hostnames(servers) == ['par1-%d-%d' % (page, idx) for page in (1, 2, 3) for idx in range(2)]
+    assert len(api.requested) == 3
+
+
+@pytest.mark.parametrize('announce_last', [True, False])
+def test_fetch_zones_information(mocker, announce_last):
+    api = FakeAPI(pages=4, announce_last=announce_last)
+    mocker.patch.object(scaleway, 'open_url', side_effect=api)
+
+    results = scaleway._fetch_zones_information('token', [PAR1, AMS1], workers=4)
+
+    assert [hostnames(servers) for servers in results] == [
+        ['%s-%d-%d' % (zone, page, idx) for page in range(1, 5) for idx in range(2)]
+        for zone in ('par1', 'ams1')
+    ]
+    assert len(api.requested) == 8
+
+
+def test_fetch_zones_information_total_count(mocker):
+    def fake_open_url(url, headers=None):
+        page = int(parse_qs(url.partition('?')[2]).get('page', ['1'])[0])
+        link = '</servers?page=%d>; rel="next"' % (page + 1) if page < 3 else ''
+        return FakeResponse([server('s%d' % page, 'par1')], FakeHeaders(Link=link, **{'X-Total-Count': '3'}))
+
+    open_url = mocker.patch.object(scaleway, 'open_url', side_effect=fake_open_url)
+
+    results = scaleway._fetch_zones_information('token', [PAR1], workers=2)
+
+    assert hostnames(results[0]) == ['s1', 's2', 's3']
+    assert open_url.call_count == 3
+
+
+def test_fetch_zones_information_error(mocker):
+    mocker.patch.object(scaleway, 'open_url', side_effect=Exception('boom'))
+
+    with pytest.raises(AnsibleError, match='boom'):
+        scaleway._fetch_zones_information('token', [PAR1, AMS1], workers=2)
+
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_parse(inventory, mocker, workers):
+    api = FakeAPI(pages=2)
+    mocker.patch.object(scaleway, 'open_url', side_effect=api)
+    mocker.patch.object(InventoryModule, '_read_config_data')
+    mocker.patch.object(InventoryModule, 'get_oauth_token', return_value='token')
+    options = {'regions': ['par1', 'EMEA-FR-PAR1', 'ams1'], 'tags': None, 'hostnames': ['hostname'],
+               'variables': {}, 'workers': workers}
+    inventory.get_option = mocker.MagicMock(side_effect=options.get)
+
+    inventory.parse(inventory.inventory, None, 'scaleway.yml')
+
+    assert len(inventory.inventory.groups['ams1'].hosts) == 4
+    assert sorted(h.name for h in inventory.inventory.groups['web'].get_hosts()) == sorted(
+        '%s-%d-%d' % (zone, page, idx) for zone in ('par1', 'ams1') for page in (1, 2) for idx in range(2))
+    assert inventory.inventory.get_host('par1-2-1').vars['public_ipv4'] == '192.0.2.1'
+    expected_requests = 4 if workers > 1 else 6
+    assert len(api.requested) == expected_requests
@@ -227,6 +227,26 @@ class LoggedOutMockBitwarden(MockBitwarden):
     unlocked = False
 
 
+class CountingMockBitwarden(MockBitwarden):
+
+    def __init__(self, *args, **kwargs):
+        super(CountingMockBitwarden, self).__init__(*args, **kwargs)
+        self.calls = []
+
+    def _run(self, args, stdin=None, expected_rc=0):
+        self.calls.append(args)
+        return super(CountingMockBitwarden, self)._run(args, stdin=stdin, expected_rc=expected_rc)
+
+
+class NotFoundMockBitwarden(CountingMockBitwarden):
+
+    def _run(self, args, stdin=None, expected_rc=0):
+        if args[:2] == ['get', 'item'] and not any(item.get('id') == args[2] for item in MOCK_RECORDS):
+            self.calls.append(args)
+            raise BitwardenException('More than one result was found.')
+        return super(NotFoundMockBitwarden, self)._run(args, stdin=stdin, expected_rc=expected_rc)
+
+
 class TestLookupModule(unittest.TestCase):
 
     def setUp(self):
@@ -330,3 +350,42 @@ class TestLookupModule(unittest.TestCase):
         self.lookup.run(None, organization_id=MOCK_ORGANIZATION_ID, result_count=3)
         with self.assertRaises(BitwardenException):
             self.lookup.run(None, organization_id=MOCK_ORGANIZATION_ID, result_count=0)
+
+    def test_bitwarden_plugin_cache(self):
+        mock_bitwarden = CountingMockBitwarden()
+        with patch("ansible_collections.community.general.plugins.lookup.bitwarden._bitwarden", mock_bitwarden):
+            terms = ['a_test', 'dupe_name', 'not_here', 'a_test']
+            self.assertEqual(self.lookup.run(terms, field='password'),
+                             self.lookup.run(terms, field='password', cache=True))
+            self.assertEqual(self.lookup.run(None, organization_id=MOCK_ORGANIZATION_ID),
+                             self.lookup.run(None, organization_id=MOCK_ORGANIZATION_ID, cache=True))
+            self.assertEqual(self.lookup.run([MOCK_RECORDS[1]['id']], search='id'),
+                             self.lookup.run([MOCK_RECORDS[1]['id']], search='id', cache=True))
+
+            mock_bitwarden.calls = []
+            self.lookup.run(terms, field='password', cache=True)
+            self.lookup.run([MOCK_RECORDS[1]['id']], search='id', cache=True)
+            self.lookup.run(None, organization_id=MOCK_ORGANIZATION_ID, cache=True)
+            self.assertEqual([], mock_bitwarden.calls)
+
+    def test_bitwarden_plugin_cache_ttl(self):
+        mock_bitwarden = CountingMockBitwarden()
+        with patch("ansible_collections.community.general.plugins.lookup.bitwarden._bitwarden", mock_bitwarden):
+            with patch("ansible_collections.community.general.plugins.lookup.bitwarden.time.time", side_effect=[100, 110, 200, 200]):
+                self.lookup.run(['a_test'], cache=True, cache_ttl=60)
+                self.lookup.run(['a_test'], cache=True, cache_ttl=60)
+                self.lookup.run(['a_test'], cache=True, cache_ttl=60)
+            self.assertEqual(2, mock_bitwarden.calls.count(['list', 'items']))
+
+    def test_bitwarden_plugin_cache_search_id(self):
+        mock_bitwarden = NotFoundMockBitwarden()
+        with patch("ansible_collections.community.general.plugins.lookup.bitwarden._bitwarden", mock_bitwarden):
+            # searches by id are not filtered by collection
+            self.assertEqual([[MOCK_RECORDS[1]]], self.lookup.run([MOCK_RECORDS[1]['id']], search='id'))
+            self.assertEqual([[MOCK_RECORDS[1]]], self.lookup.run([MOCK_RECORDS[1]['id']], search='id',
+                                                                  collection_id=MOCK_COLLECTION_ID, cache=True))
+            # unknown ids fail like without cache
+            mock_bitwarden.calls = []
+            with self.assertRaises(BitwardenException):
+                self.lookup.run(['not-an-id'], search='id', cache=True)
+            self.assertEqual([['get', 'item', 'not-an-id']], mock_bitwarden.calls)
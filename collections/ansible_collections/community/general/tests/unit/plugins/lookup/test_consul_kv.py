@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible.plugins.loader import lookup_loader
+
+from ansible_collections.community.general.plugins.lookup import consul_kv
+
+
+DATA = {
+    'app/config/a': 'value a',
+    'app/config/b': 'value b',
+    'app/config/nested/c': 'value c',
+    'other/d': 'value d',
+}
+
+
+def fake_get(key, token=None, index=None, recurse=False, dc=None):
+    if recurse:
+        matches = [{'Key': k, 'Value': v} for k, v in sorted(DATA.items()) if k.startswith(key)]
+        return 1, matches or None
+    if key in DATA:
+        return 1, {'Key': key, 'Value': DATA[key]}
+    return 1, None
+
+
+@pytest.fixture
+def consul_api(mocker):
+    mocker.patch.object(consul_kv, 'HAS_CONSUL', True)
+    mocker.patch.object(consul_kv, '_CLIENTS', {})
+    consul_module = mocker.patch.object(consul_kv, 'consul', create=True)
+    api = consul_module.Consul.return_value
+    api.kv.get.side_effect = fake_get
+    return consul_module, api
+
+
+def test_consul_kv_prefetch_prefix(consul_api):
+    consul_module, api = consul_api
+    terms = ['app/config/a', 'app/config/missing', 'app/config/nested recurse=true', 'other/d', 'app/config/b']
+    lookup = lookup_loader.get('community.general.consul_kv')
+    expected = ['value a', 'value c', 'value d', 'value b']
+    assert lookup.run(terms, prefetch_prefix='app/config/') == expected
+    assert api.kv.get.call_count == 2
+    assert lookup.run(terms) == expected
+    assert api.kv.get.call_count == 7
+    consul_module.Consul.assert_called_once()
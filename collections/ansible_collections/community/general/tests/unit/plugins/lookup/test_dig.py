@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import socket
+import threading
+
+import pytest
+
+from ansible.errors import AnsibleError
+from ansible.plugins.loader import lookup_loader
+
+dns = pytest.importorskip('dns')
+import dns.message  # noqa: E402
+import dns.rcode  # noqa: E402
+import dns.rdatatype  # noqa: E402
+import dns.rdata  # noqa: E402
+import dns.rrset  # noqa: E402
+
+from ansible_collections.community.general.plugins.lookup import dig  # noqa: E402
+
+
+class StubServer(object):
+    ''' Minimal UDP DNS server answering A queries for *.example.com with 192.0.2.<number of labels>. '''
+
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.settimeout(0.2)
+        self.port = self.sock.getsockname()[1]
+        self.queries = []
+        self.running = True
+        self.thread = threading.Thread(target=self.serve)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def serve(self):
+        while self.running:
+            try:
+                wire, addr = self.sock.recvfrom(4096)
+            except socket.timeout:
+                continue
+            query = dns.message.from_wire(wire)
+            question = query.question[0]
+            name = question.name.to_text()
+            self.queries.append(name)
+            response = dns.message.make_response(query)
+            if question.rdtype == dns.rdatatype.A and name.endswith('.example.com.'):
+                address = '192.0.2.%d' % len(name.split('.'))
+                response.answer.append(dns.rrset.from_text(name, 300, 'IN', 'A', address))
+            else:
+                response.set_rcode(dns.rcode.NXDOMAIN)
+            self.sock.sendto(response.to_wire(), addr)
+
+    def stop(self):
+        self.running = False
+        self.thread.join()
+        self.sock.close()
+
+
+@pytest.fixture
+def server(mocker):
+    mocker.patch('ansible_collections.community.general.plugins.lookup.dig._RESOLVERS', {})
+    stub = StubServer()
+    yield stub
+    stub.stop()
+
+
+def run_dig(server, terms, **kwargs):
+    lookup = lookup_loader.get('community.general.dig')
+    return lookup.run(terms + ['@127.0.0.1'], port=server.port, **kwargs)
+
+
+def test_dig_workers(server):
+    domains = ['a.example.com', 'b.c.example.com', 'missing.org', 'd.e.f.example.com']
+    sequential = run_dig(server, domains)
+    parallel = run_dig(server, domains, workers=3)
+    assert sequential == ['192.0.2.4', '192.0.2.5', '192.0.2.6']
+    assert parallel == sequential
+
+
+def test_dig_cache(server):
+    assert run_dig(server, ['a.example.com'], cache=True) == ['192.0.2.4']
+    assert run_dig(server, ['a.example.com'], cache=True) == ['192.0.2.4']
+    assert server.queries == ['a.example.com.']
+    assert run_dig(server, ['a.example.com']) == ['192.0.2.4']
+    assert server.queries == ['a.example.com.', 'a.example.com.']
+
+
+def test_dig_records(server):
+    result = run_dig(server, ['b.c.example.com', 'qtype=A', 'flat=0'], workers=2)
+    assert result == [{
+        'address': '192.0.2.5',
+        'owner': 'b.c.example.com.',
+        'type': 'A',
+        'ttl': 300,
+        'class': 'IN',
+    }]
+
+
+def test_dig_workers_fail_on_error(server):
+    with pytest.raises(AnsibleError, match='Lookup failed'):
+        run_dig(server, ['a.example.com', 'missing.org', 'fail_on_error=true'], workers=2)
+
+
+class FakeAnswer(list):
+    def __init__(self, address, expiration):
+        super(FakeAnswer, self).__init__([dns.rdata.from_text('IN', 'A', address)])
+        self.expiration = expiration
+
+
+def test_nameserver_address_ttl(mocker):
+    mocker.patch.object(dig, '_NAMESERVER_ADDRESSES', {})
+    clock = mocker.patch.object(dig.time, 'time', return_value=1000)
+    query = mocker.patch.object(dig.dns.resolver, 'query', side_effect=[
+        FakeAnswer('192.0.2.1', 1060), FakeAnswer('192.0.2.2', 1120), FakeAnswer('192.0.2.3', 1200),
+    ])
+
+    assert dig._get_nameserver_address('ns.example.com', True) == '192.0.2.1'
+    assert dig._get_nameserver_address('ns.example.com', True) == '192.0.2.1'
+    assert query.call_count == 1
+
+    # the address is resolved again once the TTL of the answer has passed
+    clock.return_value = 1060
+    assert dig._get_nameserver_address('ns.example.com', True) == '192.0.2.2'
+    assert query.call_count == 2
+
+    # without cache, the name is always resolved
+    assert dig._get_nameserver_address('ns.example.com', False) == '192.0.2.3'
+    assert query.call_count == 3
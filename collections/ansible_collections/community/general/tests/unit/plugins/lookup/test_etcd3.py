@@ -35,6 +35,19 @@ class FakeEtcd3Client(MagicMock):
         return ("{0} value".format(key), FakeKVMetadata(key, None))
 
 
+class FakeTransactionalEtcd3Client(FakeEtcd3Client):
+
+    def __init__(self, *args, **kwargs):
+        super(FakeTransactionalEtcd3Client, self).__init__(*args, **kwargs)
+        self.transactions = MagicMock()
+        self.transactions.get.side_effect = lambda key: key
+        self.calls = []
+
+    def transaction(self, compare, success, failure):
+        self.calls.append(success)
+        return True, [[self.get(key)] for key in success]
+
+
 class TestLookupModule(unittest.TestCase):
 
     def setUp(self):
@@ -54,3 +67,29 @@ class TestLookupModule(unittest.TestCase):
             {'key': 'a_key_3', 'value': 'a_key_3 value'},
         ]
         self.assertListEqual(expected_result, self.lookup.run(['a_key'], [], **{'prefix': True}))
+
+    @patch('ansible_collections.community.general.plugins.lookup.etcd3._CLIENTS', {})
+    def test_keys_transaction(self):
+        client = FakeTransactionalEtcd3Client()
+        with patch('ansible_collections.community.general.plugins.lookup.etcd3.etcd3_client', return_value=client) as etcd3_client:
+            expected_result = [
+                {'key': 'key_1', 'value': 'key_1 value'},
+                {'key': 'key_2', 'value': 'key_2 value'},
+                {'key': 'key_3', 'value': 'key_3 value'},
+            ]
+            self.assertListEqual(expected_result, self.lookup.run(['key_1', 'key_2', 'key_3'], [], txn_size=2))
+            self.assertListEqual(expected_result, self.lookup.run(['key_1', 'key_2', 'key_3'], [], txn_size=2))
+        self.assertEqual(1, etcd3_client.call_count)
+        self.assertEqual([['key_1', 'key_2'], ['key_3'], ['key_1', 'key_2'], ['key_3']], client.calls)
+
+    @patch('ansible_collections.community.general.plugins.lookup.etcd3._CLIENTS', {})
+    def test_client_per_process(self):
+        with patch('ansible_collections.community.general.plugins.lookup.etcd3.etcd3_client',
+                   side_effect=lambda params: FakeTransactionalEtcd3Client()) as etcd3_client:
+            with patch('os.getpid', return_value=100):
+                self.lookup.run(['key_1'], [])
+                self.lookup.run(['key_1'], [])
+            # a forked worker does not reuse the client of its parent
+            with patch('os.getpid', return_value=101):
+                self.lookup.run(['key_1'], [])
+        self.assertEqual(2, etcd3_client.call_count)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+
+import pytest
+
+from ansible.parsing.dataloader import DataLoader
+from ansible.plugins.loader import lookup_loader
+
+from ansible_collections.community.general.plugins.lookup import filetree
+
+
+@pytest.fixture
+def trees(tmp_path):
+    for tree, files in (("first", ("a/x", "a/y", "b/z", "top")), ("second", ("a/x", "c/w", "top", "extra"))):
+        for name in files:
+            path = tmp_path / tree / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(tree)
+    os.symlink("a", str(tmp_path / "first" / "link"))
+    return [str(tmp_path / "first"), str(tmp_path / "second")]
+
+
+def walk_paths(paths):
+    result = []
+    for path in paths:
+        for root, dirs, files in os.walk(path, topdown=True):
+            for entry in dirs + files:
+                relpath = os.path.relpath(os.path.join(root, entry), path)
+                if relpath not in result:
+                    result.append(relpath)
+    return result
+
+
+def test_filetree_order_and_merge(trees):
+    lookup = lookup_loader.get("community.general.filetree", loader=DataLoader())
+
+    result = lookup.run(trees, {})
+
+    assert [item["path"] for item in result] == walk_paths(trees)
+    by_path = dict((item["path"], item) for item in result)
+    assert by_path["a/x"]["root"] == trees[0]
+    assert by_path["extra"]["root"] == trees[1]
+    assert by_path["link"]["state"] == "link"
+    assert by_path["link"]["src"] == "a"
+    assert by_path["a"]["state"] == "directory"
+    assert by_path["top"]["src"] == os.path.join(trees[0], "top")
+    assert by_path["top"]["size"] == len("first")
+
+
+def test_filetree_matches_file_props(trees):
+    lookup = lookup_loader.get("community.general.filetree", loader=DataLoader())
+
+    for item in lookup.run(trees, {}):
+        assert item == filetree.file_props(item["root"], item["path"])
+
+
+def test_filetree_without_selinux(trees, mocker):
+    mocker.patch.object(filetree, "HAVE_SELINUX", True)
+    mocker.patch.object(filetree, "selinux", create=True)
+    filetree.selinux.is_selinux_enabled.return_value = 1
+    context = mocker.patch.object(filetree, "selinux_context", return_value=["u", "r", "t", "s0"])
+    lookup = lookup_loader.get("community.general.filetree", loader=DataLoader())
+
+    assert all(item["setype"] == "t" for item in lookup.run(trees, {}))
+    context.reset_mock()
+    result = lookup.run(trees, {}, selinux=False)
+
+    context.assert_not_called()
+    assert all("setype" not in item for item in result)
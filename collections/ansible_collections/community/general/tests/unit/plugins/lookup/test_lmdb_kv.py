@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import subprocess
+import sys
+
+import pytest
+
+from ansible.plugins.loader import lookup_loader
+
+from ansible_collections.community.general.plugins.lookup import lmdb_kv
+
+lmdb = pytest.importorskip('lmdb')
+
+
+def write_db(path, data):
+    env = lmdb.open(path, map_size=1024 * 100)
+    with env.begin(write=True) as txn:
+        for key, value in data.items():
+            txn.put(key.encode(), value.encode())
+    env.close()
+
+
+@pytest.fixture
+def db(tmp_path, mocker):
+    mocker.patch.object(lmdb_kv, '_ENVIRONMENTS', {})
+    path = str(tmp_path / 'jp.mdb')
+    write_db(path, {'fr': 'France', 'nl': 'Netherlands', 'no': 'Norway', 'be': 'Belgium', 'lu': 'Luxembourg'})
+    return path
+
+
+def test_lmdb_kv_keys_and_prefixes(db):
+    lookup = lookup_loader.get('community.general.lmdb_kv')
+    assert lookup.run(['nl', 'be', 'xx'], db=db) == ['Netherlands', 'Belgium']
+    assert lookup.run(['n*', 'be', 'f*', 'z*'], db=db) == [
+        ('nl', 'Netherlands'), ('no', 'Norway'), 'Belgium', ('fr', 'France'),
+    ]
+    assert len(lookup.run([], db=db)) == 5
+    assert lookup.run(['*'], db=db) == lookup.run([], db=db)
+
+
+def test_lmdb_kv_reuses_environment(db, mocker):
+    open_spy = mocker.spy(lmdb_kv.lmdb, 'open')
+    lookup = lookup_loader.get('community.general.lmdb_kv')
+    assert lookup.run(['nl'], db=db) == ['Netherlands']
+    assert lookup.run(['be'], db=db) == ['Belgium']
+    assert open_spy.call_count == 1
+
+    # LMDB does not allow opening the same environment twice in one process
+    subprocess.check_call([sys.executable, '-c', (
+        'import lmdb\n'
+        'env = lmdb.open(%r)\n'
+        'with env.begin(write=True) as txn:\n'
+        '    txn.put(b"nl", b"Nederland")\n'
+    ) % db])
+    assert lookup.run(['nl'], db=db) == ['Nederland']
+    assert open_spy.call_count == 2
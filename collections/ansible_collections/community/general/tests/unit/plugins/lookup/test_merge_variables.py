@@ -300,3 +300,39 @@ class TestMergeVariablesLookup(unittest.TestCase):
         results = self.merge_vars_lookup.run(['__merge_var'], variables)
 
         self.assertEqual(results, [['item1', 'item5']])
+
+    @patch.object(AnsiblePlugin, 'set_options')
+    @patch.object(AnsiblePlugin, 'get_option', side_effect=[None, 'ignore', 'prefix', ['dummy1']])
+    @patch.object(Templar, 'template', side_effect=[['item1'], ['item2'], ['item3']])
+    def test_merge_list_group_multiple_terms(self, mock_set_options, mock_get_option, mock_template):
+        hostvars = self.HostVarsMock({
+            'host1': {
+                'group_names': ['dummy1'],
+                'inventory_hostname': 'host1',
+                'merge_list_a': ['item1'],
+                'merge_list_b': ['item2'],
+            },
+            'host2': {
+                'group_names': ['dummy1'],
+                'inventory_hostname': 'host2',
+                'merge_list_a': ['item3'],
+            },
+            'host3': {
+                'group_names': ['dummy2'],
+                'inventory_hostname': 'host3',
+                'merge_list_a': ['item4'],
+            }
+        })
+        variables = {
+            'inventory_hostname': 'host1',
+            'hostvars': hostvars
+        }
+
+        results = self.merge_vars_lookup.run(['merge_list', 'merge_list_a', 'merge_list'], variables)
+
+        # every matching variable is only templated once, even if several terms match it
+        self.assertEqual(results, [
+            ['item1', 'item2', 'item3'],
+            ['item1', 'item3'],
+            ['item1', 'item2', 'item3'],
+        ])
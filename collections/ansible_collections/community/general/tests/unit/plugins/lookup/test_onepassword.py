@@ -10,11 +10,12 @@ import itertools
 import json
 import pytest
 
-from .onepassword_common import MOCK_ENTRIES
+from .onepassword_common import MOCK_ENTRIES, load_file
 
 from ansible.errors import AnsibleLookupError, AnsibleOptionsError
 from ansible.plugins.loader import lookup_loader
 from ansible_collections.community.general.plugins.lookup.onepassword import (
+    OnePass,
     OnePassCLIv1,
     OnePassCLIv2,
 )
@@ -317,3 +318,73 @@ def test_opv1_unsupported_features(kwargs):
     op_cli = OnePassCLIv1(**kwargs)
     with pytest.raises(AnsibleLookupError):
         op_cli.full_signin()
+
+
+@pytest.mark.parametrize("op_fixture", OP_VERSION_FIXTURES)
+def test_op_reuse_session(op_fixture, request, mocker):
+    mocker.patch.dict("ansible_collections.community.general.plugins.lookup.onepassword._SESSIONS", clear=True)
+    op = request.getfixturevalue(op_fixture)
+    op.reuse_session = True
+    mocker.patch.object(op._cli, "assert_logged_in", return_value=False)
+    mocker.patch.object(op._cli, "signin", return_value=(0, "token\n", ""))
+    mocker.patch("os.path.isfile", return_value=True)
+
+    op.assert_logged_in()
+
+    other_op = OnePass(reuse_session=True, cli_class=type(op._cli))
+    mocker.patch.object(other_op._cli, "assert_logged_in", return_value=False)
+    other_op.assert_logged_in()
+
+    op._cli.signin.assert_called_once()
+    other_op._cli.assert_logged_in.assert_not_called()
+    assert other_op.token == "token"
+
+
+def test_op_reuse_expired_session(opv2, mocker):
+    mocker.patch.dict("ansible_collections.community.general.plugins.lookup.onepassword._SESSIONS", clear=True)
+    opv2.reuse_session = True
+    mocker.patch.object(opv2._cli, "assert_logged_in", return_value=True)
+    opv2.assert_logged_in()
+    opv2.assert_logged_in()
+    mocker.patch.object(opv2._cli, "get_raw", side_effect=[AnsibleLookupError("session expired"), (0, "RAW OUTPUT", "")])
+
+    assert opv2.get_raw("some item") == "RAW OUTPUT"
+    assert opv2._cli.assert_logged_in.call_count == 2
+
+
+def test_op_prefetch(mocker):
+    mocker.patch.dict("ansible_collections.community.general.plugins.lookup.onepassword._PREFETCHED_ITEMS", clear=True)
+    mocker.patch("ansible_collections.community.general.plugins.lookup.onepassword.OnePass._get_cli_class", OnePassCLIv2)
+    mocker.patch("ansible_collections.community.general.plugins.lookup.onepassword.OnePass.assert_logged_in", return_value=True)
+    items = [load_file("v2_out_01.json"), load_file("v2_out_02.json")]
+    item_list = json.dumps([{"id": item["id"], "title": item["title"]} for item in items])
+    item_get = "\n".join(json.dumps(item, indent=2) for item in items)
+    run = mocker.patch(
+        "ansible_collections.community.general.plugins.lookup.onepassword.OnePassCLIBase._run",
+        side_effect=[(0, item_list, ""), (0, item_get, "")],
+    )
+
+    op_lookup = lookup_loader.get("community.general.onepassword")
+    result = op_lookup.run(["Authy Backup", "awk4s2u44fhnrgppszcsvc663i"], vault="Test Vault", prefetch=True)
+    result += op_lookup.run(["dummy login"], vault="Test Vault", field="password1", prefetch=True)
+
+    assert result == ["OctoberPoppyNuttyDraperySabbath", "FootworkDegreeReverence", "data in custom field"]
+    assert run.call_count == 2
+    assert run.call_args_list[1][1]["command_input"] == item_list.encode()
+
+
+def test_op_prefetch_unknown_item(mocker):
+    mocker.patch.dict("ansible_collections.community.general.plugins.lookup.onepassword._PREFETCHED_ITEMS", clear=True)
+    mocker.patch("ansible_collections.community.general.plugins.lookup.onepassword.OnePass._get_cli_class", OnePassCLIv2)
+    mocker.patch("ansible_collections.community.general.plugins.lookup.onepassword.OnePass.assert_logged_in", return_value=True)
+    item = load_file("v2_out_01.json")
+    run = mocker.patch(
+        "ansible_collections.community.general.plugins.lookup.onepassword.OnePassCLIBase._run",
+        side_effect=[(0, "[]", ""), (0, json.dumps(item), "")],
+    )
+
+    op_lookup = lookup_loader.get("community.general.onepassword_raw")
+
+    assert op_lookup.run(["Authy Backup"], vault="Test Vault", prefetch=True) == [item]
+    assert run.call_count == 2
+    assert run.call_args_list[1][0][0][:3] == ["item", "get", "Authy Backup"]
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible.errors import AnsibleError
+from ansible.plugins.loader import lookup_loader
+
+from ansible_collections.community.general.plugins.lookup import redis as redis_lookup
+
+
+class FakePipeline(object):
+
+    def __init__(self, data, calls):
+        self.data = data
+        self.calls = calls
+        self.commands = []
+
+    def mget(self, keys):
+        self.commands.append(list(keys))
+
+    def type(self, key):
+        self.commands.append(('type', key))
+
+    def execute(self):
+        self.calls.append(self.commands)
+        results = []
+        for command in self.commands:
+            if isinstance(command, tuple):
+                value = self.data.get(command[1])
+                results.append(b'none' if value is None else b'string' if isinstance(value, bytes) else b'list')
+            else:
+                # MGET answers nil for keys that do not hold a string
+                results.append([value if isinstance(value, bytes) else None for value in map(self.data.get, command)])
+        return results
+
+
+class FakeRedis(object):
+
+    def __init__(self, data):
+        self.data = data
+        self.calls = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self.data, self.calls)
+
+
+@pytest.fixture
+def fake_redis(mocker):
+    mocker.patch.object(redis_lookup, 'HAVE_REDIS', True)
+    mocker.patch.object(redis_lookup, '_CONNECTIONS', {})
+    conn = FakeRedis({'a': b'1', 'b': b'2', 'c': u'é'.encode('utf-8')})
+    redis_module = mocker.patch.object(redis_lookup, 'redis', create=True)
+    redis_module.Redis.return_value = conn
+    return redis_module, conn
+
+
+def test_redis_batches(fake_redis):
+    redis_module, conn = fake_redis
+    lookup = lookup_loader.get('community.general.redis')
+    assert lookup.run(['a', 'missing', 'c', 'b'], [], batch_size=3) == ['1', '', u'é', '2']
+    assert conn.calls == [[['a', 'missing', 'c'], ['b']], [('type', 'missing')]]
+    assert lookup.run(['b'], []) == ['2']
+    redis_module.Redis.assert_called_once_with(host='127.0.0.1', port=6379)
+
+
+def test_redis_error(fake_redis):
+    redis_module, conn = fake_redis
+    conn.pipeline = lambda transaction=True: 1 / 0
+    lookup = lookup_loader.get('community.general.redis')
+    with pytest.raises(AnsibleError, match='Encountered exception while fetching a, b'):
+        lookup.run(['a', 'b'], [])
+
+
+def test_redis_wrong_type(fake_redis):
+    redis_module, conn = fake_redis
+    conn.data['queue'] = [b'1', b'2']
+    lookup = lookup_loader.get('community.general.redis')
+    with pytest.raises(AnsibleError, match='while fetching queue: WRONGTYPE'):
+        lookup.run(['a', 'missing', 'queue'], [])
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible.errors import AnsibleError
+from ansible.parsing.dataloader import DataLoader
+from ansible.plugins.loader import lookup_loader
+
+from ansible_collections.community.general.plugins.lookup import shelvefile
+
+
+class FakeShelf(dict):
+
+    closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def shelf(tmp_path, mocker):
+    mocker.patch.object(shelvefile, '_SHELVES', {})
+    path = tmp_path / 'data.db'
+    path.write_text('first version')
+    contents = [FakeShelf(a='first', b='second'), FakeShelf(a='changed')]
+    shelve_open = mocker.patch.object(shelvefile.shelve, 'open', side_effect=contents)
+    return path, shelve_open, contents
+
+
+def test_shelvefile_reuses_handle(shelf):
+    path, shelve_open, contents = shelf
+    lookup = lookup_loader.get('community.general.shelvefile', loader=DataLoader())
+
+    terms = ['file=%s key=a' % path, 'file=%s key=b' % path]
+    assert lookup.run(terms, {}) == ['first', 'second']
+    assert lookup.run(terms[:1], {}) == ['first']
+    shelve_open.assert_called_once_with(str(path).encode(), flag='r')
+
+    with pytest.raises(AnsibleError, match='Key missing not found'):
+        lookup.run(['file=%s key=missing' % path], {})
+
+
+def test_shelvefile_reopens_modified_file(shelf):
+    path, shelve_open, contents = shelf
+    lookup = lookup_loader.get('community.general.shelvefile', loader=DataLoader())
+    assert lookup.run(['file=%s key=a' % path], {}) == ['first']
+
+    path.write_text('second version')
+    assert lookup.run(['file=%s key=a' % path], {}) == ['changed']
+    assert shelve_open.call_count == 2
+    assert contents[0].closed
@@ -8,6 +8,15 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import json
+import threading
+
+import pytest
+
+from ansible.module_utils.six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from ansible.module_utils.six.moves.socketserver import ThreadingMixIn
+from ansible.module_utils.six.moves.urllib.parse import parse_qs, urlparse
+
 from ansible_collections.community.internal_test_tools.tests.unit.compat.unittest import TestCase
 from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import (
     patch,
@@ -118,3 +127,117 @@ class TestLookupModule(TestCase):
         kwargs = kwargs or {"base_url": "dummy", "username": "dummy", "password": "dummy"}
 
         return self.lookup.run(terms, variables, **kwargs)
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class SecretServerStandIn(object):
+    """Serves the Secret Server REST API endpoints used by the SDK from a local thread."""
+
+    SECRETS = {1: 'first', 2: 'second', 3: 'third'}
+    FOLDERS = {10: [1, 2], 20: [3]}
+
+    def __init__(self):
+        self.requests = []
+        self.expires_in = 1200
+        self.lock = threading.Lock()
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def reply(self, body):
+                body = json.dumps(body).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers['Content-Length']))
+                stand_in.record(self.path)
+                self.reply({'access_token': 'token', 'expires_in': stand_in.expires_in})
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                stand_in.record(url.path)
+                if url.path == '/api/v1/healthcheck':
+                    return self.reply({'Healthy': True})
+                if self.headers.get('Authorization') != 'Bearer token':
+                    self.send_error(401)
+                    return
+                if url.path == '/api/v1/secrets/search-total':
+                    return self.reply(len(stand_in.FOLDERS[int(query['filter.folderId'][0])]))
+                if url.path == '/api/v1/secrets':
+                    ids = stand_in.FOLDERS[int(query['filter.folderId'][0])]
+                    return self.reply({'records': [{'id': secret_id} for secret_id in ids]})
+                secret_id = int(url.path.rsplit('/', 1)[1])
+                self.reply({'id': secret_id, 'name': stand_in.SECRETS[secret_id]})
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = 'http://127.0.0.1:%d' % self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def record(self, path):
+        with self.lock:
+            self.requests.append(path)
+
+    def count(self, path):
+        return self.requests.count(path)
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def secret_server(monkeypatch):
+    if not tss.HAS_TSS_AUTHORIZER or not tss.HAS_DELINEA_SS_SDK:
+        pytest.skip('python-tss-sdk is not installed')
+    monkeypatch.setattr(tss, '_AUTHORIZERS', {})
+    for name in ('http_proxy', 'HTTP_PROXY', 'https_proxy', 'HTTPS_PROXY', 'all_proxy', 'ALL_PROXY'):
+        monkeypatch.delenv(name, raising=False)
+    stand_in = SecretServerStandIn()
+    yield stand_in
+    stand_in.stop()
+
+
+def run_tss(secret_server, terms, **kwargs):
+    lookup = lookup_loader.get('community.general.tss')
+    kwargs.setdefault('password', 'password')
+    kwargs.update(base_url=secret_server.url, username='user')
+    return [json.loads(result) if isinstance(result, str) else result for result in lookup.run(terms, [], **kwargs)]
+
+
+def test_tss_workers_and_deduplicate(secret_server):
+    terms = [1, 2, 1, 3, 2]
+    expected = [{'id': secret_id, 'name': SecretServerStandIn.SECRETS[secret_id]} for secret_id in terms]
+    assert run_tss(secret_server, terms) == expected
+    assert run_tss(secret_server, terms, workers=3) == expected
+    assert secret_server.count('/oauth2/token') == 2
+
+    assert run_tss(secret_server, terms, workers=3, deduplicate=True) == expected
+    assert secret_server.count('/api/v1/secrets/1') == 5
+
+
+def test_tss_folders(secret_server):
+    assert run_tss(secret_server, [10, 20], fetch_secret_ids_from_folder=True, workers=2) == [[1, 2], [3]]
+
+
+def test_tss_reuse_token(secret_server):
+    assert run_tss(secret_server, [1], reuse_token=True) == [{'id': 1, 'name': 'first'}]
+    assert run_tss(secret_server, [2], reuse_token=True) == [{'id': 2, 'name': 'second'}]
+    assert secret_server.count('/oauth2/token') == 1
+
+    # an access grant that is about to expire is not reused
+    secret_server.expires_in = 30
+    assert run_tss(secret_server, [3], reuse_token=True, password='other') == [{'id': 3, 'name': 'third'}]
+    assert run_tss(secret_server, [3], reuse_token=True, password='other') == [{'id': 3, 'name': 'third'}]
+    assert secret_server.count('/oauth2/token') == 3
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import os
+import stat
+import threading
+
+import pytest
+
+from ansible.module_utils.six.moves import BaseHTTPServer, socketserver
+from ansible.module_utils.six.moves.urllib.parse import parse_qs, unquote, urlsplit
+from ansible_collections.community.general.plugins.module_utils.identity.keycloak.keycloak import KeycloakAPI, get_token
+
+
+REALM = '/admin/realms/master'
+
+
+class KeycloakHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    wbufsize = -1
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, status, data=None):
+        body = json.dumps(data).encode('utf-8') if data is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self):
+        return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+    def do_POST(self):
+        body = self._read_body()
+        path = urlsplit(self.path).path
+        if path == '/realms/master/protocol/openid-connect/token':
+            form = dict((k, v[0]) for k, v in parse_qs(body.decode('utf-8')).items())
+            self.server.requests.append('TOKEN ' + form['grant_type'])
+            self.server.token_count += 1
+            token = 'token-%d' % self.server.token_count
+            self.server.valid_tokens.add(token)
+            self._send_json(200, {
+                'access_token': token, 'expires_in': 300,
+                'refresh_token': 'refresh-%d' % self.server.token_count, 'refresh_expires_in': 1800,
+            })
+            return
+        self.server.requests.append('POST ' + self.path)
+        self._send_json(201)
+
+    def do_PUT(self):
+        self._read_body()
+        self.server.requests.append('PUT ' + self.path)
+        self._send_json(204)
+
+    def do_GET(self):
+        self.server.requests.append('GET ' + self.path)
+        if self.headers.get('Authorization', '')[len('Bearer '):] not in self.server.valid_tokens:
+            self._send_json(401, {'error': 'HTTP 401 Unauthorized'})
+            return
+        url = urlsplit(self.path)
+        query = dict((k, v[0]) for k, v in parse_qs(url.query).items())
+        path = unquote(url.path)
+        if path == REALM + '/groups':
+            groups = self.server.groups
+            if 'search' in query:
+                groups = [g for g in groups if g['name'] == query['search']]
+            first = int(query.get('first', 0))
+            self._send_json(200, groups[first:first + int(query.get('max', len(groups)))])
+        elif path.startswith(REALM + '/groups/'):
+            gid = path.rsplit('/', 1)[1]
+            group = [g for g in self.server.groups if g['id'] == gid]
+            self._send_json(200 if group else 404, dict(group[0], attributes={}) if group else None)
+        elif path == REALM + '/client-scopes':
+            self._send_json(200, self.server.clientscopes)
+        elif path.startswith(REALM + '/clients/c1/roles/'):
+            name = path.rsplit('/', 1)[1]
+            if name == 'missing':
+                self._send_json(404, {'error': 'Could not find role'})
+            else:
+                self._send_json(200, {'id': 'role-' + name, 'name': name})
+        else:
+            self._send_json(404)
+
+
+class ThreadingServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingServer(('127.0.0.1', 0), KeycloakHandler)
+    httpd.requests = []
+    httpd.token_count = 0
+    httpd.valid_tokens = set()
+    httpd.groups = [{'id': 'g%d' % idx, 'name': 'group%d' % idx, 'subGroupCount': 0} for idx in range(250)]
+    httpd.clientscopes = [{'id': 'cs%d' % idx, 'name': 'scope%d' % idx, 'protocol': 'openid-connect'} for idx in range(3)]
+    thread = threading.Thread(target=httpd.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class FakeModule(object):
+    def __init__(self, params):
+        self.params = params
+
+    def fail_json(self, **kwargs):
+        raise AssertionError(kwargs['msg'])
+
+
+def make_params(server, **kwargs):
+    params = {
+        'auth_keycloak_url': 'http://127.0.0.1:%d' % server.server_address[1],
+        'auth_realm': 'master', 'auth_client_id': 'admin-cli', 'auth_client_secret': None,
+        'auth_username': 'admin', 'auth_password': 'secret', 'token': None, 'refresh_token': None,
+        'validate_certs': True, 'connection_timeout': 10, 'http_agent': 'Ansible', 'token_cache_dir': None,
+    }
+    params.update(kwargs)
+    return params
+
+
+def make_api(server, **kwargs):
+    params = make_params(server, **kwargs)
+    return KeycloakAPI(FakeModule(params), get_token(params))
+
+
+def cache_file(cache_dir):
+    files = os.listdir(cache_dir)
+    assert len(files) == 1
+    return os.path.join(cache_dir, files[0])
+
+
+def test_token_without_cache(server):
+    get_token(make_params(server))
+    get_token(make_params(server))
+
+    assert server.requests == ['TOKEN password', 'TOKEN password']
+
+
+def test_token_cache(server, tmpdir):
+    cache_dir = str(tmpdir.join('tokens'))
+    params = make_params(server, token_cache_dir=cache_dir)
+
+    assert get_token(params)['Authorization'] == 'Bearer token-1'
+    assert get_token(params)['Authorization'] == 'Bearer token-1'
+    assert server.requests == ['TOKEN password']
+
+    path = cache_file(cache_dir)
+    assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    with open(path) as f:
+        content = f.read()
+    assert 'secret' not in content
+
+    # another user, or another client, does not share the cache entry
+    get_token(make_params(server, token_cache_dir=cache_dir, auth_username='other'))
+    assert server.requests == ['TOKEN password', 'TOKEN password']
+
+
+def test_token_cache_refresh(server, tmpdir):
+    params = make_params(server, token_cache_dir=str(tmpdir))
+    get_token(params)
+    path = cache_file(str(tmpdir))
+
+    with open(path) as f:
+        entry = json.load(f)
+    entry['expires_at'] -= 290
+    with open(path, 'w') as f:
+        json.dump(entry, f)
+
+    assert get_token(params)['Authorization'] == 'Bearer token-2'
+    assert get_token(params)['Authorization'] == 'Bearer token-2'
+    assert server.requests == ['TOKEN password', 'TOKEN refresh_token']
+
+    with open(path) as f:
+        entry = json.load(f)
+    entry['expires_at'] -= 300
+    entry['refresh_expires_at'] -= 1800
+    with open(path, 'w') as f:
+        json.dump(entry, f)
+
+    assert get_token(params)['Authorization'] == 'Bearer token-3'
+    assert server.requests == ['TOKEN password', 'TOKEN refresh_token', 'TOKEN password']
+
+
+def test_token_cache_other_password(server, tmpdir):
+    get_token(make_params(server, token_cache_dir=str(tmpdir)))
+
+    header = get_token(make_params(server, token_cache_dir=str(tmpdir), auth_password='changed'))
+
+    assert header['Authorization'] == 'Bearer token-2'
+    assert server.requests == ['TOKEN password', 'TOKEN password']
+
+
+def test_token_cache_revoked(server, tmpdir):
+    api = make_api(server, token_cache_dir=str(tmpdir))
+    server.valid_tokens.clear()
+
+    api.get_clientscopes()
+    make_api(server, token_cache_dir=str(tmpdir)).get_clientscopes()
+
+    # the token obtained after the 401 replaces the revoked one in the cache
+    assert server.requests == [
+        'TOKEN password',
+        'GET %s/client-scopes' % REALM,
+        'TOKEN password',
+        'GET %s/client-scopes' % REALM,
+        'GET %s/client-scopes' % REALM,
+    ]
+
+
+def test_get_group_by_name(server):
+    api = make_api(server)
+    del server.requests[:]
+
+    group = api.get_group_by_name('group201')
+    assert group == {'id': 'g201', 'name': 'group201', 'subGroupCount': 0, 'attributes': {}}
+    assert server.requests == [
+        'GET %s/groups?search=group201&exact=true&first=0&max=100' % REALM,
+        'GET %s/groups/g201' % REALM,
+    ]
+
+    del server.requests[:]
+    assert api.get_group_by_name('nonexistent') is None
+    assert len(server.requests) == 1
+
+
+def test_group_search_pages(server):
+    api = make_api(server)
+    del server.requests[:]
+
+    # a server ignoring the search parameter returns all groups page by page
+    server.groups = [dict(g, name='same') for g in server.groups]
+    assert len(api._search_groups('same')) == 250
+    assert len(server.requests) == 3
+
+
+def test_get_clientscope_by_name(server):
+    api = make_api(server)
+    del server.requests[:]
+
+    assert api.get_clientscope_by_name('scope2') == server.clientscopes[2]
+    assert api.get_clientscope_by_name('scope1') == server.clientscopes[1]
+    assert api.get_clientscope_by_name('nonexistent') is None
+    assert server.requests == ['GET %s/client-scopes' % REALM]
+
+    # listings are returned as copies
+    api.get_clientscopes()[0]['name'] = 'modified'
+    assert api.get_clientscope_by_name('scope0') == server.clientscopes[0]
+
+    api.update_clientscope({'id': 'cs1', 'name': 'scope1'})
+    api.get_clientscope_by_name('scope1')
+    assert server.requests == [
+        'GET %s/client-scopes' % REALM,
+        'PUT %s/client-scopes/cs1' % REALM,
+        'GET %s/client-scopes' % REALM,
+    ]
+
+
+def test_get_client_role_id_by_name(server):
+    api = make_api(server)
+    del server.requests[:]
+
+    assert api.get_client_role_id_by_name('c1', 'a role') == 'role-a role'
+    assert api.get_client_role_id_by_name('c1', 'missing') is None
+    assert server.requests == [
+        'GET %s/clients/c1/roles/a%%20role' % REALM,
+        'GET %s/clients/c1/roles/missing' % REALM,
+    ]
@@ -6,6 +6,7 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import threading
 from functools import partial
 
 import pytest
@@ -371,3 +372,103 @@ def test_runner_context(runner_input, cmd_execution, expected):
         with runner(**runner_input['runner_ctx_args']) as ctx2:
             results2 = ctx2.run(**cmd_execution['runner_ctx_run_args'])
             _assert_run(runner_input, cmd_execution, expected, ctx2, results2)
+
+
+def _batch_runner(params=None, **kwargs):
+    module = MagicMock()
+    type(module).params = PropertyMock(return_value=params or {})
+    module.get_bin_path.return_value = '/mock/bin/testing'
+    module.check_mode = False
+    module.run_command.side_effect = lambda cmd, **kw: (0 if 'bad' not in cmd else 1, " ".join(cmd[1:]), "")
+    runner = CmdRunner(
+        module=module,
+        command="testing",
+        arg_formats=dict(
+            state=cmd_runner_fmt.as_map(dict(present="install", absent="remove")),
+            classic=cmd_runner_fmt.as_bool("--classic"),
+            name=cmd_runner_fmt.as_list(multiple_operands=True),
+        ),
+        **kwargs
+    )
+    return module, runner
+
+
+@pytest.mark.parametrize('max_workers', [1, 3])
+def test_runner_batch_coalesce(max_workers):
+    module, runner = _batch_runner(params=dict(state="present", classic=False), collect_stats=True)
+    items = [
+        dict(name="a"),
+        dict(name=["b", "c"], classic=True),
+        dict(name="d", state="absent"),
+        dict(name="e"),
+        dict(name="f", classic=True),
+    ]
+    with runner("state classic name", output_process=lambda rc, out, err: out) as ctx:
+        results = ctx.run_batch(items, max_workers=max_workers)
+
+    assert results == [
+        "install a e",
+        "install --classic b c f",
+        "remove d",
+        "install a e",
+        "install --classic b c f",
+    ]
+    assert module.run_command.call_count == 3
+    assert [info['items'] for info in ctx.batch_run_info] == [[0, 3], [1, 4], [2]]
+    assert sorted(stat['cmd'][1:] for stat in runner.stats) == [
+        ["install", "--classic", "b", "c", "f"],
+        ["install", "a", "e"],
+        ["remove", "d"],
+    ]
+    assert all(stat['rc'] == 0 and stat['elapsed'] >= 0 for stat in runner.stats)
+
+
+def test_runner_batch_no_coalesce_check_rc():
+    module, runner = _batch_runner(params=dict(state="present"))
+    assert runner.stats is None
+    with runner("state name", check_rc=True) as ctx:
+        results = ctx.run_batch([dict(name="a"), dict(name="bad"), dict(name="c")], max_workers=2, coalesce=False)
+
+    assert [rc for rc, out, err in results] == [0, 1, 0]
+    assert [call[1]['check_rc'] for call in module.run_command.call_args_list] == [False] * 3
+    module.fail_json.assert_called_once_with(cmd=['/mock/bin/testing', 'install', 'bad'], rc=1,
+                                             stdout='install bad', stderr='', msg='')
+
+
+def test_runner_context_environ_isolated():
+    module, runner = _batch_runner(params=dict(state="present"), environ_update={"A": "1"})
+    with runner("state name", environ_update={"B": "2"}) as ctx:
+        ctx.run(name="a")
+    with runner("state name") as ctx2:
+        ctx2.run(name="b")
+
+    assert runner.environ_update == {"A": "1"}
+    assert ctx.run_info['environ_update'] == {"A": "1", "B": "2", "LANGUAGE": "C", "LC_ALL": "C"}
+    assert ctx2.run_info['environ_update'] == {"A": "1", "LANGUAGE": "C", "LC_ALL": "C"}
+
+
+def test_runner_context_threads():
+    module, runner = _batch_runner(params=dict(state="present", name=["x"]))
+    errors = []
+
+    with runner("state name") as ctx:
+        def worker(name):
+            try:
+                for dummy in range(50):
+                    rc, out, err = ctx.run(name=name)
+                    assert out == "install {0}".format(name)
+                    assert ctx.cmd == ["/mock/bin/testing", "install", name]
+                    assert ctx.run_info['context_run_args'] == dict(name=name)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(name, )) for name in "abcd"]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert ctx.cmd is None
+        assert ctx.run() == (0, "install x", "")
+        assert ctx.run(state="absent") == (0, "remove x", "")
+
+    assert errors == []
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+
+import pytest
+
+from ansible.module_utils.six import BytesIO
+from ansible_collections.community.general.plugins.module_utils import ipa
+from ansible_collections.community.general.plugins.module_utils.ipa import IPAClient
+
+
+class FailJson(Exception):
+    pass
+
+
+class FakeModule(object):
+    def __init__(self, check_mode=False):
+        self.params = {'ipa_timeout': 10}
+        self.check_mode = check_mode
+
+    def fail_json(self, **kwargs):
+        raise FailJson(kwargs['msg'])
+
+
+class FakeResponse(BytesIO):
+    class headers(object):
+        @staticmethod
+        def get_content_charset(default):
+            return 'utf-8'
+
+
+class FakeIPAServer(object):
+    """Answers the JSON-RPC requests of IPAClient in place of fetch_url."""
+
+    def __init__(self, batch_supported=True, failing=None):
+        self.requests = []
+        self.batch_supported = batch_supported
+        self.failing = failing or []
+
+    def run(self, command):
+        method, params = command['method'], command['params']
+        if method in self.failing:
+            return {'error': '%s failed' % params[0][0], 'error_code': 4001, 'error_name': 'NotFound'}
+        return {'result': {'cn': params[0]}, 'value': params[0][0], 'summary': None, 'error': None}
+
+    def __call__(self, module, url, data, headers, timeout, use_gssapi):
+        request = json.loads(data)
+        self.requests.append(request)
+        if request['method'] == 'batch':
+            if not self.batch_supported:
+                response = {'result': None, 'error': {'code': 4004, 'message': "unknown command 'batch'"}}
+            else:
+                results = [self.run(command) for command in request['params'][0]]
+                response = {'result': {'count': len(results), 'results': results}, 'error': None}
+        else:
+            result = self.run(request)
+            response = {'result': None, 'error': result['error']} if result['error'] else {'result': result, 'error': None}
+        return FakeResponse(json.dumps(response).encode('utf-8')), {'status': 200}
+
+
+@pytest.fixture
+def server(mocker):
+    server = FakeIPAServer()
+    mocker.patch.object(ipa, 'fetch_url', side_effect=server)
+    return server
+
+
+def methods(request):
+    return [command['method'] for command in request['params'][0]]
+
+
+def add_member(client):
+    return lambda name, item: client._post_json(method='group_add_member', name=name, item=item)
+
+
+def remove_member(client):
+    return lambda name, item: client._post_json(method='group_remove_member', name=name, item=item)
+
+
+def test_modify_if_diff_batch(server):
+    client = IPAClient(FakeModule(), 'ipa.example.com', 443, 'https')
+
+    changed = client.modify_if_diff('admins', ['alice', 'bob'], ['bob', 'carol'], add_member(client), remove_member(client), item='user')
+
+    assert changed is True
+    assert len(server.requests) == 1
+    assert methods(server.requests[0]) == ['group_remove_member', 'group_add_member']
+    assert server.requests[0]['params'][0][0]['params'] == [['admins'], {'user': ['alice']}]
+    assert server.requests[0]['params'][0][1]['params'] == [['admins'], {'user': ['carol']}]
+
+
+def test_batch_context(server):
+    client = IPAClient(FakeModule(), 'ipa.example.com', 443, 'https')
+
+    with client.batch():
+        client.modify_if_diff('admins', [], ['alice'], add_member(client), remove_member(client))
+        client.modify_if_diff('admins', ['bob'], [], add_member(client), remove_member(client))
+        assert server.requests == []
+
+    assert len(server.requests) == 1
+    assert methods(server.requests[0]) == ['group_add_member', 'group_remove_member']
+
+    # nothing to change, nothing sent
+    with client.batch():
+        client.modify_if_diff('admins', ['alice'], ['alice'], add_member(client), remove_member(client))
+    assert len(server.requests) == 1
+
+
+def test_post_json_batch_results(server):
+    client = IPAClient(FakeModule(), 'ipa.example.com', 443, 'https')
+
+    results = client.post_json_batch([('group_show', 'admins', None), ('group_show', 'editors', {'all': True})])
+
+    assert results == [{'cn': ['admins']}, {'cn': ['editors']}]
+    assert len(server.requests) == 1
+
+
+def test_post_json_batch_errors(server):
+    server.failing = ['group_remove_member', 'hostgroup_add_member']
+    client = IPAClient(FakeModule(), 'ipa.example.com', 443, 'https')
+
+    with pytest.raises(FailJson) as exc:
+        client.post_json_batch([('group_add_member', 'admins', {}), ('group_remove_member', 'admins', {}),
+                                ('hostgroup_add_member', 'servers', {})])
+
+    assert str(exc.value) == ('response group_remove_member: admins failed; '
+                              'response hostgroup_add_member: servers failed')
+
+
+def test_post_json_batch_unsupported(server):
+    server.batch_supported = False
+    client = IPAClient(FakeModule(), 'ipa.example.com', 443, 'https')
+
+    client.modify_if_diff('admins', ['alice'], ['bob'], add_member(client), remove_member(client))
+    client.modify_if_diff('admins', ['bob'], ['carol'], add_member(client), remove_member(client))
+
+    # batch is only tried once
+    assert [request['method'] for request in server.requests] == [
+        'batch', 'group_remove_member', 'group_add_member', 'group_remove_member', 'group_add_member']
+
+    server.failing = ['group_add_member']
+    with pytest.raises(FailJson, match='response group_add_member: admins failed'):
+        client.modify_if_diff('admins', [], ['dave'], add_member(client), remove_member(client))
+
+
+def test_modify_if_diff_check_mode(server):
+    client = IPAClient(FakeModule(check_mode=True), 'ipa.example.com', 443, 'https')
+
+    assert client.modify_if_diff('admins', ['alice'], ['bob'], add_member(client), remove_member(client)) is True
+    assert server.requests == []
@@ -7,6 +7,10 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import base64
+import hashlib
+import hmac
+
 import pytest
 
 from ansible_collections.community.general.plugins.module_utils import known_hosts
@@ -116,3 +120,110 @@ def test_add_host_key(mocker, fqdn, port, add_host_key_cmd):
 
     known_hosts.add_host_key(am, fqdn, port=port)
     run_command.assert_called_with(keyscan_cmd + add_host_key_cmd)
+
+
+def hashed_entry(host, salt=b'0123456789abcdefghij'):
+    digest = hmac.new(salt, host.encode('utf-8'), hashlib.sha1).digest()
+    return '|1|%s|%s' % (base64.b64encode(salt).decode('ascii'), base64.b64encode(digest).decode('ascii'))
+
+
+KNOWN_HOSTS = '\n'.join([
+    '# comment',
+    'plain.example.org,192.0.2.1 ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAIA',
+    '[port.example.org]:2222 ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAIA',
+    '*.wild.example.org,!bad.wild.example.org ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAIA',
+    '@revoked revoked.example.org ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAIA',
+    '@cert-authority ca.example.org ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAIA',
+    '%s ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAIA' % hashed_entry('hashed.example.org'),
+    '%s ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAIA' % hashed_entry('other.example.org', salt=b'another salt value!!'),
+    '|1|invalid|entry ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAIA',
+    '',
+])
+
+
+@pytest.mark.parametrize('host, known', [
+    ('plain.example.org', True),
+    ('192.0.2.1', True),
+    ('example.org', False),
+    ('port.example.org', True),
+    ('host.wild.example.org', True),
+    ('revoked.example.org', False),
+    ('ca.example.org', True),
+    ('hashed.example.org', True),
+    ('other.example.org', True),
+    ('unknown.example.org', False),
+])
+def test_known_hosts_index(host, known):
+    index = known_hosts.KnownHostsIndex(KNOWN_HOSTS)
+    assert index.has_host(host) == known
+
+
+def test_known_hosts_index_hashed_salts():
+    index = known_hosts.KnownHostsIndex(KNOWN_HOSTS + '%s ssh-rsa AAAAB3NzaC1yc2EAAAADAQABAAABAQ\n' % hashed_entry('third.example.org'))
+    assert len(index.hashed) == 2
+    assert index.has_host('third.example.org')
+
+
+def test_get_known_hosts_index(tmpdir):
+    path = tmpdir.join('known_hosts')
+    path.write(KNOWN_HOSTS)
+
+    index = known_hosts.get_known_hosts_index(str(path))
+    assert known_hosts.get_known_hosts_index(str(path)) is index
+    assert not index.has_host('new.example.org')
+
+    path.write('new.example.org ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAIA\n', mode='a')
+    index = known_hosts.get_known_hosts_index(str(path))
+    assert index.has_host('new.example.org')
+
+    path.remove()
+    assert known_hosts.get_known_hosts_index(str(path)) is None
+
+
+def test_not_in_host_file(mocker, tmpdir):
+    path = tmpdir.join('known_hosts')
+    path.write(KNOWN_HOSTS)
+    mocker.patch('os.path.expanduser', return_value=str(path))
+
+    assert not known_hosts.not_in_host_file(None, 'hashed.example.org')
+    assert known_hosts.not_in_host_file(None, 'unknown.example.org')
+
+
+def test_add_host_keys(mocker):
+    am = mocker.MagicMock()
+    am.get_bin_path.return_value = keyscan_cmd = "/custom/path/ssh-keyscan"
+    am.run_command.return_value = (0, "one line of output\n", "")
+
+    mocker.patch('os.path.isdir', return_value=True)
+    mocker.patch('os.path.exists', return_value=True)
+
+    rc, out, err = known_hosts.add_host_keys(am, [('one.example.org', None), ('two.example.org', '2222'),
+                                                  ('three.example.org', None), ('one.example.org', None)])
+
+    assert am.run_command.call_args_list == [
+        mocker.call(keyscan_cmd + " -t rsa one.example.org three.example.org"),
+        mocker.call(keyscan_cmd + " -t rsa -p 2222 two.example.org"),
+    ]
+    assert am.append_to_file.call_count == 2
+    assert out == "one line of output\n" * 2
+
+
+def test_add_host_keys_missing_hosts(mocker):
+    am = mocker.MagicMock()
+    am.get_bin_path.return_value = keyscan_cmd = "/custom/path/ssh-keyscan"
+    am.fail_json.side_effect = SystemExit
+    out = ("[one.example.org]:2222 ssh-rsa AAAA\n"
+           "[2001:db8::abcd:abcd]:2222 ssh-rsa AAAA\n")
+    am.run_command.return_value = (0, out, "")
+
+    mocker.patch('os.path.isdir', return_value=True)
+    mocker.patch('os.path.exists', return_value=True)
+
+    with pytest.raises(SystemExit):
+        known_hosts.add_host_keys(am, [('one.example.org', '2222'), ('[2001:DB8::abcd:abcd]', '2222'), ('three.example.org', '2222')])
+
+    # the keys found are kept
+    am.append_to_file.assert_called_once_with(mocker.ANY, out)
+    am.fail_json.assert_called_once_with(
+        msg='failed to retrieve hostkey of three.example.org. '
+            '"%s -t rsa -p 2222 one.example.org [2001:DB8::abcd:abcd] three.example.org" returned no matches for them.' % keyscan_cmd)
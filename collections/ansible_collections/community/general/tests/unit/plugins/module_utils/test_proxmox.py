@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+
+import pytest
+
+proxmoxer = pytest.importorskip('proxmoxer')
+
+from ansible.module_utils.six.moves.urllib.parse import urlsplit
+from ansible_collections.community.general.plugins.module_utils import proxmox as proxmox_utils
+from ansible_collections.community.general.plugins.module_utils.proxmox import ProxmoxAnsible
+
+
+RESOURCES = [
+    {'vmid': 100, 'name': 'web', 'node': 'pve1', 'type': 'qemu'},
+    {'vmid': 101, 'name': 'db', 'node': 'pve2', 'type': 'qemu'},
+    {'vmid': 102, 'name': 'web', 'node': 'pve2', 'type': 'lxc'},
+]
+
+
+class FailJson(Exception):
+    pass
+
+
+class FakeModule(object):
+    def __init__(self):
+        self.params = dict(api_host='127.0.0.1', api_port=None, api_user='root@pam', api_password=None,
+                           api_token_id='ansible', api_token_secret='secret', validate_certs=False)
+
+    def fail_json(self, **kwargs):
+        raise FailJson(kwargs['msg'])
+
+
+class FakeResponse(object):
+    def __init__(self, data, status_code=200):
+        self.status_code = status_code
+        self.content = json.dumps({'data': data}).encode('utf-8')
+
+
+class FakeCluster(object):
+    """Answers the requests of a real ProxmoxAPI object in place of its HTTP session."""
+
+    def __init__(self, task_statuses=None):
+        self.requests = []
+        self.task_statuses = task_statuses or {}
+
+    def __call__(self, method, url, data=None, params=None, **kwargs):
+        path = urlsplit(url).path.replace('/api2/json', '')
+        self.requests.append('%s %s' % (method, path))
+        if path == '/version':
+            return FakeResponse({'version': '8.2.4'})
+        if path == '/cluster/resources':
+            return FakeResponse(RESOURCES)
+        if path.endswith('/status') and '/tasks/' in path:
+            upid = path.split('/')[-2]
+            statuses = self.task_statuses[upid]
+            return FakeResponse(statuses.pop(0) if len(statuses) > 1 else statuses[0])
+        return FakeResponse(None)
+
+
+@pytest.fixture
+def cluster(mocker):
+    cluster = FakeCluster()
+
+    def connect(self):
+        api = proxmoxer.ProxmoxAPI('127.0.0.1', user='root@pam', token_name='ansible', token_value='secret', verify_ssl=False)
+        api._store['session'].request = cluster
+        return api
+
+    mocker.patch.object(ProxmoxAnsible, '_connect', connect)
+    return cluster
+
+
+@pytest.fixture
+def sleeps(mocker):
+    clock = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(round(seconds, 3))
+        clock[0] += seconds
+
+    mocker.patch.object(proxmox_utils, 'sleep', side_effect=sleep)
+    mocker.patch.object(proxmox_utils, 'time', side_effect=lambda: clock[0])
+    return sleeps
+
+
+def count(cluster, request):
+    return len([r for r in cluster.requests if r == request])
+
+
+def test_resource_index(cluster):
+    proxmox = ProxmoxAnsible(FakeModule())
+
+    assert proxmox.get_vmid('db') == 101
+    assert proxmox.get_vm(102)['node'] == 'pve2'
+    assert proxmox.get_vm('100')['name'] == 'web'
+    assert proxmox.get_vm(999, ignore_missing=True) is None
+    assert proxmox.get_vmid('web', choose_first_if_multiple=True) == 100
+    with pytest.raises(FailJson, match='Multiple VMs with name web found'):
+        proxmox.get_vmid('web')
+    with pytest.raises(FailJson, match='No VM with name missing found'):
+        proxmox.get_vmid('missing')
+
+    assert count(cluster, 'GET /cluster/resources') == 1
+
+
+def test_resource_index_invalidated_on_change(cluster):
+    proxmox = ProxmoxAnsible(FakeModule())
+
+    proxmox.get_vm(100)
+    proxmox.proxmox_api.nodes('pve1').qemu(100).status.current.get()
+    proxmox.get_vm(100)
+    assert count(cluster, 'GET /cluster/resources') == 1
+
+    proxmox.proxmox_api.nodes('pve1').qemu(100).config.set(name='web2')
+    proxmox.get_vm(100)
+    assert count(cluster, 'GET /cluster/resources') == 2
+
+    proxmox.invalidate_resources()
+    proxmox.get_vm(100)
+    assert count(cluster, 'GET /cluster/resources') == 3
+
+
+def test_api_task_complete_backoff(cluster, sleeps):
+    running = {'status': 'running'}
+    cluster.task_statuses['UPID:1'] = [running] * 7 + [{'status': 'stopped', 'exitstatus': 'OK'}]
+    proxmox = ProxmoxAnsible(FakeModule())
+
+    assert proxmox.api_task_complete('pve1', 'UPID:1', 30) == (True, None)
+    assert sleeps == [0.1, 0.2, 0.4, 0.8, 1.6, 2.0, 2.0]
+
+
+def test_api_task_complete_failed_and_timeout(cluster, sleeps):
+    cluster.task_statuses['UPID:1'] = [{'status': 'stopped', 'exitstatus': 'command failed'}]
+    cluster.task_statuses['UPID:2'] = [{'status': 'running'}]
+    proxmox = ProxmoxAnsible(FakeModule())
+
+    assert proxmox.api_task_complete('pve1', 'UPID:1', 30) == (False, 'command failed')
+    assert sleeps == []
+    assert proxmox.api_task_complete('pve1', 'UPID:2', 3) == (False, ProxmoxAnsible.TASK_TIMED_OUT)
+    assert sum(sleeps) == pytest.approx(3)
+
+
+def test_api_tasks_complete(cluster, sleeps):
+    running = {'status': 'running'}
+    cluster.task_statuses['UPID:1'] = [running, {'status': 'stopped', 'exitstatus': 'OK'}]
+    cluster.task_statuses['UPID:2'] = [running, running, running, {'status': 'stopped', 'exitstatus': 'OK'}]
+    cluster.task_statuses['UPID:3'] = [running, {'status': 'stopped', 'exitstatus': 'job errors'}]
+    proxmox = ProxmoxAnsible(FakeModule())
+    proxmox.get_vm(100)
+
+    results = proxmox.api_tasks_complete([('pve1', 'UPID:1'), ('pve2', 'UPID:2'), ('pve2', 'UPID:3')], 30)
+
+    assert results == {'UPID:1': (True, None), 'UPID:2': (True, None), 'UPID:3': (False, 'job errors')}
+    # the tasks are waited for together
+    assert sleeps == [0.1, 0.2, 0.4]
+    assert count(cluster, 'GET /nodes/pve2/tasks/UPID:2/status') == 4
+    # finished tasks may have changed guests
+    proxmox.get_vm(100)
+    assert count(cluster, 'GET /cluster/resources') == 2
@@ -0,0 +1,441 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import hashlib
+import json
+import threading
+import time
+
+import pytest
+
+from ansible.module_utils.six.moves import BaseHTTPServer, socketserver
+from ansible_collections.community.general.plugins.module_utils.redfish_utils import RedfishUtils, _MultipartStream
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+def make_resources(cpus=4, expand=True, storages=0, drives=0):
+    resources = {
+        '/redfish/v1/': {
+            'Systems': {'@odata.id': '/redfish/v1/Systems'},
+            'UpdateService': {'@odata.id': '/redfish/v1/UpdateService'},
+            'ProtocolFeaturesSupported': {'ExpandQuery': {'NoLinks': True, 'Levels': True, 'MaxLevels': 3}} if expand else {},
+        },
+        '/redfish/v1/Systems': {'Members': [{'@odata.id': '/redfish/v1/Systems/1'}]},
+        '/redfish/v1/UpdateService': {'MultipartHttpPushUri': '/redfish/v1/UpdateService/upload'},
+        '/redfish/v1/Systems/1': {
+            '@odata.id': '/redfish/v1/Systems/1', 'Id': '1', 'PowerState': 'On',
+            'Processors': {'@odata.id': '/redfish/v1/Systems/1/Processors'},
+            'Storage': {'@odata.id': '/redfish/v1/Systems/1/Storage'},
+        },
+        '/redfish/v1/Systems/1/Storage': {
+            'Members': [{'@odata.id': '/redfish/v1/Systems/1/Storage/%d' % idx} for idx in range(storages)],
+        },
+        '/redfish/v1/Systems/1/Processors': {
+            'Members': [{'@odata.id': '/redfish/v1/Systems/1/Processors/%d' % idx} for idx in range(cpus)],
+        },
+    }
+    for idx in range(cpus):
+        resources['/redfish/v1/Systems/1/Processors/%d' % idx] = {
+            '@odata.id': '/redfish/v1/Systems/1/Processors/%d' % idx, 'Id': str(idx), 'Name': 'CPU %d' % idx,
+            'TotalCores': 8, 'Status': {'State': 'Enabled'},
+        }
+    for storage in range(storages):
+        storage_uri = '/redfish/v1/Systems/1/Storage/%d' % storage
+        resources[storage_uri] = {
+            '@odata.id': storage_uri, 'Id': str(storage), 'StorageControllers': [{'Name': 'RAID %d' % storage}],
+            'Drives': [{'@odata.id': '%s/Drives/%d' % (storage_uri, idx)} for idx in range(drives)],
+        }
+        for idx in range(drives):
+            resources['%s/Drives/%d' % (storage_uri, idx)] = {
+                '@odata.id': '%s/Drives/%d' % (storage_uri, idx), 'Id': str(idx), 'Name': 'Drive %d' % idx,
+                'CapacityBytes': 10 ** 12, 'Status': {'State': 'Enabled'},
+            }
+    return resources
+
+
+class RedfishHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # send headers and body together, as separate small writes stall on delayed ACKs
+    wbufsize = -1
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _send_json(self, status, data=None, headers=None):
+        body = json.dumps(data).encode('utf-8') if data is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        try:
+            time.sleep(self.server.delay)
+            self._get()
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+
+    def _get(self):
+        path, dummy, query = self.path.partition('?')
+        with self.server.lock:
+            self.server.requests.append(self.path)
+        resource = self.server.resources.get(path)
+        if resource is None:
+            self._send_json(404, {'error': {'@Message.ExtendedInfo': [{'Message': 'not found'}]}})
+            return
+        if '$expand' in query:
+            members = [self.server.resources[m['@odata.id']] for m in resource['Members']]
+            resource = dict(resource, Members=members)
+        etag = '"%s"' % self.server.versions.get(path, 1)
+        if self.server.etags and self.headers.get('If-None-Match') == etag:
+            self._send_json(304)
+            return
+        self._send_json(200, resource, {'ETag': etag} if self.server.etags else None)
+
+    def do_PATCH(self):
+        length = int(self.headers.get('Content-Length', 0))
+        payload = json.loads(self.rfile.read(length))
+        with self.server.lock:
+            self.server.requests.append('PATCH ' + self.path)
+            self.server.resources[self.path].update(payload)
+            self.server.versions[self.path] = self.server.versions.get(self.path, 1) + 1
+        self._send_json(204)
+
+    def do_POST(self):
+        # read the upload in chunks, as a BMC would, and remember its size and hash
+        remaining = int(self.headers['Content-Length'])
+        digest = hashlib.sha256()
+        while remaining:
+            chunk = self.rfile.read(min(remaining, 1 << 20))
+            if not chunk:
+                break
+            digest.update(chunk)
+            remaining -= len(chunk)
+        with self.server.lock:
+            self.server.requests.append('POST ' + self.path)
+            self.server.uploads.append({'content_type': self.headers['Content-Type'],
+                                        'length': int(self.headers['Content-Length']) - remaining,
+                                        'sha256': digest.hexdigest()})
+        self._send_json(202, None, {'Location': '/redfish/v1/TaskService/Tasks/1'})
+
+
+class RedfishServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, resources, etags=True, delay=0):
+        BaseHTTPServer.HTTPServer.__init__(self, ('127.0.0.1', 0), RedfishHandler)
+        self.resources = resources
+        self.etags = etags
+        self.delay = delay
+        self.in_flight = self.max_in_flight = 0
+        self.versions = {}
+        self.requests = []
+        self.uploads = []
+        self.connections = 0
+        self.lock = threading.Lock()
+
+    @property
+    def root_uri(self):
+        return 'http://127.0.0.1:%d' % self.server_address[1]
+
+
+@pytest.fixture
+def redfish_server():
+    servers = []
+
+    def start(**kwargs):
+        server = RedfishServer(make_resources(**kwargs.pop('resources', {})), **kwargs)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+class FakeModule(object):
+    def __init__(self, **params):
+        self.params = dict(validate_certs=False, ca_path=None, ciphers=None,
+                           keep_alive=False, response_cache=False, expand_collections=False, workers=1)
+        self.params.update(params)
+
+
+def make_utils(server, **params):
+    return RedfishUtils({'user': 'root', 'pswd': 'secret', 'token': None}, server.root_uri, 10, FakeModule(**params))
+
+
+def cpu_inventory(utils):
+    assert utils._find_systems_resource()['ret']
+    return utils.get_multi_cpu_inventory()
+
+
+def test_defaults_open_a_connection_per_request(redfish_server):
+    server = redfish_server()
+    inventory = cpu_inventory(make_utils(server))
+
+    assert [cpu['Name'] for cpu in inventory['entries'][0][1]] == ['CPU %d' % idx for idx in range(4)]
+    assert server.connections == len(server.requests) == 8
+
+
+def test_keep_alive(redfish_server):
+    server = redfish_server()
+    expected = cpu_inventory(make_utils(server))
+    server.connections = 0
+
+    assert cpu_inventory(make_utils(server, keep_alive=True)) == expected
+    assert server.connections == 1
+
+
+def test_keep_alive_http_error(redfish_server):
+    server = redfish_server()
+    utils = make_utils(server, keep_alive=True)
+
+    response = utils.get_request(server.root_uri + '/redfish/v1/Missing')
+
+    assert response['ret'] is False
+    assert response['status'] == 404
+    assert 'not found' in response['msg']
+    assert utils.get_request(server.root_uri + '/redfish/v1/Systems/1')['data']['Id'] == '1'
+    assert server.connections == 1
+
+
+def test_response_cache(redfish_server):
+    server = redfish_server()
+    utils = make_utils(server, response_cache=True)
+    system_uri = server.root_uri + '/redfish/v1/Systems/1'
+
+    for dummy in range(3):
+        assert utils._find_systems_resource()['ret']
+        assert utils.get_request(system_uri)['data']['PowerState'] == 'On'
+
+    # the service root is read once, the other resources are revalidated with their ETag
+    assert server.requests.count('/redfish/v1/') == 1
+    assert server.requests.count('/redfish/v1/Systems/1') == 3
+
+    assert utils.patch_request(system_uri, {'PowerState': 'Off'})['ret']
+    assert utils.get_request(system_uri)['data']['PowerState'] == 'Off'
+
+
+def test_response_cache_returns_copies(redfish_server):
+    server = redfish_server()
+    utils = make_utils(server, response_cache=True)
+    system_uri = server.root_uri + '/redfish/v1/Systems/1'
+
+    utils.get_request(system_uri)['data']['PowerState'] = 'changed by caller'
+
+    assert utils.get_request(system_uri)['data']['PowerState'] == 'On'
+
+
+def test_response_cache_without_etags(redfish_server):
+    server = redfish_server(etags=False)
+    utils = make_utils(server, response_cache=True)
+
+    for dummy in range(2):
+        utils.get_request(server.root_uri + '/redfish/v1/Systems/1')
+
+    assert server.requests.count('/redfish/v1/Systems/1') == 2
+
+
+@pytest.mark.parametrize('advertised', [True, False])
+def test_expand_collections(redfish_server, advertised):
+    server = redfish_server(resources={'expand': advertised})
+    expected = cpu_inventory(make_utils(server))
+    del server.requests[:]
+
+    assert cpu_inventory(make_utils(server, expand_collections=True)) == expected
+    if advertised:
+        assert '/redfish/v1/Systems/1/Processors?$expand=.($levels=1)' in server.requests
+        assert not any(uri.startswith('/redfish/v1/Systems/1/Processors/') for uri in server.requests)
+        # the service root is read once more to look for $expand support
+        assert server.requests == ['/redfish/v1/', '/redfish/v1/', '/redfish/v1/Systems?$expand=.($levels=1)',
+                                   '/redfish/v1/Systems/1/Processors?$expand=.($levels=1)']
+    else:
+        assert len(server.requests) == 9
+
+
+def test_expanded_members_are_dropped_on_modification(redfish_server):
+    server = redfish_server()
+    utils = make_utils(server, expand_collections=True)
+    assert utils._find_systems_resource()['ret']
+    system_uri = server.root_uri + '/redfish/v1/Systems/1'
+
+    assert utils.patch_request(system_uri, {'PowerState': 'Off'})['ret']
+
+    assert utils.get_request(system_uri)['data']['PowerState'] == 'Off'
+
+
+def test_expanded_members_without_headers_are_requested_again(redfish_server):
+    server = redfish_server()
+    utils = make_utils(server, expand_collections=True)
+    assert utils._find_systems_resource()['ret']
+    system_uri = server.root_uri + '/redfish/v1/Systems/1'
+
+    # the ETag and Allow headers of a member are only known from its own response
+    response = utils._get_request_with_headers(system_uri)
+
+    assert response['headers']['etag'] == '"1"'
+    assert server.requests[-1] == '/redfish/v1/Systems/1'
+
+
+def disk_inventory(utils):
+    assert utils._find_systems_resource()['ret']
+    return utils.get_multi_disk_inventory()
+
+
+@pytest.mark.parametrize('keep_alive', [False, True])
+def test_workers(redfish_server, keep_alive):
+    server = redfish_server(resources={'storages': 2, 'drives': 6}, delay=0.02)
+    expected = disk_inventory(make_utils(server))
+    assert server.max_in_flight == 1
+    assert [d['Name'] for d in expected['entries'][0][1][1]['Drives']] == ['Drive %d' % idx for idx in range(6)]
+    del server.requests[:]
+
+    assert disk_inventory(make_utils(server, workers=3, keep_alive=keep_alive)) == expected
+    assert server.max_in_flight == 3
+    assert len(server.requests) == 18
+
+
+def test_workers_cpu_inventory(redfish_server):
+    server = redfish_server(resources={'cpus': 8})
+
+    assert cpu_inventory(make_utils(server, workers=4)) == cpu_inventory(make_utils(server))
+
+
+def test_workers_error(redfish_server):
+    server = redfish_server(resources={'storages': 1, 'drives': 4})
+    del server.resources['/redfish/v1/Systems/1/Processors/2']
+
+    expected = cpu_inventory(make_utils(server))
+    assert expected['ret'] is False
+    assert cpu_inventory(make_utils(server, workers=4)) == expected
+
+
+def test_workers_error_drops_unused_responses(redfish_server):
+    """Responses prefetched after the failed member are requested again by later lookups"""
+
+    server = redfish_server()
+    del server.resources['/redfish/v1/Systems/1/Processors/2']
+    utils = make_utils(server, workers=4)
+
+    assert cpu_inventory(utils)['ret'] is False
+    assert utils._prefetched == {}
+    server.resources['/redfish/v1/Systems/1/Processors/3']['Name'] = 'Replaced'
+    del server.requests[:]
+
+    response = utils.get_request(server.root_uri + '/redfish/v1/Systems/1/Processors/3')
+
+    assert response['data']['Name'] == 'Replaced'
+    assert server.requests == ['/redfish/v1/Systems/1/Processors/3']
+
+
+def multipart_fields(image):
+    return {
+        'UpdateParameters': {'content': json.dumps({'Targets': []}), 'mime_type': 'application/json'},
+        'UpdateFile': {'filename': image, 'mime_type': 'application/octet-stream'},
+        'Oem': {'content': {'Vendor': 'x'}, 'mime_type': 'application/json'},
+    }
+
+
+def test_multipart_stream(tmp_path):
+    image = tmp_path / 'image"1.bin'
+    image.write_bytes(bytes(bytearray(range(256))) * 1000)
+    expected, content_type = RedfishUtils._prepare_multipart(multipart_fields(str(image)))
+    boundary = content_type.split('boundary=')[1]
+
+    stream = _MultipartStream(multipart_fields(str(image)), boundary=boundary, hash_algorithm='sha256')
+    chunks = []
+    while True:
+        chunk = stream.read(4093)
+        if not chunk:
+            break
+        chunks.append(chunk)
+
+    assert b''.join(chunks) == expected
+    assert stream.length == len(expected)
+    assert stream.content_type == content_type
+    assert stream.hexdigest() == hashlib.sha256(image.read_bytes()).hexdigest()
+
+    stream.seek(0)
+    assert stream.read() == expected
+
+
+def test_multipart_stream_file_shrinks(tmp_path):
+    image = tmp_path / 'image.bin'
+    image.write_bytes(b'x' * 100)
+    stream = _MultipartStream(multipart_fields(str(image)))
+    image.write_bytes(b'x' * 10)
+
+    with pytest.raises(IOError, match='changed'):
+        stream.read()
+
+
+@pytest.mark.parametrize('keep_alive', [False, True])
+def test_multipart_push_update_streams_image(redfish_server, tmp_path, keep_alive):
+    server = redfish_server()
+    utils = make_utils(server, keep_alive=keep_alive)
+    assert utils._find_updateservice_resource()['ret']
+    image = tmp_path / 'image.bin'
+    image.write_bytes(b'firmware' * 1000)
+
+    result = utils.multipath_http_push_update({'update_image_file': str(image)})
+
+    assert result['ret'] is True
+    assert result['update_status']['handle'] == '/redfish/v1/TaskService/Tasks/1'
+    upload = server.uploads[0]
+    assert upload['content_type'].startswith('multipart/form-data; boundary=')
+    boundary = upload['content_type'].split('boundary=')[1]
+    expected = _MultipartStream({
+        'UpdateParameters': {'content': json.dumps({}), 'mime_type': 'application/json'},
+        'UpdateFile': {'filename': str(image), 'mime_type': 'application/octet-stream'},
+    }, boundary=boundary).read()
+    assert upload['length'] == len(expected)
+    assert upload['sha256'] == hashlib.sha256(expected).hexdigest()
+
+
+@pytest.mark.skipif(tracemalloc is None, reason='needs the tracemalloc module')
+def test_multipart_push_update_memory(redfish_server, tmp_path):
+    server = redfish_server()
+    utils = make_utils(server, keep_alive=True)
+    assert utils._find_updateservice_resource()['ret']
+    image = tmp_path / 'image.bin'
+    size = 256 * 1024 ** 2
+    with open(str(image), 'wb') as f:
+        # sparse file, it takes no space on disk
+        f.truncate(size)
+
+    tracemalloc.start()
+    try:
+        result = utils.multipath_http_push_update({'update_image_file': str(image)})
+        dummy, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert result['ret'] is True
+    assert server.uploads[0]['length'] > size
+    # the peak of the memory allocated during the upload, which would include the whole image if it was read at once
+    assert peak < size // 8
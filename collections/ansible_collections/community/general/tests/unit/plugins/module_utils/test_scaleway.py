@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import threading
+
+import pytest
+
+from ansible.module_utils.six.moves.urllib.parse import parse_qs, urlsplit
+from ansible_collections.community.general.plugins.module_utils import scaleway
+from ansible_collections.community.general.plugins.module_utils.scaleway import Scaleway
+
+
+class FailJson(Exception):
+    pass
+
+
+class FakeModule(object):
+    ansible_version = '2.18.0'
+
+    def __init__(self, **params):
+        self.params = dict(api_token='token', api_url='https://api.scaleway.com', api_timeout=30,
+                           query_parameters={}, validate_certs=True, api_workers=1)
+        self.params.update(params)
+        self.warnings = []
+
+    def warn(self, msg):
+        self.warnings.append(msg)
+
+    def jsonify(self, data):
+        return json.dumps(data)
+
+    def fail_json(self, **kwargs):
+        raise FailJson(kwargs['msg'])
+
+
+class FakeAPI(object):
+    """Serves ``total`` functions, ``page_size`` per page."""
+
+    def __init__(self, total, page_size, total_header=False, fail_page=None):
+        self.total = total
+        self.page_size = page_size
+        self.total_header = total_header
+        self.fail_page = fail_page
+        self.pages = []
+        self.lock = threading.Lock()
+
+    def __call__(self, module, url, **kwargs):
+        query = parse_qs(urlsplit(url).query)
+        page = int(query.get('page', ['1'])[0])
+        with self.lock:
+            self.pages.append(page)
+        if page == self.fail_page:
+            return None, {'status': 500, 'body': json.dumps({'message': 'internal error'})}
+        first = (page - 1) * self.page_size
+        functions = [{'id': 'fn%d' % idx} for idx in range(first, min(first + self.page_size, self.total))]
+        body = {'functions': functions}
+        info = {'status': 200}
+        if self.total_header:
+            info['x-total-count'] = str(self.total)
+        else:
+            body['total_count'] = self.total
+        info['body'] = json.dumps(body)
+        return None, info
+
+
+def make_api(mocker, fake_api, **params):
+    mocker.patch.object(scaleway, 'fetch_url', side_effect=fake_api)
+    api = Scaleway(FakeModule(**params))
+    api.api_path = 'functions/v1beta1/regions/fr-par/functions'
+    return api
+
+
+def test_fetch_all_resources_sequential(mocker):
+    fake_api = FakeAPI(total=5, page_size=2)
+    api = make_api(mocker, fake_api)
+
+    functions = api.fetch_all_resources('functions')
+
+    assert [fn['id'] for fn in functions] == ['fn%d' % idx for idx in range(5)]
+    # the sequential mode stops at the first empty page
+    assert fake_api.pages == [1, 2, 3, 4]
+    assert api.module.params['query_parameters'] == {}
+
+
+@pytest.mark.parametrize('total_header', [False, True])
+def test_fetch_all_resources_parallel(mocker, total_header):
+    fake_api = FakeAPI(total=9, page_size=2, total_header=total_header)
+    api = make_api(mocker, fake_api, api_workers=4)
+
+    functions = api.fetch_all_resources('functions')
+
+    assert [fn['id'] for fn in functions] == ['fn%d' % idx for idx in range(9)]
+    assert sorted(fake_api.pages) == [1, 2, 3, 4, 5]
+    assert api.module.params['query_parameters'] == {}
+
+
+def test_fetch_all_resources_parallel_error(mocker):
+    fake_api = FakeAPI(total=9, page_size=2, fail_page=3)
+    api = make_api(mocker, fake_api, api_workers=4)
+
+    with pytest.raises(FailJson, match='internal error'):
+        api.fetch_all_resources('functions')
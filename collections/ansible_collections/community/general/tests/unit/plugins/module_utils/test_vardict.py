@@ -7,6 +7,7 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import pytest
 
 from ansible_collections.community.general.plugins.module_utils.vardict import VarDict
 
@@ -132,3 +133,85 @@ def test_vardict_dict():
 
     assert vd.as_dict() == {"xx": 123, "yy": 456, "zz": 789}
     assert vd.get_meta("xx") == {"output": True, "change": False, "diff": False, "fact": False, "verbosity": 0}
+
+
+def test_vardict_copy_on_write():
+    packages = ["a", "b", "c"]
+    config = dict(x=[1, 2], y=dict(z=3))
+
+    vd = VarDict(copy_on_write=True)
+    vd.set("packages", packages, change=True)
+    vd.set("config", config, diff=True)
+    vd.set("info", {"big": list(range(10))})
+
+    assert vd._var("packages").initial_value is packages
+    assert vd._var("info").initial_value is vd.info
+    assert vd._var("config").initial_value == config
+    assert vd._var("config").initial_value is not config
+    assert vd.has_changed is False
+    assert vd.diff() is None
+
+    output = vd.output()
+    assert output == {"packages": packages, "config": config, "info": {"big": list(range(10))}}
+    output["extra"] = 1
+    assert "extra" not in vd.output()
+
+    packages.append("d")
+    vd.packages = packages
+    assert vd.has_changed is True
+
+    config["y"]["z"] = 4
+    vd.config = config
+    assert vd.diff() == {
+        "before": {"config": dict(x=[1, 2], y=dict(z=3))},
+        "after": {"config": dict(x=[1, 2], y=dict(z=4))},
+    }
+
+
+def test_vardict_copy_on_write_meta():
+    value = [dict(name="a")]
+    vd = VarDict(copy_on_write=True)
+    vd.set("items", value)
+    assert vd.has_changed is False
+
+    vd.set_meta("items", change=True)
+    vd.items = [dict(name="a")]
+    assert vd.has_changed is False
+    vd.items = [dict(name="b")]
+    assert vd.has_changed is True
+
+    vd.set_meta("items", diff=True)
+    assert vd.diff() == {"before": {"items": [dict(name="a")]}, "after": {"items": [dict(name="b")]}}
+
+
+@pytest.mark.parametrize("initial, modify", [
+    # hash(-1) == hash(-2)
+    ([-1], lambda value: value.__setitem__(0, -2)),
+    (dict(a=[-1]), lambda value: value["a"].__setitem__(0, -2)),
+    ([[1, 2]], lambda value: value[0].append(3)),
+    ([1], lambda value: value.__setitem__(0, 1.5)),
+    (dict(a={1, 2}), lambda value: value["a"].add(3)),
+])
+def test_vardict_copy_on_write_change(initial, modify):
+    vd = VarDict(copy_on_write=True)
+    vd.set("value", initial, change=True)
+    assert vd.has_changed is False
+
+    modify(initial)
+    vd.value = initial
+    assert vd.has_changed is True
+
+
+@pytest.mark.parametrize("copy_on_write", [False, True])
+@pytest.mark.parametrize("initial, modify, duplicate", [
+    ([1, 3], lambda value: value.append(5), list),
+    (dict(a=1), lambda value: value.__setitem__("b", 2), dict),
+])
+def test_vardict_change_in_place_then_replaced(copy_on_write, initial, modify, duplicate):
+    initial = duplicate(initial)
+    vd = VarDict(copy_on_write=copy_on_write)
+    vd.set("value", initial, change=True)
+
+    modify(initial)
+    vd.value = duplicate(initial)
+    assert vd.has_changed is True
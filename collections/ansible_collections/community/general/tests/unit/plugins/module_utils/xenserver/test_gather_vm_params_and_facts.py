@@ -8,6 +8,7 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 
+import copy
 import pytest
 
 from .common import testcase_bad_xenapi_refs
@@ -73,3 +74,77 @@ def test_gather_vm_params_and_facts(mocker, fake_ansible_module, XenAPI, xenserv
     vm_ref = list(fixture_data_from_file[params_file]['VM'].keys())[0]
 
     assert xenserver.gather_vm_facts(fake_ansible_module, xenserver.gather_vm_params(fake_ansible_module, vm_ref)) == fixture_data_from_file[facts_file]
+
+
+def fake_event_batch(params, token, operation="add"):
+    """Returns event.from result with all records from params as events."""
+    events = []
+
+    for xapi_class, records in params.items():
+        for obj_ref, record in records.items():
+            events.append({"class": xapi_class.lower(), "operation": operation, "ref": obj_ref, "snapshot": copy.deepcopy(record)})
+
+    return {"events": events, "token": token, "valid_ref_counts": {}}
+
+
+@pytest.mark.parametrize('fixture_data_from_file',
+                         testcase_gather_vm_params_and_facts['params'],
+                         ids=testcase_gather_vm_params_and_facts['ids'],
+                         indirect=True)
+def test_gather_vm_params_and_facts_bulk(mocker, fake_ansible_module, XenAPI, xenserver, fixture_data_from_file):
+    """Tests that bulk retrieval gives the same VM parameters and facts with a single XAPI call."""
+    mocker.patch.object(xenserver.XAPI, '_xapi_session', None)
+    mocker.patch.object(xenserver.XAPIRecordCache, '_records', None)
+    mocked_xenapi = mocker.patch.object(XenAPI.Session, 'xenapi', create=True)
+
+    params_file = [file_name for file_name in fixture_data_from_file if "params" in file_name][0]
+    facts_file = [file_name for file_name in fixture_data_from_file if "facts" in file_name][0]
+
+    mocked_xenapi_request = mocker.patch.object(XenAPI.Session, 'xenapi_request',
+                                                return_value=fake_event_batch(fixture_data_from_file[params_file], "token-1"))
+
+    mocker.patch('ansible_collections.community.general.plugins.module_utils.xenserver.get_xenserver_version', return_value=[7, 2, 0])
+
+    fake_ansible_module.params['retrieval_mode'] = "bulk"
+    vm_ref = list(fixture_data_from_file[params_file]['VM'].keys())[0]
+
+    assert xenserver.gather_vm_facts(fake_ansible_module, xenserver.gather_vm_params(fake_ansible_module, vm_ref)) == fixture_data_from_file[facts_file]
+
+    mocked_xenapi_request.assert_called_once_with("event.from", (xenserver.XAPIRecordCache.xapi_classes, "", 0.0))
+    assert mocked_xenapi.mock_calls == []
+
+
+@pytest.mark.parametrize('fixture_data_from_file', ["ansible-test-vm-1-params.json"], indirect=True)
+def test_gather_vm_params_bulk_refresh(mocker, fake_ansible_module, XenAPI, xenserver, fixture_data_from_file):
+    """Tests that cached records are updated with changes only."""
+    mocker.patch.object(xenserver.XAPI, '_xapi_session', None)
+    mocker.patch.object(xenserver.XAPIRecordCache, '_records', None)
+    mocker.patch.object(XenAPI.Session, 'xenapi', create=True)
+
+    params = fixture_data_from_file["ansible-test-vm-1-params.json"]
+    vm_ref = list(params['VM'].keys())[0]
+    vm_vbd_refs = params['VM'][vm_ref]['VBDs']
+
+    changed_params = {"VM": copy.deepcopy(params['VM'])}
+    changed_params['VM'][vm_ref]['name_label'] = "ansible-test-vm-1-renamed"
+    changed_params['VM'][vm_ref]['VBDs'] = vm_vbd_refs[:1]
+    changed_event_batch = fake_event_batch(changed_params, "token-2", operation="mod")
+    changed_event_batch['events'].append({"class": "vbd", "operation": "del", "ref": vm_vbd_refs[1]})
+
+    mocked_xenapi_request = mocker.patch.object(XenAPI.Session, 'xenapi_request',
+                                                side_effect=[fake_event_batch(params, "token-1"), changed_event_batch])
+
+    mocker.patch('ansible_collections.community.general.plugins.module_utils.xenserver.get_xenserver_version', return_value=[7, 2, 0])
+
+    fake_ansible_module.params['retrieval_mode'] = "bulk"
+
+    vm_params = xenserver.gather_vm_params(fake_ansible_module, vm_ref)
+    assert vm_params['name_label'] == "ansible-test-vm-1"
+    assert len(vm_params['VBDs']) == 2
+
+    vm_params = xenserver.gather_vm_params(fake_ansible_module, vm_ref)
+    assert vm_params['name_label'] == "ansible-test-vm-1-renamed"
+    assert len(vm_params['VBDs']) == 1
+    assert vm_vbd_refs[1] not in xenserver.XAPIRecordCache._records['vbd']
+
+    assert mocked_xenapi_request.call_args_list[1] == mocker.call("event.from", (xenserver.XAPIRecordCache.xapi_classes, "token-1", 0.0))
@@ -10,6 +10,9 @@ __metaclass__ = type
 
 import pytest
 import atexit
+import json
+import os
+import stat
 
 from .FakeAnsibleModule import FailJsonException
 from ansible.module_utils.ansible_release import __version__ as ANSIBLE_VERSION
@@ -174,3 +177,70 @@ def test_xapi_connect_singleton(mocker, fake_ansible_module, XenAPI, xenserver):
 
     XenAPI.Session.assert_called_once()
     assert xapi_session1 == xapi_session2
+
+
+def test_xapi_connect_session_cache(mocker, fake_ansible_module, XenAPI, xenserver, tmpdir):
+    """Tests that session is cached and reused by the next module run."""
+    mocker.patch.object(xenserver.XAPI, '_xapi_session', None)
+    mocker.patch('atexit.register')
+    mocked_login = mocker.spy(XenAPI.Session, '_login')
+
+    session_cache_dir = str(tmpdir.join("sessions"))
+    fake_ansible_module.params['session_cache_dir'] = session_cache_dir
+
+    xapi_session = xenserver.XAPI.connect(fake_ansible_module)
+
+    assert mocked_login.call_count == 1
+    atexit.register.assert_not_called()
+
+    session_cache_files = os.listdir(session_cache_dir)
+    assert len(session_cache_files) == 1
+    session_cache_path = os.path.join(session_cache_dir, session_cache_files[0])
+    assert stat.S_IMODE(os.stat(session_cache_dir).st_mode) == 0o700
+    assert stat.S_IMODE(os.stat(session_cache_path).st_mode) == 0o600
+
+    with open(session_cache_path) as f:
+        session_cache_entry = json.load(f)
+
+    assert session_cache_entry['session'] == xapi_session._session
+    assert fake_ansible_module.params['password'] not in json.dumps(session_cache_entry)
+
+    # Next module run.
+    mocker.patch.object(xenserver.XAPI, '_xapi_session', None)
+    mocked_xenapi = mocker.patch.object(XenAPI.Session, 'xenapi', create=True)
+
+    xapi_session = xenserver.XAPI.connect(fake_ansible_module)
+
+    assert mocked_login.call_count == 1
+    mocked_xenapi.pool.get_all.assert_called_once()
+    assert xapi_session._session == session_cache_entry['session']
+    assert xapi_session.last_login_method == 'login_with_password'
+    assert xapi_session.last_login_params == (fake_ansible_module.params['username'], fake_ansible_module.params['password'], ANSIBLE_VERSION, 'Ansible')
+
+
+def test_xapi_connect_session_cache_invalid(mocker, fake_ansible_module, XenAPI, xenserver, tmpdir):
+    """Tests that a new session is logged on if cached one is not valid or password differs."""
+    mocker.patch.object(xenserver.XAPI, '_xapi_session', None)
+    mocker.patch('atexit.register')
+    mocked_login = mocker.spy(XenAPI.Session, '_login')
+
+    fake_ansible_module.params['session_cache_dir'] = str(tmpdir)
+
+    xenserver.XAPI.connect(fake_ansible_module)
+
+    mocker.patch.object(xenserver.XAPI, '_xapi_session', None)
+    mocked_xenapi = mocker.patch.object(XenAPI.Session, 'xenapi', create=True)
+    mocked_xenapi.pool.get_all.side_effect = XenAPI.Failure(["SESSION_INVALID"])
+
+    xenserver.XAPI.connect(fake_ansible_module)
+
+    assert mocked_login.call_count == 2
+
+    mocker.patch.object(xenserver.XAPI, '_xapi_session', None)
+    mocked_xenapi.pool.get_all.reset_mock(side_effect=True)
+    fake_ansible_module.params['password'] = "otherpwd"
+
+    xenserver.XAPI.connect(fake_ansible_module)
+
+    assert mocked_login.call_count == 3
+    mocked_xenapi.pool.get_all.assert_not_called()
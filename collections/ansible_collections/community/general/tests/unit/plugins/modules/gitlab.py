@@ -7,11 +7,13 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import json
 import sys
 
 from httmock import response  # noqa
 from httmock import urlmatch  # noqa
 
+from ansible.module_utils.six.moves.urllib.parse import parse_qs, unquote, urlencode
 from ansible_collections.community.internal_test_tools.tests.unit.compat import unittest
 
 import gitlab
@@ -762,3 +764,91 @@ def resp_delete_runner(url, request):
     content = ('{}')
     content = content.encode("utf-8")
     return response(204, content, headers, None, 5, request)
+
+
+class FakeGitLab(object):
+    """An in-memory GitLab instance answering the requests of python-gitlab, for tests with many objects.
+
+    It has one group or project, depending on kind, with ID 1 and path foo-bar. It serves
+    the users, and the members and CI/CD variables of that group or project. The requests
+    are recorded as "METHOD path", relative to /api/v4.
+    """
+
+    def __init__(self, kind, users=(), members=None, variables=None):
+        self.kind = kind
+        self.base = '/%ss/1' % kind
+        self.users = [{'id': idx, 'username': name} for idx, name in enumerate(users, 1)]
+        self.members = dict((user['id'], (members or {})[user['username']]) for user in self.users if user['username'] in (members or {}))
+        self.variables = variables if variables is not None else []
+        self.requests = []
+
+    def _paginate(self, url, items):
+        query = dict((k, v[0]) for k, v in parse_qs(url.query).items())
+        page, per_page = int(query.get('page', 1)), int(query.get('per_page', 20))
+        total_pages = max(1, (len(items) + per_page - 1) // per_page)
+        headers = {'Content-Type': 'application/json', 'X-Page': str(page), 'X-Total-Pages': str(total_pages),
+                   'X-Per-Page': str(per_page), 'X-Total': str(len(items))}
+        if page < total_pages:
+            query['page'] = page + 1
+            headers['Link'] = '<http://localhost%s?%s>; rel="next"' % (url.path, urlencode(query))
+        return response(200, items[(page - 1) * per_page:page * per_page], headers)
+
+    def _members(self, url, request, path):
+        headers = {'Content-Type': 'application/json'}
+        user_by_id = dict((user['id'], user) for user in self.users)
+        if path == '/members' and request.method == 'GET':
+            return self._paginate(url, [dict(user_by_id[uid], access_level=level) for uid, level in sorted(self.members.items())])
+        if path == '/members' and request.method == 'POST':
+            body = json.loads(request.body)
+            self.members[int(body['user_id'])] = body['access_level']
+            return response(201, dict(user_by_id[int(body['user_id'])], access_level=body['access_level']), headers)
+        uid = int(path.rsplit('/', 1)[1])
+        if request.method == 'PUT':
+            self.members[uid] = json.loads(request.body)['access_level']
+        elif request.method == 'DELETE':
+            del self.members[uid]
+            return response(204, None)
+        if uid in self.members:
+            return response(200, dict(user_by_id[uid], access_level=self.members[uid]), headers)
+        return response(404, {'message': '404 Not found'}, headers)
+
+    def _variables(self, url, request, path):
+        headers = {'Content-Type': 'application/json'}
+        owner = {'%s_id' % self.kind: 1}
+        if path == '/variables' and request.method == 'GET':
+            return response(200, [dict(var, **owner) for var in self.variables], headers)
+        if path == '/variables' and request.method == 'POST':
+            var = json.loads(request.body)
+            var.setdefault('environment_scope', '*')
+            if any((v['key'], v['environment_scope']) == (var['key'], var['environment_scope']) for v in self.variables):
+                return response(400, {'message': {'key': ['has already been taken']}}, headers)
+            self.variables.append(var)
+            return response(201, dict(var, **owner), headers)
+        if request.method == 'DELETE':
+            key = unquote(path.rsplit('/', 1)[1])
+            scope = parse_qs(url.query).get('filter[environment_scope]', ['*'])[0]
+            self.variables[:] = [v for v in self.variables if (v['key'], v['environment_scope']) != (key, scope)]
+            return response(204, None)
+        return response(404, {'message': '404 Not found'}, headers)
+
+    def __call__(self, url, request):
+        path = url.path[len('/api/v4'):]
+        self.requests.append('%s %s' % (request.method, path))
+        headers = {'Content-Type': 'application/json'}
+        if path == '/user':
+            return response(200, {'id': 1, 'username': 'root'}, headers)
+        if path == '/users':
+            query = parse_qs(url.query)
+            users = self.users
+            if 'username' in query:
+                users = [user for user in users if user['username'].lower() == query['username'][0].lower()]
+            return self._paginate(url, users)
+        if self.kind == 'group' and path == '/groups':
+            return self._paginate(url, [{'id': 1, 'full_path': 'foo-bar'}])
+        if path == '/%ss/foo-bar' % self.kind:
+            return response(200, {'id': 1, 'full_path' if self.kind == 'group' else 'path_with_namespace': 'foo-bar'}, headers)
+        if path.startswith(self.base + '/members'):
+            return self._members(url, request, path[len(self.base):])
+        if path.startswith(self.base + '/variables'):
+            return self._variables(url, request, path[len(self.base):])
+        return response(404, {'message': '404 Not found'}, headers)
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import re
+
+import ldap
+
+
+def _unescape(value):
+    return re.sub(r'\\([0-9a-fA-F]{2})', lambda m: chr(int(m.group(1), 16)), value)
+
+
+def _evaluate(attrs, filterstr, pos=0):
+    """Evaluates the filter starting at filterstr[pos] for attrs, and returns the result and the position after it.
+
+    Supports &, | and ! and equality and presence assertions, compared case insensitively."""
+    if filterstr[pos] != '(':
+        raise ValueError('Malformed filter %s' % filterstr)
+    operator = filterstr[pos + 1]
+    if operator in '&|!':
+        pos += 2
+        results = []
+        while filterstr[pos] == '(':
+            result, pos = _evaluate(attrs, filterstr, pos)
+            results.append(result)
+        if filterstr[pos] != ')' or (operator == '!' and len(results) != 1):
+            raise ValueError('Malformed filter %s' % filterstr)
+        if operator == '&':
+            return all(results), pos + 1
+        if operator == '|':
+            return any(results), pos + 1
+        return not results[0], pos + 1
+    end = filterstr.index(')', pos)
+    name, value = filterstr[pos + 1:end].split('=', 1)
+    values = [v.decode().lower() for n, vs in attrs.items() if n.lower() == name.lower() for v in vs]
+    if value == '*':
+        return bool(values), end + 1
+    return _unescape(value).lower() in values, end + 1
+
+
+class FakeLdapConnection(object):
+    """An in-memory directory answering the calls of the LDAP modules in place of a connection.
+
+    DNs and the values compared by search filters are matched case insensitively,
+    like a server does for most attributes. Like on a server, filters also match the
+    attributes of the RDN of an entry. Entries are stored by lower case DN.
+    Entries with children cannot be deleted, and the subtree delete control is not
+    supported. Write operations on the DNs in ``failures`` raise that exception.
+    Subtree searches end with the search continuation references in ``references``.
+    The DNs of the entries returned by all searches are recorded in ``returned``.
+    """
+
+    def __init__(self, entries):
+        self.entries = dict((dn.lower(), dict(attrs)) for dn, attrs in entries.items())
+        self.failures = {}
+        self.references = []
+        self.calls = []
+        self.returned = []
+        self._pending = {}
+
+    def set_option(self, option, value):
+        pass
+
+    def simple_bind_s(self, who, cred):
+        pass
+
+    def _children(self, dn):
+        return [child for child in self.entries if child.endswith(',' + dn.lower())]
+
+    def _matches(self, dn, filterstr):
+        attrs = dict(self.entries[dn])
+        for assertion in dn.split(',', 1)[0].split('+'):
+            name, value = assertion.split('=', 1)
+            attrs[name] = attrs.get(name, []) + [value.encode()]
+        if filterstr == '(objectClass=*)':
+            return True
+        result, end = _evaluate(attrs, filterstr)
+        if end != len(filterstr):
+            raise ValueError('Malformed filter %s' % filterstr)
+        return result
+
+    def search_s(self, base, scope, filterstr='(objectClass=*)', attrlist=None):
+        self.calls.append(('search_s', base, scope))
+        if base.lower() not in self.entries:
+            raise ldap.NO_SUCH_OBJECT({'desc': 'No such object'})
+        if scope == ldap.SCOPE_BASE:
+            dns = [base.lower()]
+        elif scope == ldap.SCOPE_ONELEVEL:
+            dns = [dn for dn in self._children(base) if dn.count(',') == base.count(',') + 1]
+        else:
+            # parents before their children
+            dns = sorted([base.lower()] + self._children(base), key=lambda dn: dn.count(','))
+        results = []
+        for dn in dns:
+            attrs = self.entries[dn]
+            if not self._matches(dn, filterstr):
+                continue
+            self.returned.append(dn)
+            if attrlist is not None:
+                wanted = [name.lower() for name in attrlist]
+                attrs = dict((name, values) for name, values in attrs.items() if name.lower() in wanted)
+            results.append((dn, attrs))
+        if scope == ldap.SCOPE_SUBTREE:
+            results.extend((None, [reference]) for reference in self.references)
+        return results
+
+    def _write(self, operation, dn, *args):
+        if dn in self.failures:
+            raise self.failures[dn]
+        key = dn.lower()
+        if operation == 'add':
+            if key.split(',', 1)[1] not in self.entries:
+                raise ldap.NO_SUCH_OBJECT({'desc': 'No such object'})
+            self.entries[key] = dict(args[0])
+        elif operation == 'delete':
+            if self._children(dn):
+                raise ldap.NOT_ALLOWED_ON_NONLEAF({'desc': 'Operation not allowed on non-leaf'})
+            del self.entries[key]
+        else:
+            attrs = self.entries[key]
+            for mod_op, name, values in args[0]:
+                if not isinstance(values, list):
+                    values = [] if values is None else [values]
+                if mod_op == ldap.MOD_ADD:
+                    attrs[name] = attrs.get(name, []) + values
+                elif mod_op == ldap.MOD_REPLACE:
+                    attrs[name] = values
+                else:
+                    attrs[name] = [value for value in attrs.get(name, []) if values and value not in values]
+
+    def add_s(self, dn, modlist):
+        self.calls.append(('add_s', dn))
+        self._write('add', dn, modlist)
+
+    def modify_s(self, dn, modlist):
+        self.calls.append(('modify_s', dn))
+        self._write('modify', dn, modlist)
+
+    def delete_s(self, dn):
+        self.calls.append(('delete_s', dn))
+        self._write('delete', dn)
+
+    def delete_ext_s(self, dn, serverctrls=None):
+        self.calls.append(('delete_ext_s', dn))
+        self._write('delete', dn)
+
+    def _send(self, operation, dn, *args):
+        self.calls.append(('%s_ext' % operation, dn))
+        msgid = len(self.calls)
+        self._pending[msgid] = (operation, dn, args)
+        return msgid
+
+    def add_ext(self, dn, modlist):
+        return self._send('add', dn, modlist)
+
+    def modify_ext(self, dn, modlist):
+        return self._send('modify', dn, modlist)
+
+    def delete_ext(self, dn):
+        return self._send('delete', dn)
+
+    def result3(self, msgid):
+        operation, dn, args = self._pending.pop(msgid)
+        self.calls.append(('result3', dn))
+        self._write(operation, dn, *args)
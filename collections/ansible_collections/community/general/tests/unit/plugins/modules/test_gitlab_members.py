@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible.module_utils import basic
+from ansible_collections.community.general.plugins.modules import gitlab_group_members, gitlab_project_members
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import patch
+from ansible_collections.community.internal_test_tools.tests.unit.plugins.modules.utils import (
+    AnsibleExitJson, AnsibleFailJson, exit_json, fail_json, set_module_args)
+
+pytest.importorskip('gitlab')
+httmock = pytest.importorskip('httmock')
+
+from .gitlab import FakeGitLab
+
+MODULES = {'group': gitlab_group_members, 'project': gitlab_project_members}
+OWNER_ARGS = {'group': {'gitlab_group': 'foo-bar'}, 'project': {'project': 'foo-bar'}}
+# the request finding the group or project
+LOOKUP = {'group': 'GET /groups', 'project': 'GET /projects/foo-bar'}
+
+
+def run_module(server, **kwargs):
+    module_args = {'api_url': 'http://localhost', 'api_token': 'token'}
+    module_args.update(OWNER_ARGS[server.kind])
+    module_args.update(kwargs)
+    with set_module_args(module_args):
+        with patch.multiple(basic.AnsibleModule, exit_json=exit_json, fail_json=fail_json):
+            with httmock.HTTMock(httmock.urlmatch(netloc='localhost')(server)):
+                with pytest.raises((AnsibleExitJson, AnsibleFailJson)) as exec_info:
+                    MODULES[server.kind].main()
+    return exec_info.value.args[0]
+
+
+def count(server, prefix):
+    return len([r for r in server.requests if r.startswith(prefix)])
+
+
+@pytest.mark.parametrize('kind', ['group', 'project'])
+def test_sync_many_users(kind):
+    """Known members and new users are resolved with a few listings"""
+
+    users = ['user%d' % idx for idx in range(250)]
+    server = FakeGitLab(kind, users, members=dict((name, 30) for name in users[:150]))
+    wanted = [{'name': name.upper() if idx % 2 else name, 'access_level': 'maintainer' if idx < 10 else 'developer'}
+              for idx, name in enumerate(users[:200])]
+
+    result = run_module(server, gitlab_users_access=wanted, purge_users=['developer'])
+
+    assert result['changed'] is True
+    assert server.members == dict((idx + 1, 40 if idx < 10 else 30) for idx in range(200))
+    assert count(server, 'POST %s/members' % server.base) == 50
+    assert count(server, 'PUT %s/members/' % server.base) == 10
+    assert count(server, 'DELETE') == 0
+    # two pages of members and three pages of users, no lookup per user
+    assert count(server, 'GET %s/members' % server.base) == 2
+    assert count(server, 'GET /users') == 3
+    assert len(server.requests) == 2 + 2 + 3 + 50 + 10
+
+    server.requests = []
+    result = run_module(server, gitlab_users_access=wanted, purge_users=['developer'])
+    assert result['changed'] is False
+    assert server.requests == ['GET /user', LOOKUP[kind], 'GET %s/members' % server.base, 'GET %s/members' % server.base]
+
+
+@pytest.mark.parametrize('kind', ['group', 'project'])
+def test_few_new_users_and_purge(kind):
+    """A few unknown usernames are looked up one by one"""
+
+    users = ['user%d' % idx for idx in range(450)]
+    server = FakeGitLab(kind, users, members={'user0': 30, 'user1': 30, 'user2': 40})
+
+    result = run_module(server, gitlab_user=['user0', 'user10', 'user11', 'missing'], access_level='developer',
+                        purge_users=['developer'])
+
+    assert result['failed'] is True
+    assert [(data['gitlab_user'], data['result']) for data in result['result_data']] == [
+        ('user0', 'OK'), ('user10', 'CHANGED'), ('user11', 'CHANGED'), ('missing', 'FAILED'), ('user1', 'CHANGED'),
+    ]
+    assert server.members == {1: 30, 3: 40, 11: 30, 12: 30}
+    # the first page of all users, then one lookup per unknown username
+    assert count(server, 'GET /users') == 4
+
+
+@pytest.mark.parametrize('kind', ['group', 'project'])
+def test_single_user(kind):
+    users = ['user%d' % idx for idx in range(5)]
+    server = FakeGitLab(kind, users, members={'user0': 30})
+
+    result = run_module(server, gitlab_user=['user0'], access_level='developer', state='absent')
+
+    assert result['changed'] is True
+    assert server.members == {}
+    assert server.requests == ['GET /user', LOOKUP[kind], 'GET /users', 'GET %s/members/1' % server.base,
+                               'DELETE %s/members/1' % server.base]
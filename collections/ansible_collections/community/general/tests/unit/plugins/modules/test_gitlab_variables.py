@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible.module_utils import basic
+from ansible_collections.community.general.plugins.modules import gitlab_group_variable, gitlab_project_variable
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import patch
+from ansible_collections.community.internal_test_tools.tests.unit.plugins.modules.utils import (
+    AnsibleExitJson, AnsibleFailJson, exit_json, fail_json, set_module_args)
+
+pytest.importorskip('gitlab')
+httmock = pytest.importorskip('httmock')
+
+from .gitlab import FakeGitLab
+
+MODULES = {'group': gitlab_group_variable, 'project': gitlab_project_variable}
+
+
+def variable(key, value, environment_scope='*'):
+    return {'key': key, 'value': value, 'masked': False, 'protected': False, 'raw': False,
+            'variable_type': 'env_var', 'environment_scope': environment_scope}
+
+
+def run_module(server, **kwargs):
+    module_args = {'api_url': 'http://localhost', 'api_token': 'token', server.kind: 'foo-bar'}
+    module_args.update(kwargs)
+    with set_module_args(module_args):
+        with patch.multiple(basic.AnsibleModule, exit_json=exit_json, fail_json=fail_json):
+            with httmock.HTTMock(httmock.urlmatch(netloc='localhost')(server)):
+                with pytest.raises((AnsibleExitJson, AnsibleFailJson)) as exec_info:
+                    MODULES[server.kind].main()
+    return exec_info.value.args[0]
+
+
+@pytest.mark.parametrize('kind', ['group', 'project'])
+def test_purge_by_key_and_environment_scope(kind):
+    """Variables with the same key in another environment scope are distinct"""
+
+    server = FakeGitLab(kind, variables=[variable('A', '1'), variable('B', 'old'), variable('B', 'x', 'production'), variable('D', '4')])
+
+    result = run_module(server, purge=True, variables=[
+        {'name': 'A', 'value': '1'}, {'name': 'B', 'value': 'new'}, {'name': 'C', 'value': '3'},
+    ])
+
+    assert result['changed'] is True
+    assert result['%s_variable' % kind] == {'added': ['C'], 'updated': ['B'], 'removed': ['B', 'D'], 'untouched': ['A']}
+    assert sorted((v['key'], v['environment_scope'], v['value']) for v in server.variables) == [
+        ('A', '*', '1'), ('B', '*', 'new'), ('C', '*', '3'),
+    ]
+    # the variables are listed before and after the changes only
+    assert server.requests.count('GET %s/variables' % server.base) == 2
+
+
+@pytest.mark.parametrize('kind', ['group', 'project'])
+def test_update_in_one_environment_scope(kind):
+    server = FakeGitLab(kind, variables=[variable('B', 'old'), variable('B', 'x', 'production')])
+
+    result = run_module(server, variables=[{'name': 'B', 'value': 'y', 'environment_scope': 'production'}])
+
+    assert result['changed'] is True
+    assert result['%s_variable' % kind]['updated'] == ['B']
+    assert sorted((v['environment_scope'], v['value']) for v in server.variables) == [('*', 'old'), ('production', 'y')]
+
+
+@pytest.mark.parametrize('kind', ['group', 'project'])
+def test_unchanged(kind):
+    server = FakeGitLab(kind, variables=[variable('A', '1'), variable('B', 'x', 'production')])
+
+    result = run_module(server, variables=[{'name': 'A', 'value': '1'}, {'name': 'B', 'value': 'x', 'environment_scope': 'production'}])
+
+    assert result['changed'] is False
+    assert server.requests == ['GET /user', 'GET /%ss/foo-bar' % kind, 'GET %s/variables' % server.base]
+
+
+@pytest.mark.parametrize('kind', ['group', 'project'])
+def test_absent_in_one_environment_scope(kind):
+    server = FakeGitLab(kind, variables=[variable('A', '1'), variable('A', '1', 'production')])
+
+    result = run_module(server, state='absent', variables=[{'name': 'A', 'value': '1', 'environment_scope': 'production'}])
+
+    assert result['changed'] is True
+    assert result['%s_variable' % kind]['removed'] == ['A']
+    assert server.variables == [variable('A', '1')]
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2025, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import copy
+from contextlib import contextmanager
+from itertools import count
+
+from ansible.module_utils.six import StringIO
+from ansible_collections.community.general.plugins.modules import keycloak_realm_partial_import
+from ansible_collections.community.internal_test_tools.tests.unit.compat import unittest
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import DEFAULT, MagicMock, call, patch
+from ansible_collections.community.internal_test_tools.tests.unit.plugins.modules.utils import (
+    AnsibleExitJson, ModuleTestCase, set_module_args)
+
+
+PATCHED_METHODS = [
+    'export_realm_partial', 'import_realm_partial', 'get_clientsecret', 'get_realm_role', 'get_client_role', 'get_client_id',
+    'update_realm_role', 'update_client_role', 'update_group', 'create_subgroup',
+    'add_group_realm_rolemapping', 'delete_group_realm_rolemapping', 'add_group_rolemapping', 'delete_group_rolemapping',
+]
+
+
+@contextmanager
+def patch_keycloak_api(**return_values):
+    """Mock context manager for patching the methods of KeycloakAPI used by the module.
+    Yields a dict of the mocks by method name."""
+
+    with patch.multiple(keycloak_realm_partial_import.KeycloakAPI, **dict((name, DEFAULT) for name in PATCHED_METHODS)) as mocks:
+        for name, value in return_values.items():
+            mocks[name].return_value = value
+        yield mocks
+
+
+def get_role(name, client_id=None, realm='master'):
+    return {'id': 'id-%s' % name, 'name': name}
+
+
+def created_at(location):
+    response = MagicMock()
+    response.getheader.return_value = location
+    return response
+
+
+def get_response(object_with_future_response, method, get_id_call_count):
+    if callable(object_with_future_response):
+        return object_with_future_response()
+    if isinstance(object_with_future_response, dict):
+        return get_response(
+            object_with_future_response[method], method, get_id_call_count)
+    if isinstance(object_with_future_response, list):
+        call_number = next(get_id_call_count)
+        return get_response(
+            object_with_future_response[call_number], method, get_id_call_count)
+    return object_with_future_response
+
+
+def build_mocked_request(get_id_user_count, response_dict):
+    def _mocked_requests(*args, **kwargs):
+        url = args[0]
+        method = kwargs['method']
+        future_response = response_dict.get(url, None)
+        return get_response(future_response, method, get_id_user_count)
+    return _mocked_requests
+
+
+def create_wrapper(text_as_string):
+    """Allow to mock many times a call to one address.
+    Without this function, the StringIO is empty for the second call.
+    """
+    def _create_wrapper():
+        return StringIO(text_as_string)
+    return _create_wrapper
+
+
+def mock_good_connection():
+    token_response = {
+        'http://keycloak.url/auth/realms/master/protocol/openid-connect/token': create_wrapper('{"access_token": "alongtoken"}'), }
+    return patch(
+        'ansible_collections.community.general.plugins.module_utils.identity.keycloak.keycloak.open_url',
+        side_effect=build_mocked_request(count(), token_response),
+        autospec=True
+    )
+
+
+EXPORT = {
+    'realm': 'realm-name',
+    'clients': [
+        {'id': 'c-1', 'clientId': 'frontend', 'publicClient': True, 'redirectUris': ['https://app.example.com/*']},
+        {'id': 'c-2', 'clientId': 'backend', 'publicClient': False, 'secret': '**********', 'serviceAccountsEnabled': False},
+    ],
+    'roles': {
+        'realm': [{'id': 'r-1', 'name': 'auditor', 'description': 'Read only access', 'composite': False}],
+        'client': {
+            'frontend': [{'id': 'r-2', 'name': 'viewer', 'composite': False}],
+            'backend': [{'id': 'r-3', 'name': 'admin', 'composite': False}, {'id': 'r-4', 'name': 'reader', 'composite': False}],
+        },
+    },
+    'groups': [
+        {'id': 'g-1', 'name': 'operators', 'path': '/operators', 'realmRoles': ['auditor'], 'clientRoles': {},
+         'subGroups': [{'id': 'g-2', 'name': 'oncall', 'path': '/operators/oncall', 'realmRoles': [], 'subGroups': []}]},
+    ],
+    'identityProviders': [],
+}
+
+
+class TestKeycloakRealmPartialImport(ModuleTestCase):
+    def setUp(self):
+        super(TestKeycloakRealmPartialImport, self).setUp()
+        self.module = keycloak_realm_partial_import
+
+    def module_args(self, **kwargs):
+        module_args = {
+            'auth_keycloak_url': 'http://keycloak.url/auth',
+            'auth_password': 'admin',
+            'auth_realm': 'master',
+            'auth_username': 'admin',
+            'auth_client_id': 'admin-cli',
+            'validate_certs': True,
+            'realm': 'realm-name',
+        }
+        module_args.update(kwargs)
+        return module_args
+
+    def test_unchanged(self):
+        """Objects matching the export are not imported"""
+
+        module_args = self.module_args(
+            clients=[{'clientId': 'frontend', 'publicClient': True}, {'clientId': 'backend', 'secret': 'other'}],
+            realm_roles=[{'name': 'auditor'}],
+            client_roles={'backend': [{'name': 'admin'}]},
+            groups=[{'name': 'operators', 'realmRoles': ['auditor'], 'subGroups': [{'name': 'oncall'}]}],
+        )
+
+        with set_module_args(module_args):
+            with mock_good_connection():
+                with patch_keycloak_api(export_realm_partial=copy.deepcopy(EXPORT)) as mocks:
+                    with self.assertRaises(AnsibleExitJson) as exec_info:
+                        self.module.main()
+
+        self.assertEqual(len(mocks['export_realm_partial'].mock_calls), 1)
+        self.assertEqual([name for name in PATCHED_METHODS if mocks[name].called], ['export_realm_partial'])
+        result = exec_info.exception.args[0]
+        self.assertIs(result['changed'], False)
+        self.assertEqual(set(obj['action'] for obj in result['objects']), set(['unchanged']))
+        self.assertEqual(len(result['objects']), 5)
+
+    def test_single_import(self):
+        """New objects and changed clients are imported with a single partial import"""
+
+        module_args = self.module_args(
+            clients=[{'clientId': 'frontend', 'publicClient': True}, {'clientId': 'backend', 'serviceAccountsEnabled': True}],
+            realm_roles=[{'name': 'auditor', 'description': 'Auditors'}, {'name': 'operator'}],
+            client_roles={'backend': [{'name': 'writer'}], 'frontend': [{'name': 'viewer'}]},
+            groups=[{'name': 'operators'}, {'name': 'developers', 'realmRoles': ['operator']}],
+        )
+        import_result = {'added': 3, 'overwritten': 3, 'skipped': 0, 'results': []}
+
+        with set_module_args(module_args):
+            with mock_good_connection():
+                with patch_keycloak_api(export_realm_partial=copy.deepcopy(EXPORT), import_realm_partial=import_result,
+                                        get_clientsecret={'type': 'secret', 'value': 'the-secret'}) as mocks:
+                    with self.assertRaises(AnsibleExitJson) as exec_info:
+                        self.module.main()
+
+        self.assertEqual(len(mocks['import_realm_partial'].mock_calls), 1)
+        importrep = mocks['import_realm_partial'].call_args[0][0]
+        self.assertEqual(importrep['ifResourceExists'], 'OVERWRITE')
+        # the replaced client keeps its id, its settings and its secret
+        self.assertEqual(importrep['clients'], [
+            {'id': 'c-2', 'clientId': 'backend', 'publicClient': False, 'secret': 'the-secret', 'serviceAccountsEnabled': True},
+        ])
+        mocks['get_clientsecret'].assert_called_once_with('c-2', realm='realm-name')
+        # the existing role is updated in place, which keeps its mappings
+        self.assertEqual(importrep['roles']['realm'], [{'name': 'operator'}])
+        mocks['update_realm_role'].assert_called_once_with(
+            {'id': 'r-1', 'name': 'auditor', 'description': 'Auditors', 'composite': False}, realm='realm-name')
+        # the roles of the replaced client are imported again along with it
+        self.assertEqual(importrep['roles']['client'], {'backend': [
+            {'name': 'writer'},
+            {'id': 'r-3', 'name': 'admin', 'composite': False},
+            {'id': 'r-4', 'name': 'reader', 'composite': False},
+        ]})
+        self.assertEqual(importrep['groups'], [{'name': 'developers', 'realmRoles': ['operator']}])
+        self.assertEqual([name for name in PATCHED_METHODS if mocks[name].called],
+                         ['export_realm_partial', 'import_realm_partial', 'get_clientsecret', 'update_realm_role'])
+
+        result = exec_info.exception.args[0]
+        self.assertIs(result['changed'], True)
+        self.assertEqual(result['import_result'], import_result)
+        actions = dict(((obj['resource_type'], obj.get('client_id'), obj['name']), obj['action']) for obj in result['objects'])
+        self.assertEqual(actions, {
+            ('client', None, 'frontend'): 'unchanged',
+            ('client', None, 'backend'): 'overwritten',
+            ('realm_role', None, 'auditor'): 'updated',
+            ('realm_role', None, 'operator'): 'added',
+            ('client_role', 'backend', 'writer'): 'added',
+            ('client_role', 'backend', 'admin'): 'overwritten',
+            ('client_role', 'backend', 'reader'): 'overwritten',
+            ('client_role', 'frontend', 'viewer'): 'unchanged',
+            ('group', None, 'operators'): 'unchanged',
+            ('group', None, 'developers'): 'added',
+        })
+        self.assertEqual(result['msg'], '3 objects added, 1 object updated, 3 objects overwritten, 3 objects unchanged')
+
+    def test_update_in_place(self):
+        """Existing groups and roles are changed with their endpoints, so that members and mappings are kept"""
+
+        module_args = self.module_args(
+            realm_roles=[{'name': 'auditor', 'composites': {'realm': ['operator']}}],
+            client_roles={'frontend': [{'name': 'viewer', 'description': 'Viewers'}]},
+            groups=[{'name': 'operators', 'attributes': {'team': ['ops']}, 'realmRoles': ['operator'], 'clientRoles': {'frontend': ['viewer']},
+                     'subGroups': [{'name': 'oncall', 'realmRoles': ['auditor']}, {'name': 'daytime', 'subGroups': [{'name': 'weekend'}]}]}],
+        )
+        export = copy.deepcopy(EXPORT)
+        export['roles']['realm'][0].update({'composite': True, 'composites': {'realm': ['reader']}})
+
+        with set_module_args(module_args):
+            with mock_good_connection():
+                with patch_keycloak_api(export_realm_partial=export, get_client_id='c-1') as mocks:
+                    mocks['get_realm_role'].side_effect = get_role
+                    mocks['get_client_role'].side_effect = get_role
+                    mocks['create_subgroup'].side_effect = [
+                        created_at('http://keycloak.url/auth/admin/realms/realm-name/groups/g-3'),
+                        created_at('http://keycloak.url/auth/admin/realms/realm-name/groups/g-4'),
+                    ]
+                    with self.assertRaises(AnsibleExitJson) as exec_info:
+                        self.module.main()
+
+        self.assertEqual(len(mocks['import_realm_partial'].mock_calls), 0)
+        mocks['update_realm_role'].assert_called_once_with(
+            {'id': 'r-1', 'name': 'auditor', 'description': 'Read only access', 'composite': True,
+             'composites': [{'client_id': None, 'name': 'operator', 'state': 'present'},
+                            {'client_id': None, 'name': 'reader', 'state': 'absent'}]},
+            realm='realm-name')
+        mocks['update_client_role'].assert_called_once_with(
+            {'id': 'r-2', 'name': 'viewer', 'description': 'Viewers', 'composite': False}, 'frontend', realm='realm-name')
+        # the group is not deleted, so its members stay
+        mocks['update_group'].assert_called_once_with(
+            {'id': 'g-1', 'name': 'operators', 'path': '/operators', 'attributes': {'team': ['ops']}}, realm='realm-name')
+        self.assertEqual(mocks['add_group_realm_rolemapping'].mock_calls, [
+            call('g-1', [{'id': 'id-operator', 'name': 'operator'}], realm='realm-name'),
+            call('g-2', [{'id': 'id-auditor', 'name': 'auditor'}], realm='realm-name'),
+        ])
+        mocks['delete_group_realm_rolemapping'].assert_called_once_with('g-1', [{'id': 'id-auditor', 'name': 'auditor'}], realm='realm-name')
+        mocks['add_group_rolemapping'].assert_called_once_with('g-1', 'c-1', [{'id': 'id-viewer', 'name': 'viewer'}], realm='realm-name')
+        self.assertEqual(mocks['create_subgroup'].mock_calls, [
+            call([{'id': 'g-1'}], {'name': 'daytime'}, realm='realm-name'),
+            call([{'id': 'g-3'}], {'name': 'weekend'}, realm='realm-name'),
+        ])
+
+        result = exec_info.exception.args[0]
+        self.assertIs(result['changed'], True)
+        self.assertNotIn('import_result', result)
+        self.assertEqual(result['msg'], '0 objects added, 3 objects updated, 0 objects overwritten, 0 objects unchanged')
+
+    def test_check_mode(self):
+        """Check mode reports the changes without importing or reading secrets"""
+
+        module_args = self.module_args(
+            clients=[{'clientId': 'backend', 'secret': 'new-secret', 'serviceAccountsEnabled': True}],
+            _ansible_check_mode=True,
+            _ansible_diff=True,
+        )
+
+        with set_module_args(module_args):
+            with mock_good_connection():
+                with patch_keycloak_api(export_realm_partial=copy.deepcopy(EXPORT)) as mocks:
+                    with self.assertRaises(AnsibleExitJson) as exec_info:
+                        self.module.main()
+
+        self.assertEqual([name for name in PATCHED_METHODS if mocks[name].called], ['export_realm_partial'])
+        result = exec_info.exception.args[0]
+        self.assertIs(result['changed'], True)
+        self.assertEqual(result['diff']['before']['client']['backend']['serviceAccountsEnabled'], False)
+        self.assertEqual(result['diff']['after']['client']['backend']['serviceAccountsEnabled'], True)
+        self.assertEqual(result['diff']['after']['client']['backend']['secret'], '**********')
+        self.assertEqual(sorted(result['diff']['after']['client_role']), ['backend/admin', 'backend/reader'])
+
+
+if __name__ == '__main__':
+    unittest.main()
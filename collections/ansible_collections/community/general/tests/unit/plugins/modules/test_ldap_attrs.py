@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+ldap = pytest.importorskip('ldap')
+
+from ansible_collections.community.general.plugins.module_utils import ldap as ldap_utils
+from ansible_collections.community.general.plugins.modules import ldap_attrs
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import patch
+from ansible_collections.community.internal_test_tools.tests.unit.plugins.modules.utils import (
+    AnsibleExitJson, AnsibleFailJson, ModuleTestCase, set_module_args)
+
+from .ldap_test_utils import FakeLdapConnection
+
+
+def people(count):
+    entries = {'dc=example,dc=com': {}, 'ou=people,dc=example,dc=com': {}}
+    for idx in range(count):
+        entries['uid=user%d,ou=people,dc=example,dc=com' % idx] = {
+            'uid': [b'user%d' % idx], 'mail': [b'User%d@Example.com' % idx], 'loginShell': [b'/bin/sh'],
+        }
+    return entries
+
+
+class TestLdapAttrs(ModuleTestCase):
+    def setUp(self):
+        super(TestLdapAttrs, self).setUp()
+        self.module = ldap_attrs
+
+    def run_module(self, connection, **kwargs):
+        module_args = {'dn': 'ou=people,dc=example,dc=com', 'bind_dn': 'cn=admin,dc=example,dc=com', 'bind_pw': 'secret',
+                       'xorder_discovery': 'disable'}
+        module_args.update(kwargs)
+        with set_module_args(module_args):
+            with patch.object(ldap, 'initialize', return_value=connection):
+                with self.assertRaises((AnsibleExitJson, AnsibleFailJson)) as exec_info:
+                    self.module.main()
+        return exec_info.exception.args[0]
+
+    def writes(self, connection):
+        return [call for call in connection.calls if not call[0].startswith('search')]
+
+    def test_entries_exact(self):
+        """The values of all entries are read together, and the modifications are pipelined"""
+
+        connection = FakeLdapConnection(people(5))
+        entries = [{'dn': 'uid=user%d,ou=people,dc=example,dc=com' % idx, 'attributes': {'loginShell': '/bin/bash' if idx % 2 else '/bin/sh'}}
+                   for idx in range(5)]
+
+        result = self.run_module(connection, state='exact', entries=entries, pipeline_depth=10)
+
+        self.assertIs(result['changed'], True)
+        self.assertEqual([entry['dn'] for entry in result['entries']],
+                         ['uid=user1,ou=people,dc=example,dc=com', 'uid=user3,ou=people,dc=example,dc=com'])
+        self.assertEqual(result['entries'][0]['modlist'], [(ldap.MOD_REPLACE, 'loginShell', [b'/bin/bash'])])
+        self.assertEqual(connection.calls[0], ('search_s', 'ou=people,dc=example,dc=com', ldap.SCOPE_SUBTREE))
+        self.assertEqual(len(connection.calls), 5)
+        self.assertEqual(self.writes(connection), [
+            ('modify_ext', 'uid=user1,ou=people,dc=example,dc=com'), ('modify_ext', 'uid=user3,ou=people,dc=example,dc=com'),
+            ('result3', 'uid=user1,ou=people,dc=example,dc=com'), ('result3', 'uid=user3,ou=people,dc=example,dc=com'),
+        ])
+        self.assertEqual(connection.entries['uid=user3,ou=people,dc=example,dc=com']['loginShell'], [b'/bin/bash'])
+
+    def test_entries_present_compares_on_server(self):
+        """Values are compared with the matching rules of the server, as without entries"""
+
+        connection = FakeLdapConnection(people(2))
+
+        result = self.run_module(connection, state='present', entries=[
+            {'dn': 'uid=user0,ou=people,dc=example,dc=com', 'attributes': {'mail': 'user0@example.com'}},
+            {'dn': 'uid=user1,ou=people,dc=example,dc=com', 'attributes': {'mail': ['user1@example.com', 'user1@example.org']}},
+        ])
+
+        self.assertIs(result['changed'], True)
+        self.assertEqual(result['entries'], [{'dn': 'uid=user1,ou=people,dc=example,dc=com',
+                                              'modlist': [(ldap.MOD_ADD, 'mail', b'user1@example.org')]}])
+        self.assertEqual(connection.entries['uid=user1,ou=people,dc=example,dc=com']['mail'],
+                         [b'User1@Example.com', b'user1@example.org'])
+
+    def test_entries_present_uses_values_read(self):
+        """Values equal to a value read, or of attributes without values, need no search of their own"""
+
+        connection = FakeLdapConnection(people(3))
+
+        result = self.run_module(connection, state='present', entries=[
+            {'dn': 'uid=user%d,ou=people,dc=example,dc=com' % idx,
+             'attributes': {'mail': 'User%d@Example.com' % idx, 'description': 'Person %d' % idx}} for idx in range(3)
+        ])
+
+        self.assertIs(result['changed'], True)
+        self.assertEqual([entry['modlist'] for entry in result['entries']],
+                         [[(ldap.MOD_ADD, 'description', b'Person %d' % idx)] for idx in range(3)])
+        self.assertEqual([call for call in connection.calls if call[0] == 'search_s'],
+                         [('search_s', 'ou=people,dc=example,dc=com', ldap.SCOPE_SUBTREE)])
+
+    def test_entries_absent_compares_on_server(self):
+        connection = FakeLdapConnection(people(2))
+
+        result = self.run_module(connection, state='absent', entries=[
+            {'dn': 'uid=user0,ou=people,dc=example,dc=com', 'attributes': {'mail': 'user0@example.com'}},
+            {'dn': 'uid=user1,ou=people,dc=example,dc=com', 'attributes': {'mail': 'other@example.com'}},
+        ])
+
+        self.assertIs(result['changed'], True)
+        self.assertEqual([entry['dn'] for entry in result['entries']], ['uid=user0,ou=people,dc=example,dc=com'])
+
+    def test_entries_errors(self):
+        """All modifications are attempted, the failed ones are reported by DN"""
+
+        connection = FakeLdapConnection(people(4))
+        connection.failures['uid=user1,ou=people,dc=example,dc=com'] = ldap.LDAPError({'desc': 'Insufficient access'})
+        entries = [{'dn': 'uid=user%d,ou=people,dc=example,dc=com' % idx, 'attributes': {'loginShell': '/bin/bash'}}
+                   for idx in range(4)]
+
+        for pipeline_depth in (1, 2):
+            connection.entries = FakeLdapConnection(people(4)).entries
+            result = self.run_module(connection, state='exact', entries=entries, pipeline_depth=pipeline_depth)
+
+            self.assertIs(result['failed'], True)
+            self.assertEqual(result['msg'], 'Attribute action failed for 1 of 4 entries.')
+            self.assertEqual(list(result['details']), ['uid=user1,ou=people,dc=example,dc=com'])
+            self.assertIn('Insufficient access', result['details']['uid=user1,ou=people,dc=example,dc=com'])
+            self.assertEqual([dn for dn, attrs in sorted(connection.entries.items()) if attrs.get('loginShell') == [b'/bin/bash']],
+                             ['uid=user0,ou=people,dc=example,dc=com', 'uid=user2,ou=people,dc=example,dc=com',
+                              'uid=user3,ou=people,dc=example,dc=com'])
+
+    def test_entries_missing(self):
+        connection = FakeLdapConnection(people(1))
+
+        result = self.run_module(connection, state='exact', entries=[
+            {'dn': 'UID=user0,ou=People,dc=example,dc=com', 'attributes': {'loginShell': '/bin/sh'}},
+            {'dn': 'uid=nobody,ou=people,dc=example,dc=com', 'attributes': {'loginShell': '/bin/sh'}},
+        ])
+
+        self.assertIs(result['failed'], True)
+        self.assertEqual(result['msg'], 'Entries not found below ou=people,dc=example,dc=com: uid=nobody,ou=people,dc=example,dc=com')
+
+    def test_search_entries_in_chunks(self):
+        connection = FakeLdapConnection(people(5))
+        connection.references = ['ldap://other.example.com/ou=people,dc=example,dc=com']
+
+        with patch.object(ldap_utils, 'BULK_SEARCH_CHUNK', 2):
+            result = self.run_module(connection, state='exact', entries=[
+                {'dn': 'uid=user%d,ou=people,dc=example,dc=com' % idx, 'attributes': {'loginShell': '/bin/sh'}} for idx in range(5)
+            ])
+
+        self.assertIs(result['changed'], False)
+        self.assertEqual(connection.calls, [('search_s', 'ou=people,dc=example,dc=com', ldap.SCOPE_SUBTREE)] * 3)
+
+    def test_search_entries_only_returns_the_entries_given(self):
+        """The filter of the subtree search selects the entries given by their RDN"""
+
+        connection = FakeLdapConnection(people(5))
+
+        result = self.run_module(connection, state='exact', entries=[
+            {'dn': 'uid=user%d,ou=people,dc=example,dc=com' % idx, 'attributes': {'loginShell': '/bin/sh'}} for idx in (1, 3)
+        ])
+
+        self.assertIs(result['changed'], False)
+        self.assertEqual(sorted(connection.returned), ['uid=user1,ou=people,dc=example,dc=com', 'uid=user3,ou=people,dc=example,dc=com'])
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+ldap = pytest.importorskip('ldap')
+
+from ansible_collections.community.general.plugins.modules import ldap_entry
+from ansible_collections.community.internal_test_tools.tests.unit.compat.mock import patch
+from ansible_collections.community.internal_test_tools.tests.unit.plugins.modules.utils import (
+    AnsibleExitJson, AnsibleFailJson, ModuleTestCase, set_module_args)
+
+from .ldap_test_utils import FakeLdapConnection
+
+
+def directory():
+    return FakeLdapConnection({
+        'dc=example,dc=com': {},
+        'ou=people,dc=example,dc=com': {},
+        'uid=jdoe,ou=people,dc=example,dc=com': {},
+        'uid=asmith,ou=people,dc=example,dc=com': {},
+        'ou=groups,dc=example,dc=com': {},
+    })
+
+
+class TestLdapEntry(ModuleTestCase):
+    def setUp(self):
+        super(TestLdapEntry, self).setUp()
+        self.module = ldap_entry
+
+    def run_module(self, connection, **kwargs):
+        module_args = {'dn': 'dc=example,dc=com', 'bind_dn': 'cn=admin,dc=example,dc=com', 'bind_pw': 'secret',
+                       'xorder_discovery': 'disable'}
+        module_args.update(kwargs)
+        with set_module_args(module_args):
+            with patch.object(ldap, 'initialize', return_value=connection):
+                with self.assertRaises((AnsibleExitJson, AnsibleFailJson)) as exec_info:
+                    self.module.main()
+        return exec_info.exception.args[0]
+
+    def writes(self, connection):
+        return [call for call in connection.calls if not call[0].startswith('search')]
+
+    def test_entries_add_parents_first(self):
+        """Each level of the tree is added before the next one, even with pipelining"""
+
+        connection = directory()
+
+        result = self.run_module(connection, pipeline_depth=10, entries=[
+            {'dn': 'ou=admins,ou=groups,dc=example,dc=com', 'objectClass': ['organizationalUnit']},
+            {'dn': 'ou=hosts,dc=example,dc=com', 'objectClass': ['organizationalUnit'], 'attributes': {'description': 'Hosts'}},
+            {'dn': 'cn=web,ou=hosts,dc=example,dc=com', 'objectClass': ['device']},
+            {'dn': 'ou=people,dc=example,dc=com', 'objectClass': ['organizationalUnit']},
+        ])
+
+        self.assertIs(result['changed'], True)
+        self.assertEqual(result['entries'], ['ou=hosts,dc=example,dc=com', 'ou=admins,ou=groups,dc=example,dc=com',
+                                             'cn=web,ou=hosts,dc=example,dc=com'])
+        self.assertEqual(self.writes(connection), [
+            ('add_ext', 'ou=hosts,dc=example,dc=com'), ('result3', 'ou=hosts,dc=example,dc=com'),
+            ('add_ext', 'ou=admins,ou=groups,dc=example,dc=com'), ('add_ext', 'cn=web,ou=hosts,dc=example,dc=com'),
+            ('result3', 'ou=admins,ou=groups,dc=example,dc=com'), ('result3', 'cn=web,ou=hosts,dc=example,dc=com'),
+        ])
+        self.assertEqual(sorted(connection.entries['ou=hosts,dc=example,dc=com'].items()),
+                         [('description', [b'Hosts']), ('objectClass', [b'organizationalUnit'])])
+
+    def test_entries_delete_children_first(self):
+        connection = directory()
+
+        result = self.run_module(connection, state='absent', entries=[
+            {'dn': 'ou=people,dc=example,dc=com'},
+            {'dn': 'uid=jdoe,ou=people,dc=example,dc=com'},
+            {'dn': 'uid=asmith,ou=people,dc=example,dc=com'},
+            {'dn': 'ou=missing,dc=example,dc=com'},
+        ])
+
+        self.assertIs(result['changed'], True)
+        self.assertEqual(self.writes(connection), [
+            ('delete_s', 'uid=jdoe,ou=people,dc=example,dc=com'), ('delete_s', 'uid=asmith,ou=people,dc=example,dc=com'),
+            ('delete_s', 'ou=people,dc=example,dc=com'),
+        ])
+        self.assertEqual(sorted(connection.entries), ['dc=example,dc=com', 'ou=groups,dc=example,dc=com'])
+
+    def test_entries_delete_recursive(self):
+        """Without the subtree delete control, the entries below are deleted one by one"""
+
+        connection = directory()
+
+        result = self.run_module(connection, state='absent', recursive=True, entries=[
+            {'dn': 'ou=people,dc=example,dc=com'}, {'dn': 'ou=groups,dc=example,dc=com'},
+        ])
+
+        self.assertIs(result['changed'], True)
+        self.assertEqual(self.writes(connection), [
+            ('delete_ext_s', 'ou=people,dc=example,dc=com'),
+            ('delete_s', 'uid=asmith,ou=people,dc=example,dc=com'), ('delete_s', 'uid=jdoe,ou=people,dc=example,dc=com'),
+            ('delete_s', 'ou=people,dc=example,dc=com'),
+            ('delete_ext_s', 'ou=groups,dc=example,dc=com'),
+        ])
+        self.assertEqual(sorted(connection.entries), ['dc=example,dc=com'])
+
+    def test_delete_recursive(self):
+        connection = directory()
+
+        result = self.run_module(connection, dn='ou=people,dc=example,dc=com', state='absent', recursive=True)
+
+        self.assertIs(result['changed'], True)
+        self.assertEqual(sorted(connection.entries), ['dc=example,dc=com', 'ou=groups,dc=example,dc=com'])
+
+    def test_entries_errors(self):
+        """A failed deletion does not stop the others"""
+
+        connection = directory()
+        connection.failures['uid=jdoe,ou=people,dc=example,dc=com'] = ldap.LDAPError({'desc': 'Insufficient access'})
+
+        result = self.run_module(connection, state='absent', pipeline_depth=5, entries=[
+            {'dn': 'uid=jdoe,ou=people,dc=example,dc=com'}, {'dn': 'uid=asmith,ou=people,dc=example,dc=com'},
+        ])
+
+        self.assertIs(result['failed'], True)
+        self.assertEqual(result['msg'], 'Entry action failed for 1 of 2 entries.')
+        self.assertEqual(list(result['details']), ['uid=jdoe,ou=people,dc=example,dc=com'])
+        self.assertNotIn('uid=asmith,ou=people,dc=example,dc=com', connection.entries)
@@ -129,3 +129,28 @@ def test_rollback_snapshot_check_mode(connect_mock, capfd, mocker):
     output = json.loads(out)
     assert not output['changed']
     assert output['msg'] == "Snapshot test does not exist"
+
+
+@patch('ansible_collections.community.general.plugins.module_utils.proxmox.ProxmoxAnsible._connect')
+def test_create_snapshot_task_error(connect_mock, capfd, mocker):
+    with set_module_args({
+        "hostname": "test-lxc",
+        "api_user": "root@pam",
+        "api_password": "secret",
+        "api_host": "127.0.0.1",
+        "state": "present",
+        "snapname": "test",
+        "timeout": "1",
+    }):
+        proxmox_utils.HAS_PROXMOXER = True
+        api = fake_api(mocker)
+        api.nodes.return_value.tasks.return_value.status.get.return_value = {'status': 'stopped', 'exitstatus': 'snapshot feature is not available'}
+        connect_mock.side_effect = lambda: api
+        with pytest.raises(SystemExit) as results:
+            proxmox_snap.main()
+
+    out, err = capfd.readouterr()
+    assert not err
+    result = json.loads(out)
+    assert result['failed']
+    assert result['msg'] == 'Task error while waiting for creating VM snapshot: snapshot feature is not available'